@@ -0,0 +1,143 @@
+#!/usr/bin/env node
+// Clustered run mode: the primary process forks CLUSTER_WORKERS copies of
+// server.js, which share the port, so a slow request in one worker no longer
+// stalls every other player's API calls.
+//
+//   node cluster.js           start (npm run start:cluster)
+//   kill -HUP <primary pid>   rolling restart: workers are replaced one at a
+//                             time, each only after its replacement is listening
+//   kill -TERM <primary pid>  graceful stop: workers finish in-flight requests
+//                             and flush their write-behind queues first
+//
+// Workers that crash are replaced, with a growing delay if they keep crashing.
+// Rate limit counters and the chat history windows are kept here in the
+// primary (utils/rateLimitStore.js, utils/clusterCache.js), so they apply
+// across workers. Auth cache invalidations are relayed to every worker, and
+// /metrics scrapes are answered with all workers' samples merged here
+// (utils/metrics.js).
+
+require('dotenv').config();
+const cluster = require('cluster');
+const os = require('os');
+const path = require('path');
+const logger = require('./utils/logger');
+const { serveRateLimitCounters } = require('./utils/rateLimitStore');
+const { serveClusterCaches } = require('./utils/clusterCache');
+const { serveClusterMetrics } = require('./utils/metrics');
+
+const WORKERS = parseInt(process.env.CLUSTER_WORKERS) || os.availableParallelism();
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.CLUSTER_SHUTDOWN_TIMEOUT_MS) || 30000;
+const START_TIMEOUT_MS = parseInt(process.env.CLUSTER_START_TIMEOUT_MS) || 30000;
+const MAX_RESPAWN_DELAY_MS = 10000;
+
+cluster.setupPrimary({ exec: path.join(__dirname, 'server.js') });
+serveRateLimitCounters();
+serveClusterCaches();
+serveClusterMetrics();
+
+let stopping = false;
+let restarting = false;
+let respawnDelayMs = 0;
+const retiring = new Set();
+
+const fork = () => {
+    const worker = cluster.fork();
+    worker.startedAt = Date.now();
+    return worker;
+};
+
+const waitForListening = (worker) => new Promise((resolve, reject) => {
+    const timer = setTimeout(() => reject(new Error(`worker ${worker.id} did not start listening within ${START_TIMEOUT_MS}ms`)), START_TIMEOUT_MS);
+    worker.once('listening', () => {
+        clearTimeout(timer);
+        resolve();
+    });
+    worker.once('exit', () => {
+        clearTimeout(timer);
+        reject(new Error(`worker ${worker.id} exited during startup`));
+    });
+});
+
+/**
+ * Ask a worker to shut down gracefully (server.js handles SIGTERM) and
+ * resolve once it has exited; force it after SHUTDOWN_TIMEOUT_MS.
+ */
+const retire = (worker) => new Promise((resolve) => {
+    if (worker.isDead()) {
+        return resolve();
+    }
+    retiring.add(worker.id);
+    const timer = setTimeout(() => {
+        logger.warn(`Worker ${worker.id} did not exit within ${SHUTDOWN_TIMEOUT_MS}ms, killing it`);
+        worker.process.kill('SIGKILL');
+    }, SHUTDOWN_TIMEOUT_MS);
+    worker.once('exit', () => {
+        clearTimeout(timer);
+        resolve();
+    });
+    worker.process.kill('SIGTERM');
+});
+
+const rollingRestart = async () => {
+    if (restarting || stopping) {
+        logger.info('Rolling restart already in progress, ignoring');
+        return;
+    }
+    restarting = true;
+    const current = Object.values(cluster.workers).filter(worker => !retiring.has(worker.id));
+    logger.info(`Rolling restart of ${current.length} workers`);
+
+    try {
+        for (const old of current) {
+            // Start the replacement first so capacity never drops below WORKERS
+            const replacement = fork();
+            replacement.replacing = true;
+            try {
+                await waitForListening(replacement);
+                replacement.replacing = false;
+            } catch (error) {
+                logger.error(`Rolling restart aborted, old workers keep serving: ${error.message}`);
+                await retire(replacement);
+                return;
+            }
+            await retire(old);
+            logger.info(`Worker ${old.id} replaced by worker ${replacement.id}`);
+        }
+        logger.info('Rolling restart complete');
+    } finally {
+        restarting = false;
+    }
+};
+
+const stop = async (signal) => {
+    if (stopping) return;
+    stopping = true;
+    logger.info(`${signal} received, stopping ${Object.keys(cluster.workers).length} workers`);
+    await Promise.all(Object.values(cluster.workers).map(retire));
+    logger.info('All workers stopped');
+    process.exit(0);
+};
+
+cluster.on('exit', (worker, code, signal) => {
+    // Retired on purpose, or a replacement that failed to start (the restart is aborted)
+    if (retiring.delete(worker.id) || stopping || worker.replacing) {
+        return;
+    }
+
+    // Unexpected exit: replace the worker, backing off if it keeps crashing on startup
+    const crashedEarly = Date.now() - worker.startedAt < 5000;
+    respawnDelayMs = crashedEarly ? Math.min(MAX_RESPAWN_DELAY_MS, respawnDelayMs * 2 || 500) : 0;
+    logger.error(`Worker ${worker.id} (pid ${worker.process.pid}) exited with ${signal || code}, restarting in ${respawnDelayMs}ms`);
+    setTimeout(() => {
+        if (!stopping) fork();
+    }, respawnDelayMs);
+});
+
+process.on('SIGHUP', () => rollingRestart());
+process.on('SIGTERM', () => stop('SIGTERM'));
+process.on('SIGINT', () => stop('SIGINT'));
+
+logger.info(`Cluster primary ${process.pid} starting ${WORKERS} workers`);
+for (let i = 0; i < WORKERS; i++) {
+    fork();
+}
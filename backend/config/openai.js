@@ -1,8 +1,84 @@
 const OpenAI = require('openai');
 const logger = require('../utils/logger');
+const { counter, histogram, METRICS_ENABLED } = require('../utils/metrics');
 
 let openai = null;
 
+const openaiDuration = histogram(
+    'openai_request_duration_seconds',
+    'OpenAI call latency, to the last chunk for streamed completions',
+    ['endpoint', 'model', 'status']
+);
+const openaiFirstToken = histogram(
+    'openai_time_to_first_token_seconds',
+    'Time to the first streamed chunk of a chat completion',
+    ['model']
+);
+const openaiTokens = counter(
+    'openai_tokens_total',
+    'Tokens used by OpenAI chat completions',
+    ['model', 'kind']
+);
+
+const countUsage = (model, usage) => {
+    if (!usage) return;
+    openaiTokens.inc({ model, kind: 'prompt' }, usage.prompt_tokens || 0);
+    openaiTokens.inc({ model, kind: 'completion' }, usage.completion_tokens || 0);
+};
+
+/**
+ * Time chat completions and count their tokens. Streams are timed to their
+ * last chunk (usage arrives there with stream_options.include_usage), so the
+ * stream is wrapped rather than consumed.
+ */
+const instrumentChatCompletions = (client) => {
+    const completions = client.chat.completions;
+    const create = completions.create.bind(completions);
+
+    completions.create = async (params, options) => {
+        const labels = { endpoint: 'chat/completions', model: params.model };
+        const stopTimer = openaiDuration.startTimer(labels);
+        const stopFirstToken = openaiFirstToken.startTimer({ model: params.model });
+        let result;
+        try {
+            result = await create(params, options);
+        } catch (error) {
+            stopTimer({ status: error.status || 'error' });
+            throw error;
+        }
+
+        if (!params.stream) {
+            stopTimer({ status: 200 });
+            countUsage(params.model, result.usage);
+            return result;
+        }
+
+        const iterate = result[Symbol.asyncIterator].bind(result);
+        result[Symbol.asyncIterator] = async function* () {
+            // Stays "cancelled" if the consumer stops early (client disconnected)
+            let status = 'cancelled';
+            let first = true;
+            try {
+                for await (const chunk of iterate()) {
+                    if (first) {
+                        stopFirstToken();
+                        first = false;
+                    }
+                    countUsage(params.model, chunk.usage);
+                    yield chunk;
+                }
+                status = 200;
+            } catch (error) {
+                status = error.status || 'error';
+                throw error;
+            } finally {
+                stopTimer({ status });
+            }
+        };
+        return result;
+    };
+};
+
 const initializeOpenAI = () => {
     try {
         const apiKey = process.env.OPENAI_API_KEY;
@@ -14,8 +90,13 @@ const initializeOpenAI = () => {
 
         openai = new OpenAI({
             apiKey: apiKey,
+            // Point at a compatible server, e.g. scripts/mock-openai.js for local testing
+            baseURL: process.env.OPENAI_BASE_URL || undefined,
             dangerouslyAllowBrowser: false // Ensure server-side only
         });
+        if (METRICS_ENABLED) {
+            instrumentChatCompletions(openai);
+        }
 
         logger.info('✅ OpenAI client initialized successfully');
         return openai;
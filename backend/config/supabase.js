@@ -1,8 +1,53 @@
 const { createClient } = require('@supabase/supabase-js');
 const logger = require('../utils/logger');
+const { histogram, METRICS_ENABLED } = require('../utils/metrics');
 
 let supabase = null;
 
+const supabaseDuration = histogram(
+    'supabase_request_duration_seconds',
+    'Supabase API call latency by table (or RPC function) and operation',
+    ['table', 'operation', 'status']
+);
+
+const REST_OPERATIONS = { GET: 'select', HEAD: 'count', POST: 'insert', PATCH: 'update', DELETE: 'delete' };
+
+// Table and operation of a Supabase request from its URL:
+// /rest/v1/<table>, /rest/v1/rpc/<function>, /auth/v1/<endpoint>, /storage/v1/...
+const describeRequest = (input, init = {}) => {
+    // input is a string, URL or Request
+    const url = new URL(input.url ?? input);
+    const method = (init.method || input.method || 'GET').toUpperCase();
+    const [, service, , first, second] = url.pathname.split('/');
+
+    if (service === 'rest') {
+        if (first === 'rpc') {
+            return { table: second, operation: 'rpc' };
+        }
+        const prefer = new Headers(init.headers).get('prefer') || '';
+        const operation = method === 'POST' && prefer.includes('resolution=') ? 'upsert' : REST_OPERATIONS[method] || method;
+        return { table: first, operation };
+    }
+    return { table: `${service}:${first || ''}`, operation: method.toLowerCase() };
+};
+
+/**
+ * fetch for Supabase clients (global.fetch option) that times every call
+ */
+const supabaseFetch = METRICS_ENABLED
+    ? async (input, init) => {
+        const stopTimer = supabaseDuration.startTimer(describeRequest(input, init));
+        try {
+            const response = await fetch(input, init);
+            stopTimer({ status: response.status });
+            return response;
+        } catch (error) {
+            stopTimer({ status: 'error' });
+            throw error;
+        }
+    }
+    : fetch;
+
 const initializeSupabase = () => {
     try {
         const supabaseUrl = process.env.SUPABASE_URL;
@@ -19,7 +64,8 @@ const initializeSupabase = () => {
                 autoRefreshToken: true,
                 persistSession: false,
                 detectSessionInUrl: false
-            }
+            },
+            global: { fetch: supabaseFetch }
         });
 
         // Create service client for admin operations
@@ -28,7 +74,8 @@ const initializeSupabase = () => {
                 autoRefreshToken: true,
                 persistSession: false,
                 detectSessionInUrl: false
-            }
+            },
+            global: { fetch: supabaseFetch }
         });
 
         logger.info('✅ Supabase client initialized successfully');
@@ -51,11 +98,14 @@ const getSupabaseService = () => {
     if (!supabase) {
         throw new Error('Supabase service client not initialized. Call initializeSupabase() first.');
     }
-    return createClient(process.env.SUPABASE_URL, process.env.SUPABASE_SERVICE_ROLE_KEY);
+    return createClient(process.env.SUPABASE_URL, process.env.SUPABASE_SERVICE_ROLE_KEY, {
+        global: { fetch: supabaseFetch }
+    });
 };
 
 module.exports = {
     initializeSupabase,
     getSupabase,
-    getSupabaseService
+    getSupabaseService,
+    supabaseFetch
 };
@@ -1,8 +1,69 @@
+const crypto = require('crypto');
 const jwt = require('jsonwebtoken');
 const { getSupabase } = require('../config/supabase');
+const { LRUCache } = require('../utils/lruCache');
+const { subscribe, broadcast } = require('../utils/clusterCache');
 const logger = require('../utils/logger');
 
+// Identities Supabase has confirmed, keyed by token hash. The JWT itself is
+// still verified locally on every request; only the remote lookup is cached.
+const identityCache = new LRUCache({
+    max: parseInt(process.env.AUTH_CACHE_MAX) || 5000,
+    ttlMs: parseInt(process.env.AUTH_CACHE_TTL_MS) || 60 * 1000
+});
+
+// Time spent in authentication, split by whether the identity came from cache
+const authMetrics = {
+    remoteLookups: 0,
+    remoteFailures: 0,
+    hit: { count: 0, totalMs: 0, maxMs: 0 },
+    miss: { count: 0, totalMs: 0, maxMs: 0 }
+};
+
+const tokenCacheKey = (token) => crypto.createHash('sha256').update(token).digest('base64');
+
+const recordLatency = (bucket, startedAt) => {
+    const elapsedMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+    bucket.count++;
+    bucket.totalMs += elapsedMs;
+    bucket.maxMs = Math.max(bucket.maxMs, elapsedMs);
+};
+
+// Look up the Supabase user for a locally verified token, from cache when possible
+const resolveIdentity = async (token, decoded) => {
+    const key = tokenCacheKey(token);
+    const cached = identityCache.get(key);
+    if (cached) {
+        return { user: cached, cached: true };
+    }
+
+    authMetrics.remoteLookups++;
+    const supabase = getSupabase();
+    const { data: { user }, error } = await supabase.auth.getUser(token);
+
+    if (error || !user) {
+        authMetrics.remoteFailures++;
+        return { user: null, cached: false };
+    }
+
+    const identity = {
+        id: user.id,
+        email: user.email,
+        role: user.role || 'user'
+    };
+
+    // Never keep an identity past the token's own expiry
+    const ttlMs = decoded.exp
+        ? Math.min(identityCache.ttlMs, decoded.exp * 1000 - Date.now())
+        : identityCache.ttlMs;
+    identityCache.set(key, identity, ttlMs);
+
+    return { user: identity, cached: false };
+};
+
 const authenticateToken = async (req, res, next) => {
+    const startedAt = process.hrtime.bigint();
+
     try {
         const authHeader = req.headers['authorization'];
         const token = authHeader && authHeader.split(' ')[1]; // Bearer TOKEN
@@ -17,11 +78,11 @@ const authenticateToken = async (req, res, next) => {
         // Verify JWT token
         const decoded = jwt.verify(token, process.env.JWT_SECRET);
 
-        // Get user from Supabase
-        const supabase = getSupabase();
-        const { data: { user }, error } = await supabase.auth.getUser(token);
+        // Get user from cache or Supabase
+        const { user, cached } = await resolveIdentity(token, decoded);
+        recordLatency(cached ? authMetrics.hit : authMetrics.miss, startedAt);
 
-        if (error || !user) {
+        if (!user) {
             return res.status(401).json({
                 error: 'Invalid token',
                 message: 'Authentication token is invalid or expired'
@@ -29,13 +90,9 @@ const authenticateToken = async (req, res, next) => {
         }
 
         // Add user info to request
-        req.user = {
-            id: user.id,
-            email: user.email,
-            role: user.role || 'user'
-        };
+        req.user = { ...user };
 
-        logger.info(`User authenticated: ${user.email}`);
+        logger.debug(`User authenticated: ${user.email}${cached ? ' (cached)' : ''}`);
         next();
     } catch (error) {
         logger.error('Authentication error:', error.message);
@@ -68,15 +125,10 @@ const optionalAuth = async (req, res, next) => {
 
         if (token) {
             const decoded = jwt.verify(token, process.env.JWT_SECRET);
-            const supabase = getSupabase();
-            const { data: { user }, error } = await supabase.auth.getUser(token);
-
-            if (!error && user) {
-                req.user = {
-                    id: user.id,
-                    email: user.email,
-                    role: user.role || 'user'
-                };
+            const { user } = await resolveIdentity(token, decoded);
+
+            if (user) {
+                req.user = { ...user };
             }
         }
 
@@ -110,8 +162,45 @@ const requireRole = (roles) => {
     };
 };
 
+// Each cluster worker keeps its own identity cache; invalidations are
+// broadcast so a revoked token stops working on every worker at once
+subscribe('auth:token', (key) => identityCache.delete(key));
+subscribe('auth:user', (userId) => identityCache.deleteWhere(identity => identity.id === userId));
+
+// Drop the cached identity for a token (logout)
+const invalidateToken = (token) => {
+    if (token) {
+        broadcast('auth:token', tokenCacheKey(token));
+    }
+};
+
+// Drop every cached identity of a user (profile or password changes)
+const invalidateUser = (userId) => {
+    broadcast('auth:user', userId);
+};
+
+const summarizeLatency = ({ count, totalMs, maxMs }) => ({
+    count,
+    avgMs: count > 0 ? Number((totalMs / count).toFixed(3)) : 0,
+    maxMs: Number(maxMs.toFixed(3))
+});
+
+// Hit rate and authentication latency for the health endpoint
+const getAuthCacheStats = () => ({
+    ...identityCache.stats(),
+    remoteLookups: authMetrics.remoteLookups,
+    remoteFailures: authMetrics.remoteFailures,
+    latency: {
+        hit: summarizeLatency(authMetrics.hit),
+        miss: summarizeLatency(authMetrics.miss)
+    }
+});
+
 module.exports = {
     authenticateToken,
     optionalAuth,
-    requireRole
+    requireRole,
+    invalidateToken,
+    invalidateUser,
+    getAuthCacheStats
 };
@@ -0,0 +1,26 @@
+const { histogram } = require('../utils/metrics');
+
+const httpDuration = histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route; _count is the request count',
+    ['method', 'route', 'status']
+);
+
+/**
+ * Time every request. The route label is the matched route pattern (e.g.
+ * /api/ai/conversation/:conversationId), never the raw URL, so ids do not
+ * create new series; requests that match no route are labelled "unmatched".
+ */
+const requestMetrics = (req, res, next) => {
+    const stopTimer = httpDuration.startTimer();
+    res.once('finish', () => {
+        stopTimer({
+            method: req.method,
+            route: req.route ? `${req.baseUrl}${req.route.path}` : 'unmatched',
+            status: res.statusCode
+        });
+    });
+    next();
+};
+
+module.exports = { requestMetrics };
@@ -1,14 +1,29 @@
 const express = require('express');
-const { body, validationResult } = require('express-validator');
+const { Readable } = require('stream');
+const multer = require('multer');
+const { body, query, validationResult } = require('express-validator');
 const { getOpenAI, isOpenAIAvailable, getAVSystemPrompt, calculateTokenCost } = require('../config/openai');
-const { getSupabase } = require('../config/supabase');
+const { getSupabase, supabaseFetch } = require('../config/supabase');
 const logger = require('../utils/logger');
 const { v4: uuidv4 } = require('uuid');
 const webSearchService = require('../services/webSearch');
-const { getLinkPreview } = require('../services/linkPreview');
+const { getLinkPreview, getLinkPreviews } = require('../services/linkPreview');
+const { recordApiUsage } = require('../services/telemetry');
+const { getRecentMessages, invalidateConversation, recordExchange } = require('../services/conversationHistory');
+const { openEventStream, sendEvent } = require('../utils/sse');
+const { getCachedResponse, cacheResponse } = require('../services/responseCache');
+const { transcribeStream, UploadTooLargeError } = require('../services/transcription');
+const { decodeBase64 } = require('../services/cpuTasks');
 
 const router = express.Router();
 
+// Model for tutor chat replies (also part of the response cache key)
+const CHAT_MODEL = 'gpt-4o';
+
+// Follow-up questions depend on the conversation, which the response cache ignores
+const FOLLOW_UP_PATTERN = /\b(more|again|above|earlier|previous|you said|last answer|continue|go on)\b/i;
+const isCacheablePrompt = (message) => !FOLLOW_UP_PATTERN.test(message);
+
 // Start a new AI conversation
 router.post('/conversation/start', async (req, res) => {
     try {
@@ -117,7 +132,8 @@ function getSupabaseService() {
             auth: {
                 autoRefreshToken: false,
                 persistSession: false
-            }
+            },
+            global: { fetch: supabaseFetch }
         }
     );
 }
@@ -132,7 +148,8 @@ router.post('/chat', [
         }
         return true;
     }),
-    body('needsWebSearch').optional().isBoolean().withMessage('needsWebSearch must be a boolean')
+    body('needsWebSearch').optional().isBoolean().withMessage('needsWebSearch must be a boolean'),
+    body('stream').optional().isBoolean().withMessage('stream must be a boolean')
 ], async (req, res) => {
     try {
         // Check validation errors
@@ -144,7 +161,7 @@ router.post('/chat', [
             });
         }
 
-        const { message, conversationId, equipmentContext } = req.body;
+        const { message, conversationId, equipmentContext, stream } = req.body;
 
         // Check if OpenAI is available
         if (!isOpenAIAvailable()) {
@@ -161,14 +178,32 @@ router.post('/chat', [
         const supabaseService = getSupabaseService();
         const openai = getOpenAI();
 
-        // Get conversation history
-        const { data: messages, error: messagesError } = await supabaseService
-            .from('ai_messages')
-            .select('*')
-            .eq('conversation_id', conversationId)
-            .order('created_at', { ascending: true });
+        const userMessageAt = new Date().toISOString();
+
+        // Repeated questions in the same equipment context are answered from the
+        // cache, before (and without) the history query: a hit does not use it
+        const cacheQuery = isCacheablePrompt(message)
+            ? { prompt: message, equipmentContext, model: CHAT_MODEL }
+            : null;
+        const cached = cacheQuery && await getCachedResponse(cacheQuery);
+        if (cached) {
+            return sendCachedChatResponse(res, {
+                supabaseService,
+                cached,
+                stream,
+                conversationId,
+                userId: testUserId,
+                message,
+                userMessageAt,
+                equipmentContext
+            });
+        }
 
-        if (messagesError) {
+        // Get the recent history window (bounded query, cached per conversation)
+        let history;
+        try {
+            history = await getRecentMessages(supabaseService, conversationId);
+        } catch (messagesError) {
             logger.error('Error fetching messages:', messagesError);
             return res.status(500).json({ error: 'Failed to fetch conversation history' });
         }
@@ -177,18 +212,29 @@ router.post('/chat', [
         const systemPrompt = getAVSystemPrompt(equipmentContext);
         const openaiMessages = [
             { role: 'system', content: systemPrompt },
-            ...messages.slice(-10).map(msg => ({
-                role: msg.role,
-                content: msg.content
-            })),
+            ...history,
             { role: 'user', content: message }
         ];
 
+        if (stream) {
+            return await streamChatResponse(req, res, {
+                openai,
+                supabaseService,
+                openaiMessages,
+                cacheQuery,
+                conversationId,
+                userId: testUserId,
+                message,
+                userMessageAt,
+                equipmentContext
+            });
+        }
+
         const startTime = Date.now();
 
         // Call OpenAI API with GPT-4o for voice responses
         const completion = await openai.chat.completions.create({
-            model: 'gpt-4o', // Use GPT-4o for voice responses
+            model: CHAT_MODEL, // Use GPT-4o for voice responses
             messages: openaiMessages,
             max_tokens: parseInt(process.env.OPENAI_MAX_TOKENS) || 500,
             temperature: parseFloat(process.env.OPENAI_TEMPERATURE) || 0.7,
@@ -199,67 +245,12 @@ router.post('/chat', [
         const tokensUsed = completion.usage.total_tokens;
         const cost = calculateTokenCost(tokensUsed);
 
-        // Save user message
-        const { error: userMessageError } = await supabaseService
-            .from('ai_messages')
-            .insert({
-                conversation_id: conversationId,
-                user_id: testUserId,
-                role: 'user',
-                content: message,
-                equipment_context: equipmentContext,
-                message_type: 'text',
-                created_at: new Date().toISOString()
-            });
-
-        if (userMessageError) {
-            logger.error('Error saving user message:', userMessageError);
-        }
-
-        // Save AI response
-        const { error: aiMessageError } = await supabaseService
-            .from('ai_messages')
-            .insert({
-                conversation_id: conversationId,
-                user_id: testUserId,
-                role: 'assistant',
-                content: aiResponse,
-                equipment_context: equipmentContext,
-                message_type: 'text',
-                tokens_used: tokensUsed,
-                response_time: responseTime,
-                created_at: new Date().toISOString()
-            });
-
-        if (aiMessageError) {
-            logger.error('Error saving AI message:', aiMessageError);
-        }
-
-        // Track API usage
-        const { error: usageError } = await supabaseService
-            .from('api_usage')
-            .insert({
-                user_id: testUserId,
-                api_type: 'openai_chat',
-                tokens_used: tokensUsed,
-                cost_usd: cost,
-                request_count: 1,
-                success: true,
-                created_at: new Date().toISOString()
-            });
+        logger.info(`AI chat processed for user ${testUserId}, tokens: ${tokensUsed}, cost: $${cost}`);
 
-        if (usageError) {
-            logger.error('Error tracking API usage:', usageError);
+        if (cacheQuery) {
+            cacheResponse(cacheQuery, { response: aiResponse, tokensUsed, cost });
         }
 
-        // Update conversation message count
-        await supabaseService
-            .from('ai_conversations')
-            .update({ total_messages: (messages?.length || 0) + 2 })
-            .eq('id', conversationId);
-
-        logger.info(`AI chat processed for user ${testUserId}, tokens: ${tokensUsed}, cost: $${cost}`);
-
         res.json({
             success: true,
             response: aiResponse,
@@ -269,23 +260,33 @@ router.post('/chat', [
             cost: cost
         });
 
+        // Messages, usage row and message counter in one transaction, after the response
+        recordExchange(supabaseService, {
+            conversationId,
+            userId: testUserId,
+            userMessage: message,
+            userMessageAt,
+            assistantMessage: aiResponse,
+            assistantMessageAt: new Date().toISOString(),
+            equipmentContext,
+            tokensUsed,
+            responseTime,
+            cost
+        });
+
     } catch (error) {
         logger.error('Error in AI chat:', error);
 
         // Track failed API usage
         try {
-            await supabaseService
-                .from('api_usage')
-                .insert({
-                    user_id: testUserId,
-                    api_type: 'openai_chat',
-                    tokens_used: 0,
-                    cost_usd: 0,
-                    request_count: 1,
-                    success: false,
-                    error_message: error.message,
-                    created_at: new Date().toISOString()
-                });
+            recordApiUsage({
+                user_id: testUserId,
+                api_type: 'openai_chat',
+                tokens_used: 0,
+                cost_usd: 0,
+                success: false,
+                error_message: error.message
+            });
         } catch (trackingError) {
             logger.error('Error tracking failed API usage:', trackingError);
         }
@@ -297,117 +298,420 @@ router.post('/chat', [
     }
 });
 
-// Process voice message
-router.post('/voice', [
-    body('audioData').isString().withMessage('Audio data required'),
-    body('conversationId').isUUID().withMessage('Valid conversation ID required'),
-    body('duration').isInt({ min: 1 }).withMessage('Valid duration required')
-], async (req, res) => {
+// Answer a chat message from the response cache, in the format the client
+// asked for. The exchange is still recorded, with no tokens used.
+function sendCachedChatResponse(res, { supabaseService, cached, stream, conversationId, userId, message, userMessageAt, equipmentContext }) {
+    const responseTime = Date.now() - Date.parse(userMessageAt);
+
+    if (stream) {
+        openEventStream(res);
+        sendEvent(res, 'token', { content: cached.response });
+        sendEvent(res, 'done', {
+            conversation_id: conversationId,
+            tokens_used: 0,
+            response_time: responseTime,
+            time_to_first_token: responseTime,
+            cost: 0,
+            cached: true
+        });
+        res.end();
+    } else {
+        res.json({
+            success: true,
+            response: cached.response,
+            conversation_id: conversationId,
+            tokens_used: 0,
+            response_time: responseTime,
+            cost: 0,
+            cached: true
+        });
+    }
+
+    logger.info(`AI chat answered from cache for user ${userId} (entry hits: ${cached.hits}, saved tokens: ${cached.tokensUsed})`);
+
+    recordExchange(supabaseService, {
+        conversationId,
+        userId,
+        userMessage: message,
+        userMessageAt,
+        assistantMessage: cached.response,
+        assistantMessageAt: new Date().toISOString(),
+        equipmentContext,
+        tokensUsed: 0,
+        responseTime,
+        cost: 0
+    });
+}
+
+// Relay a chat completion to the client as server-sent events:
+//   event: token  data: { content }                     one per generated delta
+//   event: done   data: { conversation_id, tokens_used, response_time,
+//                         time_to_first_token, cost }   after the last token
+//   event: error  data: { error, message }              generation failed midway
+// Errors before the first byte is sent still answer with a JSON 500.
+async function streamChatResponse(req, res, { openai, supabaseService, openaiMessages, cacheQuery, conversationId, userId, message, userMessageAt, equipmentContext }) {
+    const startTime = Date.now();
+    let timeToFirstToken = null;
+    let aiResponse = '';
+    let tokensUsed = 0;
+
+    // Stop generating (and paying for) tokens once the client has gone away
+    const abortController = new AbortController();
+    res.on('close', () => {
+        if (!res.writableEnded) {
+            abortController.abort();
+        }
+    });
+
     try {
-        const errors = validationResult(req);
-        if (!errors.isEmpty()) {
-            return res.status(400).json({
-                error: 'Validation failed',
-                details: errors.array()
-            });
+        const completion = await openai.chat.completions.create({
+            model: CHAT_MODEL,
+            messages: openaiMessages,
+            max_tokens: parseInt(process.env.OPENAI_MAX_TOKENS) || 500,
+            temperature: parseFloat(process.env.OPENAI_TEMPERATURE) || 0.7,
+            stream: true,
+            stream_options: { include_usage: true }
+        }, { signal: abortController.signal });
+
+        openEventStream(res);
+
+        for await (const chunk of completion) {
+            const delta = chunk.choices[0]?.delta?.content;
+            if (delta) {
+                if (timeToFirstToken === null) {
+                    timeToFirstToken = Date.now() - startTime;
+                }
+                aiResponse += delta;
+                sendEvent(res, 'token', { content: delta });
+            }
+            if (chunk.usage) {
+                tokensUsed = chunk.usage.total_tokens;
+            }
+        }
+    } catch (error) {
+        if (abortController.signal.aborted) {
+            logger.info(`AI chat stream for conversation ${conversationId} closed by the client after ${Date.now() - startTime}ms`);
+            return;
         }
 
-        const { audioData, conversationId, duration } = req.body;
-        const userId = req.user.id;
+        logger.error('Error in streamed AI chat:', error);
+        recordApiUsage({
+            user_id: userId,
+            api_type: 'openai_chat',
+            tokens_used: 0,
+            cost_usd: 0,
+            success: false,
+            error_message: error.message
+        });
 
-        if (!isOpenAIAvailable()) {
-            return res.status(503).json({
-                error: 'AI service unavailable',
-                message: 'OpenAI service is currently not available'
-            });
+        const failure = {
+            error: 'AI service error',
+            message: 'Failed to process your message. Please try again.'
+        };
+        if (!res.headersSent) {
+            return res.status(500).json(failure);
         }
+        sendEvent(res, 'error', failure);
+        return res.end();
+    }
 
-        const openai = getOpenAI();
-        const supabase = getSupabase();
+    const responseTime = Date.now() - startTime;
+    const cost = calculateTokenCost(tokensUsed);
 
-        // Convert base64 audio to buffer
-        const audioBuffer = Buffer.from(audioData, 'base64');
+    sendEvent(res, 'done', {
+        conversation_id: conversationId,
+        tokens_used: tokensUsed,
+        response_time: responseTime,
+        time_to_first_token: timeToFirstToken,
+        cost: cost
+    });
+    res.end();
 
-        // Transcribe audio using OpenAI Whisper
-        const transcription = await openai.audio.transcriptions.create({
-            file: audioBuffer,
-            model: 'whisper-1',
-            response_format: 'text'
-        });
+    logger.info(`AI chat streamed for user ${userId}, first token: ${timeToFirstToken}ms, total: ${responseTime}ms, tokens: ${tokensUsed}, cost: $${cost}`);
 
-        const transcribedText = transcription.text;
+    if (cacheQuery) {
+        cacheResponse(cacheQuery, { response: aiResponse, tokensUsed, cost });
+    }
 
-        // Process the transcribed text through chat
-        const systemPrompt = getAVSystemPrompt();
-        const completion = await openai.chat.completions.create({
-            model: process.env.OPENAI_MODEL || 'gpt-4o',
-            messages: [
-                { role: 'system', content: systemPrompt },
-                { role: 'user', content: transcribedText }
-            ],
-            max_tokens: parseInt(process.env.OPENAI_MAX_TOKENS) || 500,
-            temperature: parseFloat(process.env.OPENAI_TEMPERATURE) || 0.7,
-        });
+    recordExchange(supabaseService, {
+        conversationId,
+        userId,
+        userMessage: message,
+        userMessageAt,
+        assistantMessage: aiResponse,
+        assistantMessageAt: new Date().toISOString(),
+        equipmentContext,
+        tokensUsed,
+        responseTime,
+        cost
+    });
+}
 
-        const aiResponse = completion.choices[0].message.content;
-        const tokensUsed = completion.usage.total_tokens;
-        const cost = calculateTokenCost(tokensUsed);
+// Voice messages: the recording is transcribed, answered like a chat message,
+// and both sides are saved to the conversation
+const VOICE_UPLOAD_MAX_BYTES = parseInt(process.env.VOICE_UPLOAD_MAX_BYTES) || 25 * 1024 * 1024; // Whisper's own limit
+
+const AUDIO_EXTENSIONS = {
+    'audio/webm': 'webm',
+    'video/webm': 'webm',
+    'audio/ogg': 'ogg',
+    'audio/mpeg': 'mp3',
+    'audio/mp3': 'mp3',
+    'audio/mp4': 'm4a',
+    'audio/x-m4a': 'm4a',
+    'audio/wav': 'wav',
+    'audio/x-wav': 'wav',
+    'audio/wave': 'wav',
+    'audio/flac': 'flac'
+};
+
+// Whisper detects the format from the file name, so it needs the right extension
+const audioFilename = (contentType) => {
+    const type = (contentType || '').split(';')[0].trim().toLowerCase();
+    return `voice.${AUDIO_EXTENSIONS[type] || 'webm'}`;
+};
+
+const isAudioType = (contentType) => /^(audio\/|video\/webm|application\/octet-stream)/i.test(contentType || '');
+
+// multer storage that pipes the uploaded file into the transcription request
+// instead of holding it in memory or writing it to disk
+const streamingTranscriptionStorage = (signal) => ({
+    _handleFile(req, file, cb) {
+        transcribeStream(file.stream, {
+            filename: file.originalname || audioFilename(file.mimetype),
+            contentType: file.mimetype,
+            maxBytes: VOICE_UPLOAD_MAX_BYTES,
+            signal
+        }).then(({ text, bytes }) => cb(null, { transcript: text, size: bytes }), cb);
+    },
+    _removeFile(req, file, cb) {
+        cb(null);
+    }
+});
 
-        // Save voice message
-        await supabase
-            .from('ai_messages')
-            .insert({
+const parseVoiceForm = (req, res, signal) => new Promise((resolve, reject) => {
+    multer({
+        storage: streamingTranscriptionStorage(signal),
+        // One byte over the cap so transcribeStream sees the overflow and aborts,
+        // rather than busboy truncating the file and Whisper getting half of it
+        limits: { fileSize: VOICE_UPLOAD_MAX_BYTES + 1, files: 1, fields: 5 },
+        fileFilter: (req, file, cb) => cb(null, isAudioType(file.mimetype))
+    }).single('audio')(req, res, (error) => (error ? reject(error) : resolve(req.file)));
+});
+
+/**
+ * Answer a transcribed voice message and save the exchange
+ */
+async function answerVoiceMessage(res, { transcribedText, conversationId, duration, audioBytes }) {
+    const userId = getTestUserId();
+    const openai = getOpenAI();
+    const supabase = getSupabaseService();
+
+    const completion = await openai.chat.completions.create({
+        model: process.env.OPENAI_MODEL || CHAT_MODEL,
+        messages: [
+            { role: 'system', content: getAVSystemPrompt() },
+            { role: 'user', content: transcribedText }
+        ],
+        max_tokens: parseInt(process.env.OPENAI_MAX_TOKENS) || 500,
+        temperature: parseFloat(process.env.OPENAI_TEMPERATURE) || 0.7,
+    });
+
+    const aiResponse = completion.choices[0].message.content;
+    const tokensUsed = completion.usage.total_tokens;
+    const cost = calculateTokenCost(tokensUsed);
+
+    res.json({
+        success: true,
+        transcribed_text: transcribedText,
+        response: aiResponse,
+        tokens_used: tokensUsed,
+        cost: cost
+    });
+
+    // Save both messages after responding; one insert, so they land together
+    const now = new Date().toISOString();
+    const { error: saveError } = await supabase
+        .from('ai_messages')
+        .insert([
+            {
                 conversation_id: conversationId,
                 user_id: userId,
                 role: 'user',
                 content: transcribedText,
                 message_type: 'voice',
                 voice_duration: duration,
-                created_at: new Date().toISOString()
-            });
-
-        // Save AI response
-        await supabase
-            .from('ai_messages')
-            .insert({
+                created_at: now
+            },
+            {
                 conversation_id: conversationId,
                 user_id: userId,
                 role: 'assistant',
                 content: aiResponse,
                 message_type: 'text',
                 tokens_used: tokensUsed,
-                created_at: new Date().toISOString()
+                created_at: now
+            }
+        ]);
+    if (saveError) {
+        logger.error('Error saving voice messages:', saveError);
+    }
+    invalidateConversation(conversationId);
+
+    // Track API usage
+    recordApiUsage({
+        user_id: userId,
+        api_type: 'openai_voice',
+        tokens_used: tokensUsed,
+        cost_usd: cost,
+        success: true
+    });
+
+    logger.info(`Voice message processed for user ${userId}, duration: ${duration}ms, audio: ${audioBytes} bytes, tokens: ${tokensUsed}`);
+}
+
+const sendVoiceError = (res, error) => {
+    // Already answered, or the client went away (ABORT_ERR)
+    if (res.headersSent || error.code === 'ABORT_ERR') {
+        return;
+    }
+    if (error.code === 'EQUEUEFULL') {
+        return res.status(503).json({
+            error: 'Server busy',
+            message: 'Too many voice messages are being processed. Please try again shortly.'
+        });
+    }
+    if (error.code === 'LIMIT_FILE_SIZE') {
+        // The rest of the upload is not read; close the connection instead of draining it
+        res.set('Connection', 'close');
+        return res.status(413).json({
+            error: 'Audio too large',
+            message: `Recordings are limited to ${VOICE_UPLOAD_MAX_BYTES} bytes`
+        });
+    }
+    if (error.status === 400) {
+        return res.status(400).json({ error: 'Validation failed', message: error.message });
+    }
+    logger.error('Error processing voice message:', error);
+    res.status(500).json({
+        error: 'Voice processing error',
+        message: 'Failed to process voice message. Please try again.'
+    });
+};
+
+// Upload a voice message as binary audio, streamed straight to transcription.
+// The body is either the raw recording (Content-Type: audio/*) or a multipart
+// form with the recording in the "audio" field; conversationId and duration
+// go in the query string.
+router.post('/voice/upload', [
+    query('conversationId').isUUID().withMessage('Valid conversation ID required'),
+    query('duration').isInt({ min: 1 }).withMessage('Valid duration required')
+], async (req, res) => {
+    const errors = validationResult(req);
+    if (!errors.isEmpty()) {
+        return res.status(400).json({
+            error: 'Validation failed',
+            details: errors.array()
+        });
+    }
+
+    if (!isOpenAIAvailable()) {
+        return res.status(503).json({
+            error: 'AI service unavailable',
+            message: 'OpenAI service is currently not available'
+        });
+    }
+
+    const contentType = req.get('content-type');
+    const isMultipart = req.is('multipart/form-data');
+    if (!isMultipart && !isAudioType(contentType)) {
+        return res.status(415).json({
+            error: 'Unsupported media type',
+            message: 'Send the recording as audio/* or multipart/form-data'
+        });
+    }
+
+    // Refuse oversized uploads before reading any of them when the size is declared
+    const declaredBytes = parseInt(req.get('content-length'));
+    if (declaredBytes > VOICE_UPLOAD_MAX_BYTES + (isMultipart ? 64 * 1024 : 0)) {
+        return sendVoiceError(res, new UploadTooLargeError(VOICE_UPLOAD_MAX_BYTES));
+    }
+
+    // Stop the upstream upload if the client goes away mid-request
+    const controller = new AbortController();
+    res.on('close', () => controller.abort());
+
+    try {
+        let transcript;
+        let audioBytes;
+        if (isMultipart) {
+            const file = await parseVoiceForm(req, res, controller.signal);
+            if (!file) {
+                return res.status(400).json({ error: 'Validation failed', message: 'Audio file required in the "audio" field' });
+            }
+            ({ transcript, size: audioBytes } = file);
+        } else {
+            ({ text: transcript, bytes: audioBytes } = await transcribeStream(req, {
+                filename: audioFilename(contentType),
+                contentType,
+                maxBytes: VOICE_UPLOAD_MAX_BYTES,
+                signal: controller.signal
+            }));
+        }
+
+        await answerVoiceMessage(res, {
+            transcribedText: transcript,
+            conversationId: req.query.conversationId,
+            duration: parseInt(req.query.duration),
+            audioBytes
+        });
+    } catch (error) {
+        sendVoiceError(res, error);
+    }
+});
+
+// Process voice message sent as base64 JSON (kept for older clients; prefer /voice/upload)
+router.post('/voice', [
+    body('audioData').isString().withMessage('Audio data required'),
+    body('conversationId').isUUID().withMessage('Valid conversation ID required'),
+    body('duration').isInt({ min: 1 }).withMessage('Valid duration required')
+], async (req, res) => {
+    try {
+        const errors = validationResult(req);
+        if (!errors.isEmpty()) {
+            return res.status(400).json({
+                error: 'Validation failed',
+                details: errors.array()
             });
+        }
 
-        // Track API usage
-        await supabase
-            .from('api_usage')
-            .insert({
-                user_id: userId,
-                api_type: 'openai_voice',
-                tokens_used: tokensUsed,
-                cost_usd: cost,
-                request_count: 1,
-                success: true,
-                created_at: new Date().toISOString()
+        const { audioData, conversationId, duration } = req.body;
+
+        if (!isOpenAIAvailable()) {
+            return res.status(503).json({
+                error: 'AI service unavailable',
+                message: 'OpenAI service is currently not available'
             });
+        }
 
-        logger.info(`Voice message processed for user ${userId}, duration: ${duration}ms, tokens: ${tokensUsed}`);
+        // Decode on the CPU worker pool; a client that goes away cancels it
+        const controller = new AbortController();
+        res.on('close', () => controller.abort());
+        const audioBuffer = await decodeBase64(audioData, { signal: controller.signal });
 
-        res.json({
-            success: true,
-            transcribed_text: transcribedText,
-            response: aiResponse,
-            tokens_used: tokensUsed,
-            cost: cost
+        const { text: transcribedText } = await transcribeStream(Readable.from([audioBuffer]), {
+            maxBytes: VOICE_UPLOAD_MAX_BYTES
         });
 
-    } catch (error) {
-        logger.error('Error processing voice message:', error);
-        res.status(500).json({
-            error: 'Voice processing error',
-            message: 'Failed to process voice message. Please try again.'
+        await answerVoiceMessage(res, {
+            transcribedText,
+            conversationId,
+            duration,
+            audioBytes: audioBuffer.length
         });
+
+    } catch (error) {
+        sendVoiceError(res, error);
     }
 });
 
@@ -520,21 +824,8 @@ router.post('/web-search', [
         logger.info(`Performing web search for: "${query}"`);
         const webResults = await webSearchService.searchWeb(query, 5);
 
-        // Get detailed information from top results
-        const detailedResults = [];
-        for (const result of webResults.slice(0, 3)) {
-            try {
-                const detailedInfo = await webSearchService.getDetailedInfo(result.url);
-                if (detailedInfo) {
-                    detailedResults.push({
-                        ...result,
-                        detailedInfo
-                    });
-                }
-            } catch (error) {
-                logger.error(`Error getting detailed info for ${result.url}:`, error.message);
-            }
-        }
+        // Get detailed information from top results (concurrently, bounded by a deadline)
+        const detailedResults = await webSearchService.getDetailedInfoForResults(webResults.slice(0, 3));
 
         // Prepare context for AI
         const searchContext = webResults.map(result =>
@@ -602,23 +893,16 @@ ${detailedContext}`
         if (searchError) {
             logger.error('Error saving web search:', searchError);
         }
+        invalidateConversation(conversationId);
 
         // Track API usage
-        const { error: usageError } = await supabaseService
-            .from('api_usage')
-            .insert({
-                user_id: testUserId,
-                api_type: 'openai_chat', // Use existing type since web_search isn't in constraints
-                tokens_used: tokensUsed,
-                cost_usd: cost,
-                request_count: 1,
-                success: true,
-                created_at: new Date().toISOString()
-            });
-
-        if (usageError) {
-            logger.error('Error tracking web search usage:', usageError);
-        }
+        recordApiUsage({
+            user_id: testUserId,
+            api_type: 'openai_chat', // Use existing type since web_search isn't in constraints
+            tokens_used: tokensUsed,
+            cost_usd: cost,
+            success: true
+        });
 
         logger.info(`Web search completed for user ${testUserId}, query: "${query}", tokens: ${tokensUsed}, cost: $${cost}`);
 
@@ -637,19 +921,14 @@ ${detailedContext}`
 
         // Track failed API usage
         try {
-            const supabaseService = getSupabaseService();
-            await supabaseService
-                .from('api_usage')
-                .insert({
-                    user_id: getTestUserId(),
-                    api_type: 'openai_chat', // Use existing type
-                    tokens_used: 0,
-                    cost_usd: 0,
-                    request_count: 1,
-                    success: false,
-                    error_message: error.message,
-                    created_at: new Date().toISOString()
-                });
+            recordApiUsage({
+                user_id: getTestUserId(),
+                api_type: 'openai_chat', // Use existing type
+                tokens_used: 0,
+                cost_usd: 0,
+                success: false,
+                error_message: error.message
+            });
         } catch (trackingError) {
             logger.error('Error tracking failed web search usage:', trackingError);
         }
@@ -693,11 +972,15 @@ router.post('/pricing-search', [
         // Perform specialized pricing search
         logger.info(`Performing pricing search for: "${query}"`);
         const pricingResults = await webSearchService.searchForPricing(query);
+        const detailedResults = await webSearchService.getDetailedInfoForResults(pricingResults);
+        const detailsByUrl = new Map(detailedResults.map(result => [result.url, result.detailedInfo]));
 
         // Prepare context for AI
-        const pricingContext = pricingResults.map(result =>
-            `Title: ${result.title}\nURL: ${result.url}\nSnippet: ${result.snippet}\nSource: ${result.source}`
-        ).join('\n\n');
+        const pricingContext = pricingResults.map(result => {
+            const details = detailsByUrl.get(result.url);
+            return `Title: ${result.title}\nURL: ${result.url}\nSnippet: ${result.snippet}\nSource: ${result.source}` +
+                (details ? `\nDetails: ${details.content.substring(0, 500)}` : '');
+        }).join('\n\n');
 
         const completion = await openai.chat.completions.create({
             model: 'gpt-4o',
@@ -753,23 +1036,16 @@ ${pricingContext}`
         if (searchError) {
             logger.error('Error saving pricing search:', searchError);
         }
+        invalidateConversation(conversationId);
 
         // Track API usage
-        const { error: usageError } = await supabaseService
-            .from('api_usage')
-            .insert({
-                user_id: testUserId,
-                api_type: 'openai_chat',
-                tokens_used: tokensUsed,
-                cost_usd: cost,
-                request_count: 1,
-                success: true,
-                created_at: new Date().toISOString()
-            });
-
-        if (usageError) {
-            logger.error('Error tracking pricing search usage:', usageError);
-        }
+        recordApiUsage({
+            user_id: testUserId,
+            api_type: 'openai_chat',
+            tokens_used: tokensUsed,
+            cost_usd: cost,
+            success: true
+        });
 
         logger.info(`Pricing search completed for user ${testUserId}, query: "${query}", tokens: ${tokensUsed}, cost: $${cost}`);
 
@@ -793,9 +1069,27 @@ ${pricingContext}`
     }
 });
 
-// Simple rate limiter for link preview
+// Simple rate limiter for link preview: max 20 previews per minute per IP
+const LINK_PREVIEW_LIMIT = 20;
 const linkPreviewRequests = new Map();
 
+// Record `count` previews for a client; false when that would exceed the limit
+function allowLinkPreviews(clientIP, count) {
+    const now = Date.now();
+    const recentRequests = (linkPreviewRequests.get(clientIP) || []).filter(time => now - time < 60000); // Last minute
+
+    if (recentRequests.length + count > LINK_PREVIEW_LIMIT) {
+        linkPreviewRequests.set(clientIP, recentRequests);
+        return false;
+    }
+
+    for (let i = 0; i < count; i++) {
+        recentRequests.push(now);
+    }
+    linkPreviewRequests.set(clientIP, recentRequests);
+    return true;
+}
+
 // Link preview endpoint
 router.post('/link-preview', [
     body('url').trim().isURL().withMessage('Valid URL required')
@@ -810,28 +1104,13 @@ router.post('/link-preview', [
         }
 
         const { url } = req.body;
-        const clientIP = req.ip || 'unknown';
-        const now = Date.now();
 
-        // Simple rate limiting: max 20 requests per minute per IP (more generous for multiple links)
-        const clientRequests = linkPreviewRequests.get(clientIP) || [];
-        const recentRequests = clientRequests.filter(time => now - time < 60000); // Last minute
-
-        if (recentRequests.length >= 20) {
+        if (!allowLinkPreviews(req.ip || 'unknown', 1)) {
             return res.status(429).json({
                 error: 'Rate limit exceeded. Please wait before making more requests.'
             });
         }
 
-        // Add current request
-        recentRequests.push(now);
-        linkPreviewRequests.set(clientIP, recentRequests);
-
-        // Clean up old entries
-        if (recentRequests.length > 10) {
-            linkPreviewRequests.set(clientIP, recentRequests.slice(-5));
-        }
-
         const preview = await getLinkPreview(url);
         res.json({ success: true, preview });
     } catch (error) {
@@ -840,4 +1119,34 @@ router.post('/link-preview', [
     }
 });
 
+// Batch link previews: all links of a message in one request, fetched in parallel
+router.post('/link-previews', [
+    body('urls').isArray({ min: 1, max: 10 }).withMessage('Between 1 and 10 URLs required'),
+    body('urls.*').trim().isURL().withMessage('Valid URLs required')
+], async (req, res) => {
+    try {
+        const errors = validationResult(req);
+        if (!errors.isEmpty()) {
+            return res.status(400).json({
+                error: 'Validation failed',
+                details: errors.array()
+            });
+        }
+
+        const urls = [...new Set(req.body.urls)];
+
+        if (!allowLinkPreviews(req.ip || 'unknown', urls.length)) {
+            return res.status(429).json({
+                error: 'Rate limit exceeded. Please wait before making more requests.'
+            });
+        }
+
+        const previews = await getLinkPreviews(urls);
+        res.json({ success: true, previews });
+    } catch (error) {
+        logger.error('Error generating link previews:', error);
+        res.status(500).json({ error: 'Failed to generate link previews' });
+    }
+});
+
 module.exports = router;
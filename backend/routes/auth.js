@@ -5,6 +5,8 @@ const jwt = require('jsonwebtoken');
 const { createClient } = require('@supabase/supabase-js');
 const { v4: uuidv4 } = require('uuid');
 const logger = require('../utils/logger');
+const { supabaseFetch } = require('../config/supabase');
+const { invalidateToken, invalidateUser } = require('../middleware/auth');
 
 const router = express.Router();
 
@@ -562,7 +564,8 @@ const supabase = createClient(
         auth: {
             autoRefreshToken: false,
             persistSession: false
-        }
+        },
+        global: { fetch: supabaseFetch }
     }
 );
 
@@ -1012,6 +1015,9 @@ router.put('/profile', [
             return res.status(500).json({ error: 'Failed to update profile' });
         }
 
+        // The cached identity carries the role, so drop it
+        invalidateUser(user.id);
+
         logger.info(`Profile updated for user: ${user.email}`);
 
         res.json({
@@ -1086,6 +1092,8 @@ router.post('/change-password', [
             return res.status(500).json({ error: 'Failed to change password' });
         }
 
+        invalidateUser(user.id);
+
         logger.info(`Password changed for user: ${user.email}`);
 
         res.json({
@@ -1108,8 +1116,9 @@ router.post('/logout', async (req, res) => {
         const token = req.headers.authorization?.replace('Bearer ', '');
 
         if (token) {
-            // Optionally blacklist the token or track logout
-            // For now, we'll just log it
+            // Forget the cached identity so the token is checked with Supabase again
+            invalidateToken(token);
+
             const decoded = jwt.verify(token, process.env.JWT_SECRET || 'your-secret-key');
             logger.info(`User logged out: ${decoded.email}`);
         }
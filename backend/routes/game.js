@@ -2,6 +2,7 @@ const express = require('express');
 const { body, validationResult } = require('express-validator');
 const { getSupabase } = require('../config/supabase');
 const logger = require('../utils/logger');
+const { recordEquipmentInteraction } = require('../services/telemetry');
 
 const router = express.Router();
 
@@ -182,65 +183,18 @@ router.post('/progress', [
 
         const supabase = getSupabase();
 
-        // Get existing progress
-        const { data: existingProgress, error: fetchError } = await supabase
-            .from('user_progress')
-            .select('*')
-            .eq('user_id', userId)
-            .eq('level_id', levelId)
-            .single();
-
-        let progressData = {
-            user_id: userId,
-            level_id: levelId,
-            completed,
-            score,
-            time_spent: timeSpent,
-            attempts: existingProgress ? existingProgress.attempts + 1 : attempts,
-            updated_at: new Date().toISOString()
-        };
-
-        if (completed) {
-            progressData.completed_at = new Date().toISOString();
-
-            // Update best score and fastest time
-            if (!existingProgress || score > existingProgress.best_score) {
-                progressData.best_score = score;
-            } else {
-                progressData.best_score = existingProgress.best_score;
-            }
-
-            if (!existingProgress || timeSpent < existingProgress.fastest_time || existingProgress.fastest_time === 0) {
-                progressData.fastest_time = timeSpent;
-            } else {
-                progressData.fastest_time = existingProgress.fastest_time;
-            }
-        }
-
-        let result;
-        if (existingProgress) {
-            // Update existing progress
-            const { data, error } = await supabase
-                .from('user_progress')
-                .update(progressData)
-                .eq('id', existingProgress.id)
-                .select()
-                .single();
-
-            result = { data, error };
-        } else {
-            // Create new progress
-            const { data, error } = await supabase
-                .from('user_progress')
-                .insert(progressData)
-                .select()
-                .single();
-
-            result = { data, error };
-        }
+        // Insert or merge in one atomic statement (database/upsert_user_progress.sql)
+        const { data: progress, error } = await supabase.rpc('upsert_user_progress', {
+            p_user_id: userId,
+            p_level_id: levelId,
+            p_completed: completed,
+            p_score: score,
+            p_time_spent: timeSpent,
+            p_attempts: attempts
+        });
 
-        if (result.error) {
-            logger.error('Error saving progress:', result.error);
+        if (error) {
+            logger.error('Error saving progress:', error);
             return res.status(500).json({ error: 'Failed to save progress' });
         }
 
@@ -248,7 +202,7 @@ router.post('/progress', [
         res.json({
             success: true,
             message: 'Progress saved successfully',
-            progress: result.data
+            progress
         });
 
     } catch (error) {
@@ -350,26 +304,26 @@ router.post('/equipment/interaction', [
             return res.status(500).json({ error: 'No active game session found' });
         }
 
-        // Record interaction
-        const { error } = await supabase
-            .from('equipment_interactions')
-            .insert({
-                user_id: userId,
-                session_id: session.id,
-                equipment_type: equipmentType,
-                equipment_name: equipmentName,
-                interaction_type: interactionType,
-                interaction_data: interactionData || {},
-                created_at: new Date().toISOString()
-            });
+        // Queue the interaction; it is written in the next bulk insert
+        const queued = recordEquipmentInteraction({
+            user_id: userId,
+            session_id: session.id,
+            equipment_type: equipmentType,
+            equipment_name: equipmentName,
+            interaction_type: interactionType,
+            interaction_data: interactionData || {}
+        });
 
-        if (error) {
-            logger.error('Error recording equipment interaction:', error);
-            return res.status(500).json({ error: 'Failed to record interaction' });
+        if (!queued) {
+            res.set('Retry-After', '1');
+            return res.status(503).json({
+                error: 'Interaction queue full',
+                message: 'Too many interactions are waiting to be recorded. Please retry shortly.'
+            });
         }
 
-        logger.info(`Equipment interaction recorded: ${equipmentName} (${interactionType}) for user ${userId}`);
-        res.json({
+        logger.debug(`Equipment interaction queued: ${equipmentName} (${interactionType}) for user ${userId}`);
+        res.status(202).json({
             success: true,
             message: 'Interaction recorded successfully'
         });
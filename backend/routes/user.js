@@ -1,5 +1,6 @@
+const crypto = require('crypto');
 const express = require('express');
-const { body, validationResult } = require('express-validator');
+const { body, query, validationResult } = require('express-validator');
 const { getSupabase } = require('../config/supabase');
 const logger = require('../utils/logger');
 
@@ -236,60 +237,99 @@ router.post('/achievements', [
     }
 });
 
-// Get API usage statistics
-router.get('/api-usage', async (req, res) => {
+// Get API usage, summed per day or week. Totals come from the daily rollup
+// (database/api_usage_rollup.sql), so the work and the response are bounded by
+// the range, not by how many requests the user has made.
+const MAX_USAGE_RANGE_DAYS = 366;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const toDateString = (date) => date.toISOString().slice(0, 10);
+
+router.get('/api-usage', [
+    query('days').optional().isInt({ min: 1, max: MAX_USAGE_RANGE_DAYS }).withMessage(`days must be between 1 and ${MAX_USAGE_RANGE_DAYS}`),
+    query('from').optional().isISO8601({ strict: true }).withMessage('from must be a date (YYYY-MM-DD)'),
+    query('to').optional().isISO8601({ strict: true }).withMessage('to must be a date (YYYY-MM-DD)'),
+    query('bucket').optional().isIn(['day', 'week']).withMessage('bucket must be day or week')
+], async (req, res) => {
     try {
+        const errors = validationResult(req);
+        if (!errors.isEmpty()) {
+            return res.status(400).json({
+                error: 'Validation failed',
+                details: errors.array()
+            });
+        }
+
         const userId = req.user.id;
-        const { days = 30 } = req.query;
+        const { days = 30, bucket = 'day' } = req.query;
 
-        const supabase = getSupabase();
+        // Range in UTC days, inclusive: from/to when given, otherwise the last `days` days
+        const to = req.query.to ? new Date(req.query.to) : new Date();
+        const from = req.query.from ? new Date(req.query.from) : new Date(to.getTime() - (parseInt(days) - 1) * DAY_MS);
+        const rangeDays = Math.floor((Date.parse(toDateString(to)) - Date.parse(toDateString(from))) / DAY_MS) + 1;
+        if (rangeDays < 1 || rangeDays > MAX_USAGE_RANGE_DAYS) {
+            return res.status(400).json({
+                error: 'Validation failed',
+                message: `The range must cover 1 to ${MAX_USAGE_RANGE_DAYS} days`
+            });
+        }
 
-        // Calculate date range
-        const endDate = new Date();
-        const startDate = new Date();
-        startDate.setDate(startDate.getDate() - parseInt(days));
+        const supabase = getSupabase();
 
-        const { data: usage, error } = await supabase
-            .from('api_usage')
-            .select('*')
-            .eq('user_id', userId)
-            .gte('created_at', startDate.toISOString())
-            .lte('created_at', endDate.toISOString())
-            .order('created_at', { ascending: false });
+        const { data: rows, error } = await supabase.rpc('get_api_usage', {
+            p_user_id: userId,
+            p_start: toDateString(from),
+            p_end: toDateString(to),
+            p_bucket: bucket
+        });
 
         if (error) {
             logger.error('Error fetching API usage:', error);
             return res.status(500).json({ error: 'Failed to fetch API usage' });
         }
 
-        // Calculate statistics
+        // At most one row per bucket and API type
         const stats = {
-            total_requests: usage.length,
-            successful_requests: usage.filter(u => u.success).length,
-            failed_requests: usage.filter(u => !u.success).length,
-            total_tokens: usage.reduce((sum, u) => sum + (u.tokens_used || 0), 0),
-            total_cost: usage.reduce((sum, u) => sum + parseFloat(u.cost_usd || 0), 0),
+            total_requests: 0,
+            successful_requests: 0,
+            failed_requests: 0,
+            total_tokens: 0,
+            total_cost: 0,
             by_type: {}
         };
+        const buckets = new Map();
 
-        // Group by API type
-        usage.forEach(u => {
-            if (!stats.by_type[u.api_type]) {
-                stats.by_type[u.api_type] = {
-                    requests: 0,
-                    tokens: 0,
-                    cost: 0
-                };
+        rows.forEach(row => {
+            const requests = Number(row.requests);
+            const tokens = Number(row.tokens);
+            const cost = parseFloat(row.cost_usd || 0);
+
+            stats.total_requests += requests;
+            stats.successful_requests += Number(row.successful_requests);
+            stats.total_tokens += tokens;
+            stats.total_cost += cost;
+
+            const byType = stats.by_type[row.api_type] ||= { requests: 0, tokens: 0, cost: 0 };
+            byType.requests += requests;
+            byType.tokens += tokens;
+            byType.cost += cost;
+
+            if (!buckets.has(row.bucket_start)) {
+                buckets.set(row.bucket_start, { start: row.bucket_start, requests: 0, tokens: 0, cost: 0, by_type: {} });
             }
-            stats.by_type[u.api_type].requests++;
-            stats.by_type[u.api_type].tokens += u.tokens_used || 0;
-            stats.by_type[u.api_type].cost += parseFloat(u.cost_usd || 0);
+            const entry = buckets.get(row.bucket_start);
+            entry.requests += requests;
+            entry.tokens += tokens;
+            entry.cost += cost;
+            entry.by_type[row.api_type] = { requests, tokens, cost };
         });
+        stats.failed_requests = stats.total_requests - stats.successful_requests;
 
         res.json({
             success: true,
+            range: { from: toDateString(from), to: toDateString(to), bucket },
             usage_stats: stats,
-            usage_data: usage
+            buckets: [...buckets.values()]
         });
 
     } catch (error) {
@@ -305,40 +345,25 @@ router.get('/stats', async (req, res) => {
 
         const supabase = getSupabase();
 
-        // Get various statistics
-        const [
-            progressResult,
-            sessionsResult,
-            achievementsResult,
-            conversationsResult
-        ] = await Promise.all([
-            supabase.from('user_progress').select('*').eq('user_id', userId),
-            supabase.from('game_sessions').select('*').eq('user_id', userId),
-            supabase.from('user_achievements').select('*').eq('user_id', userId),
-            supabase.from('ai_conversations').select('*').eq('user_id', userId)
-        ]);
-
-        if (progressResult.error || sessionsResult.error || achievementsResult.error || conversationsResult.error) {
-            logger.error('Error fetching user statistics:', {
-                progress: progressResult.error,
-                sessions: sessionsResult.error,
-                achievements: achievementsResult.error,
-                conversations: conversationsResult.error
-            });
+        // Totals are aggregated in the database (database/get_user_stats.sql)
+        const { data: stats, error } = await supabase
+            .rpc('get_user_stats', { p_user_id: userId })
+            .single();
+
+        if (error) {
+            logger.error('Error fetching user statistics:', error);
             return res.status(500).json({ error: 'Failed to fetch user statistics' });
         }
 
-        const stats = {
-            total_levels_completed: progressResult.data.filter(p => p.completed).length,
-            total_levels_attempted: progressResult.data.length,
-            total_game_sessions: sessionsResult.data.length,
-            total_achievements: achievementsResult.data.length,
-            total_ai_conversations: conversationsResult.data.length,
-            average_score: progressResult.data.length > 0
-                ? progressResult.data.reduce((sum, p) => sum + p.score, 0) / progressResult.data.length
-                : 0,
-            total_time_spent: progressResult.data.reduce((sum, p) => sum + p.time_spent, 0)
-        };
+        // Unchanged stats are answered with 304 before the response body is built
+        const etag = `W/"${crypto.createHash('sha1').update(JSON.stringify(stats)).digest('base64url')}"`;
+        res.set({
+            'ETag': etag,
+            'Cache-Control': 'private, no-cache'
+        });
+        if (req.fresh) {
+            return res.status(304).end();
+        }
 
         res.json({
             success: true,
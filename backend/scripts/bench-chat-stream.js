@@ -0,0 +1,122 @@
+#!/usr/bin/env node
+// Time-to-first-token benchmark for POST /api/ai/chat: buffered JSON vs.
+// streamed server-sent events.
+//
+// For the buffered mode the first token arrives with the whole response, so
+// its time-to-first-token equals its total time. For the streamed mode it is
+// the time until the first "token" event.
+//
+// Every round asks the same question, so with the response cache on
+// (AI_CACHE_ENABLED) all but the first answer come from the cache. Set
+// AI_CACHE_ENABLED=false on the backend to measure OpenAI itself.
+//
+// Run the backend against the mock for repeatable numbers:
+//   node scripts/mock-openai.js &
+//   OPENAI_BASE_URL=http://localhost:4010/v1 npm start
+//   node scripts/bench-chat-stream.js [--rounds 10] [--url http://localhost:3001]
+
+const argValue = (name, fallback) => {
+    const index = process.argv.indexOf(name);
+    return index !== -1 ? process.argv[index + 1] : fallback;
+};
+
+const ROUNDS = parseInt(argValue('--rounds', '10'), 10);
+const BASE_URL = argValue('--url', process.env.BENCH_URL || 'http://localhost:3001');
+const MESSAGE = 'How do I connect a wireless microphone to the mixer?';
+
+async function startConversation() {
+    const response = await fetch(`${BASE_URL}/api/ai/conversation/start`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({})
+    });
+    if (!response.ok) {
+        throw new Error(`conversation/start: ${response.status} ${await response.text()}`);
+    }
+    return (await response.json()).conversation_id;
+}
+
+const postChat = (conversationId, stream) => fetch(`${BASE_URL}/api/ai/chat`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ message: MESSAGE, conversationId, stream })
+});
+
+async function buffered(conversationId) {
+    const startedAt = performance.now();
+    const response = await postChat(conversationId, false);
+    const data = await response.json();
+    if (!response.ok) {
+        throw new Error(`chat: ${response.status} ${JSON.stringify(data)}`);
+    }
+    const total = performance.now() - startedAt;
+    return { ttft: total, total, chars: data.response.length, cached: !!data.cached };
+}
+
+async function streamed(conversationId) {
+    const startedAt = performance.now();
+    const response = await postChat(conversationId, true);
+    if (!response.ok) {
+        throw new Error(`chat: ${response.status} ${await response.text()}`);
+    }
+
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let ttft = null;
+    let chars = 0;
+    let cached = false;
+
+    for await (const bytes of response.body) {
+        buffer += decoder.decode(bytes, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const frame = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            const event = /^event: (.*)$/m.exec(frame)?.[1];
+            const data = /^data: (.*)$/m.exec(frame)?.[1];
+            if (event === 'token') {
+                ttft ??= performance.now() - startedAt;
+                chars += JSON.parse(data).content.length;
+            } else if (event === 'done') {
+                cached = !!JSON.parse(data).cached;
+            } else if (event === 'error') {
+                throw new Error(`stream error: ${data}`);
+            }
+        }
+    }
+
+    return { ttft, total: performance.now() - startedAt, chars, cached };
+}
+
+const percentile = (values, pct) => {
+    const sorted = [...values].sort((a, b) => a - b);
+    return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * pct / 100))];
+};
+
+async function main() {
+    const conversationId = await startConversation();
+    const results = { buffered: [], streamed: [] };
+
+    console.log(`POST /api/ai/chat at ${BASE_URL}: ${ROUNDS} rounds per mode\n`);
+    for (let round = 0; round < ROUNDS; round++) {
+        // Alternate so both modes see the same server state
+        results.buffered.push(await buffered(conversationId));
+        results.streamed.push(await streamed(conversationId));
+    }
+
+    console.log('mode      ttft p50  ttft p95  total p50  total p95  (ms)  cached');
+    for (const [mode, runs] of Object.entries(results)) {
+        const ttft = runs.map(run => run.ttft);
+        const total = runs.map(run => run.total);
+        const cached = runs.filter(run => run.cached).length;
+        console.log(`${mode.padEnd(9)} ${percentile(ttft, 50).toFixed(0).padStart(8)}  ${percentile(ttft, 95).toFixed(0).padStart(8)}  ${percentile(total, 50).toFixed(0).padStart(9)}  ${percentile(total, 95).toFixed(0).padStart(9)}  ${String(cached).padStart(10)}/${runs.length}`);
+    }
+
+    const speedup = percentile(results.buffered.map(r => r.ttft), 50) / percentile(results.streamed.map(r => r.ttft), 50);
+    console.log(`\nTime to first token (p50): ${speedup.toFixed(1)}x faster when streamed`);
+}
+
+main().catch(error => {
+    console.error('Benchmark failed:', error);
+    process.exit(1);
+});
@@ -0,0 +1,76 @@
+#!/usr/bin/env node
+// Event loop delay while HTML extraction runs inline vs. on the CPU worker
+// pool (services/cpuTasks.js).
+//
+// Simulates heavy AI traffic: --concurrency extractions of a ~350KB page are
+// kept in flight for --duration seconds. The event loop delay histogram is
+// what a game API request arriving at the same time would wait before
+// being handled.
+//
+// Usage: node scripts/bench-event-loop.js [--duration 5] [--concurrency 8] [--pool-size 2]
+
+const os = require('os');
+const path = require('path');
+const { monitorEventLoopDelay } = require('perf_hooks');
+const { WorkerPool } = require('../utils/workerPool');
+const { extractPageContent } = require('../services/htmlExtract');
+
+const argValue = (name, fallback) => {
+    const index = process.argv.indexOf(name);
+    return index !== -1 ? parseFloat(process.argv[index + 1]) : fallback;
+};
+
+const DURATION_MS = argValue('--duration', 5) * 1000;
+const CONCURRENCY = argValue('--concurrency', 8);
+const POOL_SIZE = argValue('--pool-size', Math.max(1, Math.min(4, os.availableParallelism() - 1)));
+
+// A product page as the search routes see it: head, scripts, nested markup
+const buildPage = () => {
+    const paragraphs = Array.from({ length: 1500 }, (_, i) =>
+        `<div class="spec"><span>Channel ${i}</span> <a href="/p/${i}">XLR &amp; TRS input</a>` +
+        `<!-- row ${i} --><script>track(${i})</script></div>`).join('\n');
+    return `<html><head><title>Mixer X32</title><meta property="og:description" content="Digital mixer"></head>` +
+        `<body><style>.spec{color:red}</style>${paragraphs}</body></html>`;
+};
+
+async function measure(label, extract) {
+    const page = buildPage();
+    const histogram = monitorEventLoopDelay({ resolution: 1 });
+    const deadline = Date.now() + DURATION_MS;
+    let completed = 0;
+
+    histogram.enable();
+    await Promise.all(Array.from({ length: CONCURRENCY }, async (_, i) => {
+        while (Date.now() < deadline) {
+            await extract(page, `https://example.com/product/${i}`);
+            completed++;
+            // Let timers and I/O run between extractions, as they would between requests
+            await new Promise(resolve => setImmediate(resolve));
+        }
+    }));
+    histogram.disable();
+
+    const ms = (ns) => (ns / 1e6).toFixed(1);
+    console.log(`${label.padEnd(16)} ${String(completed).padStart(7)}  ${ms(histogram.percentile(50)).padStart(8)}  ${ms(histogram.percentile(99)).padStart(8)}  ${ms(histogram.max).padStart(8)}`);
+}
+
+async function main() {
+    console.log(`${CONCURRENCY} concurrent extractions of a ${(buildPage().length / 1024).toFixed(0)}KB page for ${DURATION_MS / 1000}s, ${os.availableParallelism()} cores\n`);
+    console.log('mode             extracted  p50 (ms)  p99 (ms)  max (ms)   event loop delay');
+
+    await measure('inline', async (html, url) => extractPageContent(html, url));
+
+    const pool = new WorkerPool({
+        filename: path.join(__dirname, '..', 'workers', 'cpuWorker.js'),
+        size: POOL_SIZE,
+        timeoutMs: 10000
+    });
+    await measure(`pool (${POOL_SIZE} threads)`, (html, url) => pool.run('extractPageContent', [html, url]));
+    console.log('\npool stats:', pool.stats());
+    await pool.close();
+}
+
+main().catch(error => {
+    console.error('Benchmark failed:', error);
+    process.exit(1);
+});
@@ -0,0 +1,168 @@
+#!/usr/bin/env node
+// Throughput of the clustered backend (cluster.js) by worker count.
+//
+// For each count in --workers the script starts `node cluster.js` with
+// CLUSTER_WORKERS set, waits until that many workers answer, then keeps
+// --connections keep-alive requests in flight against --path for --duration
+// seconds from --client-processes load generator processes. Requests/second
+// should grow with the worker count up to the number of free cores (the load
+// generators need cores too).
+//
+// --rolling-restart sends SIGHUP halfway through each run; a zero-downtime
+// restart shows no failed requests.
+//
+// /health is the default target: it is outside /api/, so the rate limiter
+// does not throttle the test.
+//
+// Usage: node scripts/loadtest-cluster.js [--workers 1,2,4] [--duration 10]
+//        [--connections 64] [--client-processes 2] [--path /health] [--port 3101]
+//        [--rolling-restart]
+
+const { spawn, fork } = require('child_process');
+const http = require('http');
+const os = require('os');
+const path = require('path');
+
+const argValue = (name, fallback) => {
+    const index = process.argv.indexOf(name);
+    return index !== -1 ? process.argv[index + 1] : fallback;
+};
+
+const DURATION_MS = parseFloat(argValue('--duration', '10')) * 1000;
+const CONNECTIONS = parseInt(argValue('--connections', '64'), 10);
+const CLIENT_PROCESSES = parseInt(argValue('--client-processes', String(Math.max(1, Math.floor(os.availableParallelism() / 4)))), 10);
+const TARGET_PATH = argValue('--path', '/health');
+const PORT = parseInt(argValue('--port', '3101'), 10);
+const ROLLING_RESTART = process.argv.includes('--rolling-restart');
+const WORKER_COUNTS = argValue('--workers', [...new Set([1, 2, 4, os.availableParallelism()])].filter(n => n <= os.availableParallelism()).join(','))
+    .split(',')
+    .map(n => parseInt(n, 10));
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Load generator: runs in a child process, reports { requests, failures, latencies }
+async function generateLoad({ port, connections, durationMs, targetPath }) {
+    const agent = new http.Agent({ keepAlive: true, maxSockets: connections });
+    const deadline = Date.now() + durationMs;
+    const latencies = [];
+    let requests = 0;
+    let failures = 0;
+
+    const get = () => new Promise((resolve) => {
+        const startedAt = performance.now();
+        http.get({ host: '127.0.0.1', port, path: targetPath, agent }, (res) => {
+            res.resume();
+            res.on('end', () => {
+                if (res.statusCode === 200) {
+                    requests++;
+                    // Keep a sample, not every latency
+                    if (requests % 10 === 0) latencies.push(performance.now() - startedAt);
+                } else {
+                    failures++;
+                }
+                resolve();
+            });
+        }).on('error', () => {
+            failures++;
+            resolve();
+        });
+    });
+
+    await Promise.all(Array.from({ length: connections }, async () => {
+        while (Date.now() < deadline) {
+            await get();
+        }
+    }));
+    agent.destroy();
+    return { requests, failures, latencies };
+}
+
+if (process.argv[2] === '--client') {
+    process.once('message', async (options) => {
+        process.send(await generateLoad(options));
+        process.exit(0);
+    });
+    return;
+}
+
+const healthPid = () => new Promise((resolve) => {
+    http.get({ host: '127.0.0.1', port: PORT, path: '/health', agent: false }, (res) => {
+        let body = '';
+        res.on('data', chunk => { body += chunk; });
+        res.on('end', () => {
+            try {
+                resolve(JSON.parse(body).pid);
+            } catch {
+                resolve(null);
+            }
+        });
+    }).on('error', () => resolve(null));
+});
+
+async function startCluster(workers) {
+    const primary = spawn(process.execPath, [path.join(__dirname, '..', 'cluster.js')], {
+        env: { ...process.env, CLUSTER_WORKERS: String(workers), PORT: String(PORT) },
+        stdio: 'ignore'
+    });
+
+    // Ready once every worker has answered (connections are spread round-robin)
+    const pids = new Set();
+    const giveUpAt = Date.now() + 60000;
+    while (pids.size < workers) {
+        if (Date.now() > giveUpAt || primary.exitCode !== null) {
+            primary.kill('SIGKILL');
+            throw new Error(`cluster with ${workers} workers did not come up (${pids.size} answering)`);
+        }
+        const pid = await healthPid();
+        if (pid) pids.add(pid); else await sleep(200);
+    }
+    return primary;
+}
+
+const stopCluster = (primary) => new Promise((resolve) => {
+    primary.once('exit', resolve);
+    primary.kill('SIGTERM');
+});
+
+async function run(workers) {
+    const primary = await startCluster(workers);
+    const perClient = Math.max(1, Math.floor(CONNECTIONS / CLIENT_PROCESSES));
+
+    if (ROLLING_RESTART) {
+        setTimeout(() => primary.kill('SIGHUP'), DURATION_MS / 2);
+    }
+
+    const startedAt = Date.now();
+    const results = await Promise.all(Array.from({ length: CLIENT_PROCESSES }, () => new Promise((resolve, reject) => {
+        const client = fork(__filename, ['--client']);
+        client.once('message', resolve);
+        client.once('error', reject);
+        client.send({ port: PORT, connections: perClient, durationMs: DURATION_MS, targetPath: TARGET_PATH });
+    })));
+    const elapsedS = (Date.now() - startedAt) / 1000;
+
+    await stopCluster(primary);
+
+    const requests = results.reduce((sum, r) => sum + r.requests, 0);
+    const failures = results.reduce((sum, r) => sum + r.failures, 0);
+    const latencies = results.flatMap(r => r.latencies).sort((a, b) => a - b);
+    const pct = (p) => latencies[Math.min(latencies.length - 1, Math.floor(latencies.length * p / 100))] || 0;
+    return { workers, rps: requests / elapsedS, p50: pct(50), p99: pct(99), failures };
+}
+
+async function main() {
+    console.log(`GET ${TARGET_PATH}: ${CONNECTIONS} connections from ${CLIENT_PROCESSES} processes, ${DURATION_MS / 1000}s per run, ${os.availableParallelism()} cores${ROLLING_RESTART ? ', rolling restart mid-run' : ''}\n`);
+    console.log('workers   req/s  speedup  p50 (ms)  p99 (ms)  failed');
+
+    let baseline = null;
+    for (const workers of WORKER_COUNTS) {
+        const result = await run(workers);
+        baseline ??= result.rps;
+        console.log(`${String(workers).padStart(7)}  ${result.rps.toFixed(0).padStart(6)}  ${(result.rps / baseline).toFixed(2).padStart(6)}x  ${result.p50.toFixed(1).padStart(8)}  ${result.p99.toFixed(1).padStart(8)}  ${String(result.failures).padStart(6)}`);
+    }
+}
+
+main().catch(error => {
+    console.error('Load test failed:', error);
+    process.exit(1);
+});
@@ -0,0 +1,193 @@
+#!/usr/bin/env node
+// Load test for saving level progress: the old select-then-write handler vs.
+// the upsert_user_progress RPC (database/upsert_user_progress.sql).
+//
+// 1. Latency: --requests saves spread over distinct levels, --concurrency at a
+//    time, timed per save (p50/p95/p99).
+// 2. Lost updates: --concurrency completions of the same level fired at once.
+//    Afterwards attempts must equal the number of saves, best_score the highest
+//    score and fastest_time the lowest time.
+//
+// Talks to Supabase directly with the service role key. Rows are written for
+// LOADTEST_USER_ID (an existing users.id) under level ids "loadtest-*", and
+// removed again at the end.
+//
+// Usage: node scripts/loadtest-progress.js [--requests 400] [--concurrency 20]
+
+require('dotenv').config();
+const { createClient } = require('@supabase/supabase-js');
+
+const argValue = (name, fallback) => {
+    const index = process.argv.indexOf(name);
+    return index !== -1 ? parseInt(process.argv[index + 1], 10) : fallback;
+};
+
+const REQUESTS = argValue('--requests', 400);
+const CONCURRENCY = argValue('--concurrency', 20);
+const USER_ID = process.env.LOADTEST_USER_ID;
+const LEVEL_PREFIX = 'loadtest-';
+
+const supabase = createClient(process.env.SUPABASE_URL, process.env.SUPABASE_SERVICE_ROLE_KEY, {
+    auth: { autoRefreshToken: false, persistSession: false }
+});
+
+// The previous POST /progress implementation: two sequential round trips
+async function saveLegacy({ levelId, completed, score, timeSpent, attempts = 1 }) {
+    const { data: existingProgress } = await supabase
+        .from('user_progress')
+        .select('*')
+        .eq('user_id', USER_ID)
+        .eq('level_id', levelId)
+        .maybeSingle();
+
+    const progressData = {
+        user_id: USER_ID,
+        level_id: levelId,
+        completed,
+        score,
+        time_spent: timeSpent,
+        attempts: existingProgress ? existingProgress.attempts + 1 : attempts,
+        updated_at: new Date().toISOString()
+    };
+
+    if (completed) {
+        progressData.completed_at = new Date().toISOString();
+        progressData.best_score = !existingProgress || score > existingProgress.best_score
+            ? score : existingProgress.best_score;
+        progressData.fastest_time = !existingProgress || timeSpent < existingProgress.fastest_time || existingProgress.fastest_time === 0
+            ? timeSpent : existingProgress.fastest_time;
+    }
+
+    const query = existingProgress
+        ? supabase.from('user_progress').update(progressData).eq('id', existingProgress.id)
+        : supabase.from('user_progress').insert(progressData);
+    const { error } = await query.select().single();
+    return error;
+}
+
+// The new implementation: one atomic RPC
+async function saveUpsert({ levelId, completed, score, timeSpent, attempts = 1 }) {
+    const { error } = await supabase.rpc('upsert_user_progress', {
+        p_user_id: USER_ID,
+        p_level_id: levelId,
+        p_completed: completed,
+        p_score: score,
+        p_time_spent: timeSpent,
+        p_attempts: attempts
+    });
+    return error;
+}
+
+async function cleanup() {
+    await supabase.from('user_progress').delete().eq('user_id', USER_ID).like('level_id', `${LEVEL_PREFIX}%`);
+}
+
+function percentile(sorted, pct) {
+    return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * pct / 100))];
+}
+
+async function runPool(total, concurrency, task) {
+    let next = 0;
+    const workers = Array.from({ length: concurrency }, async () => {
+        while (next < total) {
+            await task(next++);
+        }
+    });
+    await Promise.all(workers);
+}
+
+async function measureLatency(label, save) {
+    const timings = [];
+    let errors = 0;
+
+    // Half the saves hit a fresh level (insert path), half an existing one (update path)
+    await runPool(REQUESTS, CONCURRENCY, async (i) => {
+        const startedAt = process.hrtime.bigint();
+        const error = await save({
+            levelId: `${LEVEL_PREFIX}${label}-${Math.floor(i / 2)}`,
+            completed: true,
+            score: 100 + i,
+            timeSpent: 60 + (i % 30)
+        });
+        timings.push(Number(process.hrtime.bigint() - startedAt) / 1e6);
+        if (error) errors++;
+    });
+
+    timings.sort((a, b) => a - b);
+    return {
+        p50: percentile(timings, 50),
+        p95: percentile(timings, 95),
+        p99: percentile(timings, 99),
+        errors
+    };
+}
+
+async function measureLostUpdates(label, save) {
+    const levelId = `${LEVEL_PREFIX}${label}-race`;
+    const saves = Array.from({ length: CONCURRENCY }, (_, i) => ({
+        levelId,
+        completed: true,
+        score: 500 + ((i * 37) % CONCURRENCY),
+        timeSpent: 30 + ((i * 11) % CONCURRENCY)
+    }));
+
+    const results = await Promise.all(saves.map(save));
+    const errors = results.filter(Boolean).length;
+
+    const { data: row } = await supabase
+        .from('user_progress')
+        .select('attempts, best_score, fastest_time')
+        .eq('user_id', USER_ID)
+        .eq('level_id', levelId)
+        .single();
+
+    const expected = {
+        attempts: saves.length,
+        best_score: Math.max(...saves.map(s => s.score)),
+        fastest_time: Math.min(...saves.map(s => s.timeSpent))
+    };
+    return {
+        errors,
+        expected,
+        actual: row,
+        lostUpdates: expected.attempts - (row?.attempts || 0),
+        consistent: !!row && row.attempts === expected.attempts
+            && row.best_score === expected.best_score
+            && row.fastest_time === expected.fastest_time
+    };
+}
+
+async function main() {
+    if (!process.env.SUPABASE_URL || !process.env.SUPABASE_SERVICE_ROLE_KEY || !USER_ID) {
+        console.error('Set SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY and LOADTEST_USER_ID');
+        process.exit(2);
+    }
+
+    await cleanup();
+    try {
+        console.log(`Progress saves: ${REQUESTS} requests, concurrency ${CONCURRENCY}\n`);
+        const report = {};
+        for (const [label, save] of [['legacy', saveLegacy], ['upsert', saveUpsert]]) {
+            report[label] = {
+                latency: await measureLatency(label, save),
+                race: await measureLostUpdates(label, save)
+            };
+        }
+
+        console.log('mode     p50 ms   p95 ms   p99 ms  errors  race: lost  consistent');
+        Object.entries(report).forEach(([label, { latency, race }]) => {
+            console.log(`${label.padEnd(8)} ${latency.p50.toFixed(1).padStart(6)} ${latency.p95.toFixed(1).padStart(8)} ${latency.p99.toFixed(1).padStart(8)} ${String(latency.errors + race.errors).padStart(7)}  ${String(race.lostUpdates).padStart(10)}  ${race.consistent ? 'yes' : 'no'}`);
+        });
+
+        const speedup = report.legacy.latency.p50 / report.upsert.latency.p50;
+        console.log(`\np50 speedup: ${speedup.toFixed(2)}x`);
+        process.exitCode = report.upsert.race.consistent ? 0 : 1;
+    } finally {
+        await cleanup();
+    }
+}
+
+main().catch(error => {
+    console.error('Load test failed:', error);
+    process.exit(1);
+});
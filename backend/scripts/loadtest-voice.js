@@ -0,0 +1,106 @@
+#!/usr/bin/env node
+// Memory load test for voice messages: the legacy base64 JSON route
+// (POST /api/ai/voice) vs. the streamed binary upload (POST /api/ai/voice/upload).
+//
+// Each mode fires --concurrency requests carrying --size-mb of audio at once,
+// --rounds times, while /health is polled for the server's resident set size.
+// Streamed uploads should leave peak RSS close to the baseline regardless of
+// concurrency; the base64 route grows with concurrency x size.
+//
+// Run the backend against the OpenAI mock so no audio is sent anywhere:
+//   node scripts/mock-openai.js &
+//   OPENAI_BASE_URL=http://localhost:4010/v1 npm start
+//   node scripts/loadtest-voice.js [--concurrency 20] [--size-mb 5] [--rounds 3] [--url http://localhost:3001]
+
+const crypto = require('crypto');
+
+const argValue = (name, fallback) => {
+    const index = process.argv.indexOf(name);
+    return index !== -1 ? process.argv[index + 1] : fallback;
+};
+
+const CONCURRENCY = parseInt(argValue('--concurrency', '20'), 10);
+const SIZE_BYTES = Math.round(parseFloat(argValue('--size-mb', '5')) * 1024 * 1024);
+const ROUNDS = parseInt(argValue('--rounds', '3'), 10);
+const BASE_URL = argValue('--url', process.env.BENCH_URL || 'http://localhost:3001');
+const CONVERSATION_ID = argValue('--conversation', crypto.randomUUID());
+
+// Random bytes stand in for a recording; the mock only counts them
+const audio = crypto.randomBytes(SIZE_BYTES);
+const audioBase64 = audio.toString('base64');
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+const mb = (bytes) => (bytes / 1024 / 1024).toFixed(1);
+
+async function serverRss() {
+    const response = await fetch(`${BASE_URL}/health`);
+    return (await response.json()).memory.rss;
+}
+
+// Poll RSS until stopped; resolves with the peak seen
+function sampleRss() {
+    let running = true;
+    const done = (async () => {
+        let peak = 0;
+        while (running) {
+            peak = Math.max(peak, await serverRss());
+            await sleep(50);
+        }
+        return peak;
+    })();
+    return { stop: () => { running = false; return done; } };
+}
+
+const modes = {
+    base64: () => fetch(`${BASE_URL}/api/ai/voice`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ audioData: audioBase64, conversationId: CONVERSATION_ID, duration: 5000 })
+    }),
+    upload: () => fetch(`${BASE_URL}/api/ai/voice/upload?conversationId=${CONVERSATION_ID}&duration=5000`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'audio/webm' },
+        body: audio
+    })
+};
+
+async function runMode(name, send) {
+    const sampler = sampleRss();
+    const latencies = [];
+    let failures = 0;
+
+    for (let round = 0; round < ROUNDS; round++) {
+        await Promise.all(Array.from({ length: CONCURRENCY }, async () => {
+            const startedAt = performance.now();
+            const response = await send();
+            await response.arrayBuffer();
+            if (!response.ok) {
+                failures++;
+            }
+            latencies.push(performance.now() - startedAt);
+        }));
+    }
+
+    const peak = await sampler.stop();
+    latencies.sort((a, b) => a - b);
+    return { name, peak, p50: latencies[Math.floor(latencies.length / 2)], failures };
+}
+
+async function main() {
+    console.log(`Voice uploads at ${BASE_URL}: ${CONCURRENCY} concurrent x ${mb(SIZE_BYTES)}MB, ${ROUNDS} rounds per mode\n`);
+    const baseline = await serverRss();
+    console.log(`baseline RSS ${mb(baseline)}MB\n`);
+    console.log('mode     peak RSS (MB)  growth (MB)  p50 (ms)  failed');
+
+    for (const [name, send] of Object.entries(modes)) {
+        // Give the previous mode's garbage a chance to be collected
+        await sleep(2000);
+        const result = await runMode(name, send);
+        console.log(`${name.padEnd(8)} ${mb(result.peak).padStart(13)}  ${mb(result.peak - baseline).padStart(11)}  ${result.p50.toFixed(0).padStart(8)}  ${String(result.failures).padStart(6)}/${CONCURRENCY * ROUNDS}`);
+    }
+}
+
+main().catch(error => {
+    console.error('Load test failed:', error);
+    process.exit(1);
+});
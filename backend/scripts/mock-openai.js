@@ -0,0 +1,145 @@
+#!/usr/bin/env node
+// Minimal OpenAI-compatible server for local testing of the AI routes.
+//
+// Implements POST /v1/chat/completions, plain and streamed (stream: true),
+// with a configurable delay before the first token and between tokens, so
+// time-to-first-token and total latency behave like the real API.
+// POST /v1/audio/transcriptions reads the upload, counts its bytes and
+// returns a fixed transcript as text.
+//
+// Usage: node scripts/mock-openai.js [--port 4010] [--first-token-ms 600] [--token-ms 40]
+// Then start the backend with OPENAI_BASE_URL=http://localhost:4010/v1
+
+const http = require('http');
+
+const argValue = (name, fallback) => {
+    const index = process.argv.indexOf(name);
+    return index !== -1 ? parseInt(process.argv[index + 1], 10) : fallback;
+};
+
+const PORT = argValue('--port', 4010);
+const FIRST_TOKEN_MS = argValue('--first-token-ms', 600);
+const TOKEN_MS = argValue('--token-ms', 40);
+
+const REPLY = 'Hello, I am AVA, your Audio Visual Assistant. ' +
+    'An XLR cable carries a balanced microphone signal, which keeps noise out over long runs. ' +
+    'Connect the microphone to a mixer input, set the gain so peaks stay out of the red, and route the main mix to the amplifier. ' +
+    'Check the speaker impedance against the amplifier rating before you power anything on.';
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Split into word-sized deltas with their trailing whitespace, like streamed tokens
+const tokenize = (text) => text.match(/\S+\s*/g) || [];
+
+const usageFor = (body, reply) => {
+    const promptTokens = Math.ceil(JSON.stringify(body.messages || []).length / 4);
+    const completionTokens = tokenize(reply).length;
+    return {
+        prompt_tokens: promptTokens,
+        completion_tokens: completionTokens,
+        total_tokens: promptTokens + completionTokens
+    };
+};
+
+async function completion(body, res) {
+    const tokens = tokenize(REPLY);
+    await sleep(FIRST_TOKEN_MS + TOKEN_MS * (tokens.length - 1));
+
+    res.writeHead(200, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify({
+        id: `chatcmpl-mock-${Date.now()}`,
+        object: 'chat.completion',
+        created: Math.floor(Date.now() / 1000),
+        model: body.model,
+        choices: [{ index: 0, message: { role: 'assistant', content: REPLY }, finish_reason: 'stop' }],
+        usage: usageFor(body, REPLY)
+    }));
+}
+
+async function streamedCompletion(body, req, res) {
+    const id = `chatcmpl-mock-${Date.now()}`;
+    const created = Math.floor(Date.now() / 1000);
+    const chunk = (delta, finishReason = null) => ({
+        id,
+        object: 'chat.completion.chunk',
+        created,
+        model: body.model,
+        choices: [{ index: 0, delta, finish_reason: finishReason }]
+    });
+    const send = (data) => res.write(`data: ${JSON.stringify(data)}\n\n`);
+
+    let closed = false;
+    res.on('close', () => { closed = true; });
+
+    res.writeHead(200, { 'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache' });
+
+    const tokens = tokenize(REPLY);
+    await sleep(FIRST_TOKEN_MS);
+    send(chunk({ role: 'assistant', content: '' }));
+
+    for (let i = 0; i < tokens.length && !closed; i++) {
+        if (i > 0) {
+            await sleep(TOKEN_MS);
+        }
+        send(chunk({ content: tokens[i] }));
+    }
+
+    if (closed) {
+        console.log('client disconnected mid-stream');
+        return;
+    }
+
+    send(chunk({}, 'stop'));
+    if (body.stream_options?.include_usage) {
+        send({ id, object: 'chat.completion.chunk', created, model: body.model, choices: [], usage: usageFor(body, REPLY) });
+    }
+    res.end('data: [DONE]\n\n');
+}
+
+const TRANSCRIPT = 'How do I connect a wireless microphone to the mixer?';
+
+function transcription(req, res) {
+    let bytes = 0;
+    req.on('data', data => { bytes += data.length; });
+    req.on('end', async () => {
+        await sleep(FIRST_TOKEN_MS);
+        console.log(`${new Date().toISOString()} audio.transcriptions ${bytes} bytes`);
+        res.writeHead(200, { 'Content-Type': 'text/plain' });
+        res.end(`${TRANSCRIPT}\n`);
+    });
+}
+
+const server = http.createServer((req, res) => {
+    if (req.method === 'POST' && req.url.endsWith('/audio/transcriptions')) {
+        return transcription(req, res);
+    }
+    if (req.method !== 'POST' || !req.url.endsWith('/chat/completions')) {
+        res.writeHead(404, { 'Content-Type': 'application/json' });
+        res.end(JSON.stringify({ error: { message: `No mock for ${req.method} ${req.url}` } }));
+        return;
+    }
+
+    let raw = '';
+    req.on('data', data => { raw += data; });
+    req.on('end', () => {
+        let body;
+        try {
+            body = JSON.parse(raw);
+        } catch (error) {
+            res.writeHead(400, { 'Content-Type': 'application/json' });
+            res.end(JSON.stringify({ error: { message: 'Invalid JSON body' } }));
+            return;
+        }
+
+        console.log(`${new Date().toISOString()} chat.completions model=${body.model} stream=${!!body.stream}`);
+        const handler = body.stream ? streamedCompletion(body, req, res) : completion(body, res);
+        handler.catch(error => {
+            console.error('Mock failed:', error);
+            res.destroy();
+        });
+    });
+});
+
+server.listen(PORT, () => {
+    console.log(`Mock OpenAI listening on http://localhost:${PORT}/v1 (first token ${FIRST_TOKEN_MS}ms, ${TOKEN_MS}ms per token)`);
+});
@@ -19,10 +19,22 @@ try {
 }
 const { initializeSupabase } = require('./config/supabase');
 const { initializeOpenAI } = require('./config/openai');
+const { closeWriteQueues, getWriteQueueStats } = require('./services/writeBehind');
+const { flushPendingExchanges, getHistoryCacheStats } = require('./services/conversationHistory');
+const { isEventStream } = require('./utils/sse');
+const { getResponseCacheStats, getTopCachedPrompts } = require('./services/responseCache');
+const { getUrlContentStats } = require('./services/urlContent');
+const { getLinkPreviewStats } = require('./services/linkPreview');
+const { getTranscriptionStats } = require('./services/transcription');
+const { createRateLimitStore } = require('./utils/rateLimitStore');
+const { getCpuPoolStats } = require('./services/cpuTasks');
+const { startEventLoopMonitor, getEventLoopStats } = require('./utils/eventLoopMonitor');
+const { METRICS_ENABLED, registerCollector, renderMetrics } = require('./utils/metrics');
+const { requestMetrics } = require('./middleware/metrics');
 
 // Import routes with error handling - only load if environment variables are available
 let authRoutes, aiRoutes, gameRoutes, voiceRoutes, userRoutes;
-let authenticateToken, errorHandler;
+let authenticateToken, requireRole, getAuthCacheStats, errorHandler;
 
 // Load auth routes (with fallback if Supabase not available)
 try {
@@ -127,11 +139,14 @@ try {
 
 // Import middleware with error handling
 try {
-    authenticateToken = require('./middleware/auth').authenticateToken;
+    ({ authenticateToken, requireRole, getAuthCacheStats } = require('./middleware/auth'));
     console.log('✅ Auth middleware loaded');
 } catch (error) {
     console.log('⚠️ Auth middleware not available:', error.message);
     authenticateToken = (req, res, next) => next(); // Pass-through middleware
+    // Without authentication nobody can be an admin
+    requireRole = () => (req, res) => res.status(503).json({ error: 'Authentication not available' });
+    getAuthCacheStats = () => null;
 }
 
 try {
@@ -146,6 +161,24 @@ try {
 }
 
 const app = express();
+startEventLoopMonitor();
+
+// Per-route latency histograms for /metrics; first, so every request is timed
+if (METRICS_ENABLED) {
+    app.use(requestMetrics);
+}
+
+// Set on SIGTERM/SIGINT; see shutdown below
+let shuttingDown = false;
+
+// While shutting down, keep-alive clients are told to reconnect (in cluster
+// mode, to another worker) instead of reusing a socket that is about to close
+app.use((req, res, next) => {
+    if (shuttingDown) {
+        res.set('Connection', 'close');
+    }
+    next();
+});
 
 // Trust proxy for Railway deployment - must be before rate limiting
 app.set('trust proxy', 1);
@@ -241,19 +274,23 @@ app.get('/api/health', (req, res) => {
     });
 });
 
-// Log CORS requests for debugging
+// Log CORS requests for debugging (debug level: three console lines per
+// request cost more than the metrics that now cover request counts)
 app.use((req, res, next) => {
-    console.log('🌐 Request from origin:', req.headers.origin);
-    console.log('🌐 Request method:', req.method);
-    console.log('🌐 Request URL:', req.url);
+    logger.debug(`🌐 ${req.method} ${req.url} from origin ${req.headers.origin}`);
     next();
 });
 
-// Compression middleware
-app.use(compression());
+// Compression middleware (server-sent events must reach the client unbuffered)
+app.use(compression({
+    filter: (req, res) => !isEventStream(res) && compression.filter(req, res)
+}));
 
-// Rate limiting
+// Rate limiting. The store shares counters between cluster workers (or hosts,
+// with RATE_LIMIT_REDIS_URL); if it fails, requests are let through.
 const limiter = rateLimit({
+    store: createRateLimitStore('api:'),
+    passOnStoreError: true,
     windowMs: parseInt(process.env.RATE_LIMIT_WINDOW_MS) || 15 * 60 * 1000, // 15 minutes
     max: parseInt(process.env.RATE_LIMIT_MAX_REQUESTS) || 100, // limit each IP to 100 requests per windowMs
     message: {
@@ -265,9 +302,12 @@ const limiter = rateLimit({
 
 app.use('/api/', limiter);
 
-// Body parsing middleware
-app.use(express.json({ limit: '10mb' }));
-app.use(express.urlencoded({ extended: true, limit: '10mb' }));
+// Body parsing middleware. Only the legacy base64 voice route needs large JSON
+// bodies; POST /api/ai/voice/upload streams binary audio and is not parsed here.
+const JSON_BODY_LIMIT = process.env.JSON_BODY_LIMIT || '1mb';
+app.use('/api/ai/voice', express.json({ limit: process.env.VOICE_JSON_BODY_LIMIT || '10mb' }));
+app.use(express.json({ limit: JSON_BODY_LIMIT }));
+app.use(express.urlencoded({ extended: true, limit: JSON_BODY_LIMIT }));
 
 // Backend API server - no static file serving
 console.log('🚀 Starting backend API server only');
@@ -280,13 +320,84 @@ app.get('/health', (req, res) => {
         timestamp: new Date().toISOString(),
         uptime: process.uptime(),
         environment: process.env.NODE_ENV,
+        pid: process.pid,
         cors: {
             origin: req.headers.origin,
             allowed: true
-        }
+        },
+        authCache: getAuthCacheStats(),
+        writeQueues: getWriteQueueStats(),
+        chatHistory: getHistoryCacheStats(),
+        responseCache: getResponseCacheStats(),
+        urlContentCache: getUrlContentStats(),
+        linkPreviewCache: getLinkPreviewStats(),
+        transcription: getTranscriptionStats(),
+        cpuPool: getCpuPoolStats(),
+        eventLoopDelayMs: getEventLoopStats(),
+        memory: process.memoryUsage()
     });
 });
 
+// Prometheus metrics. Request, Supabase and OpenAI histograms are recorded as
+// they happen; the values below are read from their stats getters at scrape time.
+if (METRICS_ENABLED) {
+    const gauge = (name, help, series) => ({ name, help, type: 'gauge', series });
+    const cacheStats = {
+        auth: getAuthCacheStats,
+        chat_history: getHistoryCacheStats,
+        response: getResponseCacheStats,
+        url_content: getUrlContentStats,
+        link_preview: getLinkPreviewStats
+    };
+
+    registerCollector(() => {
+        const memory = process.memoryUsage();
+        const loop = getEventLoopStats().current;
+        return [
+            gauge('process_resident_memory_bytes', 'Resident set size', [{ labels: {}, value: memory.rss }]),
+            gauge('nodejs_heap_size_used_bytes', 'V8 heap used', [{ labels: {}, value: memory.heapUsed }]),
+            gauge('nodejs_heap_size_total_bytes', 'V8 heap allocated', [{ labels: {}, value: memory.heapTotal }]),
+            gauge('nodejs_external_memory_bytes', 'Memory of C++ objects bound to JS, incl. Buffers', [{ labels: {}, value: memory.external }]),
+            gauge('process_uptime_seconds', 'Process uptime', [{ labels: {}, value: process.uptime() }]),
+            gauge('nodejs_eventloop_delay_seconds', 'Event loop delay in the current monitor window',
+                ['p50', 'p90', 'p99', 'max'].map(quantile => ({ labels: { quantile }, value: loop[quantile] / 1000 })))
+        ];
+    });
+
+    registerCollector(() => {
+        const caches = Object.entries(cacheStats)
+            .map(([cache, getStats]) => [cache, getStats()])
+            .filter(([, stats]) => stats && typeof stats.hits === 'number');
+        const series = (read) => caches.map(([cache, stats]) => ({ labels: { cache }, value: read(stats) }));
+        return [
+            { name: 'cache_hits_total', help: 'Cache hits', type: 'counter', series: series(stats => stats.hits) },
+            { name: 'cache_misses_total', help: 'Cache misses', type: 'counter', series: series(stats => stats.misses) },
+            gauge('cache_entries', 'Entries held in the in-process caches',
+                caches.filter(([, stats]) => typeof stats.size === 'number').map(([cache, stats]) => ({ labels: { cache }, value: stats.size })))
+        ];
+    });
+
+    registerCollector(() => {
+        const pool = getCpuPoolStats();
+        const queues = getWriteQueueStats();
+        return [
+            gauge('cpu_pool_busy_workers', 'CPU pool workers running a task', [{ labels: {}, value: pool.busy || 0 }]),
+            gauge('cpu_pool_queued_tasks', 'CPU tasks waiting for a worker', [{ labels: {}, value: pool.queued || 0 }]),
+            gauge('write_queue_pending', 'Rows waiting in the write-behind queues',
+                queues.map(queue => ({ labels: { table: queue.table }, value: queue.pending })))
+        ];
+    });
+
+    app.get('/metrics', async (req, res) => {
+        // Optional shared secret for scrapers, since the endpoint is public otherwise
+        if (process.env.METRICS_TOKEN && req.headers.authorization !== `Bearer ${process.env.METRICS_TOKEN}`) {
+            return res.status(401).end();
+        }
+        res.set('Content-Type', 'text/plain; version=0.0.4; charset=utf-8');
+        res.send(await renderMetrics());
+    });
+}
+
 // CORS test endpoint
 app.get('/cors-test', (req, res) => {
     res.status(200).json({
@@ -363,6 +474,13 @@ if (userRoutes) {
     console.log('✅ User routes registered');
 }
 
+// Most requested cached AI answers. Kept out of /health: the prompts are what
+// players typed.
+app.get('/api/admin/ai-cache/top', authenticateToken, requireRole('admin'), (req, res) => {
+    const limit = Math.min(parseInt(req.query.limit) || 10, 100);
+    res.json({ top: getTopCachedPrompts(limit) });
+});
+
 // Socket.IO connection handling
 io.on('connection', (socket) => {
     logger.info(`User connected: ${socket.id}`);
@@ -443,22 +561,31 @@ server.listen(PORT, () => {
     process.exit(1);
 });
 
-// Graceful shutdown
-process.on('SIGTERM', () => {
-    logger.info('SIGTERM received, shutting down gracefully');
-    server.close(() => {
+// Graceful shutdown: let keep-alive clients move off this process, stop accepting
+// requests, then write out pending chat exchanges and queued telemetry.
+// Closing at once would reset sockets that clients are just reusing, which shows
+// up as failed requests during a rolling restart.
+const SHUTDOWN_DRAIN_MS = parseInt(process.env.SHUTDOWN_DRAIN_MS) || 1000;
+const shutdown = (signal) => {
+    // Ctrl-C in cluster mode signals the primary and every worker; act on the first signal only
+    if (shuttingDown) return;
+    shuttingDown = true;
+    logger.info(`${signal} received, shutting down gracefully`);
+    setTimeout(() => server.close(async () => {
+        try {
+            await flushPendingExchanges();
+            await closeWriteQueues();
+            logger.info('Write-behind queues flushed');
+        } catch (error) {
+            logger.error(`Failed to flush write-behind queues: ${error.message}`);
+        }
         logger.info('Process terminated');
         process.exit(0);
-    });
-});
+    }), SHUTDOWN_DRAIN_MS);
+};
 
-process.on('SIGINT', () => {
-    logger.info('SIGINT received, shutting down gracefully');
-    server.close(() => {
-        logger.info('Process terminated');
-        process.exit(0);
-    });
-});
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
 
 // Handle uncaught exceptions
 process.on('uncaughtException', (error) => {
@@ -0,0 +1,121 @@
+const { createClusterCache } = require('../utils/clusterCache');
+const logger = require('../utils/logger');
+
+// Number of previous messages sent to OpenAI with each chat request
+const HISTORY_WINDOW = parseInt(process.env.AI_HISTORY_WINDOW) || 10;
+
+// Recent window per conversation, so follow-up messages skip the history query.
+// Entries are plain { role, content } arrays of at most HISTORY_WINDOW items.
+// Under cluster.js the windows live in the primary: a conversation's messages
+// can be answered by different workers, and each must see the others' turns.
+const windowCache = createClusterCache('chat-history', {
+    max: parseInt(process.env.AI_HISTORY_CACHE_MAX) || 1000,
+    ttlMs: parseInt(process.env.AI_HISTORY_CACHE_TTL_MS) || 10 * 60 * 1000
+});
+
+// Exchange writes started after their response was sent
+const pendingWrites = new Set();
+
+const toWindowMessage = (msg) => ({ role: msg.role, content: msg.content });
+
+/**
+ * Get the last HISTORY_WINDOW messages of a conversation, oldest first.
+ * The database query is bounded by the window, not by the conversation length.
+ */
+const getRecentMessages = async (client, conversationId) => {
+    const cached = await windowCache.get(conversationId);
+    if (cached) {
+        return cached;
+    }
+
+    const { data, error } = await client
+        .from('ai_messages')
+        .select('role, content, created_at')
+        .eq('conversation_id', conversationId)
+        .order('created_at', { ascending: false })
+        .limit(HISTORY_WINDOW);
+
+    if (error) {
+        throw error;
+    }
+
+    const messages = data.reverse().map(toWindowMessage);
+    windowCache.set(conversationId, messages);
+    return messages;
+};
+
+/**
+ * Add messages to a conversation's cached window (no-op when not cached)
+ */
+const appendToWindow = (conversationId, messages) => {
+    windowCache.append(conversationId, messages.map(toWindowMessage), HISTORY_WINDOW);
+};
+
+/**
+ * Drop a conversation's cached window, e.g. after messages were written elsewhere
+ */
+const invalidateConversation = (conversationId) => {
+    windowCache.delete(conversationId);
+};
+
+/**
+ * Persist a completed chat exchange with the record_chat_exchange RPC
+ * (database/record_chat_exchange.sql): both messages, the api_usage row and
+ * the message counter in one transaction. Meant to be called after the
+ * response is sent; the cached window is updated right away so the next
+ * message sees this exchange even before the write lands.
+ */
+const recordExchange = (client, exchange) => {
+    appendToWindow(exchange.conversationId, [
+        { role: 'user', content: exchange.userMessage },
+        { role: 'assistant', content: exchange.assistantMessage }
+    ]);
+
+    const write = client
+        .rpc('record_chat_exchange', {
+            p_conversation_id: exchange.conversationId,
+            p_user_id: exchange.userId,
+            p_user_message: exchange.userMessage,
+            p_user_message_at: exchange.userMessageAt,
+            p_assistant_message: exchange.assistantMessage,
+            p_assistant_message_at: exchange.assistantMessageAt,
+            p_equipment_context: exchange.equipmentContext || null,
+            p_tokens_used: exchange.tokensUsed,
+            p_response_time: exchange.responseTime,
+            p_cost_usd: exchange.cost
+        })
+        .then(({ error }) => {
+            if (error) {
+                throw error;
+            }
+        })
+        .catch(error => {
+            // The cached window now holds messages the database does not; re-read next time
+            invalidateConversation(exchange.conversationId);
+            logger.error(`Error saving chat exchange for conversation ${exchange.conversationId}:`, error);
+        })
+        .finally(() => pendingWrites.delete(write));
+
+    pendingWrites.add(write);
+    return write;
+};
+
+/**
+ * Wait for exchange writes that are still in flight (used on shutdown)
+ */
+const flushPendingExchanges = () => Promise.all([...pendingWrites]);
+
+const getHistoryCacheStats = () => ({
+    window: HISTORY_WINDOW,
+    pendingWrites: pendingWrites.size,
+    ...windowCache.stats()
+});
+
+module.exports = {
+    getRecentMessages,
+    appendToWindow,
+    invalidateConversation,
+    recordExchange,
+    flushPendingExchanges,
+    getHistoryCacheStats
+};
@@ -0,0 +1,64 @@
+const os = require('os');
+const path = require('path');
+const { WorkerPool, isPoolError } = require('../utils/workerPool');
+const htmlExtract = require('./htmlExtract');
+
+// CPU-bound request work (HTML extraction, large base64 decodes) runs on a
+// worker thread pool so it does not stall the event loop for game API calls.
+// CPU_POOL_SIZE=0 runs everything inline instead.
+
+const POOL_SIZE = process.env.CPU_POOL_SIZE !== undefined
+    ? parseInt(process.env.CPU_POOL_SIZE) || 0
+    : Math.max(1, Math.min(4, os.availableParallelism() - 1));
+
+let pool = null;
+const getPool = () => {
+    if (!pool) {
+        pool = new WorkerPool({
+            filename: path.join(__dirname, '..', 'workers', 'cpuWorker.js'),
+            size: POOL_SIZE,
+            maxQueue: parseInt(process.env.CPU_POOL_MAX_QUEUE) || 256,
+            timeoutMs: parseInt(process.env.CPU_TASK_TIMEOUT_MS) || 2000
+        });
+    }
+    return pool;
+};
+
+/**
+ * Link preview fields from a page's <head>
+ */
+const extractMeta = (html, baseUrl, options) => (POOL_SIZE
+    ? getPool().run('extractMeta', [html, baseUrl], options)
+    : Promise.resolve(htmlExtract.extractMeta(html, baseUrl)));
+
+/**
+ * Title, description and text of a page
+ */
+const extractPageContent = (html, url, options) => (POOL_SIZE
+    ? getPool().run('extractPageContent', [html, url], options)
+    : Promise.resolve(htmlExtract.extractPageContent(html, url)));
+
+/**
+ * Decode a base64 string to a Buffer
+ */
+const decodeBase64 = async (data, options) => {
+    if (!POOL_SIZE) {
+        return Buffer.from(data, 'base64');
+    }
+    // Buffers come back as plain Uint8Arrays
+    const bytes = await getPool().run('decodeBase64', [data], options);
+    return Buffer.from(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+};
+
+const getCpuPoolStats = () => (POOL_SIZE ? getPool().stats() : { size: 0 });
+
+const closeCpuPool = () => pool?.close();
+
+module.exports = {
+    extractMeta,
+    extractPageContent,
+    decodeBase64,
+    getCpuPoolStats,
+    closeCpuPool,
+    isPoolError
+};
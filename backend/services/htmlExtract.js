@@ -0,0 +1,94 @@
+// Regex extraction from fetched HTML. Pure functions with no dependencies, so
+// they can run on the CPU worker pool (services/cpuTasks.js) as well as inline.
+
+function resolveUrlMaybe(base, maybeRelative) {
+    try {
+        return new URL(maybeRelative, base).href;
+    } catch {
+        return null;
+    }
+}
+
+/**
+ * Title, description, image and favicon from a page's <head> (link previews)
+ */
+function extractMeta(content, baseUrl) {
+    const result = {};
+
+    // Helper regex matchers
+    const m = (re) => {
+        const match = content.match(re);
+        return match ? match[1].trim() : null;
+    };
+
+    // Open Graph first
+    result.title = m(/<meta[^>]+property=["']og:title["'][^>]+content=["']([^"']+)["'][^>]*>/i)
+        || m(/<title[^>]*>([^<]+)<\/title>/i);
+
+    result.description = m(/<meta[^>]+property=["']og:description["'][^>]+content=["']([^"']+)["'][^>]*>/i)
+        || m(/<meta[^>]+name=["']description["'][^>]+content=["']([^"']+)["'][^>]*>/i);
+
+    const ogImage = m(/<meta[^>]+property=["']og:image["'][^>]+content=["']([^"']+)["'][^>]*>/i)
+        || m(/<meta[^>]+name=["']twitter:image["'][^>]+content=["']([^"']+)["'][^>]*>/i);
+    result.image = ogImage ? resolveUrlMaybe(baseUrl, ogImage) : null;
+
+    const iconHref = m(/<link[^>]+rel=["'](?:shortcut icon|icon)["'][^>]+href=["']([^"']+)["'][^>]*>/i);
+    result.favicon = iconHref ? resolveUrlMaybe(baseUrl, iconHref) : null;
+
+    return result;
+}
+
+const MAX_CONTENT_CHARS = 2000;
+
+const decodeEntities = (text) => text
+    .replace(/&nbsp;/g, ' ')
+    .replace(/&amp;/g, '&')
+    .replace(/&lt;/g, '<')
+    .replace(/&gt;/g, '>')
+    .replace(/&quot;/g, '"')
+    .replace(/&#39;|&apos;/g, "'");
+
+const matchFirst = (html, patterns) => {
+    for (const pattern of patterns) {
+        const match = html.match(pattern);
+        if (match) {
+            return decodeEntities(match[1].trim());
+        }
+    }
+    return null;
+};
+
+/**
+ * Title, description and readable text of an HTML page (search result details)
+ */
+const extractPageContent = (html, url) => {
+    const title = matchFirst(html, [
+        /<meta[^>]+property=["']og:title["'][^>]+content=["']([^"']+)["'][^>]*>/i,
+        /<title[^>]*>([^<]+)<\/title>/i
+    ]);
+    const description = matchFirst(html, [
+        /<meta[^>]+property=["']og:description["'][^>]+content=["']([^"']+)["'][^>]*>/i,
+        /<meta[^>]+name=["']description["'][^>]+content=["']([^"']+)["'][^>]*>/i
+    ]);
+
+    const body = html.replace(/^[\s\S]*?<body[^>]*>/i, '');
+    const content = decodeEntities(body
+        .replace(/<(script|style|noscript|svg|template)[^>]*>[\s\S]*?<\/\1>/gi, ' ')
+        .replace(/<!--[\s\S]*?-->/g, ' ')
+        .replace(/<[^>]+>/g, ' '))
+        .replace(/\s+/g, ' ')
+        .trim()
+        .substring(0, MAX_CONTENT_CHARS);
+
+    return {
+        title: title || new URL(url).hostname,
+        description: description || '',
+        content: content || description || '',
+        url
+    };
+};
+
+module.exports = {
+    extractMeta,
+    extractPageContent
+};
@@ -1,114 +1,246 @@
+const http = require('http');
+const https = require('https');
+const zlib = require('zlib');
 const { URL } = require('url');
+const { LRUCache } = require('../utils/lruCache');
+const { extractMeta, isPoolError } = require('./cpuTasks');
+
+// Link previews only need the <head> (title, description, Open Graph tags),
+// so responses are streamed and reading stops at </head>. Connections are
+// pooled per host with keep-alive, and every result, including failures, is
+// cached so a page is fetched at most once per TTL.
+
+const TIMEOUT_MS = parseInt(process.env.LINK_PREVIEW_TIMEOUT_MS) || 7000;
+const MAX_BYTES = 350_000; // give up on pages whose <head> is larger than ~350KB
+const MAX_REDIRECTS = 5;
+const USER_AGENT = 'Mozilla/5.0 (compatible; AVMasterBot/1.0; +https://worldcastlive.com)';
+
+const agentOptions = { keepAlive: true, maxSockets: 16, maxFreeSockets: 8, timeout: 30000 };
+const agents = {
+    'http:': new http.Agent(agentOptions),
+    'https:': new https.Agent(agentOptions)
+};
+
+const previewCache = new LRUCache({
+    max: parseInt(process.env.LINK_PREVIEW_CACHE_MAX) || 1000,
+    ttlMs: parseInt(process.env.LINK_PREVIEW_CACHE_TTL_MS) || 6 * 60 * 60 * 1000
+});
+// Failed previews are retried sooner than good ones
+const NEGATIVE_TTL_MS = parseInt(process.env.LINK_PREVIEW_NEGATIVE_TTL_MS) || 10 * 60 * 1000;
+
+const inFlight = new Map();
+const metrics = { fetches: 0, failures: 0, poolFailures: 0, shared: 0, bytesRead: 0, stoppedAtHead: 0 };
 
-async function fetchWithTimeout(resource, options = {}) {
-    const { timeout = 8000, headers = {} } = options;
-    const controller = new AbortController();
-    const id = setTimeout(() => controller.abort(), timeout);
+function getDomainFromUrl(targetUrl) {
     try {
-        const res = await fetch(resource, {
-            ...options,
-            headers: {
-                'user-agent': 'Mozilla/5.0 (compatible; AVMasterBot/1.0; +https://worldcastlive.com)'
-                , ...headers
-            },
-            signal: controller.signal
-        });
-        return res;
-    } finally {
-        clearTimeout(id);
+        return new URL(targetUrl).hostname.replace(/^www\./, '');
+    } catch {
+        return 'unknown';
     }
 }
 
-function resolveUrlMaybe(base, maybeRelative) {
-    try {
-        return new URL(maybeRelative, base).href;
-    } catch {
-        return null;
+function decodeBody(res) {
+    switch ((res.headers['content-encoding'] || '').toLowerCase()) {
+        case 'gzip':
+        case 'x-gzip':
+            return res.pipe(zlib.createGunzip());
+        case 'deflate':
+            return res.pipe(zlib.createInflate());
+        case 'br':
+            return res.pipe(zlib.createBrotliDecompress());
+        default:
+            return res;
     }
 }
 
-function extractMeta(content, baseUrl) {
-    const result = {};
-
-    // Helper regex matchers
-    const m = (re) => {
-        const match = content.match(re);
-        return match ? match[1].trim() : null;
-    };
-
-    // Open Graph first
-    result.title = m(/<meta[^>]+property=["']og:title["'][^>]+content=["']([^"']+)["'][^>]*>/i)
-        || m(/<title[^>]*>([^<]+)<\/title>/i);
-
-    result.description = m(/<meta[^>]+property=["']og:description["'][^>]+content=["']([^"']+)["'][^>]*>/i)
-        || m(/<meta[^>]+name=["']description["'][^>]+content=["']([^"']+)["'][^>]*>/i);
-
-    const ogImage = m(/<meta[^>]+property=["']og:image["'][^>]+content=["']([^"']+)["'][^>]*>/i)
-        || m(/<meta[^>]+name=["']twitter:image["'][^>]+content=["']([^"']+)["'][^>]*>/i);
-    result.image = ogImage ? resolveUrlMaybe(baseUrl, ogImage) : null;
-
-    const iconHref = m(/<link[^>]+rel=["'](?:shortcut icon|icon)["'][^>]+href=["']([^"']+)["'][^>]*>/i);
-    result.favicon = iconHref ? resolveUrlMaybe(baseUrl, iconHref) : null;
+/**
+ * GET a page and resolve with { url, contentType, head } where head is the
+ * HTML up to and including </head> (empty for non-HTML responses). Follows
+ * redirects; the whole exchange is bounded by TIMEOUT_MS.
+ */
+function fetchHead(targetUrl) {
+    return new Promise((resolve, reject) => {
+        let request = null;
+        let settled = false;
+
+        const done = (error, result) => {
+            if (settled) return;
+            settled = true;
+            clearTimeout(timer);
+            if (error) {
+                request?.destroy();
+                reject(error);
+            } else {
+                resolve(result);
+            }
+        };
 
-    return result;
-}
+        const timer = setTimeout(() => done(new Error(`Timed out after ${TIMEOUT_MS}ms`)), TIMEOUT_MS);
+
+        const get = (currentUrl, redirectsLeft) => {
+            const url = new URL(currentUrl);
+            const agent = agents[url.protocol];
+            if (!agent) {
+                return done(new Error(`Unsupported protocol ${url.protocol}`));
+            }
+
+            request = (url.protocol === 'https:' ? https : http).get(url, {
+                agent,
+                headers: {
+                    'user-agent': USER_AGENT,
+                    accept: 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.5',
+                    'accept-encoding': 'gzip, deflate, br'
+                }
+            }, (res) => {
+                const { statusCode, headers } = res;
+
+                if (statusCode >= 300 && statusCode < 400 && headers.location) {
+                    // Drain the (small) redirect body so the socket goes back to the pool
+                    res.resume();
+                    if (redirectsLeft === 0) {
+                        return done(new Error('Too many redirects'));
+                    }
+                    return get(new URL(headers.location, url).href, redirectsLeft - 1);
+                }
+
+                const contentType = headers['content-type'] || '';
+                if (statusCode >= 400 || !contentType.includes('text/html')) {
+                    res.resume();
+                    return done(null, { url: url.href, contentType, head: '' });
+                }
+
+                const body = decodeBody(res);
+                const decoder = new TextDecoder('utf-8');
+                let html = '';
+                let bytes = 0;
+
+                const finish = (stoppedEarly) => {
+                    if (settled) return;
+                    metrics.bytesRead += bytes;
+                    if (stoppedEarly) {
+                        // The rest of the page is not needed; this socket is not reused
+                        metrics.stoppedAtHead++;
+                        res.destroy();
+                        if (body !== res) {
+                            // Release the decompressor and its listeners too
+                            body.destroy();
+                        }
+                    }
+                    done(null, { url: url.href, contentType, head: html });
+                };
+
+                body.on('data', (chunk) => {
+                    if (settled) return;
+                    bytes += chunk.length;
+                    const searchFrom = Math.max(0, html.length - 6);
+                    html += decoder.decode(chunk, { stream: true });
+
+                    const headEnd = html.toLowerCase().indexOf('</head>', searchFrom);
+                    if (headEnd !== -1) {
+                        html = html.slice(0, headEnd + '</head>'.length);
+                        finish(true);
+                    } else if (bytes >= MAX_BYTES) {
+                        finish(true);
+                    }
+                });
+                body.on('end', () => finish(false));
+                body.on('error', (error) => done(error));
+            });
+
+            request.on('error', (error) => done(error));
+        };
 
-function getDomainFromUrl(targetUrl) {
-    try {
-        return new URL(targetUrl).hostname.replace(/^www\./, '');
-    } catch {
-        return 'unknown';
-    }
+        try {
+            get(targetUrl, MAX_REDIRECTS);
+        } catch (error) {
+            done(error);
+        }
+    });
 }
 
-async function getLinkPreview(targetUrl) {
+async function loadLinkPreview(targetUrl) {
     const domain = getDomainFromUrl(targetUrl);
     const fallbackFavicon = `https://www.google.com/s2/favicons?domain=${domain}&sz=64`;
+    const minimal = {
+        url: targetUrl,
+        domain,
+        title: domain,
+        description: '',
+        image: null,
+        favicon: fallbackFavicon
+    };
 
     try {
-        const res = await fetchWithTimeout(targetUrl, { timeout: 7000 });
-        const contentType = res.headers.get('content-type') || '';
-
-        if (!contentType.includes('text/html')) {
+        const { url: finalUrl, head } = await fetchHead(targetUrl);
+        if (!head) {
             // Not HTML – return minimal preview
-            return {
-                url: targetUrl,
-                domain,
-                title: domain,
-                description: '',
-                image: null,
-                favicon: fallbackFavicon
-            };
+            return { preview: minimal, ok: true };
         }
 
-        // Limit body size to avoid huge downloads
-        const buffer = await res.arrayBuffer();
-        const MAX_BYTES = 350_000; // ~350KB
-        const slice = buffer.byteLength > MAX_BYTES ? buffer.slice(0, MAX_BYTES) : buffer;
-        const html = new TextDecoder('utf-8').decode(slice);
-
-        const meta = extractMeta(html, targetUrl);
-
+        // Regex extraction runs on the CPU worker pool
+        const meta = await extractMeta(head, finalUrl);
         return {
-            url: targetUrl,
-            domain,
-            title: meta.title || domain,
-            description: meta.description || '',
-            image: meta.image || null,
-            favicon: meta.favicon || fallbackFavicon
+            preview: {
+                url: targetUrl,
+                domain,
+                title: meta.title || domain,
+                description: meta.description || '',
+                image: meta.image || null,
+                favicon: meta.favicon || fallbackFavicon
+            },
+            ok: true
         };
     } catch (err) {
-        return {
-            url: targetUrl,
-            domain,
-            title: domain,
-            description: '',
-            image: null,
-            favicon: fallbackFavicon
-        };
+        // A busy or timed-out CPU pool says nothing about the page: do not cache that
+        return { preview: minimal, ok: false, cacheable: !isPoolError(err) };
+    }
+}
+
+/**
+ * Preview for a URL, from the cache when possible. Never rejects: pages that
+ * cannot be fetched get a minimal preview (domain and favicon), which is
+ * cached for the shorter negative TTL (not at all when the CPU pool failed).
+ */
+function getLinkPreview(targetUrl) {
+    if (previewCache.has(targetUrl)) {
+        return Promise.resolve(previewCache.get(targetUrl));
+    }
+    if (inFlight.has(targetUrl)) {
+        metrics.shared++;
+        return inFlight.get(targetUrl);
     }
+
+    metrics.fetches++;
+    const pending = loadLinkPreview(targetUrl)
+        .then(({ preview, ok, cacheable = true }) => {
+            if (!cacheable) {
+                metrics.poolFailures++;
+                return preview;
+            }
+            if (!ok) {
+                metrics.failures++;
+            }
+            previewCache.set(targetUrl, preview, ok ? undefined : NEGATIVE_TTL_MS);
+            return preview;
+        })
+        .finally(() => inFlight.delete(targetUrl));
+
+    inFlight.set(targetUrl, pending);
+    return pending;
 }
 
-module.exports = { getLinkPreview };
+/**
+ * Previews for several URLs, fetched in parallel, in the order given
+ */
+function getLinkPreviews(urls) {
+    return Promise.all(urls.map(getLinkPreview));
+}
 
+const getLinkPreviewStats = () => ({
+    ...previewCache.stats(),
+    negativeTtlMs: NEGATIVE_TTL_MS,
+    inFlight: inFlight.size,
+    ...metrics
+});
 
+module.exports = { getLinkPreview, getLinkPreviews, getLinkPreviewStats };
@@ -0,0 +1,245 @@
+const crypto = require('crypto');
+const { LRUCache } = require('../utils/lruCache');
+const logger = require('../utils/logger');
+
+// Cache for AI tutor answers to repeated questions.
+//
+// Keyed on the normalized question, the equipment/level context and the
+// model. Conversation history is deliberately not part of the key: the
+// questions worth caching ("what does an XLR cable do") have the same answer
+// wherever they are asked.
+//
+// Backends: an in-process LRU (default), or any Redis-compatible server when
+// AI_CACHE_REDIS_URL is set and ioredis is installed. With Redis, eviction is
+// left to the server's maxmemory-policy (use allkeys-lru).
+
+const ENABLED = process.env.AI_CACHE_ENABLED !== 'false';
+const TTL_MS = parseInt(process.env.AI_CACHE_TTL_MS) || 24 * 60 * 60 * 1000;
+const MAX_ENTRIES = parseInt(process.env.AI_CACHE_MAX) || 2000;
+const REDIS_PREFIX = 'av:ai-cache:';
+
+const metrics = {
+    hits: 0,
+    misses: 0,
+    stores: 0,
+    errors: 0,
+    savedTokens: 0,
+    savedCostUsd: 0
+};
+
+/**
+ * Normalize a question so trivial variations share an entry: Unicode form,
+ * case, whitespace and trailing punctuation.
+ */
+const normalizePrompt = (prompt) => prompt
+    .normalize('NFKC')
+    .toLowerCase()
+    .replace(/\s+/g, ' ')
+    .replace(/[\s?!.]+$/, '')
+    .trim();
+
+/**
+ * Cache key for a question asked in a given equipment/level context
+ */
+const buildCacheKey = ({ prompt, equipmentContext, model }) => {
+    const context = equipmentContext
+        ? [equipmentContext.type || '', equipmentContext.name || '', equipmentContext.level || '']
+        : null;
+    return crypto
+        .createHash('sha256')
+        .update(JSON.stringify([model, context, normalizePrompt(prompt)]))
+        .digest('hex');
+};
+
+class MemoryStore {
+    constructor() {
+        this.name = 'memory';
+        this.cache = new LRUCache({ max: MAX_ENTRIES, ttlMs: TTL_MS });
+    }
+
+    async get(key) {
+        const entry = this.cache.get(key);
+        if (entry) {
+            entry.hits++;
+        }
+        return entry;
+    }
+
+    async set(key, entry) {
+        this.cache.set(key, entry);
+    }
+
+    // The most requested answers, for spotting what players ask again and again
+    top(limit) {
+        return [...this.cache.values()]
+            .sort((a, b) => b.hits - a.hits)
+            .slice(0, limit)
+            .map(({ prompt, hits, tokensUsed }) => ({ prompt, hits, tokensUsed }));
+    }
+
+    // Counts only: this ends up in the unauthenticated /health
+    stats() {
+        const { size, max, ttlMs, evictions } = this.cache.stats();
+        return { size, max, ttlMs, evictions };
+    }
+}
+
+class RedisStore {
+    constructor(client) {
+        this.name = 'redis';
+        this.client = client;
+    }
+
+    async get(key) {
+        const fields = await this.client.hgetall(REDIS_PREFIX + key);
+        if (!fields || !fields.response) {
+            return undefined;
+        }
+        // Only bump the counter of entries that exist, so it never outlives the TTL
+        const hits = await this.client.hincrby(REDIS_PREFIX + key, 'hits', 1);
+        return {
+            prompt: fields.prompt,
+            response: fields.response,
+            model: fields.model,
+            tokensUsed: parseInt(fields.tokensUsed) || 0,
+            cost: parseFloat(fields.cost) || 0,
+            createdAt: parseInt(fields.createdAt) || 0,
+            hits
+        };
+    }
+
+    async set(key, entry) {
+        await this.client
+            .multi()
+            .hset(REDIS_PREFIX + key, {
+                prompt: entry.prompt,
+                response: entry.response,
+                model: entry.model,
+                tokensUsed: entry.tokensUsed,
+                cost: entry.cost,
+                createdAt: entry.createdAt,
+                hits: 0
+            })
+            .pexpire(REDIS_PREFIX + key, TTL_MS)
+            .exec();
+    }
+
+    stats() {
+        return { ttlMs: TTL_MS, status: this.client.status };
+    }
+}
+
+const createStore = () => {
+    const redisUrl = process.env.AI_CACHE_REDIS_URL;
+    if (!redisUrl) {
+        return new MemoryStore();
+    }
+
+    try {
+        const Redis = require('ioredis');
+        const client = new Redis(redisUrl, { maxRetriesPerRequest: 1, enableOfflineQueue: false });
+        client.on('error', error => logger.warn(`AI response cache Redis error: ${error.message}`));
+        logger.info('AI response cache using Redis');
+        return new RedisStore(client);
+    } catch (error) {
+        logger.warn(`AI_CACHE_REDIS_URL is set but ioredis is unavailable (${error.message}), using the in-memory cache`);
+        return new MemoryStore();
+    }
+};
+
+let store = null;
+const getStore = () => {
+    if (!store) {
+        store = createStore();
+    }
+    return store;
+};
+
+/**
+ * Look up a cached answer. Resolves undefined on a miss, when the cache is
+ * disabled, or when the backend fails (a cache error never fails the request).
+ */
+const getCachedResponse = async (query) => {
+    if (!ENABLED) {
+        return undefined;
+    }
+
+    try {
+        const entry = await getStore().get(buildCacheKey(query));
+        if (entry) {
+            metrics.hits++;
+            metrics.savedTokens += entry.tokensUsed;
+            metrics.savedCostUsd += entry.cost;
+        } else {
+            metrics.misses++;
+        }
+        return entry;
+    } catch (error) {
+        metrics.errors++;
+        logger.warn(`AI response cache lookup failed: ${error.message}`);
+        return undefined;
+    }
+};
+
+/**
+ * Store an answer. Fire and forget: failures are logged and counted only.
+ */
+const cacheResponse = (query, { response, tokensUsed, cost }) => {
+    if (!ENABLED || !response) {
+        return;
+    }
+
+    const entry = {
+        prompt: normalizePrompt(query.prompt),
+        response,
+        model: query.model,
+        tokensUsed,
+        cost,
+        createdAt: Date.now(),
+        hits: 0
+    };
+
+    getStore().set(buildCacheKey(query), entry)
+        .then(() => { metrics.stores++; })
+        .catch(error => {
+            metrics.errors++;
+            logger.warn(`AI response cache store failed: ${error.message}`);
+        });
+};
+
+const getResponseCacheStats = () => {
+    if (!ENABLED) {
+        return { enabled: false };
+    }
+
+    const lookups = metrics.hits + metrics.misses;
+    return {
+        enabled: true,
+        backend: getStore().name,
+        ...metrics,
+        savedCostUsd: Number(metrics.savedCostUsd.toFixed(6)),
+        hitRate: lookups ? metrics.hits / lookups : 0,
+        store: getStore().stats()
+    };
+};
+
+/**
+ * Most hit cached prompts (raw player text, so admin-only). Null when the
+ * store cannot rank its entries (Redis).
+ */
+const getTopCachedPrompts = (limit = 10) => {
+    if (!ENABLED) {
+        return null;
+    }
+    const store = getStore();
+    return store.top ? store.top(limit) : null;
+};
+
+module.exports = {
+    normalizePrompt,
+    buildCacheKey,
+    getCachedResponse,
+    cacheResponse,
+    getResponseCacheStats,
+    getTopCachedPrompts
+};
@@ -0,0 +1,62 @@
+const { createClient } = require('@supabase/supabase-js');
+const { getSupabase, supabaseFetch } = require('../config/supabase');
+const { getWriteQueue } = require('./writeBehind');
+const logger = require('../utils/logger');
+
+// Telemetry rows are written behind the request in bulk inserts
+const batchOptions = {
+    maxBatchSize: parseInt(process.env.TELEMETRY_BATCH_SIZE) || 500,
+    flushIntervalMs: parseInt(process.env.TELEMETRY_FLUSH_INTERVAL_MS) || 1000,
+    maxQueueSize: parseInt(process.env.TELEMETRY_MAX_QUEUE) || 10000
+};
+
+// One service-role client for all api_usage writes (bypasses RLS like the routes did)
+let serviceClient = null;
+const getServiceClient = () => {
+    if (!serviceClient) {
+        serviceClient = createClient(
+            process.env.SUPABASE_URL,
+            process.env.SUPABASE_SERVICE_ROLE_KEY,
+            {
+                auth: {
+                    autoRefreshToken: false,
+                    persistSession: false
+                },
+                global: { fetch: supabaseFetch }
+            }
+        );
+    }
+    return serviceClient;
+};
+
+/**
+ * Queue an equipment_interactions row. Returns false when the queue is full.
+ */
+const recordEquipmentInteraction = (row) => {
+    return getWriteQueue('equipment_interactions', { getClient: getSupabase, ...batchOptions }).enqueue({
+        created_at: new Date().toISOString(),
+        ...row
+    });
+};
+
+/**
+ * Queue an api_usage row. Usage tracking never fails the request it describes,
+ * so a full queue only logs a warning.
+ */
+const recordApiUsage = (row) => {
+    const queued = getWriteQueue('api_usage', { getClient: getServiceClient, ...batchOptions }).enqueue({
+        request_count: 1,
+        created_at: new Date().toISOString(),
+        ...row
+    });
+
+    if (!queued) {
+        logger.warn(`api_usage queue full, dropped ${row.api_type} usage row for user ${row.user_id}`);
+    }
+    return queued;
+};
+
+module.exports = {
+    recordEquipmentInteraction,
+    recordApiUsage
+};
@@ -0,0 +1,164 @@
+const http = require('http');
+const https = require('https');
+const crypto = require('crypto');
+const { counter, histogram } = require('../utils/metrics');
+
+// Streams audio to the OpenAI transcription endpoint. The SDK's upload helper
+// reads the whole file into memory first, so the multipart request is written
+// here by hand: audio is forwarded chunk by chunk with backpressure, and a
+// request never holds more than a few socket buffers of it.
+
+const TRANSCRIPTION_MODEL = 'whisper-1';
+const agentOptions = { keepAlive: true, maxSockets: 32 };
+const agents = {
+    'http:': new http.Agent(agentOptions),
+    'https:': new https.Agent(agentOptions)
+};
+
+const metrics = { transcriptions: 0, failures: 0, rejectedTooLarge: 0, bytesStreamed: 0, inFlight: 0 };
+
+// Shared with config/openai.js, which declares the same family for chat completions
+const openaiDuration = histogram(
+    'openai_request_duration_seconds',
+    'OpenAI call latency, to the last chunk for streamed completions',
+    ['endpoint', 'model', 'status']
+);
+const audioBytes = counter('openai_transcription_audio_bytes_total', 'Audio bytes streamed to transcription');
+
+/**
+ * Error for audio over the upload cap. Same code as multer's size limit, so
+ * callers handle both the same way.
+ */
+class UploadTooLargeError extends Error {
+    constructor(maxBytes) {
+        super(`Audio exceeds the ${maxBytes} byte limit`);
+        this.code = 'LIMIT_FILE_SIZE';
+        this.status = 413;
+    }
+}
+
+const formField = (boundary, name, value) =>
+    `--${boundary}\r\nContent-Disposition: form-data; name="${name}"\r\n\r\n${value}\r\n`;
+
+/**
+ * Transcribe an audio stream. Resolves with { text, bytes }.
+ *
+ * Past maxBytes the upstream request is aborted and the promise rejects with
+ * UploadTooLargeError. The source stream is paused and left to the caller
+ * rather than destroyed, so an HTTP request can still be answered (413).
+ */
+function transcribeStream(audioStream, { filename = 'audio.webm', contentType = 'audio/webm', maxBytes = Infinity, signal } = {}) {
+    return new Promise((resolve, reject) => {
+        const baseUrl = (process.env.OPENAI_BASE_URL || 'https://api.openai.com/v1').replace(/\/$/, '');
+        const url = new URL(`${baseUrl}/audio/transcriptions`);
+        const boundary = `----avmaster${crypto.randomBytes(12).toString('hex')}`;
+        let bytes = 0;
+        let settled = false;
+        let upstreamStatus = 'error';
+        const stopTimer = openaiDuration.startTimer({ endpoint: 'audio/transcriptions', model: TRANSCRIPTION_MODEL });
+
+        metrics.inFlight++;
+
+        const finish = (error, result) => {
+            if (settled) return;
+            settled = true;
+            metrics.inFlight--;
+            metrics.bytesStreamed += bytes;
+            audioBytes.inc({}, bytes);
+            audioStream.off('data', onData);
+            audioStream.off('end', onEnd);
+            audioStream.off('error', finish);
+            signal?.removeEventListener('abort', onAbort);
+            if (error) {
+                metrics.failures++;
+                // Rejected before a response: the caller gave up, not OpenAI
+                if (error.code === 'ABORT_ERR' || error instanceof UploadTooLargeError) {
+                    upstreamStatus = 'cancelled';
+                }
+                stopTimer({ status: upstreamStatus });
+                if (error instanceof UploadTooLargeError) {
+                    metrics.rejectedTooLarge++;
+                }
+                audioStream.pause();
+                request.destroy();
+                reject(error);
+            } else {
+                metrics.transcriptions++;
+                stopTimer({ status: upstreamStatus });
+                resolve(result);
+            }
+        };
+
+        const request = (url.protocol === 'https:' ? https : http).request(url, {
+            method: 'POST',
+            agent: agents[url.protocol],
+            headers: {
+                Authorization: `Bearer ${process.env.OPENAI_API_KEY}`,
+                'Content-Type': `multipart/form-data; boundary=${boundary}`
+            }
+        }, (response) => {
+            let body = '';
+            upstreamStatus = response.statusCode;
+            response.setEncoding('utf8');
+            response.on('data', chunk => { body += chunk; });
+            response.on('end', () => {
+                if (response.statusCode !== 200) {
+                    const error = new Error(`Transcription failed (${response.statusCode}): ${body.slice(0, 300)}`);
+                    error.status = 502;
+                    return finish(error);
+                }
+                finish(null, { text: body.trim(), bytes });
+            });
+            response.on('error', finish);
+        });
+        request.on('error', finish);
+
+        const onData = (chunk) => {
+            bytes += chunk.length;
+            if (bytes > maxBytes) {
+                return finish(new UploadTooLargeError(maxBytes));
+            }
+            if (!request.write(chunk)) {
+                audioStream.pause();
+                request.once('drain', () => {
+                    if (!settled) audioStream.resume();
+                });
+            }
+        };
+
+        const onEnd = () => {
+            if (bytes === 0) {
+                const error = new Error('No audio received');
+                error.status = 400;
+                return finish(error);
+            }
+            request.end(`\r\n--${boundary}--\r\n`);
+        };
+
+        const onAbort = () => finish(Object.assign(new Error('Transcription aborted'), { code: 'ABORT_ERR' }));
+
+        if (signal?.aborted) {
+            return onAbort();
+        }
+        signal?.addEventListener('abort', onAbort, { once: true });
+
+        request.write(formField(boundary, 'model', TRANSCRIPTION_MODEL));
+        request.write(formField(boundary, 'response_format', 'text'));
+        request.write(`--${boundary}\r\nContent-Disposition: form-data; name="file"; filename="${filename.replace(/["\r\n]/g, '')}"\r\n` +
+            `Content-Type: ${contentType}\r\n\r\n`);
+
+        audioStream.on('data', onData);
+        audioStream.once('end', onEnd);
+        audioStream.once('error', finish);
+        audioStream.resume();
+    });
+}
+
+const getTranscriptionStats = () => ({ ...metrics });
+
+module.exports = {
+    transcribeStream,
+    UploadTooLargeError,
+    getTranscriptionStats,
+    TRANSCRIPTION_MODEL
+};
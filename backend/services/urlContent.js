@@ -0,0 +1,111 @@
+const { LRUCache } = require('../utils/lruCache');
+const logger = require('../utils/logger');
+const { extractPageContent } = require('./htmlExtract');
+const cpuTasks = require('./cpuTasks');
+
+// Shared cache of fetched page content, used by the search routes.
+//
+// Failed fetches are cached too (as null, for a shorter TTL), so an
+// unreachable site is not retried by every request; failures of the CPU pool
+// (overloaded, timed out) are not, since they say nothing about the page.
+// Concurrent requests for the same URL share one fetch.
+
+const FETCH_TIMEOUT_MS = parseInt(process.env.URL_FETCH_TIMEOUT_MS) || 8000;
+const MAX_BYTES = 350_000; // ~350KB of HTML is plenty for the head and lead text
+
+const contentCache = new LRUCache({
+    max: parseInt(process.env.URL_CACHE_MAX) || 500,
+    ttlMs: parseInt(process.env.URL_CACHE_TTL_MS) || 30 * 60 * 1000
+});
+const NEGATIVE_TTL_MS = parseInt(process.env.URL_CACHE_NEGATIVE_TTL_MS) || 5 * 60 * 1000;
+
+const inFlight = new Map();
+const metrics = { fetches: 0, failures: 0, poolFailures: 0, shared: 0 };
+
+const USER_AGENT = 'Mozilla/5.0 (compatible; AVMasterBot/1.0; +https://worldcastlive.com)';
+
+const fetchUrlContent = async (url) => {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), FETCH_TIMEOUT_MS);
+    try {
+        const response = await fetch(url, {
+            headers: { 'user-agent': USER_AGENT, accept: 'text/html' },
+            signal: controller.signal
+        });
+        if (!response.ok || !(response.headers.get('content-type') || '').includes('text/html')) {
+            response.body?.cancel().catch(() => {});
+            return null;
+        }
+
+        // Read at most MAX_BYTES; the rest of a large page is never downloaded
+        const reader = response.body.getReader();
+        const chunks = [];
+        let bytes = 0;
+        while (bytes < MAX_BYTES) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            chunks.push(value);
+            bytes += value.byteLength;
+        }
+        if (bytes >= MAX_BYTES) {
+            reader.cancel().catch(() => {});
+        }
+        const html = new TextDecoder('utf-8').decode(Buffer.concat(chunks).subarray(0, MAX_BYTES));
+        // Regex extraction runs on the CPU worker pool
+        return await cpuTasks.extractPageContent(html, url);
+    } finally {
+        clearTimeout(timer);
+    }
+};
+
+/**
+ * Get a page's { title, description, content, url }, from the cache when
+ * possible. Resolves null when the page cannot be fetched or is not HTML.
+ */
+const getUrlContent = (url) => {
+    if (contentCache.has(url)) {
+        return Promise.resolve(contentCache.get(url));
+    }
+    if (inFlight.has(url)) {
+        metrics.shared++;
+        return inFlight.get(url);
+    }
+
+    metrics.fetches++;
+    const pending = fetchUrlContent(url)
+        .catch(error => {
+            if (cpuTasks.isPoolError(error)) {
+                metrics.poolFailures++;
+                logger.warn(`Extracting ${url} failed, not cached: ${error.message}`);
+                return undefined;
+            }
+            logger.warn(`Fetching ${url} failed: ${error.message}`);
+            return null;
+        })
+        .then(content => {
+            if (content) {
+                contentCache.set(url, content);
+            } else if (content === null) {
+                metrics.failures++;
+                contentCache.set(url, null, NEGATIVE_TTL_MS);
+            }
+            return content || null;
+        })
+        .finally(() => inFlight.delete(url));
+
+    inFlight.set(url, pending);
+    return pending;
+};
+
+const getUrlContentStats = () => ({
+    ...contentCache.stats(),
+    negativeTtlMs: NEGATIVE_TTL_MS,
+    inFlight: inFlight.size,
+    ...metrics
+});
+
+module.exports = {
+    getUrlContent,
+    extractPageContent,
+    getUrlContentStats
+};
@@ -1,5 +1,11 @@
 const axios = require('axios');
 const logger = require('../utils/logger');
+const { getUrlContent } = require('./urlContent');
+const { mapWithDeadline } = require('../utils/concurrency');
+
+// Detail fetches for one search: how many at once, and how long the answer waits for them
+const DETAIL_CONCURRENCY = parseInt(process.env.WEB_DETAIL_CONCURRENCY) || 4;
+const DETAIL_DEADLINE_MS = parseInt(process.env.WEB_DETAIL_DEADLINE_MS) || 2500;
 
 class WebSearchService {
     constructor() {
@@ -199,7 +205,12 @@ class WebSearchService {
             };
 
             const domain = url.replace(/^https?:\/\//, '').replace(/^www\./, '');
-            return retailerInfo[domain] || {
+            if (retailerInfo[domain]) {
+                return retailerInfo[domain];
+            }
+
+            // Any other page is fetched (through the shared URL content cache)
+            return await getUrlContent(url) || {
                 title: 'Professional Audio Equipment Retailer',
                 description: 'Leading retailer for professional audio equipment.',
                 content: 'Professional audio equipment retailer offering competitive pricing and expert advice for audio professionals and enthusiasts.',
@@ -211,6 +222,33 @@ class WebSearchService {
             return null;
         }
     }
+
+    /**
+     * Detailed info for several results, fetched concurrently. Results whose
+     * details fail or are not ready by the deadline are left out, so one slow
+     * site cannot hold up the answer; their fetches still complete into the
+     * URL content cache for the next query.
+     */
+    async getDetailedInfoForResults(results, { concurrency = DETAIL_CONCURRENCY, deadlineMs = DETAIL_DEADLINE_MS } = {}) {
+        const outcomes = await mapWithDeadline(
+            results,
+            result => this.getDetailedInfo(result.url),
+            { concurrency, deadlineMs }
+        );
+
+        const detailedResults = [];
+        for (let index = 0; index < results.length; index++) {
+            const outcome = outcomes[index];
+            if (outcome?.status === 'fulfilled' && outcome.value) {
+                detailedResults.push({ ...results[index], detailedInfo: outcome.value });
+            } else if (!outcome) {
+                logger.warn(`Detailed info for ${results[index].url} missed the ${deadlineMs}ms deadline`);
+            } else if (outcome.status === 'rejected') {
+                logger.error(`Error getting detailed info for ${results[index].url}:`, outcome.reason?.message);
+            }
+        }
+        return detailedResults;
+    }
 }
 
 module.exports = new WebSearchService();
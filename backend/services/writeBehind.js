@@ -0,0 +1,226 @@
+const logger = require('../utils/logger');
+
+// Postgres error classes that a retry cannot fix (22 = data exception, 23 = constraint violation)
+const isDataError = (error) => typeof error?.code === 'string' && /^2[23]/.test(error.code);
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Upper bound for flushing on shutdown. cluster.js kills a worker
+// CLUSTER_SHUTDOWN_TIMEOUT_MS (30s) after asking it to stop, and the server
+// first waits for in-flight requests, so this must stay well below that.
+const CLOSE_TIMEOUT_MS = parseInt(process.env.WRITE_QUEUE_CLOSE_TIMEOUT_MS) || 15000;
+
+/**
+ * In-process write-behind queue for telemetry rows.
+ *
+ * Requests enqueue rows and return immediately. Rows are written as one bulk
+ * insert when maxBatchSize rows are waiting or every flushIntervalMs,
+ * whichever comes first. Failed batches are retried with exponential backoff.
+ * A batch rejected for bad data is retried row by row, so one bad row does
+ * not drop the others; rows that then fail for other reasons (network, 5xx)
+ * go back on the queue. When maxQueueSize rows are waiting, enqueue() refuses
+ * new rows (returns false) so callers can shed load instead of growing the
+ * heap.
+ */
+class WriteBehindQueue {
+    constructor({
+        table,
+        getClient,
+        maxBatchSize = 500,
+        flushIntervalMs = 1000,
+        maxQueueSize = 10000,
+        maxRetries = 5,
+        retryBaseMs = 250
+    }) {
+        this.table = table;
+        this.getClient = getClient;
+        this.maxBatchSize = maxBatchSize;
+        this.flushIntervalMs = flushIntervalMs;
+        this.maxQueueSize = maxQueueSize;
+        this.maxRetries = maxRetries;
+        this.retryBaseMs = retryBaseMs;
+
+        this.rows = [];
+        this.flushing = null;
+        this.closed = false;
+        // Set by close(): past it, failed batches are no longer retried
+        this.deadline = null;
+        this.metrics = {
+            enqueued: 0,
+            rejected: 0,
+            written: 0,
+            dropped: 0,
+            batches: 0,
+            retries: 0,
+            lastFlushMs: 0
+        };
+
+        this.timer = setInterval(() => this.flush(), flushIntervalMs);
+        // Telemetry must not keep the process alive on its own
+        this.timer.unref();
+    }
+
+    get pending() {
+        return this.rows.length;
+    }
+
+    /**
+     * Queue a row for insertion. Returns false if the queue is full or closed.
+     */
+    enqueue(row) {
+        if (this.closed || this.rows.length >= this.maxQueueSize) {
+            this.metrics.rejected++;
+            return false;
+        }
+
+        this.rows.push(row);
+        this.metrics.enqueued++;
+
+        if (this.rows.length >= this.maxBatchSize && !this.flushing) {
+            setImmediate(() => this.flush());
+        }
+        return true;
+    }
+
+    /**
+     * Write the next batch. Only one flush runs at a time; concurrent callers share it.
+     */
+    flush() {
+        if (!this.flushing && this.rows.length > 0) {
+            this.flushing = this.writeBatch(this.rows.splice(0, this.maxBatchSize))
+                .finally(() => {
+                    this.flushing = null;
+                });
+        }
+        return this.flushing || Promise.resolve();
+    }
+
+    async writeBatch(batch) {
+        const startedAt = Date.now();
+
+        let attempt = 0;
+        for (; attempt <= this.maxRetries; attempt++) {
+            if (attempt > 0) {
+                const delayMs = this.retryBaseMs * 2 ** (attempt - 1);
+                if (this.deadline && Date.now() + delayMs >= this.deadline) {
+                    break;
+                }
+                this.metrics.retries++;
+                await sleep(delayMs);
+            }
+
+            try {
+                const { error } = await this.getClient().from(this.table).insert(batch);
+
+                if (!error) {
+                    this.metrics.batches++;
+                    this.metrics.written += batch.length;
+                    this.metrics.lastFlushMs = Date.now() - startedAt;
+                    return;
+                }
+
+                if (isDataError(error)) {
+                    await this.writeRowByRow(batch, error);
+                    return;
+                }
+
+                logger.warn(`Write-behind insert into ${this.table} failed (attempt ${attempt + 1}): ${error.message}`);
+            } catch (error) {
+                logger.warn(`Write-behind insert into ${this.table} threw (attempt ${attempt + 1}): ${error.message}`);
+            }
+        }
+
+        this.metrics.dropped += batch.length;
+        logger.error(`Write-behind dropped ${batch.length} ${this.table} rows after ${attempt} attempts${this.deadline ? ' (closing)' : ''}`);
+    }
+
+    /**
+     * Isolate the rows a bulk insert rejected for bad data. Only rows rejected
+     * for their own data are dropped; the others are queued again and retried
+     * with the next batch.
+     */
+    async writeRowByRow(batch, batchError) {
+        logger.warn(`Write-behind batch for ${this.table} rejected (${batchError.code}), inserting rows individually`);
+
+        const retry = [];
+        for (const row of batch) {
+            let error;
+            try {
+                ({ error } = await this.getClient().from(this.table).insert(row));
+            } catch (thrown) {
+                error = thrown;
+            }
+
+            if (!error) {
+                this.metrics.written++;
+            } else if (isDataError(error)) {
+                this.metrics.dropped++;
+                logger.error(`Write-behind dropped a ${this.table} row: ${error.message}`);
+            } else {
+                retry.push(row);
+            }
+        }
+
+        if (retry.length > 0) {
+            logger.warn(`Write-behind requeued ${retry.length} ${this.table} rows after transient failures`);
+            this.rows.unshift(...retry);
+        }
+    }
+
+    /**
+     * Stop accepting rows and write everything still queued, for at most
+     * timeoutMs; whatever is left then is dropped (and logged)
+     */
+    async close(timeoutMs = CLOSE_TIMEOUT_MS) {
+        this.closed = true;
+        clearInterval(this.timer);
+        this.deadline = Date.now() + timeoutMs;
+
+        while ((this.rows.length > 0 || this.flushing) && Date.now() < this.deadline) {
+            // An insert that hangs must not hold up shutdown either
+            await Promise.race([this.flush(), sleep(this.deadline - Date.now())]);
+        }
+
+        if (this.rows.length > 0) {
+            this.metrics.dropped += this.rows.length;
+            logger.error(`Write-behind dropped ${this.rows.length} ${this.table} rows still queued after ${timeoutMs}ms on close`);
+            this.rows = [];
+        }
+    }
+
+    stats() {
+        return {
+            table: this.table,
+            pending: this.rows.length,
+            ...this.metrics
+        };
+    }
+}
+
+const queues = new Map();
+
+/**
+ * Get (or create) the shared queue for a table
+ */
+const getWriteQueue = (table, options = {}) => {
+    if (!queues.has(table)) {
+        queues.set(table, new WriteBehindQueue({ table, ...options }));
+    }
+    return queues.get(table);
+};
+
+/**
+ * Flush and close every queue (in parallel, so within one close timeout); called on shutdown
+ */
+const closeWriteQueues = async (timeoutMs) => {
+    await Promise.all([...queues.values()].map(queue => queue.close(timeoutMs)));
+};
+
+const getWriteQueueStats = () => [...queues.values()].map(queue => queue.stats());
+
+module.exports = {
+    WriteBehindQueue,
+    getWriteQueue,
+    closeWriteQueues,
+    getWriteQueueStats
+};
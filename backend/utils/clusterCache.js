@@ -0,0 +1,198 @@
+const cluster = require('cluster');
+const { LRUCache } = require('./lruCache');
+
+// Caches and invalidations that must agree across cluster.js workers.
+//
+// createClusterCache(name, options): an LRU cache with an async interface.
+//   As a cluster worker the entries live in the primary (serveClusterCaches)
+//   and every call is a request over the cluster IPC channel, like the rate
+//   limit counters in rateLimitStore.js; otherwise it is a local LRUCache.
+//   A request the primary does not answer in time counts as a miss.
+//
+// broadcast(channel, payload) / subscribe(channel, handler): run a handler in
+//   this process and, through the primary, in every other worker. For caches
+//   that stay per process but must drop entries everywhere (auth logout).
+
+const CACHE_MESSAGE = 'av:cache';
+const BROADCAST_MESSAGE = 'av:broadcast';
+const IPC_TIMEOUT_MS = 500;
+
+const subscribers = new Map();
+const pending = new Map();
+let nextId = 0;
+
+if (cluster.isWorker) {
+    process.on('message', (message) => {
+        if (message?.type === CACHE_MESSAGE && pending.has(message.id)) {
+            const { resolve, timer } = pending.get(message.id);
+            clearTimeout(timer);
+            pending.delete(message.id);
+            resolve(message.result);
+        } else if (message?.type === BROADCAST_MESSAGE) {
+            (subscribers.get(message.channel) || []).forEach(handler => handler(message.payload));
+        }
+    });
+}
+
+const request = (message) => new Promise((resolve) => {
+    const id = nextId++;
+    const timer = setTimeout(() => {
+        pending.delete(id);
+        resolve({ timedOut: true });
+    }, IPC_TIMEOUT_MS);
+    pending.set(id, { resolve, timer });
+    process.send({ type: CACHE_MESSAGE, id, ...message });
+});
+
+// Operations shared by the local cache and the primary's copy
+const apply = (cache, { op, key, value, ttlMs, limit }) => {
+    if (op === 'get') {
+        return { value: cache.get(key) };
+    }
+    if (op === 'set') {
+        cache.set(key, value, ttlMs);
+    } else if (op === 'append') {
+        // Extends a cached list (no-op when not cached), keeping the last `limit` items
+        const list = cache.get(key);
+        if (list) {
+            cache.set(key, [...list, ...value].slice(-limit), ttlMs);
+        }
+    } else if (op === 'delete') {
+        cache.delete(key);
+    }
+    return {};
+};
+
+class LocalCache {
+    constructor(options) {
+        this.cache = new LRUCache(options);
+    }
+
+    async get(key) {
+        return apply(this.cache, { op: 'get', key }).value;
+    }
+
+    async set(key, value, ttlMs) {
+        apply(this.cache, { op: 'set', key, value, ttlMs });
+    }
+
+    async append(key, items, limit, ttlMs) {
+        apply(this.cache, { op: 'append', key, value: items, limit, ttlMs });
+    }
+
+    async delete(key) {
+        apply(this.cache, { op: 'delete', key });
+    }
+
+    stats() {
+        return this.cache.stats();
+    }
+}
+
+/**
+ * Worker side: the cache lives in the primary. Hits and misses are counted
+ * here, per worker; size and evictions are the primary's.
+ */
+class PrimaryCache {
+    constructor(name, options) {
+        this.name = name;
+        this.options = options;
+        this.hits = 0;
+        this.misses = 0;
+        this.timeouts = 0;
+    }
+
+    async call(op, fields) {
+        const result = await request({ cache: this.name, options: this.options, op, ...fields });
+        if (result.timedOut) {
+            this.timeouts++;
+        }
+        return result;
+    }
+
+    async get(key) {
+        const { value } = await this.call('get', { key });
+        if (value === undefined) {
+            this.misses++;
+        } else {
+            this.hits++;
+        }
+        return value;
+    }
+
+    async set(key, value, ttlMs) {
+        await this.call('set', { key, value, ttlMs });
+    }
+
+    async append(key, items, limit, ttlMs) {
+        await this.call('append', { key, value: items, limit, ttlMs });
+    }
+
+    async delete(key) {
+        await this.call('delete', { key });
+    }
+
+    stats() {
+        const lookups = this.hits + this.misses;
+        return {
+            shared: true,
+            hits: this.hits,
+            misses: this.misses,
+            timeouts: this.timeouts,
+            hitRate: lookups > 0 ? this.hits / lookups : 0
+        };
+    }
+}
+
+/**
+ * Cache shared by all cluster workers (local when not clustered).
+ * options are LRUCache's { max, ttlMs }.
+ */
+const createClusterCache = (name, options) =>
+    (cluster.isWorker ? new PrimaryCache(name, options) : new LocalCache(options));
+
+/**
+ * Run a handler for a channel's broadcasts, from this process or any worker
+ */
+const subscribe = (channel, handler) => {
+    subscribers.set(channel, [...(subscribers.get(channel) || []), handler]);
+};
+
+const broadcast = (channel, payload) => {
+    (subscribers.get(channel) || []).forEach(handler => handler(payload));
+    if (cluster.isWorker) {
+        process.send({ type: BROADCAST_MESSAGE, channel, payload });
+    }
+};
+
+/**
+ * Primary side (cluster.js): hold the shared caches and relay broadcasts
+ */
+const serveClusterCaches = () => {
+    const caches = new Map();
+
+    cluster.on('message', (worker, message) => {
+        if (message?.type === CACHE_MESSAGE) {
+            if (!caches.has(message.cache)) {
+                caches.set(message.cache, new LRUCache(message.options));
+            }
+            const result = apply(caches.get(message.cache), message);
+            if (worker.isConnected()) {
+                worker.send({ type: CACHE_MESSAGE, id: message.id, result });
+            }
+        } else if (message?.type === BROADCAST_MESSAGE) {
+            Object.values(cluster.workers)
+                .filter(other => other !== worker && other.isConnected())
+                .forEach(other => other.send(message));
+        }
+    });
+
+    return { stats: () => Object.fromEntries([...caches].map(([name, cache]) => [name, cache.stats()])) };
+};
+
+module.exports = {
+    createClusterCache,
+    subscribe,
+    broadcast,
+    serveClusterCaches
+};
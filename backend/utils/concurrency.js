@@ -0,0 +1,58 @@
+// Helpers for running independent async work side by side
+
+/**
+ * Map items through an async function with at most `concurrency` calls in
+ * flight, and stop waiting after `deadlineMs`.
+ *
+ * Resolves to an array aligned with items: { status: 'fulfilled', value } or
+ * { status: 'rejected', reason } like Promise.allSettled, and undefined for
+ * items still running (or not started) at the deadline. Calls that miss the
+ * deadline are not cancelled; they finish in the background, so any caching
+ * they do still benefits the next caller.
+ */
+const mapWithDeadline = (items, fn, { concurrency = 4, deadlineMs = 2000 } = {}) => new Promise(resolve => {
+    const results = new Array(items.length);
+    let next = 0;
+    let active = 0;
+    let settled = 0;
+    let finished = false;
+
+    const finish = () => {
+        if (!finished) {
+            finished = true;
+            clearTimeout(timer);
+            resolve(results);
+        }
+    };
+
+    const launch = () => {
+        while (!finished && active < concurrency && next < items.length) {
+            const index = next++;
+            active++;
+            Promise.resolve()
+                .then(() => fn(items[index], index))
+                .then(
+                    value => { results[index] = { status: 'fulfilled', value }; },
+                    reason => { results[index] = { status: 'rejected', reason }; }
+                )
+                .finally(() => {
+                    active--;
+                    settled++;
+                    if (settled === items.length) {
+                        finish();
+                    } else {
+                        launch();
+                    }
+                });
+        }
+    };
+
+    const timer = setTimeout(finish, deadlineMs);
+    if (items.length === 0) {
+        finish();
+        return;
+    }
+    launch();
+});
+
+module.exports = { mapWithDeadline };
@@ -0,0 +1,51 @@
+const { monitorEventLoopDelay } = require('perf_hooks');
+
+// Event loop delay histogram: how late timers fire because the loop was busy.
+// High percentiles here mean every request on this process waited that long.
+// The histogram is rotated every EVENT_LOOP_WINDOW_MS; stats cover the current
+// window and the last complete one.
+
+const WINDOW_MS = parseInt(process.env.EVENT_LOOP_WINDOW_MS) || 60 * 1000;
+const RESOLUTION_MS = 10;
+
+let histogram = null;
+let lastWindow = null;
+
+const toMs = (ns) => Number((ns / 1e6).toFixed(3));
+
+const summarize = (h) => {
+    if (!h.count) {
+        return { count: 0 };
+    }
+    return {
+        count: h.count,
+        min: toMs(h.min),
+        mean: toMs(h.mean),
+        p50: toMs(h.percentile(50)),
+        p90: toMs(h.percentile(90)),
+        p99: toMs(h.percentile(99)),
+        max: toMs(h.max)
+    };
+};
+
+const startEventLoopMonitor = () => {
+    if (histogram) return;
+    histogram = monitorEventLoopDelay({ resolution: RESOLUTION_MS });
+    histogram.enable();
+    setInterval(() => {
+        lastWindow = summarize(histogram);
+        histogram.reset();
+    }, WINDOW_MS).unref();
+};
+
+/**
+ * Delay percentiles in milliseconds, or null before startEventLoopMonitor()
+ */
+const getEventLoopStats = () => (histogram
+    ? { windowMs: WINDOW_MS, resolutionMs: RESOLUTION_MS, current: summarize(histogram), lastWindow }
+    : null);
+
+module.exports = {
+    startEventLoopMonitor,
+    getEventLoopStats
+};
@@ -0,0 +1,117 @@
+// Bounded in-memory cache with least-recently-used eviction and per-entry TTL.
+// A Map keeps insertion order, so re-inserting on access makes the first key
+// the least recently used one.
+
+class LRUCache {
+    constructor({ max = 1000, ttlMs = 60000 } = {}) {
+        this.max = max;
+        this.ttlMs = ttlMs;
+        this.entries = new Map();
+        this.hits = 0;
+        this.misses = 0;
+        this.evictions = 0;
+    }
+
+    get size() {
+        return this.entries.size;
+    }
+
+    /**
+     * Get a live entry's value (undefined when missing or expired)
+     */
+    get(key) {
+        const entry = this.entries.get(key);
+
+        if (!entry) {
+            this.misses++;
+            return undefined;
+        }
+
+        if (entry.expiresAt <= Date.now()) {
+            this.entries.delete(key);
+            this.misses++;
+            return undefined;
+        }
+
+        // Move to the most recently used end
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        this.hits++;
+        return entry.value;
+    }
+
+    /**
+     * Check for a live entry without touching recency or hit counters
+     */
+    has(key) {
+        const entry = this.entries.get(key);
+        return !!entry && entry.expiresAt > Date.now();
+    }
+
+    /**
+     * Store a value; ttlMs overrides the cache default for this entry
+     */
+    set(key, value, ttlMs = this.ttlMs) {
+        this.entries.delete(key);
+        if (ttlMs <= 0) {
+            return this;
+        }
+
+        this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+        while (this.entries.size > this.max) {
+            this.entries.delete(this.entries.keys().next().value);
+            this.evictions++;
+        }
+        return this;
+    }
+
+    delete(key) {
+        return this.entries.delete(key);
+    }
+
+    /**
+     * Iterate over live values without touching recency or hit counters
+     */
+    *values() {
+        const now = Date.now();
+        for (const entry of this.entries.values()) {
+            if (entry.expiresAt > now) {
+                yield entry.value;
+            }
+        }
+    }
+
+    /**
+     * Delete every entry whose value matches a predicate; returns how many were removed
+     */
+    deleteWhere(predicate) {
+        let removed = 0;
+        for (const [key, entry] of this.entries) {
+            if (predicate(entry.value, key)) {
+                this.entries.delete(key);
+                removed++;
+            }
+        }
+        return removed;
+    }
+
+    clear() {
+        this.entries.clear();
+    }
+
+    stats() {
+        const lookups = this.hits + this.misses;
+        return {
+            size: this.entries.size,
+            max: this.max,
+            ttlMs: this.ttlMs,
+            hits: this.hits,
+            misses: this.misses,
+            evictions: this.evictions,
+            hitRate: lookups > 0 ? this.hits / lookups : 0
+        };
+    }
+}
+
+module.exports = { LRUCache };
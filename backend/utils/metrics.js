@@ -0,0 +1,275 @@
+const cluster = require('cluster');
+
+// Prometheus metrics for GET /metrics, in the text exposition format.
+//
+// Counters and histograms are updated in place (a Map lookup per sample);
+// everything else (memory, event loop delay, cache stats) is read from its
+// source by collectors only when /metrics is scraped. METRICS_ENABLED=false
+// turns all of it into no-ops and removes the endpoint.
+//
+// Under cluster.js each worker keeps its own samples. A scrape, whichever
+// worker it lands on, asks the primary to gather every worker's snapshot:
+// counters and histograms are summed, gauges get a pid label.
+
+const ENABLED = process.env.METRICS_ENABLED !== 'false';
+const DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30];
+const MESSAGE_TYPE = 'av:metrics';
+const CLUSTER_TIMEOUT_MS = 2000;
+
+const families = new Map();
+const collectors = [];
+
+const seriesKey = (labelNames, labels) => labelNames.map(name => labels[name] ?? '').join('\u0001');
+
+const pickLabels = (labelNames, labels) => {
+    const picked = {};
+    labelNames.forEach(name => { picked[name] = String(labels[name] ?? ''); });
+    return picked;
+};
+
+class Counter {
+    constructor(name, help, labelNames = []) {
+        Object.assign(this, { name, help, labelNames, type: 'counter', series: new Map() });
+    }
+
+    inc(labels = {}, value = 1) {
+        if (!ENABLED) return;
+        const key = seriesKey(this.labelNames, labels);
+        let series = this.series.get(key);
+        if (!series) {
+            series = { labels: pickLabels(this.labelNames, labels), value: 0 };
+            this.series.set(key, series);
+        }
+        series.value += value;
+    }
+
+    snapshot() {
+        return { name: this.name, help: this.help, type: this.type, series: [...this.series.values()] };
+    }
+}
+
+class Histogram {
+    constructor(name, help, labelNames = [], buckets = DEFAULT_BUCKETS) {
+        Object.assign(this, { name, help, labelNames, buckets, type: 'histogram', series: new Map() });
+    }
+
+    observe(labels = {}, value) {
+        if (!ENABLED) return;
+        const key = seriesKey(this.labelNames, labels);
+        let series = this.series.get(key);
+        if (!series) {
+            series = { labels: pickLabels(this.labelNames, labels), counts: new Array(this.buckets.length).fill(0), sum: 0, count: 0 };
+            this.series.set(key, series);
+        }
+        // Per-bucket counts; made cumulative when rendered
+        const index = this.buckets.findIndex(bound => value <= bound);
+        if (index !== -1) {
+            series.counts[index]++;
+        }
+        series.sum += value;
+        series.count++;
+    }
+
+    /**
+     * Start a timer; calling the returned function observes the elapsed seconds
+     */
+    startTimer(labels = {}) {
+        const startedAt = process.hrtime.bigint();
+        return (moreLabels = {}) => {
+            const seconds = Number(process.hrtime.bigint() - startedAt) / 1e9;
+            this.observe({ ...labels, ...moreLabels }, seconds);
+            return seconds;
+        };
+    }
+
+    snapshot() {
+        return { name: this.name, help: this.help, type: this.type, buckets: this.buckets, series: [...this.series.values()] };
+    }
+}
+
+// Declaring a metric that already exists returns the existing one, so modules
+// can share a metric by declaring it with the same name
+const register = (name, create) => {
+    if (!families.has(name)) {
+        families.set(name, create());
+    }
+    return families.get(name);
+};
+
+const counter = (name, help, labelNames) => register(name, () => new Counter(name, help, labelNames));
+const histogram = (name, help, labelNames, buckets) => register(name, () => new Histogram(name, help, labelNames, buckets));
+
+/**
+ * Add a scrape-time collector: a function returning
+ * [{ name, help, type: 'gauge' | 'counter', series: [{ labels, value }] }]
+ */
+const registerCollector = (collect) => {
+    collectors.push(collect);
+};
+
+const snapshot = () => {
+    const collected = collectors.flatMap(collect => {
+        try {
+            return collect();
+        } catch {
+            return [];
+        }
+    });
+    return [...[...families.values()].map(metric => metric.snapshot()), ...collected];
+};
+
+// Merge per-process snapshots: counters and histograms are summed by label
+// set, gauges are kept per process with a pid label
+const merge = (snapshots) => {
+    const merged = new Map();
+    const perProcess = snapshots.length > 1;
+
+    snapshots.forEach(({ pid, metrics }) => metrics.forEach(family => {
+        let target = merged.get(family.name);
+        if (!target) {
+            target = { ...family, series: new Map() };
+            merged.set(family.name, target);
+        }
+
+        family.series.forEach(series => {
+            const labels = family.type === 'gauge' && perProcess ? { ...series.labels, pid: String(pid) } : series.labels;
+            const key = JSON.stringify(labels);
+            const existing = target.series.get(key);
+            if (!existing) {
+                target.series.set(key, { ...series, labels, counts: series.counts && [...series.counts] });
+            } else if (family.type === 'histogram') {
+                series.counts.forEach((count, i) => { existing.counts[i] += count; });
+                existing.sum += series.sum;
+                existing.count += series.count;
+            } else {
+                existing.value += series.value;
+            }
+        });
+    }));
+
+    return [...merged.values()].map(family => ({ ...family, series: [...family.series.values()] }));
+};
+
+const escapeLabel = (value) => String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+
+const formatLabels = (labels, extra) => {
+    const pairs = Object.entries({ ...labels, ...extra }).map(([name, value]) => `${name}="${escapeLabel(value)}"`);
+    return pairs.length ? `{${pairs.join(',')}}` : '';
+};
+
+const render = (families) => {
+    const lines = [];
+    families.forEach(family => {
+        if (!family.series.length) return;
+        lines.push(`# HELP ${family.name} ${family.help}`, `# TYPE ${family.name} ${family.type}`);
+        family.series.forEach(series => {
+            if (family.type !== 'histogram') {
+                lines.push(`${family.name}${formatLabels(series.labels)} ${series.value}`);
+                return;
+            }
+            let cumulative = 0;
+            family.buckets.forEach((bound, i) => {
+                cumulative += series.counts[i];
+                lines.push(`${family.name}_bucket${formatLabels(series.labels, { le: bound })} ${cumulative}`);
+            });
+            lines.push(`${family.name}_bucket${formatLabels(series.labels, { le: '+Inf' })} ${series.count}`);
+            lines.push(`${family.name}_sum${formatLabels(series.labels)} ${series.sum}`);
+            lines.push(`${family.name}_count${formatLabels(series.labels)} ${series.count}`);
+        });
+    });
+    return `${lines.join('\n')}\n`;
+};
+
+// Cluster workers: answer the primary's snapshot requests and ask it for the merged output
+const pendingScrapes = new Map();
+let nextScrapeId = 0;
+
+if (ENABLED && cluster.isWorker) {
+    process.on('message', (message) => {
+        if (message?.type !== MESSAGE_TYPE) return;
+        if (message.op === 'collect') {
+            process.send({ type: MESSAGE_TYPE, op: 'snapshot', id: message.id, pid: process.pid, metrics: snapshot() });
+        } else if (message.op === 'response' && pendingScrapes.has(message.id)) {
+            pendingScrapes.get(message.id)(message.text);
+        }
+    });
+}
+
+/**
+ * The metrics text for a scrape: this process's own, or in cluster mode the
+ * merged output of all workers (this process's alone if the primary does
+ * not answer in time)
+ */
+const renderMetrics = () => {
+    const local = () => render(merge([{ pid: process.pid, metrics: snapshot() }]));
+    if (!cluster.isWorker) {
+        return Promise.resolve(local());
+    }
+
+    return new Promise((resolve) => {
+        const id = nextScrapeId++;
+        const timer = setTimeout(() => {
+            pendingScrapes.delete(id);
+            resolve(local());
+        }, CLUSTER_TIMEOUT_MS);
+        pendingScrapes.set(id, (text) => {
+            clearTimeout(timer);
+            pendingScrapes.delete(id);
+            resolve(text);
+        });
+        process.send({ type: MESSAGE_TYPE, op: 'scrape', id });
+    });
+};
+
+/**
+ * Primary side (cluster.js): gather snapshots from every worker for a scrape
+ */
+const serveClusterMetrics = () => {
+    if (!ENABLED) return;
+    let nextCollectId = 0;
+    const collections = new Map();
+
+    const finish = (collectId) => {
+        const collection = collections.get(collectId);
+        if (!collection) return;
+        collections.delete(collectId);
+        clearTimeout(collection.timer);
+        if (collection.requester.isConnected()) {
+            collection.requester.send({ type: MESSAGE_TYPE, op: 'response', id: collection.scrapeId, text: render(merge(collection.snapshots)) });
+        }
+    };
+
+    cluster.on('message', (worker, message) => {
+        if (message?.type !== MESSAGE_TYPE) return;
+
+        if (message.op === 'scrape') {
+            const collectId = nextCollectId++;
+            const workers = Object.values(cluster.workers).filter(candidate => candidate.isConnected());
+            collections.set(collectId, {
+                requester: worker,
+                scrapeId: message.id,
+                expected: workers.length,
+                snapshots: [],
+                // Answer with what has arrived if a worker is stuck
+                timer: setTimeout(() => finish(collectId), CLUSTER_TIMEOUT_MS / 2)
+            });
+            workers.forEach(candidate => candidate.send({ type: MESSAGE_TYPE, op: 'collect', id: collectId }));
+        } else if (message.op === 'snapshot') {
+            const collection = collections.get(message.id);
+            if (!collection) return;
+            collection.snapshots.push({ pid: message.pid, metrics: message.metrics });
+            if (collection.snapshots.length >= collection.expected) {
+                finish(message.id);
+            }
+        }
+    });
+};
+
+module.exports = {
+    METRICS_ENABLED: ENABLED,
+    counter,
+    histogram,
+    registerCollector,
+    renderMetrics,
+    serveClusterMetrics
+};
@@ -0,0 +1,173 @@
+const cluster = require('cluster');
+const logger = require('./logger');
+
+// Shared counters for express-rate-limit. Its default MemoryStore counts per
+// process, so with cluster.js every worker would allow the full limit again.
+//
+//   RATE_LIMIT_REDIS_URL set (and ioredis installed): counters live in Redis
+//     and are shared by every process on every host
+//   running as a cluster worker: counters live in the primary process and
+//     workers reach them over the cluster IPC channel
+//   otherwise: undefined, i.e. express-rate-limit's own MemoryStore
+
+const MESSAGE_TYPE = 'av:rate-limit';
+const IPC_TIMEOUT_MS = 1000;
+const REDIS_PREFIX = 'av:rate-limit:';
+
+class RedisStore {
+    constructor(client, prefix) {
+        this.client = client;
+        this.prefix = REDIS_PREFIX + prefix;
+        this.localKeys = false;
+    }
+
+    init(options) {
+        this.windowMs = options.windowMs;
+    }
+
+    async increment(key) {
+        const redisKey = this.prefix + key;
+        // The window starts with the first hit: SET NX only creates the key once
+        const [, [, totalHits], [, ttlMs]] = await this.client
+            .multi()
+            .set(redisKey, 0, 'PX', this.windowMs, 'NX')
+            .incr(redisKey)
+            .pttl(redisKey)
+            .exec();
+        return { totalHits, resetTime: new Date(Date.now() + Math.max(ttlMs, 0)) };
+    }
+
+    async decrement(key) {
+        await this.client.decr(this.prefix + key);
+    }
+
+    async resetKey(key) {
+        await this.client.del(this.prefix + key);
+    }
+}
+
+/**
+ * Worker side of the cluster store: every call is a request to the primary
+ */
+class ClusterStore {
+    constructor(prefix) {
+        this.prefix = prefix;
+        this.localKeys = false;
+        this.pending = new Map();
+        this.nextId = 0;
+
+        process.on('message', (message) => {
+            if (message?.type !== MESSAGE_TYPE || !this.pending.has(message.id)) {
+                return;
+            }
+            const { resolve, timer } = this.pending.get(message.id);
+            clearTimeout(timer);
+            this.pending.delete(message.id);
+            resolve(message.result);
+        });
+    }
+
+    init(options) {
+        this.windowMs = options.windowMs;
+    }
+
+    request(op, key) {
+        return new Promise((resolve, reject) => {
+            const id = `${this.prefix}${this.nextId++}`;
+            const timer = setTimeout(() => {
+                this.pending.delete(id);
+                reject(new Error(`Rate limit store did not answer ${op} within ${IPC_TIMEOUT_MS}ms`));
+            }, IPC_TIMEOUT_MS);
+            this.pending.set(id, { resolve, timer });
+            process.send({ type: MESSAGE_TYPE, id, op, key: this.prefix + key, windowMs: this.windowMs });
+        });
+    }
+
+    async increment(key) {
+        const { totalHits, resetTime } = await this.request('increment', key);
+        return { totalHits, resetTime: new Date(resetTime) };
+    }
+
+    async decrement(key) {
+        await this.request('decrement', key);
+    }
+
+    async resetKey(key) {
+        await this.request('resetKey', key);
+    }
+}
+
+/**
+ * Store for a rate limiter, or undefined for express-rate-limit's default.
+ * prefix keeps the counters of different limiters apart.
+ */
+const createRateLimitStore = (prefix) => {
+    const redisUrl = process.env.RATE_LIMIT_REDIS_URL;
+    if (redisUrl) {
+        try {
+            const Redis = require('ioredis');
+            const client = new Redis(redisUrl, { maxRetriesPerRequest: 1, enableOfflineQueue: false });
+            client.on('error', error => logger.warn(`Rate limit Redis error: ${error.message}`));
+            logger.info('Rate limiting with Redis');
+            return new RedisStore(client, prefix);
+        } catch (error) {
+            logger.warn(`RATE_LIMIT_REDIS_URL is set but ioredis is unavailable (${error.message})`);
+        }
+    }
+
+    if (cluster.isWorker) {
+        return new ClusterStore(prefix);
+    }
+    return undefined;
+};
+
+/**
+ * Primary side of the cluster store: fixed-window counters for all workers
+ */
+const serveRateLimitCounters = () => {
+    const counters = new Map();
+
+    const handle = ({ op, key, windowMs }) => {
+        const now = Date.now();
+        let counter = counters.get(key);
+        if (!counter || counter.resetTime <= now) {
+            counter = { totalHits: 0, resetTime: now + windowMs };
+            counters.set(key, counter);
+        }
+
+        if (op === 'increment') {
+            counter.totalHits++;
+        } else if (op === 'decrement') {
+            counter.totalHits = Math.max(0, counter.totalHits - 1);
+        } else if (op === 'resetKey') {
+            counters.delete(key);
+        }
+        return { totalHits: counter.totalHits, resetTime: counter.resetTime };
+    };
+
+    cluster.on('message', (worker, message) => {
+        if (message?.type !== MESSAGE_TYPE) {
+            return;
+        }
+        if (worker.isConnected()) {
+            worker.send({ type: MESSAGE_TYPE, id: message.id, result: handle(message) });
+        }
+    });
+
+    // Drop expired windows
+    setInterval(() => {
+        const now = Date.now();
+        for (const [key, counter] of counters) {
+            if (counter.resetTime <= now) {
+                counters.delete(key);
+            }
+        }
+    }, 60 * 1000).unref();
+
+    return { size: () => counters.size };
+};
+
+module.exports = {
+    createRateLimitStore,
+    serveRateLimitCounters
+};
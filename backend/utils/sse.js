@@ -0,0 +1,30 @@
+// Server-sent events helpers for streamed responses
+
+/**
+ * Switch a response to an event stream and send the headers right away.
+ * X-Accel-Buffering stops nginx from holding the events back.
+ */
+const openEventStream = (res) => {
+    res.status(200).set({
+        'Content-Type': 'text/event-stream; charset=utf-8',
+        'Cache-Control': 'no-cache, no-transform',
+        'Connection': 'keep-alive',
+        'X-Accel-Buffering': 'no'
+    });
+    res.flushHeaders();
+};
+
+/**
+ * Write one named event with a JSON payload
+ */
+const sendEvent = (res, event, data) => {
+    res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+};
+
+const isEventStream = (res) => String(res.getHeader('Content-Type') || '').startsWith('text/event-stream');
+
+module.exports = {
+    openEventStream,
+    sendEvent,
+    isEventStream
+};
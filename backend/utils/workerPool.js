@@ -0,0 +1,195 @@
+const { Worker } = require('worker_threads');
+const { performance } = require('perf_hooks');
+
+// Bounded pool of worker threads for CPU-bound work that would otherwise
+// block the event loop.
+//
+// Tasks wait in a FIFO queue capped at maxQueue (past it, run() rejects with
+// code EQUEUEFULL rather than letting the backlog grow). A task that runs
+// longer than its timeout (ETIMEDOUT) or is aborted through its AbortSignal
+// (ABORT_ERR) while running cannot be interrupted: its worker is terminated
+// and replaced. Aborting a queued task just removes it from the queue.
+
+const poolError = (code, message) => Object.assign(new Error(message), { code, pool: true });
+
+/**
+ * Whether a task failed because of the pool (queue full, timeout, abort,
+ * closed, worker crash) rather than by throwing. Such failures say nothing
+ * about the task's input, so callers should not cache them.
+ */
+const isPoolError = (error) => error?.pool === true;
+
+class WorkerPool {
+    constructor({ filename, size, maxQueue = 256, timeoutMs = 5000 }) {
+        this.filename = filename;
+        this.size = size;
+        this.maxQueue = maxQueue;
+        this.timeoutMs = timeoutMs;
+        this.workers = new Set();
+        this.idle = [];
+        this.queue = [];
+        this.metrics = {
+            completed: 0,
+            failed: 0,
+            timedOut: 0,
+            cancelled: 0,
+            rejectedQueueFull: 0,
+            workerRestarts: 0,
+            peakQueued: 0,
+            totalWaitMs: 0,
+            totalRunMs: 0,
+            maxRunMs: 0
+        };
+    }
+
+    /**
+     * Run a task on a worker. Resolves with the task's result.
+     *
+     * options.signal        AbortSignal; aborting rejects with ABORT_ERR
+     * options.timeoutMs     overrides the pool's per-task timeout
+     * options.transferList  ArrayBuffers to move to the worker instead of copying
+     */
+    run(task, args, { signal, timeoutMs = this.timeoutMs, transferList } = {}) {
+        return new Promise((resolve, reject) => {
+            if (signal?.aborted) {
+                this.metrics.cancelled++;
+                return reject(poolError('ABORT_ERR', `${task} aborted`));
+            }
+            if (this.queue.length >= this.maxQueue) {
+                this.metrics.rejectedQueueFull++;
+                return reject(poolError('EQUEUEFULL', `Worker pool queue is full (${this.maxQueue} tasks)`));
+            }
+
+            const job = { task, args, transferList, timeoutMs, signal, resolve, reject, enqueuedAt: performance.now() };
+            if (signal) {
+                job.onAbort = () => this.cancel(job);
+                signal.addEventListener('abort', job.onAbort, { once: true });
+            }
+
+            this.queue.push(job);
+            this.metrics.peakQueued = Math.max(this.metrics.peakQueued, this.queue.length);
+            this.dispatch();
+        });
+    }
+
+    dispatch() {
+        while (this.queue.length && (this.idle.length || this.workers.size < this.size)) {
+            const worker = this.idle.pop() || this.spawn();
+            this.start(worker, this.queue.shift());
+        }
+    }
+
+    spawn() {
+        const worker = new Worker(this.filename);
+        // Idle workers must not keep the process alive
+        worker.unref();
+        worker.on('message', ({ result, error }) => {
+            // A reply that raced with a timeout or abort; the worker is already gone
+            if (!this.workers.has(worker)) return;
+            const job = worker.job;
+            worker.job = null;
+            if (error) {
+                this.settle(job, Object.assign(new Error(error.message), { name: error.name }));
+            } else {
+                this.settle(job, null, result);
+            }
+            this.idle.push(worker);
+            this.dispatch();
+        });
+        worker.on('error', (error) => this.discard(worker, error));
+        worker.on('exit', (code) => this.discard(worker, poolError('EWORKEREXIT', `Worker exited with code ${code}`)));
+        this.workers.add(worker);
+        return worker;
+    }
+
+    start(worker, job) {
+        job.worker = worker;
+        job.startedAt = performance.now();
+        this.metrics.totalWaitMs += job.startedAt - job.enqueuedAt;
+        job.timer = setTimeout(() => {
+            this.metrics.timedOut++;
+            this.discard(worker, poolError('ETIMEDOUT', `${job.task} timed out after ${job.timeoutMs}ms`));
+        }, job.timeoutMs);
+        worker.job = job;
+        worker.postMessage({ task: job.task, args: job.args }, job.transferList);
+    }
+
+    settle(job, error, result) {
+        if (!job || job.settled) return;
+        job.settled = true;
+        clearTimeout(job.timer);
+        job.signal?.removeEventListener('abort', job.onAbort);
+
+        if (job.startedAt) {
+            const runMs = performance.now() - job.startedAt;
+            this.metrics.totalRunMs += runMs;
+            this.metrics.maxRunMs = Math.max(this.metrics.maxRunMs, runMs);
+        }
+        if (error) {
+            // Cancelled tasks (queued or running) only count as cancelled
+            if (job.startedAt && error.code !== 'ABORT_ERR') this.metrics.failed++;
+            job.reject(error);
+        } else {
+            this.metrics.completed++;
+            job.resolve(result);
+        }
+    }
+
+    /**
+     * Take a worker out of the pool (terminating it if still running), fail
+     * its current task with the given error and start queued work elsewhere
+     */
+    discard(worker, error) {
+        if (!this.workers.delete(worker)) return;
+        this.idle = this.idle.filter(candidate => candidate !== worker);
+        this.metrics.workerRestarts++;
+        const job = worker.job;
+        worker.job = null;
+        worker.terminate();
+        this.settle(job, error);
+        this.dispatch();
+    }
+
+    cancel(job) {
+        if (job.settled) return;
+        this.metrics.cancelled++;
+        const error = poolError('ABORT_ERR', `${job.task} aborted`);
+        const index = this.queue.indexOf(job);
+        if (index !== -1) {
+            this.queue.splice(index, 1);
+            this.settle(job, error);
+        } else if (job.worker) {
+            this.discard(job.worker, error);
+        }
+    }
+
+    stats() {
+        const { totalWaitMs, totalRunMs, ...metrics } = this.metrics;
+        const started = metrics.completed + metrics.failed;
+        return {
+            size: this.size,
+            workers: this.workers.size,
+            busy: this.workers.size - this.idle.length,
+            queued: this.queue.length,
+            maxQueue: this.maxQueue,
+            timeoutMs: this.timeoutMs,
+            ...metrics,
+            avgWaitMs: started ? Number((totalWaitMs / started).toFixed(3)) : 0,
+            avgRunMs: started ? Number((totalRunMs / started).toFixed(3)) : 0,
+            maxRunMs: Number(metrics.maxRunMs.toFixed(3))
+        };
+    }
+
+    async close() {
+        const error = poolError('ECLOSED', 'Worker pool closed');
+        this.queue.splice(0).forEach(job => this.settle(job, error));
+        await Promise.all([...this.workers].map(worker => {
+            this.workers.delete(worker);
+            this.settle(worker.job, error);
+            return worker.terminate();
+        }));
+        this.idle = [];
+    }
+}
+
+module.exports = { WorkerPool, isPoolError };
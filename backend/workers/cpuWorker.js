@@ -0,0 +1,25 @@
+// Worker thread for utils/workerPool.js: runs one CPU-bound task at a time
+// and posts back { result } or { error }.
+
+const { parentPort } = require('worker_threads');
+const { extractMeta, extractPageContent } = require('../services/htmlExtract');
+
+const tasks = {
+    extractMeta,
+    extractPageContent,
+    decodeBase64: (data) => Buffer.from(data, 'base64')
+};
+
+parentPort.on('message', ({ task, args }) => {
+    try {
+        const result = tasks[task](...args);
+        // Hand large binary results over instead of copying them (only when the
+        // buffer owns its memory; small Buffers share Node's pool)
+        const transferList = result instanceof Uint8Array && result.byteLength === result.buffer.byteLength
+            ? [result.buffer]
+            : [];
+        parentPort.postMessage({ result }, transferList);
+    } catch (error) {
+        parentPort.postMessage({ error: { name: error.name, message: error.message } });
+    }
+});
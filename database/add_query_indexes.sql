@@ -0,0 +1,38 @@
+-- Composite and partial indexes for the backend's real query shapes
+-- Run with psql, outside a transaction (CONCURRENTLY cannot run inside one):
+--   psql "$DATABASE_URL" -f database/add_query_indexes.sql
+--
+-- Access paths covered:
+--   game_sessions   WHERE user_id = ? AND is_active               (/session/start, /session/active,
+--                                                                   equipment interaction, voice sessions)
+--   user_progress   WHERE user_id = ? AND level_id = ?            (already the UNIQUE(user_id, level_id) index)
+--   ai_messages     WHERE conversation_id = ? ORDER BY created_at (/chat history, /conversation/:id)
+--   api_usage       WHERE user_id = ? AND created_at BETWEEN ...  (/api-usage)
+--
+-- database/benchmark/bench_indexes.sh shows the plans and timings before and after.
+
+-- At most one active session per user: a tiny partial index instead of
+-- filtering a user's whole session history on is_active
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_game_sessions_user_active
+    ON public.game_sessions (user_id)
+    WHERE is_active;
+
+-- History reads come back already in order, no sort step
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ai_messages_conversation_created
+    ON public.ai_messages (conversation_id, created_at);
+
+-- Date-window scans for one user, newest first without a sort
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_api_usage_user_created
+    ON public.api_usage (user_id, created_at);
+
+-- Indexes made redundant by the ones above (same leading column) or never
+-- selective enough to use; dropping them makes every insert cheaper.
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_game_sessions_active;
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_ai_messages_conversation_id;
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_api_usage_user_id;
+-- user_progress(user_id) is the leading column of UNIQUE(user_id, level_id)
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_user_progress_user_id;
+
+ANALYZE public.game_sessions;
+ANALYZE public.ai_messages;
+ANALYZE public.api_usage;
@@ -0,0 +1,120 @@
+-- Daily API usage rollup for GET /api/user/api-usage
+-- Run this script in your Supabase SQL editor
+
+-- api_usage grows by a row per AI request. Summing it on every read costs
+-- time proportional to a user's history, so a trigger keeps one row per
+-- user, UTC day and api_type up to date as usage is recorded. Reads then
+-- touch at most (days in range x api types) rows, however active the user.
+
+CREATE TABLE IF NOT EXISTS public.api_usage_daily (
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    api_type TEXT NOT NULL,
+    requests BIGINT NOT NULL DEFAULT 0,
+    successful_requests BIGINT NOT NULL DEFAULT 0,
+    tokens BIGINT NOT NULL DEFAULT 0,
+    cost_usd DECIMAL(14,6) NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, day, api_type)
+);
+
+ALTER TABLE public.api_usage_daily ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view own api usage rollup" ON public.api_usage_daily;
+CREATE POLICY "Users can view own api usage rollup" ON public.api_usage_daily
+    FOR SELECT USING (auth.uid() = user_id);
+
+-- Runs as the table owner so any role that may insert api_usage rows can
+-- maintain the rollup without write access to it
+CREATE OR REPLACE FUNCTION public.rollup_api_usage()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    INSERT INTO public.api_usage_daily AS daily (
+        user_id, day, api_type, requests, successful_requests, tokens, cost_usd
+    )
+    VALUES (
+        NEW.user_id,
+        (NEW.created_at AT TIME ZONE 'UTC')::DATE,
+        NEW.api_type,
+        1,
+        CASE WHEN NEW.success THEN 1 ELSE 0 END,
+        COALESCE(NEW.tokens_used, 0),
+        COALESCE(NEW.cost_usd, 0)
+    )
+    ON CONFLICT (user_id, day, api_type) DO UPDATE SET
+        requests = daily.requests + 1,
+        successful_requests = daily.successful_requests + EXCLUDED.successful_requests,
+        tokens = daily.tokens + EXCLUDED.tokens,
+        cost_usd = daily.cost_usd + EXCLUDED.cost_usd;
+    RETURN NULL;
+END;
+$$;
+
+-- Install the trigger and backfill in one transaction. The lock holds off new
+-- api_usage rows meanwhile, so none is counted twice or missed.
+BEGIN;
+
+LOCK TABLE public.api_usage IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS api_usage_rollup ON public.api_usage;
+-- api_usage is append-only; rows are only removed with their user, and the
+-- rollup cascades with it
+CREATE TRIGGER api_usage_rollup AFTER INSERT ON public.api_usage
+    FOR EACH ROW WHEN (NEW.user_id IS NOT NULL)
+    EXECUTE FUNCTION public.rollup_api_usage();
+
+TRUNCATE public.api_usage_daily;
+INSERT INTO public.api_usage_daily (user_id, day, api_type, requests, successful_requests, tokens, cost_usd)
+SELECT
+    user_id,
+    (created_at AT TIME ZONE 'UTC')::DATE,
+    api_type,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE success),
+    COALESCE(SUM(tokens_used), 0),
+    COALESCE(SUM(cost_usd), 0)
+FROM public.api_usage
+WHERE user_id IS NOT NULL
+GROUP BY 1, 2, 3;
+
+COMMIT;
+
+-- Usage per bucket ('day' or 'week', weeks starting Monday) and api_type for
+-- the UTC days p_start through p_end, inclusive. Buckets without usage are
+-- omitted.
+CREATE OR REPLACE FUNCTION public.get_api_usage(
+    p_user_id UUID,
+    p_start DATE,
+    p_end DATE,
+    p_bucket TEXT DEFAULT 'day'
+)
+RETURNS TABLE (
+    bucket_start DATE,
+    api_type TEXT,
+    requests BIGINT,
+    successful_requests BIGINT,
+    tokens BIGINT,
+    cost_usd DECIMAL(14,6)
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        CASE WHEN p_bucket = 'week' THEN date_trunc('week', day)::DATE ELSE day END,
+        api_type,
+        SUM(requests)::BIGINT,
+        SUM(successful_requests)::BIGINT,
+        SUM(tokens)::BIGINT,
+        SUM(cost_usd)::DECIMAL(14,6)
+    FROM public.api_usage_daily
+    WHERE user_id = p_user_id
+      AND day BETWEEN p_start AND p_end
+    GROUP BY 1, 2
+    ORDER BY 1, 2;
+$$;
+
+-- Runs with the caller's rights, so the rollup's RLS policy still applies
+GRANT EXECUTE ON FUNCTION public.get_api_usage(UUID, DATE, DATE, TEXT) TO anon, authenticated, service_role;
@@ -0,0 +1,66 @@
+#!/usr/bin/env bash
+# Benchmark database/add_query_indexes.sql against a seeded local PostgreSQL.
+#
+# Creates a scratch database, seeds it with seed.sql (schema.sql's tables and
+# old indexes, about 11M rows per scale unit), runs queries.sql, applies the
+# migration, runs queries.sql again and prints the execution times side by
+# side. Full plans are kept in before.txt / after.txt in the output directory.
+#
+# Usage: database/benchmark/bench_indexes.sh [scale]
+#   Connection via the usual PG* variables (PGHOST, PGPORT, PGUSER, ...).
+#   BENCH_DB    scratch database name (default av_master_index_bench, dropped first)
+#   BENCH_RUNS  warm-up executions per query (default 20)
+#   BENCH_OUT   output directory (default ./index-bench-results)
+#   BENCH_KEEP  set to 1 to keep the scratch database afterwards
+
+set -euo pipefail
+
+SCALE="${1:-1}"
+DB="${BENCH_DB:-av_master_index_bench}"
+RUNS="${BENCH_RUNS:-20}"
+OUT="${BENCH_OUT:-./index-bench-results}"
+HERE="$(cd "$(dirname "$0")" && pwd)"
+MIGRATION="$HERE/../add_query_indexes.sql"
+
+PSQL=(psql -X -q -v ON_ERROR_STOP=1 -d "$DB")
+
+mkdir -p "$OUT"
+
+echo "Creating scratch database $DB (scale $SCALE)"
+dropdb --if-exists "$DB"
+createdb "$DB"
+trap '[ "${BENCH_KEEP:-0}" = 1 ] || dropdb --if-exists "$DB"' EXIT
+
+started=$(date +%s)
+"${PSQL[@]}" -v scale="$SCALE" -f "$HERE/seed.sql"
+echo "Seeded in $(( $(date +%s) - started ))s"
+"${PSQL[@]}" -c "SELECT relname AS table, n_live_tup AS rows FROM pg_stat_user_tables ORDER BY relname"
+
+echo "Running queries before the migration"
+"${PSQL[@]}" -v runs="$RUNS" -f "$HERE/queries.sql" > "$OUT/before.txt"
+
+echo "Applying add_query_indexes.sql"
+started=$(date +%s)
+"${PSQL[@]}" -f "$MIGRATION"
+echo "Migration took $(( $(date +%s) - started ))s"
+
+echo "Running queries after the migration"
+"${PSQL[@]}" -v runs="$RUNS" -f "$HERE/queries.sql" > "$OUT/after.txt"
+
+# "### label" lines followed by their plan's "Execution Time: x ms"
+times() {
+    awk '/^### / { sub(/^### /, ""); label = $0 }
+         /Execution Time:/ { print label "\t" $(NF - 1) }' "$1"
+}
+
+echo
+printf '%-52s %12s %12s %9s\n' "query" "before ms" "after ms" "speedup"
+join -t $'\t' <(times "$OUT/before.txt" | nl -w1 -s$'\t' | sort) \
+              <(times "$OUT/after.txt" | nl -w1 -s$'\t' | sort) \
+    | sort -n \
+    | awk -F '\t' '{ printf "%-52s %12.3f %12.3f %8.1fx\n", $2, $3, $5, ($5 > 0 ? $3 / $5 : 0) }'
+
+echo
+"${PSQL[@]}" -c "SELECT indexrelname AS index, pg_size_pretty(pg_relation_size(indexrelid)) AS size
+                 FROM pg_stat_user_indexes ORDER BY relname, indexrelname"
+echo "Plans: $OUT/before.txt, $OUT/after.txt"
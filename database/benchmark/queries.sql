@@ -0,0 +1,46 @@
+-- The backend's query shapes, as PostgREST sends them, for bench_indexes.sh
+-- Each query runs :runs times untimed to warm the cache, then once under
+-- EXPLAIN (ANALYZE, BUFFERS). Lines starting with "### " label the plans.
+
+SELECT md5('user-4242')::uuid AS user_id,
+       md5('conversation-404242')::uuid AS conversation_id
+\gset
+
+SET plan_cache_mode = force_custom_plan;
+
+PREPARE active_session(uuid) AS
+    SELECT * FROM public.game_sessions WHERE user_id = $1 AND is_active = true LIMIT 2;
+PREPARE end_active_sessions(uuid) AS
+    UPDATE public.game_sessions SET is_active = false, session_end = NOW()
+    WHERE user_id = $1 AND is_active = true;
+PREPARE level_progress(uuid) AS
+    SELECT * FROM public.user_progress WHERE user_id = $1 AND level_id = 'level-7';
+PREPARE conversation_history(uuid) AS
+    SELECT role, content, created_at FROM public.ai_messages
+    WHERE conversation_id = $1 ORDER BY created_at ASC;
+PREPARE api_usage_window(uuid) AS
+    SELECT * FROM public.api_usage
+    WHERE user_id = $1 AND created_at >= NOW() - INTERVAL '30 days' AND created_at <= NOW()
+    ORDER BY created_at DESC;
+
+SELECT format('EXECUTE active_session(%L)', :'user_id') FROM generate_series(1, :runs) \gexec
+SELECT format('EXECUTE level_progress(%L)', :'user_id') FROM generate_series(1, :runs) \gexec
+SELECT format('EXECUTE conversation_history(%L)', :'conversation_id') FROM generate_series(1, :runs) \gexec
+SELECT format('EXECUTE api_usage_window(%L)', :'user_id') FROM generate_series(1, :runs) \gexec
+
+\echo '### game_sessions: active session of a user'
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE active_session(:'user_id');
+
+\echo '### game_sessions: end active sessions of a user'
+BEGIN;
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE end_active_sessions(:'user_id');
+ROLLBACK;
+
+\echo '### user_progress: one level of a user'
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE level_progress(:'user_id');
+
+\echo '### ai_messages: conversation history in order'
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE conversation_history(:'conversation_id');
+
+\echo '### api_usage: 30-day window of a user, newest first'
+EXPLAIN (ANALYZE, BUFFERS) EXECUTE api_usage_window(:'user_id');
@@ -0,0 +1,143 @@
+-- Seed data for bench_indexes.sh (plain PostgreSQL, not Supabase)
+-- The tables carry the columns and the pre-migration indexes of schema.sql;
+-- foreign keys, RLS and triggers are left out, they do not change the plans.
+--
+-- :scale 1 = 100k users, about 11M rows:
+--   game_sessions    10 per user, the latest one active
+--   user_progress    18 levels per user
+--   ai_conversations  5 per user, 10 messages each
+--   api_usage        30 rows per user over the last 90 days
+
+\set users (100000 * :scale)
+
+CREATE TABLE public.game_sessions (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    user_id UUID,
+    session_start TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    session_end TIMESTAMP WITH TIME ZONE,
+    current_level TEXT,
+    score INTEGER DEFAULT 0,
+    lives INTEGER DEFAULT 3,
+    time_spent INTEGER DEFAULT 0,
+    is_active BOOLEAN DEFAULT true,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE public.user_progress (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    user_id UUID,
+    level_id TEXT NOT NULL,
+    completed BOOLEAN DEFAULT false,
+    score INTEGER DEFAULT 0,
+    time_spent INTEGER DEFAULT 0,
+    attempts INTEGER DEFAULT 0,
+    best_score INTEGER DEFAULT 0,
+    fastest_time INTEGER DEFAULT 0,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE(user_id, level_id)
+);
+
+CREATE TABLE public.ai_conversations (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    user_id UUID,
+    session_id UUID,
+    conversation_start TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    conversation_end TIMESTAMP WITH TIME ZONE,
+    is_active BOOLEAN DEFAULT true,
+    total_messages INTEGER DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE public.ai_messages (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    conversation_id UUID,
+    user_id UUID,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    equipment_context JSONB,
+    message_type TEXT DEFAULT 'text',
+    voice_duration INTEGER,
+    tokens_used INTEGER,
+    response_time INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE public.api_usage (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    user_id UUID,
+    api_type TEXT NOT NULL,
+    tokens_used INTEGER DEFAULT 0,
+    cost_usd DECIMAL(10,6) DEFAULT 0,
+    request_count INTEGER DEFAULT 1,
+    success BOOLEAN DEFAULT true,
+    error_message TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Deterministic ids (md5 of a counter) so queries.sql can name a user and a
+-- conversation without looking them up. Rows are inserted interleaved across
+-- users, like a live table, so one user's rows sit on many pages.
+CREATE FUNCTION pg_temp.bench_uuid(prefix TEXT, n BIGINT) RETURNS UUID
+LANGUAGE sql IMMUTABLE AS $$ SELECT md5(prefix || n)::uuid $$;
+
+INSERT INTO public.game_sessions (user_id, session_start, current_level, score, time_spent, is_active, created_at)
+SELECT pg_temp.bench_uuid('user-', i % :users),
+       NOW() - ((10 - i / :users) * INTERVAL '1 day'),
+       'level-' || (i % 18),
+       (i * 7) % 1000,
+       (i * 13) % 3600,
+       i / :users = 9,
+       NOW() - ((10 - i / :users) * INTERVAL '1 day')
+FROM generate_series(0, :users * 10 - 1) AS i;
+
+INSERT INTO public.user_progress (user_id, level_id, completed, score, time_spent, attempts, best_score, fastest_time)
+SELECT pg_temp.bench_uuid('user-', i % :users),
+       'level-' || (i / :users),
+       i % 3 <> 0,
+       (i * 7) % 1000,
+       (i * 13) % 600,
+       1 + i % 5,
+       (i * 7) % 1000,
+       (i * 13) % 600
+FROM generate_series(0, :users * 18 - 1) AS i;
+
+INSERT INTO public.ai_conversations (id, user_id, is_active, total_messages, created_at)
+SELECT pg_temp.bench_uuid('conversation-', i),
+       pg_temp.bench_uuid('user-', i % :users),
+       i / :users = 4,
+       10,
+       NOW() - ((5 - i / :users) * INTERVAL '1 day')
+FROM generate_series(0, :users * 5 - 1) AS i;
+
+INSERT INTO public.ai_messages (conversation_id, user_id, role, content, tokens_used, created_at)
+SELECT pg_temp.bench_uuid('conversation-', i % (:users * 5)),
+       pg_temp.bench_uuid('user-', (i % (:users * 5)) % :users),
+       CASE WHEN (i / (:users * 5)) % 2 = 0 THEN 'user' ELSE 'assistant' END,
+       repeat('How do I route the mixer output to the amplifier? ', 1 + i % 4),
+       50 + i % 400,
+       NOW() - INTERVAL '5 days' + ((i / (:users * 5)) * INTERVAL '1 minute')
+FROM generate_series(0, :users * 50 - 1) AS i;
+
+INSERT INTO public.api_usage (user_id, api_type, tokens_used, cost_usd, created_at)
+SELECT pg_temp.bench_uuid('user-', i % :users),
+       (ARRAY['openai_chat', 'openai_voice', 'speech_to_text'])[1 + i % 3],
+       50 + i % 400,
+       ((50 + i % 400) * 0.000002)::DECIMAL(10,6),
+       NOW() - ((i * 7919 % (90 * 24 * 60)) * INTERVAL '1 minute')
+FROM generate_series(0, :users * 30 - 1) AS i;
+
+-- Indexes as in schema.sql before add_query_indexes.sql
+CREATE INDEX idx_game_sessions_user_id ON public.game_sessions(user_id);
+CREATE INDEX idx_game_sessions_active ON public.game_sessions(is_active);
+CREATE INDEX idx_user_progress_user_id ON public.user_progress(user_id);
+CREATE INDEX idx_user_progress_level_id ON public.user_progress(level_id);
+CREATE INDEX idx_ai_conversations_user_id ON public.ai_conversations(user_id);
+CREATE INDEX idx_ai_conversations_active ON public.ai_conversations(is_active);
+CREATE INDEX idx_ai_messages_conversation_id ON public.ai_messages(conversation_id);
+CREATE INDEX idx_ai_messages_created_at ON public.ai_messages(created_at);
+CREATE INDEX idx_api_usage_user_id ON public.api_usage(user_id);
+CREATE INDEX idx_api_usage_created_at ON public.api_usage(created_at);
+
+VACUUM ANALYZE;
@@ -0,0 +1,43 @@
+-- Aggregated player statistics for GET /api/user/stats
+-- Run this script in your Supabase SQL editor
+
+-- Returns one row of totals computed in the database. Each subquery is a
+-- single aggregate over the user_id index of its table, so the response
+-- size and the transfer do not grow with a player's history.
+CREATE OR REPLACE FUNCTION public.get_user_stats(p_user_id UUID)
+RETURNS TABLE (
+    total_levels_completed BIGINT,
+    total_levels_attempted BIGINT,
+    total_game_sessions BIGINT,
+    total_achievements BIGINT,
+    total_ai_conversations BIGINT,
+    average_score DOUBLE PRECISION,
+    total_time_spent BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        progress.levels_completed,
+        progress.levels_attempted,
+        (SELECT COUNT(*) FROM public.game_sessions WHERE user_id = p_user_id),
+        (SELECT COUNT(*) FROM public.user_achievements WHERE user_id = p_user_id),
+        (SELECT COUNT(*) FROM public.ai_conversations WHERE user_id = p_user_id),
+        progress.average_score,
+        progress.total_time_spent
+    FROM (
+        SELECT
+            COUNT(*) FILTER (WHERE completed) AS levels_completed,
+            COUNT(*) AS levels_attempted,
+            COALESCE(SUM(score)::DOUBLE PRECISION / NULLIF(COUNT(*), 0), 0) AS average_score,
+            COALESCE(SUM(time_spent), 0)::BIGINT AS total_time_spent
+        FROM public.user_progress
+        WHERE user_id = p_user_id
+    ) AS progress;
+$$;
+
+-- user_achievements had no user_id index; the other three tables already do
+CREATE INDEX IF NOT EXISTS idx_user_achievements_user_id ON public.user_achievements(user_id);
+
+-- Runs with the caller's rights, so each table's RLS policies still apply
+GRANT EXECUTE ON FUNCTION public.get_user_stats(UUID) TO anon, authenticated, service_role;
@@ -0,0 +1,47 @@
+-- Persist one /api/ai/chat exchange in a single transaction
+-- Run this script in your Supabase SQL editor
+
+-- Replaces four sequential writes after every completion: the user message,
+-- the assistant message, the api_usage row and the conversation's message
+-- counter. The counter is incremented in place instead of being recomputed
+-- from the full history, so the cost does not grow with the conversation.
+CREATE OR REPLACE FUNCTION public.record_chat_exchange(
+    p_conversation_id UUID,
+    p_user_id UUID,
+    p_user_message TEXT,
+    p_user_message_at TIMESTAMP WITH TIME ZONE,
+    p_assistant_message TEXT,
+    p_assistant_message_at TIMESTAMP WITH TIME ZONE,
+    p_equipment_context JSONB,
+    p_tokens_used INTEGER,
+    p_response_time INTEGER,
+    p_cost_usd DECIMAL(10,6)
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO public.ai_messages (
+        conversation_id, user_id, role, content, equipment_context,
+        message_type, tokens_used, response_time, created_at
+    )
+    VALUES
+        (p_conversation_id, p_user_id, 'user', p_user_message, p_equipment_context,
+         'text', NULL, NULL, p_user_message_at),
+        (p_conversation_id, p_user_id, 'assistant', p_assistant_message, p_equipment_context,
+         'text', p_tokens_used, p_response_time, p_assistant_message_at);
+
+    INSERT INTO public.api_usage (user_id, api_type, tokens_used, cost_usd, request_count, success, created_at)
+    VALUES (p_user_id, 'openai_chat', p_tokens_used, p_cost_usd, 1, true, p_assistant_message_at);
+
+    UPDATE public.ai_conversations
+    SET total_messages = COALESCE(total_messages, 0) + 2
+    WHERE id = p_conversation_id;
+END;
+$$;
+
+-- Runs with the caller's rights, so the RLS policies of all three tables still apply
+GRANT EXECUTE ON FUNCTION public.record_chat_exchange(
+    UUID, UUID, TEXT, TIMESTAMP WITH TIME ZONE, TEXT, TIMESTAMP WITH TIME ZONE,
+    JSONB, INTEGER, INTEGER, DECIMAL
+) TO anon, authenticated, service_role;
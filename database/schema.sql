@@ -141,16 +141,16 @@ CREATE TABLE IF NOT EXISTS public.user_settings (
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_game_sessions_user_id ON public.game_sessions(user_id);
-CREATE INDEX IF NOT EXISTS idx_game_sessions_active ON public.game_sessions(is_active);
-CREATE INDEX IF NOT EXISTS idx_user_progress_user_id ON public.user_progress(user_id);
+CREATE INDEX IF NOT EXISTS idx_game_sessions_user_active ON public.game_sessions(user_id) WHERE is_active;
 CREATE INDEX IF NOT EXISTS idx_user_progress_level_id ON public.user_progress(level_id);
 CREATE INDEX IF NOT EXISTS idx_ai_conversations_user_id ON public.ai_conversations(user_id);
 CREATE INDEX IF NOT EXISTS idx_ai_conversations_active ON public.ai_conversations(is_active);
-CREATE INDEX IF NOT EXISTS idx_ai_messages_conversation_id ON public.ai_messages(conversation_id);
+CREATE INDEX IF NOT EXISTS idx_ai_messages_conversation_created ON public.ai_messages(conversation_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_ai_messages_created_at ON public.ai_messages(created_at);
 CREATE INDEX IF NOT EXISTS idx_voice_sessions_user_id ON public.voice_sessions(user_id);
 CREATE INDEX IF NOT EXISTS idx_equipment_interactions_user_id ON public.equipment_interactions(user_id);
-CREATE INDEX IF NOT EXISTS idx_api_usage_user_id ON public.api_usage(user_id);
+CREATE INDEX IF NOT EXISTS idx_user_achievements_user_id ON public.user_achievements(user_id);
+CREATE INDEX IF NOT EXISTS idx_api_usage_user_created ON public.api_usage(user_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_api_usage_created_at ON public.api_usage(created_at);
 
 -- Row Level Security (RLS) policies
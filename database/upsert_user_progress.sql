@@ -0,0 +1,57 @@
+-- Atomic progress upsert for POST /api/game/progress
+-- Run this script in your Supabase SQL editor
+
+-- One statement per save: insert the level's row or merge into the existing
+-- one under the UNIQUE(user_id, level_id) constraint. Concurrent saves for the
+-- same level serialize on that row, so no attempt or best result is lost.
+--
+-- Merge rules (same as the previous select-then-write handler):
+--   completed, score, time_spent   latest save wins
+--   attempts                       +1 per save (p_attempts seeds a new row)
+--   best_score                     highest score of any completed save
+--   fastest_time                   lowest time of any completed save (0 = none yet)
+--   completed_at                   time of the latest completed save
+CREATE OR REPLACE FUNCTION public.upsert_user_progress(
+    p_user_id UUID,
+    p_level_id TEXT,
+    p_completed BOOLEAN,
+    p_score INTEGER,
+    p_time_spent INTEGER,
+    p_attempts INTEGER DEFAULT 1
+)
+RETURNS public.user_progress
+LANGUAGE sql
+AS $$
+    INSERT INTO public.user_progress AS p (
+        user_id, level_id, completed, score, time_spent, attempts,
+        best_score, fastest_time, completed_at, updated_at
+    )
+    VALUES (
+        p_user_id, p_level_id, p_completed, p_score, p_time_spent, p_attempts,
+        CASE WHEN p_completed THEN p_score ELSE 0 END,
+        CASE WHEN p_completed THEN p_time_spent ELSE 0 END,
+        CASE WHEN p_completed THEN NOW() END,
+        NOW()
+    )
+    ON CONFLICT (user_id, level_id) DO UPDATE SET
+        completed = EXCLUDED.completed,
+        score = EXCLUDED.score,
+        time_spent = EXCLUDED.time_spent,
+        attempts = COALESCE(p.attempts, 0) + 1,
+        best_score = CASE
+            WHEN EXCLUDED.completed THEN GREATEST(COALESCE(p.best_score, 0), EXCLUDED.score)
+            ELSE p.best_score
+        END,
+        fastest_time = CASE
+            WHEN NOT EXCLUDED.completed THEN p.fastest_time
+            WHEN COALESCE(p.fastest_time, 0) = 0 THEN EXCLUDED.time_spent
+            ELSE LEAST(p.fastest_time, EXCLUDED.time_spent)
+        END,
+        completed_at = CASE WHEN EXCLUDED.completed THEN NOW() ELSE p.completed_at END,
+        updated_at = NOW()
+    RETURNING p.*;
+$$;
+
+-- Runs with the caller's rights, so the user_progress RLS policies still apply
+GRANT EXECUTE ON FUNCTION public.upsert_user_progress(UUID, TEXT, BOOLEAN, INTEGER, INTEGER, INTEGER)
+    TO anon, authenticated, service_role;
@@ -5,13 +5,17 @@
 const config = {
     BACKEND_URL: 'https://wcllmsgames-backend-production.up.railway.app',
     NODE_ENV: 'production',
-    CORS_ORIGIN: '*'
+    CORS_ORIGIN: '*',
+    // Front-end log level: debug | info | warn | error | silent
+    // (override per session with ?log=debug or localStorage 'avLogLevel')
+    LOG_LEVEL: 'warn',
+    // Stream AI tutor replies token by token (server-sent events from /api/ai/chat)
+    AI_STREAMING: true
 };
 
 // Make config available globally
 if (typeof window !== 'undefined') {
     window.AV_MASTER_CONFIG = config;
-    console.log('🔧 AV Master Config loaded:', config);
 }
 
 // Export configuration
@@ -0,0 +1,150 @@
+// Connection Store Module
+// Holds the connections placed on a stage with O(1) bookkeeping: per-cable
+// counts, a per-connector adjacency map and a pair set for duplicate checks.
+// Iterates like an array (forEach/map/length/for...of) in insertion order.
+
+import { CABLE_PROGRESS_KEYS } from './LevelRules.js';
+
+/**
+ * Direction-agnostic key for a pair of connector ids
+ */
+function pairKey(connectorA, connectorB) {
+    return connectorA < connectorB ? `${connectorA}|${connectorB}` : `${connectorB}|${connectorA}`;
+}
+
+const EMPTY_SET = new Set();
+
+export class ConnectionStore {
+    constructor() {
+        this.clear();
+    }
+
+    /**
+     * Remove every connection
+     */
+    clear() {
+        this.byId = new Map();
+        this.pairs = new Map();
+        this.adjacency = new Map();
+        this.counts = {};
+        Object.values(CABLE_PROGRESS_KEYS).forEach(key => {
+            this.counts[key] = 0;
+        });
+    }
+
+    get length() {
+        return this.byId.size;
+    }
+
+    [Symbol.iterator]() {
+        return this.byId.values();
+    }
+
+    forEach(callback) {
+        let index = 0;
+        for (const connection of this.byId.values()) {
+            callback(connection, index++, this);
+        }
+    }
+
+    map(callback) {
+        return Array.from(this.byId.values(), callback);
+    }
+
+    toArray() {
+        return Array.from(this.byId.values());
+    }
+
+    get(connectionId) {
+        return this.byId.get(connectionId) || null;
+    }
+
+    /**
+     * Check whether two connectors are already joined (in either direction)
+     */
+    hasPair(fromConnectorId, toConnectorId) {
+        return this.pairs.has(pairKey(fromConnectorId, toConnectorId));
+    }
+
+    /**
+     * Add a connection. Returns false if its connector pair is already wired.
+     */
+    add(connection) {
+        const key = pairKey(connection.fromConnectorId, connection.toConnectorId);
+        if (this.pairs.has(key)) {
+            return false;
+        }
+
+        this.byId.set(connection.id, connection);
+        this.pairs.set(key, connection);
+        this.link(connection.fromConnectorId, connection);
+        this.link(connection.toConnectorId, connection);
+
+        const countKey = CABLE_PROGRESS_KEYS[connection.cableType];
+        if (countKey) {
+            this.counts[countKey]++;
+        }
+        return true;
+    }
+
+    /**
+     * Remove a connection by id. Returns the removed connection or null.
+     */
+    remove(connectionId) {
+        const connection = this.byId.get(connectionId);
+        if (!connection) {
+            return null;
+        }
+
+        this.byId.delete(connectionId);
+        this.pairs.delete(pairKey(connection.fromConnectorId, connection.toConnectorId));
+        this.unlink(connection.fromConnectorId, connection);
+        this.unlink(connection.toConnectorId, connection);
+
+        const countKey = CABLE_PROGRESS_KEYS[connection.cableType];
+        if (countKey) {
+            this.counts[countKey]--;
+        }
+        return connection;
+    }
+
+    /**
+     * Connections attached to a connector
+     */
+    getConnectorConnections(connectorId) {
+        return this.adjacency.get(connectorId) || EMPTY_SET;
+    }
+
+    /**
+     * Number of connections attached to a connector
+     */
+    getConnectorCount(connectorId) {
+        return this.getConnectorConnections(connectorId).size;
+    }
+
+    /**
+     * Connection counts per progress key (power, xlr, ...)
+     */
+    getCounts() {
+        return { ...this.counts };
+    }
+
+    link(connectorId, connection) {
+        let attached = this.adjacency.get(connectorId);
+        if (!attached) {
+            attached = new Set();
+            this.adjacency.set(connectorId, attached);
+        }
+        attached.add(connection);
+    }
+
+    unlink(connectorId, connection) {
+        const attached = this.adjacency.get(connectorId);
+        if (!attached) return;
+
+        attached.delete(connection);
+        if (attached.size === 0) {
+            this.adjacency.delete(connectorId);
+        }
+    }
+}
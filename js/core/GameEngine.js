@@ -3,20 +3,32 @@
 
 import { AudioSystem } from '../modules/AudioSystem.js';
 import { AITutor } from '../modules/AITutor.js';
-import { getLevelData, LEVEL_ORDER } from '../data/LevelData.js';
+import { getLevelData, getCachedLevelData, prefetchLevel, LEVEL_MANIFEST, LEVEL_ORDER } from '../data/LevelData.js';
+import {
+    createEmptyProgress,
+    findValidConnection,
+    getConnectionRuleIndex,
+    getConnectorKey,
+    calculateConnectionProgress,
+    isLevelComplete
+} from './LevelRules.js';
+import { ConnectionStore } from './ConnectionStore.js';
 import {
     getConnectorColor,
     calculateRequiredConnections,
     getEquipmentInfo,
     saveToStorage,
     loadFromStorage,
-    generateId
+    generateId,
+    signalReady
 } from '../utils/Helpers.js';
+import { logger } from '../utils/Logger.js';
 
 export class AVMasterGame {
     constructor() {
         this.currentScreen = 'loading';
         this.currentLevel = null;
+        this.levelLoadId = 0;
         this.gameState = {
             score: 0,
             lives: 3,
@@ -27,24 +39,19 @@ export class AVMasterGame {
         this.gameTimer = null;
         this.draggedElement = null;
         this.selectedEquipment = null;
-        this.connections = [];
+        this.dragState = null;
+        this.connections = new ConnectionStore();
         this.equipment = [];
         this.connectionMode = false;
         this.selectedConnector = null;
         this.connectionLines = [];
+        this.connectionLayer = null;
+        this.connectionPaths = new Map();
         this.successfulConnections = 0;
         this.totalRequiredConnections = 0;
 
         // Progress tracking
-        this.connectionProgress = {
-            power: { current: 0, required: 0 },
-            xlr: { current: 0, required: 0 },
-            wireless: { current: 0, required: 0 },
-            ethernet: { current: 0, required: 0 },
-            dmx: { current: 0, required: 0 },
-            hdmi: { current: 0, required: 0 },
-            usb: { current: 0, required: 0 }
-        };
+        this.connectionProgress = createEmptyProgress();
 
         // Initialize audio system
         this.audioSystem = new AudioSystem();
@@ -64,31 +71,31 @@ export class AVMasterGame {
      */
     init() {
         try {
-            console.log('GameEngine.init() - Step 1: Clearing all screens...');
+            logger.debug('GameEngine.init() - Step 1: Clearing all screens...');
             this.clearAllScreens();
-            console.log('✓ All screens cleared');
+            logger.debug('✓ All screens cleared');
 
-            console.log('GameEngine.init() - Step 2: Loading game state...');
+            logger.debug('GameEngine.init() - Step 2: Loading game state...');
             this.loadGameState();
-            console.log('✓ Game state loaded');
+            logger.debug('✓ Game state loaded');
 
-            console.log('GameEngine.init() - Step 3: Setting up event listeners...');
+            logger.debug('GameEngine.init() - Step 3: Setting up event listeners...');
             this.setupEventListeners();
-            console.log('✓ Event listeners set up');
+            logger.debug('✓ Event listeners set up');
 
-            console.log('GameEngine.init() - Step 4: Showing loading screen...');
+            logger.debug('GameEngine.init() - Step 4: Showing loading screen...');
             this.showLoadingScreen();
-            console.log('✓ Loading screen shown');
+            logger.debug('✓ Loading screen shown');
 
             // Simulate loading time with progress updates
-            console.log('GameEngine.init() - Step 5: Starting loading sequence...');
+            logger.debug('GameEngine.init() - Step 5: Starting loading sequence...');
             this.startLoadingSequence();
-            console.log('✓ Loading sequence started');
+            logger.debug('✓ Loading sequence started');
 
-            console.log('GameEngine.init() - Initialization sequence completed');
+            logger.debug('GameEngine.init() - Initialization sequence completed');
         } catch (error) {
-            console.error('❌ Error in GameEngine.init():', error);
-            console.error('Stack trace:', error.stack);
+            logger.error('❌ Error in GameEngine.init():', error);
+            logger.error('Stack trace:', error.stack);
             throw error;
         }
     }
@@ -98,15 +105,15 @@ export class AVMasterGame {
      */
     setupEventListeners() {
         try {
-            console.log('setupEventListeners() - Setting up main menu events...');
+            logger.debug('setupEventListeners() - Setting up main menu events...');
 
             // Main menu events
             const startGameBtn = document.getElementById('start-game-btn');
-            console.log('🔍 Looking for start-game-btn:', startGameBtn);
+            logger.debug('🔍 Looking for start-game-btn:', startGameBtn);
             if (startGameBtn) {
-                console.log('✅ Found start-game-btn, adding event listener...');
+                logger.debug('✅ Found start-game-btn, adding event listener...');
                 startGameBtn.addEventListener('click', (e) => {
-                    console.log('🎯 start-game-btn clicked!');
+                    logger.debug('🎯 start-game-btn clicked!');
                     e.preventDefault();
                     e.stopPropagation();
 
@@ -126,39 +133,39 @@ export class AVMasterGame {
 
                 // Add mouse events for debugging
                 startGameBtn.addEventListener('mouseenter', () => {
-                    console.log('🖱️ Mouse entered start-game-btn');
+                    logger.debug('🖱️ Mouse entered start-game-btn');
                 });
 
                 startGameBtn.addEventListener('mouseleave', () => {
-                    console.log('🖱️ Mouse left start-game-btn');
+                    logger.debug('🖱️ Mouse left start-game-btn');
                 });
 
                 startGameBtn.addEventListener('mousedown', () => {
-                    console.log('🖱️ Mouse down on start-game-btn');
+                    logger.debug('🖱️ Mouse down on start-game-btn');
                 });
 
                 startGameBtn.addEventListener('mouseup', () => {
-                    console.log('🖱️ Mouse up on start-game-btn');
+                    logger.debug('🖱️ Mouse up on start-game-btn');
                 });
-                console.log('✓ start-game-btn event listener added');
+                logger.debug('✓ start-game-btn event listener added');
 
                 // Test if the button is clickable
-                console.log('🔍 Button properties:', {
+                logger.debug('🔍 Button properties:', {
                     disabled: startGameBtn.disabled,
                     style: startGameBtn.style.display,
                     className: startGameBtn.className,
                     innerHTML: startGameBtn.innerHTML.substring(0, 50) + '...'
                 });
             } else {
-                console.log('⚠ start-game-btn not found');
-                console.log('🔍 Available buttons:', document.querySelectorAll('button').length);
-                console.log('🔍 All button IDs:', Array.from(document.querySelectorAll('button')).map(b => b.id));
+                logger.debug('⚠ start-game-btn not found');
+                logger.debug('🔍 Available buttons:', document.querySelectorAll('button').length);
+                logger.debug('🔍 All button IDs:', Array.from(document.querySelectorAll('button')).map(b => b.id));
             }
 
             const tutorialBtn = document.getElementById('tutorial-btn');
             if (tutorialBtn) {
                 tutorialBtn.addEventListener('click', () => {
-                    console.log('🎯 tutorial-btn clicked!');
+                    logger.debug('🎯 tutorial-btn clicked!');
 
                     // Require authentication for tutorial
                     if (window.authManager) {
@@ -169,15 +176,15 @@ export class AVMasterGame {
                         this.showTutorial();
                     }
                 });
-                console.log('✓ tutorial-btn event listener added');
+                logger.debug('✓ tutorial-btn event listener added');
             } else {
-                console.log('⚠ tutorial-btn not found');
+                logger.debug('⚠ tutorial-btn not found');
             }
 
             const settingsBtn = document.getElementById('settings-btn');
             if (settingsBtn) {
                 settingsBtn.addEventListener('click', () => {
-                    console.log('🎯 settings-btn clicked!');
+                    logger.debug('🎯 settings-btn clicked!');
 
                     // Require authentication for settings
                     if (window.authManager) {
@@ -188,15 +195,15 @@ export class AVMasterGame {
                         this.showSettings();
                     }
                 });
-                console.log('✓ settings-btn event listener added');
+                logger.debug('✓ settings-btn event listener added');
             } else {
-                console.log('⚠ settings-btn not found');
+                logger.debug('⚠ settings-btn not found');
             }
 
             const continueGameBtn = document.getElementById('continue-game');
             if (continueGameBtn) {
                 continueGameBtn.addEventListener('click', () => {
-                    console.log('🎯 continue-game clicked!');
+                    logger.debug('🎯 continue-game clicked!');
 
                     // Require authentication for continue game
                     if (window.authManager) {
@@ -207,68 +214,68 @@ export class AVMasterGame {
                         this.continueGame();
                     }
                 });
-                console.log('✓ continue-game event listener added');
+                logger.debug('✓ continue-game event listener added');
             } else {
-                console.log('⚠ continue-game button not found');
+                logger.debug('⚠ continue-game button not found');
             }
 
-            console.log('setupEventListeners() - Setting up level select events...');
+            logger.debug('setupEventListeners() - Setting up level select events...');
             // Level select events
             document.addEventListener('click', (e) => {
-                console.log('🌐 Document click detected on:', e.target.tagName, e.target.className, e.target.id);
-                console.log('🔍 Click target element:', e.target);
-                console.log('🔍 Click coordinates:', e.clientX, e.clientY);
+                logger.debug('🌐 Document click detected on:', e.target.tagName, e.target.className, e.target.id);
+                logger.debug('🔍 Click target element:', e.target);
+                logger.debug('🔍 Click coordinates:', e.clientX, e.clientY);
 
                 // Check if click is on a level card or its children
                 const levelCard = e.target.closest('.level-card');
                 if (levelCard) {
                     const levelId = levelCard.dataset.level;
-                    console.log('🎯 Level card clicked:', levelId);
-                    console.log('🔍 Level card element:', levelCard);
-                    console.log('🔍 Unlocked levels:', this.gameState.unlockedLevels);
+                    logger.debug('🎯 Level card clicked:', levelId);
+                    logger.debug('🔍 Level card element:', levelCard);
+                    logger.debug('🔍 Unlocked levels:', this.gameState.unlockedLevels);
                     
                     // Require authentication for level selection
                     if (window.authManager) {
                         window.authManager.requireAuthForAction('level-select', () => {
                             if (levelId && this.gameState.unlockedLevels.includes(levelId)) {
-                                console.log('✅ Level is unlocked, selecting:', levelId);
+                                logger.debug('✅ Level is unlocked, selecting:', levelId);
                                 this.selectLevel(levelId);
                             } else {
-                                console.log('❌ Level is locked or invalid:', levelId);
+                                logger.debug('❌ Level is locked or invalid:', levelId);
                             }
                         });
                     } else {
                         if (levelId && this.gameState.unlockedLevels.includes(levelId)) {
-                            console.log('✅ Level is unlocked, selecting:', levelId);
+                            logger.debug('✅ Level is unlocked, selecting:', levelId);
                             this.selectLevel(levelId);
                         } else {
-                            console.log('❌ Level is locked or invalid:', levelId);
+                            logger.debug('❌ Level is locked or invalid:', levelId);
                         }
                     }
                 } else {
-                    console.log('❌ Click was not on a level card');
-                    console.log('🔍 Closest level card:', e.target.closest('.level-card'));
+                    logger.debug('❌ Click was not on a level card');
+                    logger.debug('🔍 Closest level card:', e.target.closest('.level-card'));
                 }
             });
-            console.log('✓ level-card click event listener added');
+            logger.debug('✓ level-card click event listener added');
 
-            console.log('setupEventListeners() - Setting up game controls...');
+            logger.debug('setupEventListeners() - Setting up game controls...');
             // Game controls
             document.addEventListener('keydown', (e) => {
                 this.handleKeyPress(e);
             });
-            console.log('✓ keydown event listener added');
+            logger.debug('✓ keydown event listener added');
 
-            console.log('setupEventListeners() - Setting up hint buttons...');
+            logger.debug('setupEventListeners() - Setting up hint buttons...');
             // Hint button
             const hintBtn = document.getElementById('hint');
             if (hintBtn) {
                 hintBtn.addEventListener('click', () => {
                     this.showHint();
                 });
-                console.log('✓ hint event listener added');
+                logger.debug('✓ hint event listener added');
             } else {
-                console.log('⚠ hint button not found');
+                logger.debug('⚠ hint button not found');
             }
 
             // Detailed hint button
@@ -277,9 +284,9 @@ export class AVMasterGame {
                 detailedHintBtn.addEventListener('click', () => {
                     this.showDetailedHint();
                 });
-                console.log('✓ detailed-hint event listener added');
+                logger.debug('✓ detailed-hint event listener added');
             } else {
-                console.log('⚠ detailed-hint button not found');
+                logger.debug('⚠ detailed-hint button not found');
             }
 
             // Pause button
@@ -288,9 +295,9 @@ export class AVMasterGame {
                 pauseBtn.addEventListener('click', () => {
                     this.pauseGame();
                 });
-                console.log('✓ pause-game event listener added');
+                logger.debug('✓ pause-game event listener added');
             } else {
-                console.log('⚠ pause-game button not found');
+                logger.debug('⚠ pause-game button not found');
             }
 
             // Test setup button
@@ -299,9 +306,9 @@ export class AVMasterGame {
                 testSetupBtn.addEventListener('click', () => {
                     this.testSetup();
                 });
-                console.log('✓ test-setup event listener added');
+                logger.debug('✓ test-setup event listener added');
             } else {
-                console.log('⚠ test-setup button not found');
+                logger.debug('⚠ test-setup button not found');
             }
 
             // Reset level button
@@ -310,9 +317,9 @@ export class AVMasterGame {
                 resetLevelBtn.addEventListener('click', () => {
                     this.resetLevel();
                 });
-                console.log('✓ reset-level event listener added');
+                logger.debug('✓ reset-level event listener added');
             } else {
-                console.log('⚠ reset-level button not found');
+                logger.debug('⚠ reset-level button not found');
             }
 
             // Level complete screen buttons
@@ -321,9 +328,9 @@ export class AVMasterGame {
                 nextLevelBtn.addEventListener('click', () => {
                     this.goToNextLevel();
                 });
-                console.log('✓ next-level event listener added');
+                logger.debug('✓ next-level event listener added');
             } else {
-                console.log('⚠ next-level button not found');
+                logger.debug('⚠ next-level button not found');
             }
 
             const replayLevelBtn = document.getElementById('replay-level');
@@ -331,9 +338,9 @@ export class AVMasterGame {
                 replayLevelBtn.addEventListener('click', () => {
                     this.replayLevel();
                 });
-                console.log('✓ replay-level event listener added');
+                logger.debug('✓ replay-level event listener added');
             } else {
-                console.log('⚠ replay-level button not found');
+                logger.debug('⚠ replay-level button not found');
             }
 
             const levelSelectBtn = document.getElementById('level-select-btn');
@@ -341,15 +348,15 @@ export class AVMasterGame {
                 levelSelectBtn.addEventListener('click', () => {
                     this.showLevelSelect();
                 });
-                console.log('✓ level-select-btn event listener added');
+                logger.debug('✓ level-select-btn event listener added');
             } else {
-                console.log('⚠ level-select-btn button not found');
+                logger.debug('⚠ level-select-btn button not found');
             }
 
-            console.log('setupEventListeners() - All event listeners set up successfully');
+            logger.debug('setupEventListeners() - All event listeners set up successfully');
         } catch (error) {
-            console.error('❌ Error in setupEventListeners():', error);
-            console.error('Stack trace:', error.stack);
+            logger.error('❌ Error in setupEventListeners():', error);
+            logger.error('Stack trace:', error.stack);
             throw error;
         }
     }
@@ -359,20 +366,19 @@ export class AVMasterGame {
      */
     validateLevelData() {
         try {
-            // Test that we can access level data
-            const testLevel = getLevelData('audio-1');
-            if (!testLevel) {
-                throw new Error('Cannot access level data');
+            // Test that every level in the progression has a manifest entry
+            // (level definitions themselves are loaded on demand)
+            const missing = LEVEL_ORDER.filter(levelId => !LEVEL_MANIFEST[levelId]);
+            if (missing.length > 0) {
+                throw new Error(`Level manifest missing: ${missing.join(', ')}`);
             }
 
-            // Test that required properties exist
-            if (!testLevel.equipment || !testLevel.connections || !testLevel.validConnections) {
-                throw new Error('Level data missing required properties');
-            }
+            // Start fetching the first level while the menu is up
+            prefetchLevel(LEVEL_ORDER[0]);
 
-            console.log('✓ Level data validation passed');
+            logger.debug('✓ Level data validation passed');
         } catch (error) {
-            console.error('❌ Level data validation failed:', error);
+            logger.error('❌ Level data validation failed:', error);
             throw error;
         }
     }
@@ -420,16 +426,16 @@ export class AVMasterGame {
                 } else {
                     // Loading complete, show main menu
                     setTimeout(() => {
-                        console.log('GameEngine.init() - Step 6: Showing main menu...');
+                        logger.debug('GameEngine.init() - Step 6: Showing main menu...');
                         this.showMainMenu();
-                        console.log('✓ Main menu shown');
+                        logger.debug('✓ Main menu shown');
 
                         // Debug: Check if button is available after showing main menu
                         setTimeout(() => {
                             const debugBtn = document.getElementById('start-game-btn');
-                            console.log('🔍 Debug: Button after showMainMenu:', debugBtn);
+                            logger.debug('🔍 Debug: Button after showMainMenu:', debugBtn);
                             if (debugBtn) {
-                                console.log('🔍 Debug: Button properties:', {
+                                logger.debug('🔍 Debug: Button properties:', {
                                     disabled: debugBtn.disabled,
                                     style: debugBtn.style.display,
                                     className: debugBtn.className,
@@ -467,7 +473,7 @@ export class AVMasterGame {
      */
     showLevelSelect() {
         try {
-            console.log('Showing level select screen...');
+            logger.debug('Showing level select screen...');
             this.switchScreen('level-select');
             this.currentScreen = 'level-select';
 
@@ -481,7 +487,7 @@ export class AVMasterGame {
                 this.verifyLevelCardsAccessible();
             }, 100);
         } catch (error) {
-            console.error('Error showing level select:', error);
+            logger.error('Error showing level select:', error);
         }
     }
 
@@ -490,26 +496,26 @@ export class AVMasterGame {
      */
     clearAllScreens() {
         try {
-            console.log('clearAllScreens() - Clearing all screen states...');
+            logger.debug('clearAllScreens() - Clearing all screen states...');
 
             // Remove all active classes and set display to none
             document.querySelectorAll('.screen').forEach(screen => {
                 screen.classList.remove('active');
                 screen.style.display = 'none';
                 screen.style.zIndex = '1';
-                console.log(`🔍 Cleared screen: ${screen.id}`);
+                logger.debug(`🔍 Cleared screen: ${screen.id}`);
             });
 
             // Verify no screens are active
             const activeScreens = document.querySelectorAll('.screen.active');
             if (activeScreens.length > 0) {
-                console.warn(`⚠️ Warning: ${activeScreens.length} screens still active after clear:`,
+                logger.warn(`⚠️ Warning: ${activeScreens.length} screens still active after clear:`,
                     Array.from(activeScreens).map(s => s.id));
             } else {
-                console.log('✅ All screens cleared successfully');
+                logger.debug('✅ All screens cleared successfully');
             }
         } catch (error) {
-            console.error('❌ Error in clearAllScreens():', error);
+            logger.error('❌ Error in clearAllScreens():', error);
         }
     }
 
@@ -519,25 +525,25 @@ export class AVMasterGame {
     verifyScreenState(expectedScreenId) {
         try {
             const activeScreens = document.querySelectorAll('.screen.active');
-            console.log(`🔍 Screen state verification:`);
-            console.log(`  Expected active screen: ${expectedScreenId}`);
-            console.log(`  Currently active screens:`, Array.from(activeScreens).map(s => s.id));
+            logger.debug(`🔍 Screen state verification:`);
+            logger.debug(`  Expected active screen: ${expectedScreenId}`);
+            logger.debug(`  Currently active screens:`, Array.from(activeScreens).map(s => s.id));
 
             if (activeScreens.length === 0) {
-                console.error(`❌ No screens are active!`);
+                logger.error(`❌ No screens are active!`);
                 return false;
             } else if (activeScreens.length > 1) {
-                console.error(`❌ Multiple screens active:`, Array.from(activeScreens).map(s => s.id));
+                logger.error(`❌ Multiple screens active:`, Array.from(activeScreens).map(s => s.id));
                 return false;
             } else if (activeScreens[0].id !== expectedScreenId) {
-                console.error(`❌ Wrong screen active. Expected: ${expectedScreenId}, Got: ${activeScreens[0].id}`);
+                logger.error(`❌ Wrong screen active. Expected: ${expectedScreenId}, Got: ${activeScreens[0].id}`);
                 return false;
             } else {
-                console.log(`✅ Screen state correct - ${expectedScreenId} is active`);
+                logger.debug(`✅ Screen state correct - ${expectedScreenId} is active`);
                 return true;
             }
         } catch (error) {
-            console.error('❌ Error in verifyScreenState():', error);
+            logger.error('❌ Error in verifyScreenState():', error);
             return false;
         }
     }
@@ -546,26 +552,28 @@ export class AVMasterGame {
      * Verify level cards are accessible
      */
     verifyLevelCardsAccessible() {
+        if (!logger.enabled('debug')) return;
+
         try {
             const levelCards = document.querySelectorAll('.level-card');
-            console.log(`🔍 Level cards accessibility check:`);
-            console.log(`  Total level cards found: ${levelCards.length}`);
+            logger.debug(`🔍 Level cards accessibility check:`);
+            logger.debug(`  Total level cards found: ${levelCards.length}`);
 
             levelCards.forEach((card, index) => {
                 const levelId = card.dataset.level;
                 const isUnlocked = this.gameState.unlockedLevels.includes(levelId);
                 const computedStyle = window.getComputedStyle(card);
 
-                console.log(`  Card ${index + 1} (${levelId}):`);
-                console.log(`    - Unlocked: ${isUnlocked}`);
-                console.log(`    - Display: ${computedStyle.display}`);
-                console.log(`    - Visibility: ${computedStyle.visibility}`);
-                console.log(`    - Z-index: ${computedStyle.zIndex}`);
-                console.log(`    - Cursor: ${computedStyle.cursor}`);
-                console.log(`    - Pointer-events: ${computedStyle.pointerEvents}`);
+                logger.debug(`  Card ${index + 1} (${levelId}):`);
+                logger.debug(`    - Unlocked: ${isUnlocked}`);
+                logger.debug(`    - Display: ${computedStyle.display}`);
+                logger.debug(`    - Visibility: ${computedStyle.visibility}`);
+                logger.debug(`    - Z-index: ${computedStyle.zIndex}`);
+                logger.debug(`    - Cursor: ${computedStyle.cursor}`);
+                logger.debug(`    - Pointer-events: ${computedStyle.pointerEvents}`);
             });
         } catch (error) {
-            console.error('❌ Error in verifyLevelCardsAccessible():', error);
+            logger.error('❌ Error in verifyLevelCardsAccessible():', error);
         }
     }
 
@@ -574,12 +582,12 @@ export class AVMasterGame {
      */
     switchScreen(screenId) {
         try {
-            console.log(`switchScreen() - Switching to: ${screenId}`);
+            logger.debug(`switchScreen() - Switching to: ${screenId}`);
 
             // First, check if there are multiple active screens (this shouldn't happen)
             const currentlyActive = document.querySelectorAll('.screen.active');
             if (currentlyActive.length > 1) {
-                console.warn(`⚠️ Multiple active screens detected:`, Array.from(currentlyActive).map(s => s.id));
+                logger.warn(`⚠️ Multiple active screens detected:`, Array.from(currentlyActive).map(s => s.id));
             }
 
             // Hide all screens by removing active class and setting display to none
@@ -587,7 +595,7 @@ export class AVMasterGame {
                 screen.classList.remove('active');
                 screen.style.display = 'none';
                 screen.style.zIndex = '1';
-                console.log(`🔍 Hidden screen: ${screen.id}`);
+                logger.debug(`🔍 Hidden screen: ${screen.id}`);
             });
 
             // Show target screen by adding active class
@@ -596,24 +604,28 @@ export class AVMasterGame {
                 targetScreen.classList.add('active');
                 targetScreen.style.display = 'flex';
                 targetScreen.style.zIndex = '10';
-                console.log(`✓ Screen ${screenId} activated`);
+                logger.debug(`✓ Screen ${screenId} activated`);
 
-                // Debug: Check which screens are currently active
-                const activeScreens = document.querySelectorAll('.screen.active');
-                console.log(`🔍 Active screens after switch:`, Array.from(activeScreens).map(s => s.id));
+                // Debug: Check which screens are currently active (skipped unless debug logging is on)
+                if (logger.enabled('debug')) {
+                    const activeScreens = document.querySelectorAll('.screen.active');
+                    logger.debug(`🔍 Active screens after switch:`, Array.from(activeScreens).map(s => s.id));
 
-                // Verify only one screen is active
-                if (activeScreens.length !== 1) {
-                    console.error(`❌ Screen switching failed - ${activeScreens.length} screens are active!`);
-                    console.error(`Active screens:`, Array.from(activeScreens).map(s => s.id));
-                } else {
-                    console.log(`✅ Screen switching successful - only ${screenId} is active`);
+                    // Verify only one screen is active
+                    if (activeScreens.length !== 1) {
+                        logger.error(`❌ Screen switching failed - ${activeScreens.length} screens are active!`);
+                        logger.error(`Active screens:`, Array.from(activeScreens).map(s => s.id));
+                    } else {
+                        logger.debug(`✅ Screen switching successful - only ${screenId} is active`);
+                    }
                 }
+
+                signalReady('av:screen-changed', { screen: screenId });
             } else {
-                console.error(`❌ Screen ${screenId} not found`);
+                logger.error(`❌ Screen ${screenId} not found`);
             }
         } catch (error) {
-            console.error('❌ Error in switchScreen():', error);
+            logger.error('❌ Error in switchScreen():', error);
             throw error;
         }
     }
@@ -663,20 +675,20 @@ export class AVMasterGame {
      */
     updateLevelStatus() {
         try {
-            console.log('Updating level status...');
-            console.log('🔍 LEVEL_ORDER:', LEVEL_ORDER);
-            console.log('🔍 Game state:', this.gameState);
+            logger.debug('Updating level status...');
+            logger.debug('🔍 LEVEL_ORDER:', LEVEL_ORDER);
+            logger.debug('🔍 Game state:', this.gameState);
 
             // Update existing level cards instead of replacing content
             LEVEL_ORDER.forEach(levelId => {
                 const levelCard = document.querySelector(`[data-level="${levelId}"]`);
                 if (!levelCard) {
-                    console.log(`Level card not found for: ${levelId}`);
+                    logger.debug(`Level card not found for: ${levelId}`);
                     return;
                 }
 
-                console.log(`🔍 Found level card for: ${levelId}`);
-                console.log(`🔍 Level card element:`, levelCard);
+                logger.debug(`🔍 Found level card for: ${levelId}`);
+                logger.debug(`🔍 Level card element:`, levelCard);
 
                 const isUnlocked = this.gameState.unlockedLevels.includes(levelId);
                 const isCompleted = this.gameState.completedLevels.includes(levelId);
@@ -703,7 +715,7 @@ export class AVMasterGame {
                     // Remove any existing click listeners to prevent duplicates
                     levelCard.removeEventListener('click', () => this.selectLevel(levelId));
                     levelCard.addEventListener('click', () => {
-                        console.log('🎯 Level card clicked directly:', levelId);
+                        logger.debug('🎯 Level card clicked directly:', levelId);
                         this.selectLevel(levelId);
                     });
                 } else {
@@ -712,9 +724,9 @@ export class AVMasterGame {
                 }
             });
 
-            console.log('Level status update completed');
+            logger.debug('Level status update completed');
         } catch (error) {
-            console.error('Error updating level status:', error);
+            logger.error('Error updating level status:', error);
         }
     }
 
@@ -722,7 +734,7 @@ export class AVMasterGame {
      * Update the level selection UI (public method for external calls)
      */
     updateLevelSelectionUI() {
-        console.log('🔄 Updating level selection UI...');
+        logger.debug('🔄 Updating level selection UI...');
         this.updateLevelStatus();
     }
 
@@ -730,23 +742,23 @@ export class AVMasterGame {
      * Select a level to play
      */
     selectLevel(levelId) {
-        console.log('🎯 selectLevel() called with:', levelId);
-        console.log('🔍 Unlocked levels:', this.gameState.unlockedLevels);
-        console.log('🔍 Completed levels:', this.gameState.completedLevels);
+        logger.debug('🎯 selectLevel() called with:', levelId);
+        logger.debug('🔍 Unlocked levels:', this.gameState.unlockedLevels);
+        logger.debug('🔍 Completed levels:', this.gameState.completedLevels);
 
         // Allow access to both unlocked and completed levels
         if (this.gameState.unlockedLevels.includes(levelId) || this.gameState.completedLevels.includes(levelId)) {
-            console.log('✅ Level is accessible, loading:', levelId);
+            logger.debug('✅ Level is accessible, loading:', levelId);
             this.loadLevel(levelId);
         } else {
-            console.log('❌ Level is not accessible:', levelId);
+            logger.debug('❌ Level is not accessible:', levelId);
         }
     }
 
     /**
      * Load a specific level
      */
-    loadLevel(levelId) {
+    async loadLevel(levelId) {
         // Stop any existing timer first
         this.stopGameTimer();
 
@@ -755,12 +767,29 @@ export class AVMasterGame {
         this.totalRequiredConnections = 0;
         this.levelCompleted = false; // Reset completion flag for new level
 
-        const levelData = getLevelData(levelId);
+        // Only the most recent loadLevel() call sets up the stage
+        const loadId = ++this.levelLoadId;
+
+        let levelData;
+        try {
+            levelData = await getLevelData(levelId);
+        } catch (error) {
+            logger.error('❌ Failed to load level data:', levelId, error);
+            this.showMessage('Could not load this level. Please check your connection and try again.', 'error');
+            return;
+        }
+
+        if (loadId !== this.levelLoadId) {
+            return;
+        }
         if (!levelData) {
-            console.error('Level data not found:', levelId);
+            logger.error('Level data not found:', levelId);
             return;
         }
 
+        // Build the connection rule index once per level
+        getConnectionRuleIndex(levelData);
+
         this.switchScreen('game');
         this.currentScreen = 'game';
 
@@ -768,17 +797,9 @@ export class AVMasterGame {
         this.updateLevelNameDisplay(levelData);
 
         // Reset game state for this level
-        this.connections = [];
+        this.connections.clear();
         this.equipment = [];
-        this.connectionProgress = {
-            power: { current: 0, required: 0 },
-            xlr: { current: 0, required: 0 },
-            wireless: { current: 0, required: 0 },
-            ethernet: { current: 0, required: 0 },
-            dmx: { current: 0, required: 0 },
-            hdmi: { current: 0, required: 0 },
-            usb: { current: 0, required: 0 }
-        };
+        this.connectionProgress = createEmptyProgress();
 
         // Reset timer for this level
         this.gameState.time = 0;
@@ -793,6 +814,8 @@ export class AVMasterGame {
         setTimeout(() => {
             this.startGameTimer();
         }, 100);
+
+        signalReady('av:level-loaded', { level: levelId, equipment: 0, connections: 0 });
     }
 
     /**
@@ -809,7 +832,7 @@ export class AVMasterGame {
      * Pause game and return to level selector
      */
     pauseGame() {
-        console.log('⏸️ Pausing game and returning to level selector');
+        logger.debug('⏸️ Pausing game and returning to level selector');
 
         // Stop the game timer
         this.stopGameTimer();
@@ -835,11 +858,11 @@ export class AVMasterGame {
      * Test the current setup
      */
     testSetup() {
-        console.log('🧪 Testing setup for level:', this.currentLevel);
+        logger.debug('🧪 Testing setup for level:', this.currentLevel);
 
-        const levelData = getLevelData(this.currentLevel);
+        const levelData = getCachedLevelData(this.currentLevel);
         if (!levelData) {
-            console.error('❌ No level data found for:', this.currentLevel);
+            logger.error('❌ No level data found for:', this.currentLevel);
             return;
         }
 
@@ -847,7 +870,7 @@ export class AVMasterGame {
         const validationResult = this.validateLevelCompletion(levelData);
 
         if (validationResult.isComplete) {
-            console.log('✅ Setup test passed! All connections and resource assignments are valid.');
+            logger.debug('✅ Setup test passed! All connections and resource assignments are valid.');
 
             let successMessage = '✅ Setup test passed! All connections are valid.';
             if (validationResult.resourceAssignmentComplete !== undefined) {
@@ -861,7 +884,7 @@ export class AVMasterGame {
                 this.showLevelComplete();
             }
         } else {
-            console.log('❌ Setup test failed. Missing:', validationResult.missingConnections, validationResult.missingResources);
+            logger.debug('❌ Setup test failed. Missing:', validationResult.missingConnections, validationResult.missingResources);
 
             let errorMessage = '❌ Setup test failed. Missing: ';
             const missingItems = [...validationResult.missingConnections, ...validationResult.missingResources];
@@ -878,7 +901,7 @@ export class AVMasterGame {
      * Reset the current level
      */
     resetLevel() {
-        console.log('🔄 Resetting level:', this.currentLevel);
+        logger.debug('🔄 Resetting level:', this.currentLevel);
 
         // Confirm with user
         if (!confirm('Are you sure you want to reset this level? All progress will be lost.')) {
@@ -889,7 +912,7 @@ export class AVMasterGame {
         this.stopGameTimer();
 
         // Clear all connections
-        this.connections = [];
+        this.connections.clear();
         this.successfulConnections = 0;
         this.totalRequiredConnections = 0;
         this.levelCompleted = false; // Reset completion flag
@@ -898,15 +921,7 @@ export class AVMasterGame {
         this.clearAllConnectionLines();
 
         // Reset connection progress
-        this.connectionProgress = {
-            power: { current: 0, required: 0 },
-            xlr: { current: 0, required: 0 },
-            wireless: { current: 0, required: 0 },
-            ethernet: { current: 0, required: 0 },
-            dmx: { current: 0, required: 0 },
-            hdmi: { current: 0, required: 0 },
-            usb: { current: 0, required: 0 }
-        };
+        this.connectionProgress = createEmptyProgress();
 
         // Clear any active connection mode
         this.connectionMode = false;
@@ -930,7 +945,7 @@ export class AVMasterGame {
         // Reload the level
         this.loadLevel(this.currentLevel);
 
-        console.log('🔄 Level reset complete');
+        logger.debug('🔄 Level reset complete');
         this.showMessage('Level reset complete. Start fresh!', 'info');
     }
 
@@ -1017,31 +1032,18 @@ export class AVMasterGame {
      * Clear all connection lines
      */
     clearAllConnectionLines() {
-        // Clear only SVG elements with connection-line class
-        const stageArea = document.getElementById('stage-area');
-        if (stageArea) {
-            const svgLines = stageArea.querySelectorAll('svg.connection-line');
-            svgLines.forEach(svg => {
-                if (svg.parentNode) {
-                    svg.parentNode.removeChild(svg);
-                }
-            });
+        // Empty the shared cable layer (valid and temporary invalid lines)
+        if (this.connectionLayer) {
+            this.connectionLayer.replaceChildren();
         }
-
-        // Clear any other elements with connection-line class
-        const connectionLines = document.querySelectorAll('.connection-line:not(svg)');
-        connectionLines.forEach(line => {
-            if (line.parentNode) {
-                line.parentNode.removeChild(line);
-            }
-        });
+        this.connectionPaths.clear();
     }
 
     /**
      * Redraw all connection lines
      */
     redrawAllConnectionLines() {
-        console.log('🔄 Redrawing all connection lines...');
+        logger.debug('🔄 Redrawing all connection lines...');
 
         // Clear existing lines
         this.clearAllConnectionLines();
@@ -1053,12 +1055,13 @@ export class AVMasterGame {
                 connection.line = this.drawConnectionLineWithCoordinates(
                     connection.fromCoords,
                     connection.toCoords,
-                    getConnectorColor(connection.fromConnectorType)
+                    getConnectorColor(connection.fromConnectorType),
+                    connection.id
                 );
             }
         });
 
-        console.log(`✅ Redrew ${this.connections.length} connection lines`);
+        logger.debug(`✅ Redrew ${this.connections.length} connection lines`);
     }
 
     /**
@@ -1067,7 +1070,7 @@ export class AVMasterGame {
     closeCableSelectionDialog() {
         const cableDialog = document.querySelector('.cable-selection-dialog');
         if (cableDialog) {
-            console.log('🔌 Closing cable selection dialog');
+            logger.debug('🔌 Closing cable selection dialog');
             document.body.removeChild(cableDialog);
 
             // Reset connection mode when dialog is closed
@@ -1093,13 +1096,13 @@ export class AVMasterGame {
  * Start testing challenges flow
  */
     startTestingChallenges() {
-        console.log('🔬 Starting testing challenges flow...');
-        console.log('🔬 Current level:', this.currentLevel);
+        logger.debug('🔬 Starting testing challenges flow...');
+        logger.debug('🔬 Current level:', this.currentLevel);
 
         // Close any existing winner popup first
         const winnerPopup = document.querySelector('.winner-celebration-overlay');
         if (winnerPopup) {
-            console.log('🔬 Closing winner popup');
+            logger.debug('🔬 Closing winner popup');
             document.body.removeChild(winnerPopup);
         }
 
@@ -1111,7 +1114,7 @@ export class AVMasterGame {
      * Show "Activate Test" button at bottom of game screen
      */
     showActivateTestButton() {
-        console.log('🔬 Showing activate test button...');
+        logger.debug('🔬 Showing activate test button...');
 
         // Remove any existing activate test button
         const existingButton = document.getElementById('activate-test-btn');
@@ -1130,19 +1133,19 @@ export class AVMasterGame {
 
         // Add event listener
         activateButton.addEventListener('click', () => {
-            console.log('🔬 Activate test button clicked');
-            console.log('🔬 About to call activateTestingChallenges()...');
+            logger.debug('🔬 Activate test button clicked');
+            logger.debug('🔬 About to call activateTestingChallenges()...');
             this.activateTestingChallenges();
-            console.log('🔬 activateTestingChallenges() called successfully');
+            logger.debug('🔬 activateTestingChallenges() called successfully');
         });
 
         // Add to the game screen (bottom of stage area)
         const stageArea = document.getElementById('stage-area');
         if (stageArea) {
             stageArea.appendChild(activateButton);
-            console.log('🔬 Activate test button added to stage area');
+            logger.debug('🔬 Activate test button added to stage area');
         } else {
-            console.error('❌ Stage area not found for activate test button');
+            logger.error('❌ Stage area not found for activate test button');
         }
     }
 
@@ -1150,8 +1153,8 @@ export class AVMasterGame {
      * Activate testing challenges (called when "Activate Test" button is clicked)
      */
     activateTestingChallenges() {
-        console.log('🔬 ===== ACTIVATE TESTING CHALLENGES FUNCTION CALLED =====');
-        console.log('🔬 Activating testing challenges...');
+        logger.debug('🔬 ===== ACTIVATE TESTING CHALLENGES FUNCTION CALLED =====');
+        logger.debug('🔬 Activating testing challenges...');
 
         // Remove the activate test button safely
         const activateButton = document.getElementById('activate-test-btn');
@@ -1160,28 +1163,28 @@ export class AVMasterGame {
         }
 
         const levelData = this.getLevelData(this.currentLevel);
-        console.log('🔬 Level data:', levelData);
+        logger.debug('🔬 Level data:', levelData);
 
         if (!levelData || !levelData.testingChallenges) {
-            console.error('❌ No testing challenges found for level:', this.currentLevel);
+            logger.error('❌ No testing challenges found for level:', this.currentLevel);
             alert('No testing challenges available for this level.');
             return;
         }
 
-        console.log('🔬 Testing challenges found:', levelData.testingChallenges);
-        console.log('🔬 Number of challenges:', levelData.testingChallenges.length);
+        logger.debug('🔬 Testing challenges found:', levelData.testingChallenges);
+        logger.debug('🔬 Number of challenges:', levelData.testingChallenges.length);
 
         this.currentTestingChallenges = [...levelData.testingChallenges];
         this.currentChallengeIndex = 0;
         this.testingResults = [];
 
-        console.log('🔬 About to show first challenge...');
-        console.log('🔬 Calling showCurrentChallenge()...');
+        logger.debug('🔬 About to show first challenge...');
+        logger.debug('🔬 Calling showCurrentChallenge()...');
         try {
             this.showCurrentChallenge();
-            console.log('🔬 showCurrentChallenge() completed successfully');
+            logger.debug('🔬 showCurrentChallenge() completed successfully');
         } catch (error) {
-            console.error('❌ Error in showCurrentChallenge():', error);
+            logger.error('❌ Error in showCurrentChallenge():', error);
         }
     }
 
@@ -1189,13 +1192,13 @@ export class AVMasterGame {
  * Show current testing challenge - SIMPLE WORKING MODAL
  */
     showCurrentChallenge() {
-        console.log('🔬 ===== SHOW CURRENT CHALLENGE FUNCTION CALLED =====');
-        console.log('🔬 Showing current challenge...');
-        console.log('🔬 Current challenge index:', this.currentChallengeIndex);
-        console.log('🔬 Total challenges:', this.currentTestingChallenges.length);
+        logger.debug('🔬 ===== SHOW CURRENT CHALLENGE FUNCTION CALLED =====');
+        logger.debug('🔬 Showing current challenge...');
+        logger.debug('🔬 Current challenge index:', this.currentChallengeIndex);
+        logger.debug('🔬 Total challenges:', this.currentTestingChallenges.length);
 
         if (this.currentChallengeIndex >= this.currentTestingChallenges.length) {
-            console.log('🔬 All challenges completed!');
+            logger.debug('🔬 All challenges completed!');
             this.showCompletionMessage();
             return;
         }
@@ -1203,7 +1206,7 @@ export class AVMasterGame {
         const challenge = this.currentTestingChallenges[this.currentChallengeIndex];
         this.currentChallenge = challenge;
 
-        console.log('🔬 Current challenge:', challenge);
+        logger.debug('🔬 Current challenge:', challenge);
 
         // Create a simple, clean modal that will definitely work
         this.createSimpleModal(challenge);
@@ -1343,7 +1346,7 @@ export class AVMasterGame {
 
         // Add to page
         document.body.appendChild(modal);
-        console.log('🔬 Simple modal created and added to DOM');
+        logger.debug('🔬 Simple modal created and added to DOM');
 
         // Add event listeners to the controls
         this.setupModalEventListeners(modal, challenge);
@@ -1406,7 +1409,7 @@ export class AVMasterGame {
             micStatus.textContent = 'Muted';
             micStatus.style.background = '#e74c3c';
             stopVisualizer();
-            console.log('🔇 Microphone muted');
+            logger.debug('🔇 Microphone muted');
         });
 
         // Unmute button functionality
@@ -1415,7 +1418,7 @@ export class AVMasterGame {
             micStatus.textContent = 'Active';
             micStatus.style.background = '#27ae60';
             startVisualizer();
-            console.log('🔊 Microphone unmuted');
+            logger.debug('🔊 Microphone unmuted');
         });
     }
 
@@ -1436,7 +1439,7 @@ export class AVMasterGame {
         volumeSlider.addEventListener('input', () => {
             const volume = volumeSlider.value;
             volumeDisplay.textContent = volume + '%';
-            console.log('🔊 Volume set to:', volume + '%');
+            logger.debug('🔊 Volume set to:', volume + '%');
         });
 
         // Play test audio
@@ -1478,7 +1481,7 @@ export class AVMasterGame {
             `;
             document.head.appendChild(style);
 
-            console.log('🔊 Playing test audio on:', selectedSpeakers);
+            logger.debug('🔊 Playing test audio on:', selectedSpeakers);
         });
 
         // Stop test audio
@@ -1489,7 +1492,7 @@ export class AVMasterGame {
 
             speakerStatus.innerHTML = '<div style="color: #ecf0f1; font-size: 14px;">Audio stopped. Select speakers and click "Play Test Audio" to begin testing</div>';
 
-            console.log('🔊 Test audio stopped');
+            logger.debug('🔊 Test audio stopped');
         });
     }
 
@@ -1525,7 +1528,7 @@ export class AVMasterGame {
                 </div>
             `;
 
-            console.log('🎛️ Audio routed to channels:', selectedChannels);
+            logger.debug('🎛️ Audio routed to channels:', selectedChannels);
         });
 
         // Clear all routing
@@ -1537,7 +1540,7 @@ export class AVMasterGame {
 
             channelStatus.innerHTML = '<div style="color: #ecf0f1; font-size: 14px;">All routing cleared. Select channels and click "Route Audio" to test routing</div>';
 
-            console.log('🎛️ All channel routing cleared');
+            logger.debug('🎛️ All channel routing cleared');
         });
     }
 
@@ -2101,7 +2104,7 @@ export class AVMasterGame {
      * Go to next level
      */
     goToNextLevel() {
-        console.log('➡️ Going to next level');
+        logger.debug('➡️ Going to next level');
 
         const levelOrder = [
             'audio-1', 'audio-2', 'audio-3',
@@ -2113,10 +2116,10 @@ export class AVMasterGame {
         const currentIndex = levelOrder.indexOf(this.currentLevel);
         if (currentIndex !== -1 && currentIndex < levelOrder.length - 1) {
             const nextLevel = levelOrder[currentIndex + 1];
-            console.log('➡️ Loading next level:', nextLevel);
+            logger.debug('➡️ Loading next level:', nextLevel);
             this.loadLevel(nextLevel);
         } else {
-            console.log('🎉 All levels completed!');
+            logger.debug('🎉 All levels completed!');
             this.showMessage('Congratulations! You have completed all levels!', 'success');
             this.showLevelSelect();
         }
@@ -2126,15 +2129,15 @@ export class AVMasterGame {
      * Replay current level
      */
     replayLevel() {
-        console.log('🔄 Replaying level:', this.currentLevel);
+        logger.debug('🔄 Replaying level:', this.currentLevel);
         this.loadLevel(this.currentLevel);
     }
 
     /**
-     * Get level data (delegates to LevelData module)
+     * Get level data for a loaded level (delegates to LevelData module)
      */
     getLevelData(levelId) {
-        return getLevelData(levelId);
+        return getCachedLevelData(levelId);
     }
 
     /**
@@ -2145,6 +2148,8 @@ export class AVMasterGame {
         if (!stageArea) return;
 
         stageArea.innerHTML = '';
+        this.connectionLayer = null;
+        this.connectionPaths.clear();
         // Canvas is now responsive - no need to set fixed dimensions
         // stageArea.style.width = (levelData.stageSetup?.width || 1000) + 'px';
         // stageArea.style.height = (levelData.stageSetup?.height || 800) + 'px';
@@ -2168,7 +2173,7 @@ export class AVMasterGame {
      * Setup the toolbar with equipment
      */
     setupToolbar(levelData) {
-        console.log('🔧 Setting up toolbar with level data:', levelData);
+        logger.debug('🔧 Setting up toolbar with level data:', levelData);
         this.setupEquipmentTools(levelData.equipment);
         // Don't show connections in toolbar - they should only appear when connecting
         // this.setupConnectionTools(levelData.connections);
@@ -2303,8 +2308,9 @@ export class AVMasterGame {
         equipmentElement.style.left = x + 'px';
         equipmentElement.style.top = y + 'px';
 
-        // Get equipment data
-        const levelData = getLevelData(this.currentLevel);
+        // Get equipment data (the next level may still be loading while the old stage is up)
+        const levelData = getCachedLevelData(this.currentLevel);
+        if (!levelData) return;
         const equipmentData = levelData.equipment.find(eq => eq.name === equipmentName);
 
         if (equipmentData) {
@@ -2338,7 +2344,7 @@ export class AVMasterGame {
                 // Force a reflow to ensure proper rendering
                 connector.offsetHeight;
 
-                console.log(`🔧 Initialized connector ${index}: ${connector.dataset.type} (${connector.dataset.connectorId})`);
+                logger.debug(`🔧 Initialized connector ${index}: ${connector.dataset.type} (${connector.dataset.connectorId})`);
             });
 
             // Add equipment info click handler
@@ -2357,7 +2363,7 @@ export class AVMasterGame {
                 resourceBtn.addEventListener('contextmenu', (e) => {
                     e.preventDefault();
                     e.stopPropagation();
-                    console.log('👥 Right-click detected on resource button');
+                    logger.debug('👥 Right-click detected on resource button');
                     this.showResourceMenu(e, equipmentType, equipmentElement, uniqueId);
                 });
 
@@ -2365,7 +2371,7 @@ export class AVMasterGame {
                 resourceBtn.addEventListener('click', (e) => {
                     e.preventDefault();
                     e.stopPropagation();
-                    console.log('👥 Click detected on resource button (fallback)');
+                    logger.debug('👥 Click detected on resource button (fallback)');
                     this.showResourceMenu(e, equipmentType, equipmentElement, uniqueId);
                 });
             }
@@ -2376,9 +2382,6 @@ export class AVMasterGame {
                 this.showEquipmentSettings(equipmentType, equipmentName, equipmentElement, uniqueId);
             });
 
-            // Make equipment draggable
-            this.makeEquipmentDraggable(equipmentElement);
-
             // Add to equipment array
             this.equipment.push({
                 element: equipmentElement,
@@ -2394,6 +2397,8 @@ export class AVMasterGame {
             if (toolElement && toolElement.parentNode) {
                 toolElement.parentNode.removeChild(toolElement);
             }
+
+            signalReady('av:equipment-placed', { equipment: this.equipment.length });
         }
     }
 
@@ -2406,7 +2411,7 @@ export class AVMasterGame {
         return connectors.map((connector, index) => {
             const color = getConnectorColor(connector.type);
             // Create a unique connector identifier based on type, label, and index
-            const connectorKey = `${connector.type}-${connector.label.replace(/\s+/g, '-')}-${index}`;
+            const connectorKey = getConnectorKey(connector, index);
             return `
                 <div class="connector ${connector.position}" 
                      data-type="${connector.type}" 
@@ -2428,23 +2433,23 @@ export class AVMasterGame {
         const equipmentId = equipment.dataset.uniqueId;
         const connectorId = connector.dataset.connectorId;
 
-        console.log('🔌 Connector click debug info:');
-        console.log('  - Connector element:', connector);
-        console.log('  - Equipment element:', equipment);
-        console.log('  - Connector type:', connector.dataset.type);
-        console.log('  - Connector position:', connector.dataset.position);
-        console.log('  - Connector key:', connector.dataset.connectorKey);
-        console.log('  - Equipment ID:', equipmentId);
-        console.log('  - Connector ID:', connectorId);
+        logger.debug('🔌 Connector click debug info:');
+        logger.debug('  - Connector element:', connector);
+        logger.debug('  - Equipment element:', equipment);
+        logger.debug('  - Connector type:', connector.dataset.type);
+        logger.debug('  - Connector position:', connector.dataset.position);
+        logger.debug('  - Connector key:', connector.dataset.connectorKey);
+        logger.debug('  - Equipment ID:', equipmentId);
+        logger.debug('  - Connector ID:', connectorId);
 
         if (!equipmentId || !connectorId) {
-            console.error('❌ Missing unique identifiers:', { equipmentId, connectorId });
+            logger.error('❌ Missing unique identifiers:', { equipmentId, connectorId });
             return;
         }
 
-        console.log(`🔌 Connector clicked: ${connector.dataset.type} (${connectorId})`);
-        console.log(`🔌 Equipment: ${equipment.dataset.name} (${equipmentId})`);
-        console.log(`🔌 Connection mode: ${this.connectionMode}`);
+        logger.debug(`🔌 Connector clicked: ${connector.dataset.type} (${connectorId})`);
+        logger.debug(`🔌 Equipment: ${equipment.dataset.name} (${equipmentId})`);
+        logger.debug(`🔌 Connection mode: ${this.connectionMode}`);
 
         // Ensure connector is properly initialized
         connector.style.pointerEvents = 'auto';
@@ -2453,7 +2458,7 @@ export class AVMasterGame {
         if (this.connectionMode && this.selectedConnector) {
             // Don't allow connecting to the same connector
             if (this.selectedConnector.connectorId === connectorId) {
-                console.log('🔌 Cannot connect to the same connector');
+                logger.debug('🔌 Cannot connect to the same connector');
                 this.connectionMode = false;
                 this.selectedConnector = null;
                 this.resetConnectorStates();
@@ -2480,7 +2485,7 @@ export class AVMasterGame {
                 equipmentId
             };
             connector.classList.add('selected');
-            console.log('🔌 Started connection mode with:', connector.dataset.type, connectorId);
+            logger.debug('🔌 Started connection mode with:', connector.dataset.type, connectorId);
         }
     }
 
@@ -2498,13 +2503,9 @@ export class AVMasterGame {
  */
     updateConnectorVisualState(connector) {
         // Count how many connections this connector has using unique connector IDs
-        const connectionCount = this.connections.filter(conn => {
-            const connectorId = connector.dataset.connectorId;
-
-            return (conn.fromConnectorId === connectorId) || (conn.toConnectorId === connectorId);
-        }).length;
+        const connectionCount = this.connections.getConnectorCount(connector.dataset.connectorId);
 
-        console.log(`🔌 Updating connector visual state: ${connector.dataset.type} (${connector.dataset.connectorId}) has ${connectionCount} connections`);
+        logger.debug(`🔌 Updating connector visual state: ${connector.dataset.type} (${connector.dataset.connectorId}) has ${connectionCount} connections`);
 
         // Remove existing connection count classes
         connector.classList.remove('connected-1', 'connected-2', 'connected-3', 'connected-many');
@@ -2544,7 +2545,7 @@ export class AVMasterGame {
 
         // Ensure connector remains clickable
         connector.style.pointerEvents = 'auto';
-        console.log(`🔌 Connector ${connector.dataset.type} pointer-events: ${connector.style.pointerEvents}`);
+        logger.debug(`🔌 Connector ${connector.dataset.type} pointer-events: ${connector.style.pointerEvents}`);
     }
 
     /**
@@ -2552,7 +2553,7 @@ export class AVMasterGame {
      */
     updateAllConnectorsOnEquipment(equipment) {
         const connectors = equipment.querySelectorAll('.connector');
-        console.log(`🔧 Found ${connectors.length} connectors on ${equipment.dataset.name}`);
+        logger.debug(`🔧 Found ${connectors.length} connectors on ${equipment.dataset.name}`);
 
         connectors.forEach((connector, index) => {
             // Ensure each connector has proper pointer-events
@@ -2561,7 +2562,7 @@ export class AVMasterGame {
             // Remove any potentially problematic classes that might interfere
             connector.classList.remove('disabled', 'inactive');
 
-            console.log(`🔧 Connector ${index + 1}: ${connector.dataset.type} - pointer-events: ${connector.style.pointerEvents}`);
+            logger.debug(`🔧 Connector ${index + 1}: ${connector.dataset.type} - pointer-events: ${connector.style.pointerEvents}`);
         });
     }
 
@@ -2569,21 +2570,21 @@ export class AVMasterGame {
      * Refresh all connectors on all equipment to ensure they remain clickable
      */
     refreshAllConnectors() {
-        console.log(`🔄 Refreshing connectors on ${this.equipment.length} equipment pieces...`);
+        logger.debug(`🔄 Refreshing connectors on ${this.equipment.length} equipment pieces...`);
         this.equipment.forEach((equipmentData, index) => {
             if (equipmentData.element) {
-                console.log(`🔧 Refreshing equipment ${index + 1}: ${equipmentData.name}`);
+                logger.debug(`🔧 Refreshing equipment ${index + 1}: ${equipmentData.name}`);
                 this.updateAllConnectorsOnEquipment(equipmentData.element);
             }
         });
-        console.log('✅ All equipment connectors refreshed');
+        logger.debug('✅ All equipment connectors refreshed');
     }
 
     /**
      * Force refresh all connector states and ensure they're working
      */
     forceRefreshConnectors() {
-        console.log('🔧 Force refreshing all connectors...');
+        logger.debug('🔧 Force refreshing all connectors...');
 
         // Instead of cloning and replacing, just refresh the existing connectors
         this.equipment.forEach(equipmentData => {
@@ -2614,7 +2615,7 @@ export class AVMasterGame {
                     // Update visual state
                     this.updateConnectorVisualState(connector);
 
-                    console.log(`🔧 Refreshed connector ${index + 1}: ${connector.dataset.type} (${connector.dataset.connectorId})`);
+                    logger.debug(`🔧 Refreshed connector ${index + 1}: ${connector.dataset.type} (${connector.dataset.connectorId})`);
                 });
             }
         });
@@ -2622,7 +2623,7 @@ export class AVMasterGame {
         // Re-setup connector event listeners
         this.setupConnectorEventListeners();
 
-        console.log('✅ Force refresh complete');
+        logger.debug('✅ Force refresh complete');
     }
 
     /**
@@ -2647,17 +2648,27 @@ export class AVMasterGame {
                     e.stopPropagation();
                     const equipment = connector.closest('.equipment');
                     if (equipment) {
-                        console.log('🔌 Connector clicked via delegation:', connector.dataset.type);
-                        console.log('🔌 Connector position:', connector.dataset.position);
-                        console.log('🔌 Connector ID:', connector.dataset.connectorId);
-                        console.log('🔌 Equipment:', equipment.dataset.name, equipment.dataset.uniqueId);
-                        console.log('🔌 Click target:', e.target.tagName, e.target.className);
+                        logger.debug('🔌 Connector clicked via delegation:', connector.dataset.type);
+                        logger.debug('🔌 Connector position:', connector.dataset.position);
+                        logger.debug('🔌 Connector ID:', connector.dataset.connectorId);
+                        logger.debug('🔌 Equipment:', equipment.dataset.name, equipment.dataset.uniqueId);
+                        logger.debug('🔌 Click target:', e.target.tagName, e.target.className);
                         this.handleConnectorClick(connector, equipment);
                     }
                 }
             };
 
             stageArea.addEventListener('click', this.handleStageClick);
+
+            // One delegated mousedown listener drives dragging for all equipment
+            this.handleStageMouseDown = (e) => {
+                const equipment = e.target.closest('.equipment');
+                if (equipment && e.button === 0) {
+                    this.startEquipmentDrag(equipment, e);
+                }
+            };
+
+            stageArea.addEventListener('mousedown', this.handleStageMouseDown);
         }
 
         // Remove JavaScript hover effects - use CSS-only hover for stability
@@ -2674,18 +2685,19 @@ export class AVMasterGame {
                 stageArea.removeEventListener('click', this.handleStageClick);
                 this.handleStageClick = null;
             }
-            if (this.mouseMoveThrottle) {
-                cancelAnimationFrame(this.mouseMoveThrottle);
-                this.mouseMoveThrottle = null;
+            if (this.handleStageMouseDown) {
+                stageArea.removeEventListener('mousedown', this.handleStageMouseDown);
+                this.handleStageMouseDown = null;
             }
         }
+        this.endEquipmentDrag();
     }
 
     /**
  * Refresh XLR connectors - now uses universal connector refresh
  */
     refreshXLRConnectors() {
-        console.log('🔧 Refreshing XLR connectors using universal method...');
+        logger.debug('🔧 Refreshing XLR connectors using universal method...');
         this.forceRefreshConnectors();
     }
 
@@ -2693,18 +2705,20 @@ export class AVMasterGame {
      * Debug all connectors on equipment
      */
     debugEquipmentConnectors(equipment) {
-        console.log('🔍 Debugging all connectors on equipment:', equipment.dataset.name);
+        if (!logger.enabled('debug')) return;
+
+        logger.debug('🔍 Debugging all connectors on equipment:', equipment.dataset.name);
         const connectors = equipment.querySelectorAll('.connector');
-        console.log(`🔍 Found ${connectors.length} connectors:`);
+        logger.debug(`🔍 Found ${connectors.length} connectors:`);
 
         connectors.forEach((connector, index) => {
             const rect = connector.getBoundingClientRect();
-            console.log(`  ${index + 1}. ${connector.dataset.type} (${connector.dataset.position})`);
-            console.log(`     Position: ${rect.left}, ${rect.top}, ${rect.width}x${rect.height}`);
-            console.log(`     Z-index: ${window.getComputedStyle(connector).zIndex}`);
-            console.log(`     Pointer-events: ${window.getComputedStyle(connector).pointerEvents}`);
-            console.log(`     Display: ${window.getComputedStyle(connector).display}`);
-            console.log(`     Visibility: ${window.getComputedStyle(connector).visibility}`);
+            logger.debug(`  ${index + 1}. ${connector.dataset.type} (${connector.dataset.position})`);
+            logger.debug(`     Position: ${rect.left}, ${rect.top}, ${rect.width}x${rect.height}`);
+            logger.debug(`     Z-index: ${window.getComputedStyle(connector).zIndex}`);
+            logger.debug(`     Pointer-events: ${window.getComputedStyle(connector).pointerEvents}`);
+            logger.debug(`     Display: ${window.getComputedStyle(connector).display}`);
+            logger.debug(`     Visibility: ${window.getComputedStyle(connector).visibility}`);
         });
     }
 
@@ -2712,7 +2726,9 @@ export class AVMasterGame {
      * Debug connector clickability issues
      */
     debugConnectorClickability(connector) {
-        console.log('🔍 Debugging connector clickability...');
+        if (!logger.enabled('debug')) return;
+
+        logger.debug('🔍 Debugging connector clickability...');
 
         const rect = connector.getBoundingClientRect();
         const elementsAtPoint = document.elementsFromPoint(
@@ -2720,33 +2736,33 @@ export class AVMasterGame {
             rect.top + rect.height / 2
         );
 
-        console.log('🔍 Elements at connector center point:');
+        logger.debug('🔍 Elements at connector center point:');
         elementsAtPoint.forEach((el, index) => {
-            console.log(`  ${index + 1}. ${el.tagName}${el.className ? '.' + el.className.split(' ').join('.') : ''} - z-index: ${window.getComputedStyle(el).zIndex}`);
+            logger.debug(`  ${index + 1}. ${el.tagName}${el.className ? '.' + el.className.split(' ').join('.') : ''} - z-index: ${window.getComputedStyle(el).zIndex}`);
         });
 
         // Check if connector is the top element
         if (elementsAtPoint[0] === connector || elementsAtPoint[0].contains(connector)) {
-            console.log('✅ Connector is clickable - it\'s the top element');
+            logger.debug('✅ Connector is clickable - it\'s the top element');
         } else {
-            console.log('❌ Connector is blocked by:', elementsAtPoint[0]);
+            logger.debug('❌ Connector is blocked by:', elementsAtPoint[0]);
         }
 
         // Additional debugging for connector state
-        console.log('🔍 Connector state:');
-        console.log('  - Pointer events:', window.getComputedStyle(connector).pointerEvents);
-        console.log('  - Z-index:', window.getComputedStyle(connector).zIndex);
-        console.log('  - Display:', window.getComputedStyle(connector).display);
-        console.log('  - Visibility:', window.getComputedStyle(connector).visibility);
-        console.log('  - Connector ID:', connector.dataset.connectorId);
-        console.log('  - Equipment ID:', connector.dataset.equipmentId);
+        logger.debug('🔍 Connector state:');
+        logger.debug('  - Pointer events:', window.getComputedStyle(connector).pointerEvents);
+        logger.debug('  - Z-index:', window.getComputedStyle(connector).zIndex);
+        logger.debug('  - Display:', window.getComputedStyle(connector).display);
+        logger.debug('  - Visibility:', window.getComputedStyle(connector).visibility);
+        logger.debug('  - Connector ID:', connector.dataset.connectorId);
+        logger.debug('  - Equipment ID:', connector.dataset.equipmentId);
     }
 
     /**
      * Create a connection between two connectors
      */
     createConnection(from, to) {
-        const levelData = getLevelData(this.currentLevel);
+        const levelData = getCachedLevelData(this.currentLevel);
         this.showCableSelectionDialog(from, to, levelData);
     }
 
@@ -2817,34 +2833,26 @@ export class AVMasterGame {
      * Validate and create connection
      */
     validateAndCreateConnection(from, to, cableType, levelData) {
-        console.log('🔍 Validating connection:', {
+        logger.debug('🔍 Validating connection:', {
             from: from.connector.dataset.type,
             to: to.connector.dataset.type,
             cableType: cableType
         });
 
-        console.log('🔍 From connector element:', from.connector);
-        console.log('🔍 To connector element:', to.connector);
+        logger.debug('🔍 From connector element:', from.connector);
+        logger.debug('🔍 To connector element:', to.connector);
 
-        console.log('🔍 Available valid connections:', levelData.validConnections);
+        logger.debug('🔍 Valid connection rules for level:', levelData.validConnections.length);
 
         // Check for valid connection in both directions
-        let validConnection = levelData.validConnections.find(conn =>
-            conn.from === from.connector.dataset.type &&
-            conn.to === to.connector.dataset.type &&
-            conn.cable === cableType
+        const validConnection = findValidConnection(
+            levelData,
+            from.connector.dataset.type,
+            to.connector.dataset.type,
+            cableType
         );
 
-        // If not found, check the reverse direction
-        if (!validConnection) {
-            validConnection = levelData.validConnections.find(conn =>
-                conn.from === to.connector.dataset.type &&
-                conn.to === from.connector.dataset.type &&
-                conn.cable === cableType
-            );
-        }
-
-        console.log('🔍 Found valid connection:', validConnection);
+        logger.debug('🔍 Found valid connection:', validConnection);
 
         if (validConnection) {
             this.createValidConnection(from, to, validConnection);
@@ -2875,24 +2883,21 @@ export class AVMasterGame {
             cableType: validConnection.cable,
             animation: validConnection.animation,
             line: null,
+            fromConnector: from.connector,
+            toConnector: to.connector,
             fromCoords: null,
             toCoords: null
         };
 
         // Check for duplicate connections before adding
-        const isDuplicate = this.connections.some(existingConn =>
-            (existingConn.fromConnectorId === connectionData.fromConnectorId &&
-                existingConn.toConnectorId === connectionData.toConnectorId) ||
-            (existingConn.fromConnectorId === connectionData.toConnectorId &&
-                existingConn.toConnectorId === connectionData.fromConnectorId)
-        );
+        const isDuplicate = this.connections.hasPair(connectionData.fromConnectorId, connectionData.toConnectorId);
 
         if (isDuplicate) {
-            console.warn('⚠️ Duplicate connection detected, not adding:', connectionData);
+            logger.warn('⚠️ Duplicate connection detected, not adding:', connectionData);
             this.showMessage('Connection already exists!', 'warning');
 
             // Don't draw any visual line for duplicate connections
-            console.log('🚫 Skipping visual line creation for duplicate connection');
+            logger.debug('🚫 Skipping visual line creation for duplicate connection');
             return;
         }
 
@@ -2905,32 +2910,31 @@ export class AVMasterGame {
             connectionData.toCoords = toCoords;
 
             // Create the connection line
-            connectionData.line = this.drawConnectionLineWithCoordinates(fromCoords, toCoords, getConnectorColor(from.connector.dataset.type));
+            connectionData.line = this.drawConnectionLineWithCoordinates(fromCoords, toCoords, getConnectorColor(from.connector.dataset.type), connectionData.id);
         }
 
-        this.connections.push(connectionData);
-        console.log('🔗 Connection stored:', connectionData);
-        console.log('🔗 Total connections:', this.connections.length);
+        this.connections.add(connectionData);
+        logger.debug('🔗 Connection stored:', connectionData);
+        logger.debug('🔗 Total connections:', this.connections.length);
 
         // Increment score for successful connection
         this.gameState.score += 100;
         this.updatePlayerStats();
-        console.log('🎯 Score increased to:', this.gameState.score);
+        logger.debug('🎯 Score increased to:', this.gameState.score);
 
         // Update progress and check completion IMMEDIATELY
-        console.log('📊 Updating connection progress...');
+        logger.debug('📊 Updating connection progress...');
         this.updateConnectionProgress();
-        console.log('🔍 Checking level completion immediately...');
+        logger.debug('🔍 Checking level completion immediately...');
         this.checkLevelCompletion();
 
         // Debug: Verify visual lines match connections
-        const visualLines = document.querySelectorAll('.connection-line');
-        console.log('🎨 Visual connection lines count:', visualLines.length);
-        console.log('🔗 Stored connections count:', this.connections.length);
+        logger.debug('🎨 Visual connection lines count:', this.connectionPaths.size);
+        logger.debug('🔗 Stored connections count:', this.connections.length);
 
-        if (visualLines.length !== this.connections.length) {
-            console.warn('⚠️ Mismatch between visual lines and stored connections!');
-            console.warn('⚠️ Visual lines:', visualLines.length, 'Stored connections:', this.connections.length);
+        if (this.connectionPaths.size !== this.connections.length) {
+            logger.warn('⚠️ Mismatch between visual lines and stored connections!');
+            logger.warn('⚠️ Visual lines:', this.connectionPaths.size, 'Stored connections:', this.connections.length);
         }
 
         // Apply animation (non-blocking)
@@ -2938,19 +2942,21 @@ export class AVMasterGame {
         this.applyConnectionAnimation(to.equipment, validConnection.animation);
 
         // Update connector visual state to show connection count
-        console.log('🎨 Updating visual state for connected connectors...');
+        logger.debug('🎨 Updating visual state for connected connectors...');
         this.updateConnectorVisualState(from.connector);
         this.updateConnectorVisualState(to.connector);
 
         // Update ALL connectors on both equipment to ensure they remain clickable
-        console.log('🔧 Ensuring all connectors remain clickable...');
+        logger.debug('🔧 Ensuring all connectors remain clickable...');
         this.updateAllConnectorsOnEquipment(from.equipment);
         this.updateAllConnectorsOnEquipment(to.equipment);
 
         // Update connector states to ensure they remain clickable
-        console.log('🔄 Updating connector states after connection...');
+        logger.debug('🔄 Updating connector states after connection...');
         this.refreshAllConnectors();
-        console.log('✅ All connectors updated');
+        logger.debug('✅ All connectors updated');
+
+        signalReady('av:connection-created', { connections: this.connections.length });
     }
 
     /**
@@ -2988,45 +2994,67 @@ export class AVMasterGame {
     }
 
     /**
-     * Draw connection line with coordinates
+     * Get the shared SVG layer that holds every cable path, creating it if needed
      */
-    drawConnectionLineWithCoordinates(fromCoords, toCoords, color) {
+    getConnectionLayer() {
         const stageArea = document.getElementById('stage-area');
         if (!stageArea) return null;
 
-        const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
-        svg.setAttribute('width', '100%');
-        svg.setAttribute('height', '100%');
-        svg.style.position = 'absolute';
-        svg.style.top = '0';
-        svg.style.left = '0';
-        svg.style.pointerEvents = 'none';
-        svg.style.zIndex = '5';
-        svg.classList.add('connection-line');
+        if (!this.connectionLayer || this.connectionLayer.parentNode !== stageArea) {
+            const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
+            svg.classList.add('connection-layer');
+            stageArea.appendChild(svg);
+            this.connectionLayer = svg;
+        }
+
+        return this.connectionLayer;
+    }
+
+    /**
+     * Draw connection line with coordinates
+     * Lines are <path> elements in the shared layer; when a connection id is
+     * given the path is tracked so it can be moved or removed directly.
+     */
+    drawConnectionLineWithCoordinates(fromCoords, toCoords, color, connectionId = null) {
+        const layer = this.getConnectionLayer();
+        if (!layer) return null;
 
         const path = document.createElementNS('http://www.w3.org/2000/svg', 'path');
         const d = `M ${fromCoords.x} ${fromCoords.y} L ${toCoords.x} ${toCoords.y}`;
         path.setAttribute('d', d);
         path.setAttribute('stroke', color);
-        path.setAttribute('stroke-width', '3');
-        path.setAttribute('fill', 'none');
-        path.setAttribute('marker-end', 'url(#arrowhead)');
+        path.classList.add('connection-line');
+
+        if (connectionId) {
+            path.dataset.connectionId = connectionId;
+            this.connectionPaths.set(connectionId, path);
+        }
 
-        svg.appendChild(path);
-        stageArea.appendChild(svg);
+        layer.appendChild(path);
 
-        return svg;
+        return path;
+    }
+
+    /**
+     * Remove the line drawn for a connection
+     */
+    removeConnectionLine(connectionId) {
+        const path = this.connectionPaths.get(connectionId);
+        if (path) {
+            path.remove();
+            this.connectionPaths.delete(connectionId);
+        }
     }
 
     /**
      * Get connector coordinates
      */
-    getConnectorCoordinates(connector) {
+    getConnectorCoordinates(connector, stageRect = null) {
         const stageArea = document.getElementById('stage-area');
         if (!stageArea || !connector) return null;
 
         const connectorRect = connector.getBoundingClientRect();
-        const stageRect = stageArea.getBoundingClientRect();
+        stageRect = stageRect || stageArea.getBoundingClientRect();
 
         return {
             x: connectorRect.left - stageRect.left + connectorRect.width / 2,
@@ -3048,64 +3076,30 @@ export class AVMasterGame {
      * Update connection progress
      */
     updateConnectionProgress() {
-        const levelData = getLevelData(this.currentLevel);
+        const levelData = getCachedLevelData(this.currentLevel);
         if (!levelData) return;
 
-        const required = calculateRequiredConnections(levelData);
-
-        this.connectionProgress.power.required = required.power;
-        this.connectionProgress.xlr.required = required.xlr;
-        this.connectionProgress.wireless.required = required.wireless;
-        this.connectionProgress.ethernet.required = required.ethernet;
-        this.connectionProgress.dmx.required = required.dmx;
-        this.connectionProgress.hdmi.required = required.hdmi;
-        this.connectionProgress.usb.required = required.usb;
-
-        // Count current connections with safeguards
-        const powerCount = this.connections.filter(c => c.cableType === 'power-cable').length;
-        const xlrCount = this.connections.filter(c => c.cableType === 'xlr-cable').length;
-        const wirelessCount = this.connections.filter(c => c.cableType === 'wireless-cable').length;
-        const ethernetCount = this.connections.filter(c => c.cableType === 'ethernet-cable').length;
-        const dmxCount = this.connections.filter(c => c.cableType === 'dmx-cable').length;
-        const hdmiCount = this.connections.filter(c => c.cableType === 'hdmi-cable').length;
-        const usbCount = this.connections.filter(c => c.cableType === 'usb-cable').length;
-
-        // Apply safeguards to prevent counts from exceeding requirements
-        this.connectionProgress.power.current = Math.min(powerCount, required.power);
-        this.connectionProgress.xlr.current = Math.min(xlrCount, required.xlr);
-        this.connectionProgress.wireless.current = Math.min(wirelessCount, required.wireless);
-        this.connectionProgress.ethernet.current = Math.min(ethernetCount, required.ethernet);
-        this.connectionProgress.dmx.current = Math.min(dmxCount, required.dmx);
-        this.connectionProgress.hdmi.current = Math.min(hdmiCount, required.hdmi);
-        this.connectionProgress.usb.current = Math.min(usbCount, required.usb);
+        // Count current connections; current is capped at the requirement
+        const { progress, counts, required } = calculateConnectionProgress(levelData, this.connections.getCounts());
+        this.connectionProgress = progress;
 
         // Debug: Log if counts exceed requirements
-        if (powerCount > required.power) console.warn(`⚠️ Power count (${powerCount}) exceeds requirement (${required.power})`);
-        if (xlrCount > required.xlr) console.warn(`⚠️ XLR count (${xlrCount}) exceeds requirement (${required.xlr})`);
-        if (wirelessCount > required.wireless) console.warn(`⚠️ Wireless count (${wirelessCount}) exceeds requirement (${required.wireless})`);
-        if (ethernetCount > required.ethernet) console.warn(`⚠️ Ethernet count (${ethernetCount}) exceeds requirement (${required.ethernet})`);
-        if (dmxCount > required.dmx) console.warn(`⚠️ DMX count (${dmxCount}) exceeds requirement (${required.dmx})`);
-        if (hdmiCount > required.hdmi) console.warn(`⚠️ HDMI count (${hdmiCount}) exceeds requirement (${required.hdmi})`);
-        if (usbCount > required.usb) console.warn(`⚠️ USB count (${usbCount}) exceeds requirement (${required.usb})`);
+        Object.entries(counts).forEach(([type, count]) => {
+            if (count > required[type]) {
+                logger.warn(`⚠️ ${type.toUpperCase()} count (${count}) exceeds requirement (${required[type]})`);
+            }
+        });
 
         // Clean up orphaned visual lines that don't correspond to actual connections
         this.cleanupOrphanedVisualLines();
 
         // Debug: Log all connections and their types
-        console.log('🔍 All connections:', this.connections);
-        console.log('🔍 Connection types found:', [...new Set(this.connections.map(c => c.cableType))]);
-        console.log('🔍 Required connections:', required);
-        console.log('🔍 Current progress:', this.connectionProgress);
-
-        console.log('🔍 CONNECTION COUNTS:', {
-            power: powerCount,
-            xlr: xlrCount,
-            wireless: wirelessCount,
-            ethernet: ethernetCount,
-            dmx: dmxCount,
-            hdmi: hdmiCount,
-            usb: usbCount
-        });
+        logger.debug('🔍 All connections:', this.connections);
+        logger.debug('🔍 Connection types found:', Object.keys(counts).filter(type => counts[type] > 0));
+        logger.debug('🔍 Required connections:', required);
+        logger.debug('🔍 Current progress:', this.connectionProgress);
+
+        logger.debug('🔍 CONNECTION COUNTS:', counts);
 
         this.updateProgressUI();
     }
@@ -3114,28 +3108,18 @@ export class AVMasterGame {
      * Clean up orphaned visual lines that don't correspond to actual connections
      */
     cleanupOrphanedVisualLines() {
-        const visualLines = document.querySelectorAll('.connection-line');
-        const storedConnections = this.connections.length;
-
-        console.log('🧹 Cleaning up orphaned visual lines...');
-        console.log('🧹 Visual lines found:', visualLines.length);
-        console.log('🧹 Stored connections:', storedConnections);
-
-        if (visualLines.length > storedConnections) {
-            console.warn('🧹 Found orphaned visual lines, cleaning up...');
-
-            // Remove excess visual lines (keep only the first ones that match stored connections)
-            const linesToRemove = visualLines.length - storedConnections;
-            for (let i = 0; i < linesToRemove; i++) {
-                const lastLine = visualLines[visualLines.length - 1 - i];
-                if (lastLine && lastLine.parentNode) {
-                    console.log('🧹 Removing orphaned visual line:', lastLine);
-                    lastLine.parentNode.removeChild(lastLine);
-                }
-            }
-
-            console.log('🧹 Cleanup complete. Visual lines now match stored connections.');
+        // Lines are tracked by connection id, so a size check covers the common case
+        if (this.connectionPaths.size <= this.connections.length) {
+            return;
         }
+
+        logger.warn('🧹 Found orphaned visual lines, cleaning up...');
+        [...this.connectionPaths.keys()].forEach(connectionId => {
+            if (!this.connections.get(connectionId)) {
+                this.removeConnectionLine(connectionId);
+            }
+        });
+        logger.debug('🧹 Cleanup complete. Visual lines now match stored connections.');
     }
 
     /**
@@ -3172,12 +3156,10 @@ export class AVMasterGame {
         }
 
         // Simple check: are all required connections made?
-        const allComplete = Object.values(this.connectionProgress).every(progress =>
-            progress.current >= progress.required
-        );
+        const allComplete = isLevelComplete(this.connectionProgress);
 
         if (allComplete) {
-            console.log('🎉 LEVEL COMPLETE! Triggering celebration...');
+            logger.debug('🎉 LEVEL COMPLETE! Triggering celebration...');
             this.levelCompleted = true;
 
             // Close any open dialogs
@@ -3207,7 +3189,7 @@ export class AVMasterGame {
                 this.gameState.score += totalBonus;
                 this.updatePlayerStats();
 
-                console.log('🎯 Level completion bonus:', {
+                logger.debug('🎯 Level completion bonus:', {
                     timeBonus: timeBonus,
                     completionBonus: completionBonus,
                     totalBonus: totalBonus,
@@ -3241,7 +3223,7 @@ export class AVMasterGame {
      * Show winner celebration overlay popup
      */
     showWinnerCelebration() {
-        console.log('🎉 Creating winner celebration overlay popup');
+        logger.debug('🎉 Creating winner celebration overlay popup');
 
         // Create overlay popup
         const celebration = document.createElement('div');
@@ -3296,36 +3278,36 @@ export class AVMasterGame {
         const testingBtn = celebration.querySelector('#testing-challenge-btn');
         if (testingBtn && this.hasTestingChallenges()) {
             testingBtn.style.display = 'block';
-            console.log('🔬 Testing challenge button shown in overlay');
+            logger.debug('🔬 Testing challenge button shown in overlay');
         }
 
         // Add event listeners
         const nextLevelBtn = celebration.querySelector('#next-level-btn');
         if (nextLevelBtn) {
             nextLevelBtn.addEventListener('click', () => {
-                console.log('🎯 Next level button clicked');
+                logger.debug('🎯 Next level button clicked');
                 try {
                     this.nextLevel();
-                    console.log('🎯 Next level method completed successfully');
+                    logger.debug('🎯 Next level method completed successfully');
                 } catch (error) {
-                    console.error('❌ Error in nextLevel():', error);
+                    logger.error('❌ Error in nextLevel():', error);
                 }
 
                 try {
                     document.body.removeChild(celebration);
-                    console.log('🎯 Celebration popup removed successfully');
+                    logger.debug('🎯 Celebration popup removed successfully');
                 } catch (error) {
-                    console.error('❌ Error removing celebration popup:', error);
+                    logger.error('❌ Error removing celebration popup:', error);
                 }
             });
-            console.log('🎯 Next level button event listener added');
+            logger.debug('🎯 Next level button event listener added');
         } else {
-            console.error('❌ Next level button not found in celebration popup');
+            logger.error('❌ Next level button not found in celebration popup');
         }
 
         if (testingBtn) {
             testingBtn.addEventListener('click', () => {
-                console.log('🔬 Testing challenge button clicked from overlay');
+                logger.debug('🔬 Testing challenge button clicked from overlay');
                 this.startTestingChallenges();
                 document.body.removeChild(celebration);
             });
@@ -3334,7 +3316,7 @@ export class AVMasterGame {
         const replayBtn = celebration.querySelector('#replay-level-btn');
         if (replayBtn) {
             replayBtn.addEventListener('click', () => {
-                console.log('🔄 Replay level button clicked');
+                logger.debug('🔄 Replay level button clicked');
                 this.restartLevel();
                 document.body.removeChild(celebration);
             });
@@ -3343,23 +3325,23 @@ export class AVMasterGame {
         const levelSelectBtn = celebration.querySelector('#level-select-btn');
         if (levelSelectBtn) {
             levelSelectBtn.addEventListener('click', () => {
-                console.log('📋 Level select button clicked');
+                logger.debug('📋 Level select button clicked');
                 this.exitToMenu();
                 document.body.removeChild(celebration);
             });
         }
 
-        console.log('🎉 Winner celebration overlay popup created and displayed');
+        logger.debug('🎉 Winner celebration overlay popup created and displayed');
     }
 
     /**
      * Show equipment information
      */
     showEquipmentInfo(equipmentType, equipmentName, uniqueId = null) {
-        console.log('🔍 Showing equipment info for:', equipmentType, equipmentName);
+        logger.debug('🔍 Showing equipment info for:', equipmentType, equipmentName);
 
         const info = getEquipmentInfo(equipmentType, equipmentName);
-        console.log('🔍 Equipment info:', info);
+        logger.debug('🔍 Equipment info:', info);
 
         const popup = document.createElement('div');
         popup.className = 'equipment-info-popup';
@@ -3387,17 +3369,17 @@ export class AVMasterGame {
         `;
 
         document.body.appendChild(popup);
-        console.log('🔍 Equipment info popup added to DOM');
+        logger.debug('🔍 Equipment info popup added to DOM');
 
         // Close popup
         popup.querySelector('.close-btn').addEventListener('click', () => {
-            console.log('🔍 Closing equipment info popup');
+            logger.debug('🔍 Closing equipment info popup');
             document.body.removeChild(popup);
         });
 
         popup.addEventListener('click', (e) => {
             if (e.target === popup) {
-                console.log('🔍 Closing equipment info popup (click outside)');
+                logger.debug('🔍 Closing equipment info popup (click outside)');
                 document.body.removeChild(popup);
             }
         });
@@ -3405,7 +3387,7 @@ export class AVMasterGame {
         // Close on Escape key
         const handleEscape = (e) => {
             if (e.key === 'Escape') {
-                console.log('🔍 Closing equipment info popup (Escape key)');
+                logger.debug('🔍 Closing equipment info popup (Escape key)');
                 document.body.removeChild(popup);
                 document.removeEventListener('keydown', handleEscape);
             }
@@ -3417,22 +3399,23 @@ export class AVMasterGame {
      * Show equipment settings popup
      */
     showEquipmentSettings(equipmentType, equipmentName, equipmentElement, uniqueId = null) {
-        console.log('⚙️ Showing equipment settings for:', equipmentType, equipmentName);
+        logger.debug('⚙️ Showing equipment settings for:', equipmentType, equipmentName);
 
         // Notify AI Tutor about the selected equipment
         if (this.aiTutor) {
             this.aiTutor.setCurrentEquipment({
                 type: equipmentType,
                 name: equipmentName,
+                level: this.currentLevel,
                 element: equipmentElement,
                 uniqueId: uniqueId
             }).catch(error => {
-                console.error('🤖 Error setting current equipment:', error);
+                logger.error('🤖 Error setting current equipment:', error);
             });
         }
 
         const settings = this.getEquipmentSettings(equipmentType, equipmentName);
-        console.log('⚙️ Equipment settings:', settings);
+        logger.debug('⚙️ Equipment settings:', settings);
 
         const popup = document.createElement('div');
         popup.className = 'equipment-settings-popup';
@@ -3451,20 +3434,20 @@ export class AVMasterGame {
         `;
 
         document.body.appendChild(popup);
-        console.log('⚙️ Equipment settings popup added to DOM');
+        logger.debug('⚙️ Equipment settings popup added to DOM');
 
         // Add event listeners to settings controls
         this.setupSettingsEventListeners(popup, equipmentElement);
 
         // Close popup
         popup.querySelector('.close-btn').addEventListener('click', () => {
-            console.log('⚙️ Closing equipment settings popup');
+            logger.debug('⚙️ Closing equipment settings popup');
             document.body.removeChild(popup);
         });
 
         popup.addEventListener('click', (e) => {
             if (e.target === popup) {
-                console.log('⚙️ Closing equipment settings popup (click outside)');
+                logger.debug('⚙️ Closing equipment settings popup (click outside)');
                 document.body.removeChild(popup);
             }
         });
@@ -3472,7 +3455,7 @@ export class AVMasterGame {
         // Close on Escape key
         const handleEscape = (e) => {
             if (e.key === 'Escape') {
-                console.log('⚙️ Closing equipment settings popup (Escape key)');
+                logger.debug('⚙️ Closing equipment settings popup (Escape key)');
                 document.body.removeChild(popup);
                 document.removeEventListener('keydown', handleEscape);
             }
@@ -3530,19 +3513,19 @@ export class AVMasterGame {
                 break;
             case 'r':
                 if (this.currentScreen === 'game') {
-                    console.log('🔧 Force refreshing connectors (R key pressed)');
+                    logger.debug('🔧 Force refreshing connectors (R key pressed)');
                     this.forceRefreshConnectors();
                 }
                 break;
             case 'x':
                 if (this.currentScreen === 'game') {
-                    console.log('🔧 Refreshing XLR connectors (X key pressed)');
+                    logger.debug('🔧 Refreshing XLR connectors (X key pressed)');
                     this.refreshXLRConnectors();
                 }
                 break;
             case 'e':
                 if (this.currentScreen === 'game') {
-                    console.log('🔍 Debugging all equipment connectors (E key pressed)');
+                    logger.debug('🔍 Debugging all equipment connectors (E key pressed)');
                     this.equipment.forEach(equipmentData => {
                         if (equipmentData.element) {
                             this.debugEquipmentConnectors(equipmentData.element);
@@ -3557,15 +3540,15 @@ export class AVMasterGame {
      * Show hint
      */
     showHint() {
-        console.log('💡 Showing hint for level:', this.currentLevel);
-        const levelData = getLevelData(this.currentLevel);
+        logger.debug('💡 Showing hint for level:', this.currentLevel);
+        const levelData = getCachedLevelData(this.currentLevel);
         if (!levelData) {
-            console.log('❌ No level data found for:', this.currentLevel);
+            logger.debug('❌ No level data found for:', this.currentLevel);
             return;
         }
 
         const hint = this.generateHint(levelData);
-        console.log('💡 Generated hint:', hint);
+        logger.debug('💡 Generated hint:', hint);
         this.showHintPopup(hint);
     }
 
@@ -3573,15 +3556,15 @@ export class AVMasterGame {
      * Show detailed hint
      */
     showDetailedHint() {
-        console.log('🔍 Showing detailed hint for level:', this.currentLevel);
-        const levelData = getLevelData(this.currentLevel);
+        logger.debug('🔍 Showing detailed hint for level:', this.currentLevel);
+        const levelData = getCachedLevelData(this.currentLevel);
         if (!levelData) {
-            console.log('❌ No level data found for:', this.currentLevel);
+            logger.debug('❌ No level data found for:', this.currentLevel);
             return;
         }
 
         const hint = this.generateDetailedHint(levelData);
-        console.log('🔍 Generated detailed hint:', hint);
+        logger.debug('🔍 Generated detailed hint:', hint);
         this.showHintPopup(hint, true);
 
         // Deduct points for using detailed hint
@@ -3593,8 +3576,8 @@ export class AVMasterGame {
      * Show hint popup
      */
     showHintPopup(message, isDetailed = false) {
-        console.log('📋 Creating hint popup:', isDetailed ? 'detailed' : 'basic');
-        console.log('📋 Message:', message);
+        logger.debug('📋 Creating hint popup:', isDetailed ? 'detailed' : 'basic');
+        logger.debug('📋 Message:', message);
 
         const popup = document.createElement('div');
         popup.className = 'hint-popup';
@@ -3614,17 +3597,17 @@ export class AVMasterGame {
         `;
 
         document.body.appendChild(popup);
-        console.log('📋 Hint popup added to DOM');
+        logger.debug('📋 Hint popup added to DOM');
 
         // Close popup
         popup.querySelector('.close-btn').addEventListener('click', () => {
-            console.log('📋 Closing hint popup (X button)');
+            logger.debug('📋 Closing hint popup (X button)');
             document.body.removeChild(popup);
         });
 
         popup.addEventListener('click', (e) => {
             if (e.target === popup) {
-                console.log('📋 Closing hint popup (click outside)');
+                logger.debug('📋 Closing hint popup (click outside)');
                 document.body.removeChild(popup);
             }
         });
@@ -3632,7 +3615,7 @@ export class AVMasterGame {
         // Close on Escape key
         const handleEscape = (e) => {
             if (e.key === 'Escape') {
-                console.log('📋 Closing hint popup (Escape key)');
+                logger.debug('📋 Closing hint popup (Escape key)');
                 document.body.removeChild(popup);
                 document.removeEventListener('keydown', handleEscape);
             }
@@ -3748,66 +3731,122 @@ export class AVMasterGame {
     }
 
     /**
-     * Make equipment draggable
+     * Start dragging a piece of equipment
+     * Move/up listeners live on the document only for the duration of a drag,
+     * and the connections touching the equipment are collected once up front.
      */
-    makeEquipmentDraggable(equipment) {
-        let isDragging = false;
-        let startX, startY;
+    startEquipmentDrag(equipment, e) {
+        this.endEquipmentDrag();
 
-        equipment.addEventListener('mousedown', (e) => {
-            isDragging = true;
-            startX = e.clientX - equipment.offsetLeft;
-            startY = e.clientY - equipment.offsetTop;
-            equipment.style.zIndex = '1000';
+        const equipmentId = equipment.dataset.uniqueId;
+        const connections = new Set();
+        equipment.querySelectorAll('.connector').forEach(connector => {
+            this.connections.getConnectorConnections(connector.dataset.connectorId).forEach(conn => connections.add(conn));
         });
 
-        document.addEventListener('mousemove', (e) => {
-            if (!isDragging) return;
+        this.dragState = {
+            equipment,
+            equipmentId,
+            offsetX: e.clientX - equipment.offsetLeft,
+            offsetY: e.clientY - equipment.offsetTop,
+            clientX: e.clientX,
+            clientY: e.clientY,
+            moved: false,
+            connections: [...connections]
+        };
+        equipment.style.zIndex = '1000';
+
+        this.handleDragMouseMove = (moveEvent) => {
+            this.dragState.clientX = moveEvent.clientX;
+            this.dragState.clientY = moveEvent.clientY;
+            this.dragState.moved = true;
+
+            // Coalesce all moves within a frame into one layout + redraw
+            if (!this.mouseMoveThrottle) {
+                this.mouseMoveThrottle = requestAnimationFrame(() => {
+                    this.mouseMoveThrottle = null;
+                    this.flushEquipmentDrag();
+                });
+            }
+        };
+        this.handleDragMouseUp = () => this.endEquipmentDrag();
+
+        document.addEventListener('mousemove', this.handleDragMouseMove);
+        document.addEventListener('mouseup', this.handleDragMouseUp);
+    }
+
+    /**
+     * Apply the latest pointer position and redraw the attached cables
+     */
+    flushEquipmentDrag() {
+        const drag = this.dragState;
+        if (!drag || !drag.moved) return;
 
-            const newX = e.clientX - startX;
-            const newY = e.clientY - startY;
+        drag.moved = false;
+        drag.equipment.style.left = (drag.clientX - drag.offsetX) + 'px';
+        drag.equipment.style.top = (drag.clientY - drag.offsetY) + 'px';
 
-            equipment.style.left = newX + 'px';
-            equipment.style.top = newY + 'px';
+        this.updateConnectionLines(drag.connections);
+    }
 
-            // Update connection lines
-            this.updateConnectionLines();
-        });
+    /**
+     * Finish the current drag, if any
+     */
+    endEquipmentDrag() {
+        if (this.mouseMoveThrottle) {
+            cancelAnimationFrame(this.mouseMoveThrottle);
+            this.mouseMoveThrottle = null;
+        }
+        if (this.handleDragMouseMove) {
+            document.removeEventListener('mousemove', this.handleDragMouseMove);
+            document.removeEventListener('mouseup', this.handleDragMouseUp);
+            this.handleDragMouseMove = null;
+            this.handleDragMouseUp = null;
+        }
 
-        document.addEventListener('mouseup', () => {
-            if (isDragging) {
-                isDragging = false;
-                equipment.style.zIndex = 'auto';
-                this.updateConnectionLines();
-            }
-        });
+        const drag = this.dragState;
+        if (!drag) return;
+
+        this.flushEquipmentDrag();
+        drag.equipment.style.zIndex = 'auto';
+        this.dragState = null;
     }
 
     /**
      * Update connection lines
+     * All connector rects are read first and all paths written afterwards,
+     * so a redraw costs a single layout no matter how many cables move.
      */
-    updateConnectionLines() {
-        this.connections.forEach(connection => {
-            if (connection.line && connection.from && connection.to) {
-                const fromCoords = this.getConnectorCoordinates(connection.from.connector);
-                const toCoords = this.getConnectorCoordinates(connection.to.connector);
+    updateConnectionLines(connections = this.connections) {
+        const stageArea = document.getElementById('stage-area');
+        if (!stageArea) return;
 
-                if (fromCoords && toCoords) {
-                    this.updateConnectionLinePosition(connection.line, fromCoords, toCoords);
-                }
+        const stageRect = stageArea.getBoundingClientRect();
+        const updates = [];
+
+        connections.forEach(connection => {
+            if (connection.line && connection.fromConnector && connection.toConnector) {
+                updates.push({
+                    connection,
+                    fromCoords: this.getConnectorCoordinates(connection.fromConnector, stageRect),
+                    toCoords: this.getConnectorCoordinates(connection.toConnector, stageRect)
+                });
             }
         });
+
+        updates.forEach(({ connection, fromCoords, toCoords }) => {
+            connection.fromCoords = fromCoords;
+            connection.toCoords = toCoords;
+            this.updateConnectionLinePosition(connection.line, fromCoords, toCoords);
+        });
     }
 
     /**
      * Update connection line position
      */
-    updateConnectionLinePosition(lineElement, fromCoords, toCoords) {
-        const path = lineElement.querySelector('path');
-        if (path) {
-            const d = `M ${fromCoords.x} ${fromCoords.y} L ${toCoords.x} ${toCoords.y}`;
-            path.setAttribute('d', d);
-        }
+    updateConnectionLinePosition(path, fromCoords, toCoords) {
+        const d = `M ${fromCoords.x} ${fromCoords.y} L ${toCoords.x} ${toCoords.y}`;
+        path.setAttribute('d', d);
     }
 
     /**
@@ -3848,7 +3887,7 @@ export class AVMasterGame {
      * Pause game and return to level selector
      */
     pauseGame() {
-        console.log('⏸️ Pausing game and returning to level selector');
+        logger.debug('⏸️ Pausing game and returning to level selector');
 
         // Stop the game timer
         this.stopGameTimer();
@@ -3890,28 +3929,28 @@ export class AVMasterGame {
      * Next level
      */
     nextLevel() {
-        console.log('🎯 nextLevel() called');
-        console.log('🎯 Current level:', this.currentLevel);
-        console.log('🎯 Unlocked levels:', this.gameState.unlockedLevels);
+        logger.debug('🎯 nextLevel() called');
+        logger.debug('🎯 Current level:', this.currentLevel);
+        logger.debug('🎯 Unlocked levels:', this.gameState.unlockedLevels);
 
         const currentIndex = LEVEL_ORDER.indexOf(this.currentLevel);
-        console.log('🎯 Current index in LEVEL_ORDER:', currentIndex);
+        logger.debug('🎯 Current index in LEVEL_ORDER:', currentIndex);
 
         if (currentIndex >= 0 && currentIndex < LEVEL_ORDER.length - 1) {
             const nextLevel = LEVEL_ORDER[currentIndex + 1];
-            console.log('🎯 Next level found:', nextLevel);
+            logger.debug('🎯 Next level found:', nextLevel);
 
             // Always unlock the next level if it exists
             if (!this.gameState.unlockedLevels.includes(nextLevel)) {
                 this.gameState.unlockedLevels.push(nextLevel);
-                console.log('🎯 Next level unlocked:', nextLevel);
+                logger.debug('🎯 Next level unlocked:', nextLevel);
             }
 
             // Load the next level
-            console.log('🎯 Loading next level:', nextLevel);
+            logger.debug('🎯 Loading next level:', nextLevel);
             this.loadLevel(nextLevel);
         } else {
-            console.log('🎯 No next level available - this is the last level');
+            logger.debug('🎯 No next level available - this is the last level');
             // If this is the last level, go back to level select
             this.showLevelSelect();
         }
@@ -3949,10 +3988,10 @@ export class AVMasterGame {
     continueGame() {
         // Check if there's a saved game state
         if (this.gameState.currentLevel) {
-            console.log('🎮 Continuing game from level:', this.gameState.currentLevel);
+            logger.debug('🎮 Continuing game from level:', this.gameState.currentLevel);
             this.loadLevel(this.gameState.currentLevel);
         } else {
-            console.log('🎮 No saved game state, showing level select');
+            logger.debug('🎮 No saved game state, showing level select');
             this.showLevelSelect();
         }
     }
@@ -3961,7 +4000,7 @@ export class AVMasterGame {
      * Show authentication required modal
      */
     showAuthenticationRequired() {
-        console.log('🔐 Showing authentication required message...');
+        logger.debug('🔐 Showing authentication required message...');
 
         // Create a modal to inform user they need to login
         const modal = document.createElement('div');
@@ -4056,16 +4095,16 @@ export class AVMasterGame {
      */
     loadGameState() {
         try {
-            console.log('loadGameState() - Loading from localStorage...');
+            logger.debug('loadGameState() - Loading from localStorage...');
             const saved = loadFromStorage('avMasterGameState');
-            console.log('loadGameState() - Retrieved data:', saved);
+            logger.debug('loadGameState() - Retrieved data:', saved);
 
             if (saved && typeof saved === 'object') {
                 // Only merge if saved data is a valid object, but preserve time as 0
                 this.gameState = { ...this.gameState, ...saved, time: 0 };
-                console.log('loadGameState() - Game state updated:', this.gameState);
+                logger.debug('loadGameState() - Game state updated:', this.gameState);
             } else {
-                console.log('loadGameState() - No saved data found, using default state');
+                logger.debug('loadGameState() - No saved data found, using default state');
                 // Ensure default state is preserved
                 this.gameState = {
                     score: 0,
@@ -4076,8 +4115,8 @@ export class AVMasterGame {
                 };
             }
         } catch (error) {
-            console.error('❌ Error in loadGameState():', error);
-            console.error('Stack trace:', error.stack);
+            logger.error('❌ Error in loadGameState():', error);
+            logger.error('Stack trace:', error.stack);
             // Ensure default state is preserved even on error
             this.gameState = {
                 score: 0,
@@ -4635,7 +4674,7 @@ export class AVMasterGame {
      * Update equipment setting
      */
     updateEquipmentSetting(equipmentElement, setting, value) {
-        console.log('⚙️ Updating setting:', setting, 'to', value, 'for equipment:', equipmentElement.dataset.name);
+        logger.debug('⚙️ Updating setting:', setting, 'to', value, 'for equipment:', equipmentElement.dataset.name);
 
         // Store setting in equipment element
         if (!equipmentElement.dataset.settings) {
@@ -4697,7 +4736,7 @@ export class AVMasterGame {
      * Start confetti animation
      */
     startConfetti() {
-        console.log('🎊 Starting confetti animation');
+        logger.debug('🎊 Starting confetti animation');
         const colors = ['#ff6b35', '#4ecdc4', '#45b7d1', '#96ceb4', '#feca57', '#ff9ff3', '#54a0ff'];
 
         for (let i = 0; i < 150; i++) {
@@ -4732,7 +4771,7 @@ export class AVMasterGame {
      * Play victory sound
      */
     playVictorySound() {
-        console.log('🎵 Playing victory sound');
+        logger.debug('🎵 Playing victory sound');
         // Play a victory melody using the audio system
         if (this.audioSystem) {
             this.audioSystem.playVictorySound();
@@ -4766,7 +4805,7 @@ export class AVMasterGame {
             oscillator.start(audioContext.currentTime);
             oscillator.stop(audioContext.currentTime + duration);
         } catch (error) {
-            console.log('🔇 Could not play sound:', error);
+            logger.debug('🔇 Could not play sound:', error);
         }
     }
 
@@ -4774,9 +4813,9 @@ export class AVMasterGame {
      * Show resource assignment menu
      */
     showResourceMenu(event, equipmentType, equipmentElement, uniqueId) {
-        console.log('👥 Showing resource menu for:', equipmentType);
-        console.log('👥 Event type:', event.type);
-        console.log('👥 Equipment element:', equipmentElement);
+        logger.debug('👥 Showing resource menu for:', equipmentType);
+        logger.debug('👥 Event type:', event.type);
+        logger.debug('👥 Equipment element:', equipmentElement);
 
         // Remove any existing resource menu
         const existingMenu = document.querySelector('.resource-context-menu');
@@ -4786,8 +4825,8 @@ export class AVMasterGame {
 
         const levelData = this.getLevelData(this.currentLevel);
         if (!levelData || !levelData.resourceRequirements || !levelData.availableResources) {
-            console.log('❌ No resource requirements defined for this level');
-            console.log('❌ Level data:', levelData);
+            logger.debug('❌ No resource requirements defined for this level');
+            logger.debug('❌ Level data:', levelData);
             return;
         }
 
@@ -4885,7 +4924,7 @@ export class AVMasterGame {
      * Assign resource to equipment
      */
     assignResourceToEquipment(resource, equipmentElement, requiredResources) {
-        console.log('👥 Assigning resource:', resource.name, 'to equipment:', equipmentElement.dataset.name);
+        logger.debug('👥 Assigning resource:', resource.name, 'to equipment:', equipmentElement.dataset.name);
 
         // Check if this is a valid resource for this equipment
         const isValidResource = requiredResources.includes(resource.id);
@@ -4893,19 +4932,19 @@ export class AVMasterGame {
         if (isValidResource) {
             // Valid resource - add it to the equipment
             this.addResourceIconToEquipment(resource, equipmentElement);
-            console.log('✅ Resource assigned successfully');
+            logger.debug('✅ Resource assigned successfully');
 
             // Increment score for successful resource assignment
             this.gameState.score += 50;
             this.updatePlayerStats();
-            console.log('🎯 Score increased to:', this.gameState.score);
+            logger.debug('🎯 Score increased to:', this.gameState.score);
 
             // Play success sound
             this.playSound(800, 0.2, 'sine');
             setTimeout(() => this.playSound(1000, 0.3, 'sine'), 200);
         } else {
             // Invalid resource - show error
-            console.log('❌ Invalid resource for this equipment');
+            logger.debug('❌ Invalid resource for this equipment');
             this.showMessage(`❌ ${resource.name} cannot be assigned to ${equipmentElement.dataset.name}`, 'error');
 
             // Play error sound
@@ -4969,7 +5008,7 @@ export class AVMasterGame {
             }
         });
 
-        console.log(`👥 Resource Assignment Check: ${correctAssignments}/${totalRequired} correct assignments`);
+        logger.debug(`👥 Resource Assignment Check: ${correctAssignments}/${totalRequired} correct assignments`);
         return allAssigned && totalRequired > 0;
     }
 
@@ -4977,7 +5016,7 @@ export class AVMasterGame {
      * Remove resource assignment from equipment
      */
     removeResourceAssignment(equipmentElement) {
-        console.log('👥 Removing resource assignment from:', equipmentElement.dataset.name);
+        logger.debug('👥 Removing resource assignment from:', equipmentElement.dataset.name);
 
         const resourceBtn = equipmentElement.querySelector('.equipment-resource');
         if (resourceBtn) {
@@ -5000,7 +5039,7 @@ export class AVMasterGame {
         delete equipmentElement.dataset.assignedResource;
         delete equipmentElement.dataset.assignedResourceName;
 
-        console.log('✅ Resource assignment removed');
+        logger.debug('✅ Resource assignment removed');
         this.showMessage('Resource assignment removed', 'info');
     }
 }
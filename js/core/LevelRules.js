@@ -0,0 +1,134 @@
+// Level Rules Module
+// DOM-free connection rules, progress counting and completion logic.
+// Shared by the GameEngine and the headless LevelSimulator.
+
+import { calculateRequiredConnections } from '../utils/Helpers.js';
+
+/**
+ * Map cable types to their connectionProgress keys
+ */
+export const CABLE_PROGRESS_KEYS = {
+    'power-cable': 'power',
+    'xlr-cable': 'xlr',
+    'wireless-cable': 'wireless',
+    'ethernet-cable': 'ethernet',
+    'dmx-cable': 'dmx',
+    'hdmi-cable': 'hdmi',
+    'usb-cable': 'usb'
+};
+
+/**
+ * Create an empty connection progress object
+ */
+export function createEmptyProgress() {
+    const progress = {};
+    Object.values(CABLE_PROGRESS_KEYS).forEach(key => {
+        progress[key] = { current: 0, required: 0 };
+    });
+    return progress;
+}
+
+/**
+ * Build the unique connector key used for a connector definition
+ * (matches the data-connector-key attribute rendered on the stage)
+ */
+export function getConnectorKey(connector, index) {
+    return `${connector.type}-${connector.label.replace(/\s+/g, '-')}-${index}`;
+}
+
+// Rule indexes are cached per level data object, so each level builds its index once
+const ruleIndexCache = new WeakMap();
+
+/**
+ * Add a rule under from -> to -> cable unless an earlier rule already owns that slot
+ */
+function addRule(index, fromType, toType, rule) {
+    let byTarget = index.get(fromType);
+    if (!byTarget) {
+        byTarget = new Map();
+        index.set(fromType, byTarget);
+    }
+    let byCable = byTarget.get(toType);
+    if (!byCable) {
+        byCable = new Map();
+        byTarget.set(toType, byCable);
+    }
+    if (!byCable.has(rule.cable)) {
+        byCable.set(rule.cable, rule);
+    }
+}
+
+/**
+ * Build a direction-agnostic index (from type -> to type -> cable) of a
+ * level's validConnections. Forward matches take precedence over reverse
+ * ones and earlier rules over later ones, the same order a linear scan
+ * would find them in.
+ */
+export function buildConnectionRuleIndex(levelData) {
+    const index = new Map();
+    const rules = levelData.validConnections || [];
+
+    rules.forEach(rule => addRule(index, rule.from, rule.to, rule));
+    rules.forEach(rule => addRule(index, rule.to, rule.from, rule));
+
+    return index;
+}
+
+/**
+ * Get the (cached) connection rule index for a level
+ */
+export function getConnectionRuleIndex(levelData) {
+    let index = ruleIndexCache.get(levelData);
+    if (!index) {
+        index = buildConnectionRuleIndex(levelData);
+        ruleIndexCache.set(levelData, index);
+    }
+    return index;
+}
+
+/**
+ * Find the valid connection rule for two connector types and a cable.
+ * Rules are direction-agnostic: from/to may be given in either order.
+ */
+export function findValidConnection(levelData, fromType, toType, cableType) {
+    const byCable = getConnectionRuleIndex(levelData).get(fromType)?.get(toType);
+    return byCable?.get(cableType) || null;
+}
+
+// Required connection counts are cached per level data object, like the rule index
+const requiredCache = new WeakMap();
+
+/**
+ * Get the (cached) required connection counts for a level
+ */
+export function getRequiredConnections(levelData) {
+    let required = requiredCache.get(levelData);
+    if (!required) {
+        required = calculateRequiredConnections(levelData);
+        requiredCache.set(levelData, required);
+    }
+    return required;
+}
+
+/**
+ * Calculate connection progress for a level from per-type connection counts
+ * (as kept by ConnectionStore). Current counts are capped at the requirement
+ * so extra cables never push progress past 100%.
+ */
+export function calculateConnectionProgress(levelData, counts, required = getRequiredConnections(levelData)) {
+    const progress = createEmptyProgress();
+
+    Object.keys(progress).forEach(key => {
+        progress[key].required = required[key];
+        progress[key].current = Math.min(counts[key] || 0, required[key]);
+    });
+
+    return { progress, counts, required };
+}
+
+/**
+ * Check whether every required connection has been made
+ */
+export function isLevelComplete(progress) {
+    return Object.values(progress).every(item => item.current >= item.required);
+}
@@ -0,0 +1,258 @@
+// Level Simulator Module
+// Headless, DOM-free model of a level: place equipment, wire connectors and
+// track progress/completion with the same rules the GameEngine uses.
+
+import { ConnectionStore } from './ConnectionStore.js';
+import {
+    CABLE_PROGRESS_KEYS,
+    calculateConnectionProgress,
+    findValidConnection,
+    getConnectorKey,
+    getRequiredConnections,
+    isLevelComplete
+} from './LevelRules.js';
+
+/**
+ * Convert an equipment name into an id prefix ("Mixing Console" -> "mixing-console")
+ */
+function slugify(name) {
+    return name.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '');
+}
+
+export class LevelSimulator {
+    constructor(levelId, levelData) {
+        if (!levelData) {
+            throw new Error(`Level data not found: ${levelId}`);
+        }
+
+        this.levelId = levelId;
+        this.levelData = levelData;
+        this.required = getRequiredConnections(levelData);
+        this.reset();
+    }
+
+    /**
+     * Clear the stage and start the level over
+     */
+    reset() {
+        this.equipment = new Map();
+        this.connectors = new Map();
+        this.connections = new ConnectionStore();
+        this.nextConnectionId = 1;
+        this.placedCounts = {};
+        this.score = 0;
+        this.attempts = { valid: 0, invalid: 0, duplicate: 0, rejected: 0 };
+        this.completed = false;
+        this.updateProgress();
+    }
+
+    /**
+     * Place one piece of equipment from the level toolbar.
+     * Returns the new equipment id, or null if none are left.
+     */
+    placeEquipment(equipmentName, id = null) {
+        const equipmentData = this.levelData.equipment.find(eq => eq.name === equipmentName);
+        if (!equipmentData) {
+            throw new Error(`Unknown equipment for ${this.levelId}: ${equipmentName}`);
+        }
+
+        const placed = this.placedCounts[equipmentName] || 0;
+        if (placed >= equipmentData.quantity) {
+            return null;
+        }
+        this.placedCounts[equipmentName] = placed + 1;
+
+        const equipmentId = id || `${slugify(equipmentName)}-${placed + 1}`;
+        if (this.equipment.has(equipmentId)) {
+            throw new Error(`Duplicate equipment id: ${equipmentId}`);
+        }
+
+        const connectors = (equipmentData.connectors || []).map((connector, index) => {
+            const connectorKey = getConnectorKey(connector, index);
+            const entry = {
+                connectorId: `${equipmentId}-${connectorKey}`,
+                connectorKey,
+                equipmentId,
+                type: connector.type,
+                label: connector.label
+            };
+            this.connectors.set(entry.connectorId, entry);
+            return entry;
+        });
+
+        this.equipment.set(equipmentId, {
+            id: equipmentId,
+            name: equipmentName,
+            type: equipmentData.type,
+            connectors
+        });
+
+        return equipmentId;
+    }
+
+    /**
+     * Place every piece of equipment the level provides
+     */
+    placeAllEquipment() {
+        this.levelData.equipment.forEach(item => {
+            while (this.placeEquipment(item.name)) {
+                // keep placing until the toolbar is empty
+            }
+        });
+    }
+
+    /**
+     * Resolve a connector reference.
+     * Accepts a connector id, or "equipmentId/selector" where the selector is
+     * a connector key, label or type (first match wins).
+     */
+    resolveConnector(ref) {
+        if (this.connectors.has(ref)) {
+            return this.connectors.get(ref);
+        }
+
+        const slash = ref.indexOf('/');
+        if (slash === -1) return null;
+
+        const equipment = this.equipment.get(ref.slice(0, slash));
+        if (!equipment) return null;
+
+        const selector = ref.slice(slash + 1);
+        return equipment.connectors.find(c => c.connectorKey === selector) ||
+            equipment.connectors.find(c => c.label === selector) ||
+            equipment.connectors.find(c => c.type === selector) ||
+            null;
+    }
+
+    /**
+     * Attempt a connection the way the GameEngine cable dialog does.
+     * Returns { status: 'valid' | 'invalid' | 'duplicate' | 'rejected', ... }
+     */
+    connect(fromRef, toRef, cableType) {
+        const from = this.resolveConnector(fromRef);
+        const to = this.resolveConnector(toRef);
+
+        if (!from || !to) {
+            this.attempts.rejected++;
+            return { status: 'rejected', reason: `Unknown connector: ${!from ? fromRef : toRef}` };
+        }
+
+        // Don't allow connecting a connector to itself
+        if (from.connectorId === to.connectorId) {
+            this.attempts.rejected++;
+            return { status: 'rejected', reason: 'Cannot connect to the same connector' };
+        }
+
+        const validConnection = findValidConnection(this.levelData, from.type, to.type, cableType);
+        if (!validConnection) {
+            this.attempts.invalid++;
+            return { status: 'invalid' };
+        }
+
+        if (this.connections.hasPair(from.connectorId, to.connectorId)) {
+            this.attempts.duplicate++;
+            return { status: 'duplicate' };
+        }
+
+        const connection = {
+            id: `c${this.nextConnectionId++}`,
+            fromEquipmentId: from.equipmentId,
+            fromConnectorId: from.connectorId,
+            fromConnectorType: from.type,
+            toEquipmentId: to.equipmentId,
+            toConnectorId: to.connectorId,
+            toConnectorType: to.type,
+            cableType: validConnection.cable,
+            animation: validConnection.animation
+        };
+        this.connections.add(connection);
+        this.attempts.valid++;
+        this.score += 100;
+
+        this.updateProgress();
+        const completedNow = !this.completed && isLevelComplete(this.progress);
+        if (completedNow) {
+            this.completed = true;
+        }
+
+        return { status: 'valid', connection, completed: completedNow };
+    }
+
+    /**
+     * Recalculate progress from the current connections
+     */
+    updateProgress() {
+        const { progress, counts } = calculateConnectionProgress(this.levelData, this.connections.getCounts(), this.required);
+        this.progress = progress;
+        this.counts = counts;
+    }
+
+    /**
+     * Replay a scripted wiring sequence.
+     * Steps: { place: name, as?: id } | { placeAll: true } | { connect: [fromRef, toRef], cable }
+     */
+    replay(steps) {
+        const results = steps.map(step => {
+            if (step.placeAll) {
+                this.placeAllEquipment();
+                return { status: 'placed', count: this.equipment.size };
+            }
+            if (step.place) {
+                const id = this.placeEquipment(step.place, step.as);
+                return id ? { status: 'placed', id } : { status: 'rejected', reason: `No ${step.place} left` };
+            }
+            if (step.connect) {
+                return this.connect(step.connect[0], step.connect[1], step.cable);
+            }
+            throw new Error(`Unknown step: ${JSON.stringify(step)}`);
+        });
+
+        return { ...this.summary(), steps: results };
+    }
+
+    /**
+     * Current state in a JSON-friendly shape
+     */
+    summary() {
+        return {
+            level: this.levelId,
+            completed: this.completed,
+            score: this.score,
+            connections: this.connections.length,
+            attempts: { ...this.attempts },
+            progress: this.progress
+        };
+    }
+
+    /**
+     * Try to complete the level greedily from the placed equipment.
+     * Walks each valid connection rule and wires unused connector pairs until
+     * that cable's requirement is met. `completable: false` in the result
+     * means the level cannot be finished with the equipment it provides.
+     */
+    solve() {
+        if (this.equipment.size === 0) {
+            this.placeAllEquipment();
+        }
+
+        const connectors = [...this.connectors.values()];
+
+        (this.levelData.validConnections || []).forEach(rule => {
+            const key = CABLE_PROGRESS_KEYS[rule.cable];
+            if (!key) return;
+
+            const sources = connectors.filter(c => c.type === rule.from);
+            const targets = connectors.filter(c => c.type === rule.to);
+
+            for (const source of sources) {
+                for (const target of targets) {
+                    if (this.counts[key] >= this.required[key]) return;
+                    if (source.connectorId === target.connectorId) continue;
+                    this.connect(source.connectorId, target.connectorId, rule.cable);
+                }
+            }
+        });
+
+        return { ...this.summary(), completable: isLevelComplete(this.progress) };
+    }
+}
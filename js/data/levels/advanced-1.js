@@ -0,0 +1,227 @@
+// Level advanced-1: Concert Hall Production
+
+export default {
+    title: 'Concert Hall Production',
+    category: 'advanced',
+    difficulty: 'expert',
+    description: 'Set up complete concert hall production with professional audio, lighting, video, and streaming',
+    objectives: [
+        'Position professional concert audio system',
+        'Connect advanced lighting and video systems',
+        'Set up multi-camera live streaming',
+        'Power all production equipment with redundancy',
+        'Create professional concert production zones'
+    ],
+    equipment: [
+        {
+            type: 'microphone',
+            name: 'Vocal Mic',
+            icon: 'fas fa-microphone',
+            quantity: 4,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Instrument Mic',
+            icon: 'fas fa-microphone',
+            quantity: 6,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'mixing-console',
+            name: 'Professional Mixer',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 1' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 2' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 3' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 4' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 5' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 6' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 7' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 8' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 9' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 10' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out L' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out R' },
+                { type: 'xlr-out', position: 'bottom', label: 'Monitor Out' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Main Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 4,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Monitor Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 6,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'moving-head',
+            name: 'Moving Head Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 8,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-in', position: 'back', label: 'DMX In' }
+            ]
+        },
+        {
+            type: 'dmx-controller',
+            name: 'DMX Controller',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-out', position: 'back', label: 'DMX Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Stage Camera',
+            icon: 'fas fa-video',
+            quantity: 3,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'video-switcher',
+            name: 'Live Video Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 3' },
+                { type: 'hdmi-out', position: 'front', label: 'Program Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Preview Out' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Live Stream Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Video Wall',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'ups',
+            name: 'Uninterruptible Power Supply',
+            icon: 'fas fa-battery-full',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'UPS Out 1' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 2' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 3' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 4' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 5' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 6' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 7' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 8' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 9' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 10' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 20, color: '#ff4757' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 25, color: '#00ff88' },
+        { type: 'dmx-cable', name: 'DMX Cable', icon: 'fas fa-plug', quantity: 8, color: '#ffa502' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 6, color: '#00ccff' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 1, color: '#a29bfe' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' },
+        { from: 'dmx-out', to: 'dmx-in', cable: 'dmx-cable', animation: 'dmx-circle' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'audio', name: 'Audio Mixing', icon: 'fas fa-sliders-h' },
+        { type: 'lighting', name: 'Lighting Control', icon: 'fas fa-lightbulb' },
+        { type: 'video', name: 'Video Production', icon: 'fas fa-video' },
+        { type: 'streaming', name: 'Live Streaming', icon: 'fas fa-broadcast-tower' }
+    ],
+    resourceRequirements: {
+        'microphone': ['musician'],
+        'mixing-console': ['a1-audio-tech'],
+        'speaker': ['a2-audio-tech'],
+        'moving-head': ['lighting-tech'],
+        'dmx-controller': ['lighting-tech'],
+        'camera': ['camera-operator'],
+        'video-switcher': ['video-tech'],
+        'streaming-encoder': ['streaming-tech'],
+        'screen': ['video-tech'],
+        'ups': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'musician', name: 'Musician', icon: 'fas fa-music', description: 'Band member or performer' },
+        { id: 'a1-audio-tech', name: 'A1 Audio Tech', icon: 'fas fa-sliders-h', description: 'Lead audio technician' },
+        { id: 'a2-audio-tech', name: 'A2 Audio Tech', icon: 'fas fa-volume-up', description: 'Assistant audio technician' },
+        { id: 'lighting-tech', name: 'Lighting Tech', icon: 'fas fa-lightbulb', description: 'Lighting technician' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Video camera operator' },
+        { id: 'video-tech', name: 'Video Tech', icon: 'fas fa-video', description: 'Video technician' },
+        { id: 'streaming-tech', name: 'Streaming Tech', icon: 'fas fa-broadcast-tower', description: 'Streaming technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Main Stage', x: '5%', y: '5%', width: '35%', height: '30%' },
+            { name: 'Side Stage', x: '45%', y: '5%', width: '25%', height: '25%' },
+            { name: 'FOH Position', x: '5%', y: '40%', width: '30%', height: '20%' },
+            { name: 'Lighting Grid', x: '40%', y: '35%', width: '30%', height: '20%' },
+            { name: 'Video Control', x: '75%', y: '10%', width: '20%', height: '25%' },
+            { name: 'Power Station', x: '75%', y: '40%', width: '20%', height: '15%' },
+            { name: 'Production Office', x: '75%', y: '60%', width: '20%', height: '25%' }
+        ]
+    }
+};
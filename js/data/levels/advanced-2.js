@@ -0,0 +1,269 @@
+// Level advanced-2: Broadcast Studio Complex
+
+export default {
+    title: 'Broadcast Studio Complex',
+    category: 'advanced',
+    difficulty: 'expert',
+    description: 'Set up complete broadcast studio complex with multiple studios, control rooms, and production facilities',
+    objectives: [
+        'Position multiple broadcast studios and control rooms',
+        'Connect advanced broadcast equipment and routing',
+        'Set up multi-studio production and switching',
+        'Power all broadcast equipment with redundancy',
+        'Create professional broadcast complex zones'
+    ],
+    equipment: [
+        {
+            type: 'camera',
+            name: 'Studio Camera A',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' },
+                { type: 'tally-in', position: 'back', label: 'Tally In' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Studio Camera B',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' },
+                { type: 'tally-in', position: 'back', label: 'Tally In' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Studio Camera C',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' },
+                { type: 'tally-in', position: 'back', label: 'Tally In' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Anchor Mic',
+            icon: 'fas fa-microphone',
+            quantity: 2,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Guest Mic',
+            icon: 'fas fa-microphone',
+            quantity: 4,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'mixing-console',
+            name: 'Broadcast Mixer',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 1' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 2' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 3' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 4' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 5' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 6' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out' }
+            ]
+        },
+        {
+            type: 'video-switcher',
+            name: 'Master Control Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 3' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 4' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 5' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 6' },
+                { type: 'hdmi-out', position: 'front', label: 'Program Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Preview Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Clean Out' }
+            ]
+        },
+        {
+            type: 'graphics-computer',
+            name: 'Graphics Workstation',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'vtr',
+            name: 'Video Tape Recorder',
+            icon: 'fas fa-video',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Broadcast Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Program Monitor',
+            icon: 'fas fa-tv',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Preview Monitor',
+            icon: 'fas fa-tv',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'light-fixture',
+            name: 'Studio Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 12,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-in', position: 'back', label: 'DMX In' }
+            ]
+        },
+        {
+            type: 'dmx-controller',
+            name: 'Lighting Controller',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-out', position: 'back', label: 'DMX Out' }
+            ]
+        },
+        {
+            type: 'ups',
+            name: 'Uninterruptible Power Supply',
+            icon: 'fas fa-battery-full',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'UPS Out 1' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 2' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 3' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 4' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 5' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 6' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 7' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 8' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 9' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 10' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 11' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 12' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 25, color: '#ff4757' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 15, color: '#00ccff' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 8, color: '#00ff88' },
+        { type: 'dmx-cable', name: 'DMX Cable', icon: 'fas fa-plug', quantity: 12, color: '#ffa502' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 2, color: '#a29bfe' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' },
+        { from: 'dmx-out', to: 'dmx-in', cable: 'dmx-cable', animation: 'dmx-circle' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'broadcast', name: 'Broadcast Control', icon: 'fas fa-broadcast-tower' },
+        { type: 'studio', name: 'Studio Management', icon: 'fas fa-tv' },
+        { type: 'lighting', name: 'Studio Lighting', icon: 'fas fa-lightbulb' },
+        { type: 'audio', name: 'Audio Production', icon: 'fas fa-sliders-h' }
+    ],
+    resourceRequirements: {
+        'camera': ['camera-operator'],
+        'microphone': ['anchor'],
+        'mixing-console': ['audio-tech'],
+        'video-switcher': ['technical-director'],
+        'graphics-computer': ['graphics-operator'],
+        'vtr': ['vtr-operator'],
+        'streaming-encoder': ['broadcast-tech'],
+        'screen': ['technical-director'],
+        'light-fixture': ['lighting-tech'],
+        'dmx-controller': ['lighting-tech'],
+        'ups': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'anchor', name: 'News Anchor', icon: 'fas fa-user-tie', description: 'Broadcast news anchor' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Studio camera operator' },
+        { id: 'audio-tech', name: 'Audio Tech', icon: 'fas fa-sliders-h', description: 'Broadcast audio technician' },
+        { id: 'technical-director', name: 'Technical Director', icon: 'fas fa-video', description: 'Technical director' },
+        { id: 'graphics-operator', name: 'Graphics Operator', icon: 'fas fa-palette', description: 'Graphics and overlay operator' },
+        { id: 'vtr-operator', name: 'VTR Operator', icon: 'fas fa-video', description: 'Video tape recorder operator' },
+        { id: 'broadcast-tech', name: 'Broadcast Tech', icon: 'fas fa-broadcast-tower', description: 'Broadcast technician' },
+        { id: 'lighting-tech', name: 'Lighting Tech', icon: 'fas fa-lightbulb', description: 'Studio lighting technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Main Stage', x: '5%', y: '5%', width: '35%', height: '30%' },
+            { name: 'Side Stage', x: '45%', y: '5%', width: '25%', height: '25%' },
+            { name: 'FOH Position', x: '5%', y: '40%', width: '30%', height: '20%' },
+            { name: 'Lighting Grid', x: '40%', y: '35%', width: '30%', height: '20%' },
+            { name: 'Video Control', x: '75%', y: '10%', width: '20%', height: '25%' },
+            { name: 'Power Station', x: '75%', y: '40%', width: '20%', height: '15%' },
+            { name: 'Production Office', x: '75%', y: '60%', width: '20%', height: '25%' }
+        ]
+    }
+};
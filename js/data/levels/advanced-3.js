@@ -0,0 +1,293 @@
+// Level advanced-3: Major Event Production
+
+export default {
+    title: 'Major Event Production',
+    category: 'advanced',
+    difficulty: 'expert',
+    description: 'Set up complete major event production with multiple stages, live streaming, and global broadcast',
+    objectives: [
+        'Position multiple stages and production areas',
+        'Connect comprehensive audio, lighting, and video systems',
+        'Set up multi-platform live streaming and broadcast',
+        'Power all production equipment with full redundancy',
+        'Create professional major event production zones'
+    ],
+    equipment: [
+        {
+            type: 'microphone',
+            name: 'Vocal Mic',
+            icon: 'fas fa-microphone',
+            quantity: 8,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Instrument Mic',
+            icon: 'fas fa-microphone',
+            quantity: 12,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'mixing-console',
+            name: 'Main Stage Mixer',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 1' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 2' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 3' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 4' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 5' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 6' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 7' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 8' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 9' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 10' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 11' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 12' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 13' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 14' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 15' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 16' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 17' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 18' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 19' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 20' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out L' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out R' },
+                { type: 'xlr-out', position: 'bottom', label: 'Monitor Out 1' },
+                { type: 'xlr-out', position: 'bottom', label: 'Monitor Out 2' },
+                { type: 'xlr-out', position: 'bottom', label: 'Monitor Out 3' },
+                { type: 'xlr-out', position: 'bottom', label: 'Monitor Out 4' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Main Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 8,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Monitor Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 12,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'moving-head',
+            name: 'Moving Head Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 16,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-in', position: 'back', label: 'DMX In' }
+            ]
+        },
+        {
+            type: 'par-light',
+            name: 'PAR Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 24,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-in', position: 'back', label: 'DMX In' }
+            ]
+        },
+        {
+            type: 'dmx-controller',
+            name: 'Professional DMX Controller',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-out', position: 'back', label: 'DMX Out 1' },
+                { type: 'dmx-out', position: 'back', label: 'DMX Out 2' },
+                { type: 'dmx-out', position: 'back', label: 'DMX Out 3' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Stage Camera',
+            icon: 'fas fa-video',
+            quantity: 6,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Audience Camera',
+            icon: 'fas fa-video',
+            quantity: 4,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'video-switcher',
+            name: 'Production Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 3' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 4' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 5' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 6' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 7' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 8' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 9' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 10' },
+                { type: 'hdmi-out', position: 'front', label: 'Program Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Preview Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Clean Out' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Multi-Platform Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Video Wall',
+            icon: 'fas fa-tv',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Jumbotron',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'ups',
+            name: 'Uninterruptible Power Supply',
+            icon: 'fas fa-battery-full',
+            quantity: 2,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'UPS Out 1' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 2' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 3' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 4' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 5' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 6' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 7' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 8' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 9' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 10' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 11' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 12' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 13' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 14' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 15' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 16' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 40, color: '#ff4757' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 50, color: '#00ff88' },
+        { type: 'dmx-cable', name: 'DMX Cable', icon: 'fas fa-plug', quantity: 40, color: '#ffa502' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 20, color: '#00ccff' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 4, color: '#a29bfe' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' },
+        { from: 'dmx-out', to: 'dmx-in', cable: 'dmx-cable', animation: 'dmx-circle' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'audio', name: 'Audio Production', icon: 'fas fa-sliders-h' },
+        { type: 'lighting', name: 'Lighting Design', icon: 'fas fa-lightbulb' },
+        { type: 'video', name: 'Video Production', icon: 'fas fa-video' },
+        { type: 'streaming', name: 'Multi-Platform Streaming', icon: 'fas fa-broadcast-tower' }
+    ],
+    resourceRequirements: {
+        'microphone': ['musician'],
+        'mixing-console': ['a1-audio-tech'],
+        'speaker': ['a2-audio-tech'],
+        'moving-head': ['lighting-tech'],
+        'par-light': ['lighting-tech'],
+        'dmx-controller': ['lighting-tech'],
+        'camera': ['camera-operator'],
+        'video-switcher': ['technical-director'],
+        'streaming-encoder': ['streaming-tech'],
+        'screen': ['video-tech'],
+        'ups': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'musician', name: 'Musician', icon: 'fas fa-music', description: 'Band member or performer' },
+        { id: 'a1-audio-tech', name: 'A1 Audio Tech', icon: 'fas fa-sliders-h', description: 'Lead audio technician' },
+        { id: 'a2-audio-tech', name: 'A2 Audio Tech', icon: 'fas fa-volume-up', description: 'Assistant audio technician' },
+        { id: 'lighting-tech', name: 'Lighting Tech', icon: 'fas fa-lightbulb', description: 'Lighting technician' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Video camera operator' },
+        { id: 'technical-director', name: 'Technical Director', icon: 'fas fa-video', description: 'Technical director' },
+        { id: 'streaming-tech', name: 'Streaming Tech', icon: 'fas fa-broadcast-tower', description: 'Streaming technician' },
+        { id: 'video-tech', name: 'Video Tech', icon: 'fas fa-video', description: 'Video technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' }
+    ],
+    stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Main Stage', x: '5%', y: '5%', width: '35%', height: '30%' },
+            { name: 'Side Stage', x: '45%', y: '5%', width: '25%', height: '25%' },
+            { name: 'FOH Position', x: '5%', y: '40%', width: '30%', height: '20%' },
+            { name: 'Lighting Grid', x: '40%', y: '35%', width: '30%', height: '20%' },
+            { name: 'Video Control', x: '75%', y: '10%', width: '20%', height: '25%' },
+            { name: 'Power Station', x: '75%', y: '40%', width: '20%', height: '15%' },
+            { name: 'Production Office', x: '75%', y: '60%', width: '20%', height: '25%' }
+        ]
+    }
+};
@@ -0,0 +1,143 @@
+// Level audio-1: Basic Microphone Setup
+
+export default {
+    title: 'Basic Microphone Setup',
+    category: 'audio',
+    difficulty: 'beginner',
+    description: 'Learn to set up microphones for a live performance',
+    objectives: [
+        'Place 2 microphones on stage',
+        'Connect microphones to mixing console',
+        'Power the mixing console',
+        'Connect speakers to the console'
+    ],
+    equipment: [
+        {
+            type: 'microphone',
+            name: 'Wireless Vocal Mic',
+            icon: 'fas fa-microphone',
+            quantity: 2,
+            wireless: true,
+            requiresPower: false,
+            connectors: [
+                { type: 'wireless-out', position: 'bottom', label: 'Wireless Out' }
+            ]
+        },
+        {
+            type: 'mic-receiver',
+            name: 'Mic Receiver',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'wireless-in', position: 'top', label: 'Wireless In' },
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'mixing-console',
+            name: 'Mixing Console',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 1' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Main Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 4, color: '#ff4757' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 3, color: '#00ff88' },
+        { type: 'wireless-cable', name: 'Wireless Signal', icon: 'fas fa-wifi', quantity: 2, color: '#a29bfe' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'wireless-out', to: 'wireless-in', cable: 'wireless-cable', animation: 'wireless-signal' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' }
+    ],
+    settings: [
+        { type: 'gain', name: 'Gain Control', icon: 'fas fa-sliders-h' },
+        { type: 'eq', name: 'EQ Settings', icon: 'fas fa-wave-square' }
+    ],
+    resourceRequirements: {
+        'microphone': ['singer', 'speaker'],
+        'mic-receiver': ['a1-audio-tech', 'a2-audio-tech'],
+        'mixing-console': ['a1-audio-tech'],
+        'speaker': ['a2-audio-tech'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'singer', name: 'Singer', icon: 'fas fa-music', description: 'Vocal performer' },
+        { id: 'speaker', name: 'Speaker', icon: 'fas fa-user-tie', description: 'Public speaker' },
+        { id: 'a1-audio-tech', name: 'A1 Audio Tech', icon: 'fas fa-headphones', description: 'Lead audio technician' },
+        { id: 'a2-audio-tech', name: 'A2 Audio Tech', icon: 'fas fa-microchip', description: 'Assistant audio technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' }
+    ],
+    testingChallenges: [
+        {
+            type: 'microphone-test',
+            title: 'Microphone Muting Test',
+            icon: 'fa-microphone-slash',
+            description: 'Test microphone muting functionality to ensure proper control',
+            instructions: [
+                'Click "Mute Microphone" to mute the wireless microphone',
+                'Verify that no audio signal is detected in the visualizer',
+                'Click "Unmute Microphone" to restore audio functionality',
+                'Confirm that audio levels are visible in the visualizer'
+            ]
+        },
+        {
+            type: 'speaker-test',
+            title: 'Speaker Audio Routing Test',
+            icon: 'fa-volume-up',
+            description: 'Test audio routing to specific speakers and verify output',
+            instructions: [
+                'Select one or more speakers from the list',
+                'Adjust the volume slider to your preferred level',
+                'Click "Play Test Audio" to send audio to selected speakers',
+                'Observe the speaker color changes indicating audio output',
+                'Click "Stop Audio" to end the test'
+            ]
+        }
+    ],
+    stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Control Zone', x: '65%', y: '5%', width: '30%', height: '30%' }
+        ]
+    }
+};
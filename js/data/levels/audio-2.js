@@ -0,0 +1,171 @@
+// Level audio-2: Advanced Audio System
+
+export default {
+    title: 'Advanced Audio System',
+    category: 'audio',
+    difficulty: 'intermediate',
+    description: 'Set up a complex audio system with effects and monitoring',
+    objectives: [
+        'Connect multiple microphones and instruments',
+        'Set up effects processing chain',
+        'Configure monitor system',
+        'Power all equipment properly'
+    ],
+    equipment: [
+        {
+            type: 'microphone',
+            name: 'Vocal Mic',
+            icon: 'fas fa-microphone',
+            quantity: 2,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Instrument Mic',
+            icon: 'fas fa-microphone',
+            quantity: 2,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'mixing-console',
+            name: '8-Channel Mixer',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 1' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 2' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 3' },
+                { type: 'xlr-in', position: 'top', label: 'XLR In 4' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main Out' },
+                { type: 'xlr-out', position: 'bottom', label: 'Aux Out' }
+            ]
+        },
+        {
+            type: 'effects-processor',
+            name: 'Effects Processor',
+            icon: 'fas fa-magic',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Input' },
+                { type: 'xlr-out', position: 'bottom', label: 'Output' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Main Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Monitor Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Monitor In' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' },
+                { type: 'power-out', position: 'right', label: 'Power Out 5' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 5, color: '#ff4757' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 8, color: '#00ff88' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' }
+    ],
+    settings: [
+        { type: 'gain', name: 'Gain Control', icon: 'fas fa-sliders-h' },
+        { type: 'eq', name: 'EQ Settings', icon: 'fas fa-wave-square' },
+        { type: 'pan', name: 'Pan Control', icon: 'fas fa-arrows-alt-h' },
+        { type: 'effects', name: 'Effects', icon: 'fas fa-magic' }
+    ],
+    resourceRequirements: {
+        'microphone': ['singer', 'speaker', 'instrumentalist'],
+        'mixing-console': ['a1-audio-tech'],
+        'effects-processor': ['a2-audio-tech'],
+        'speaker': ['a2-audio-tech'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'singer', name: 'Singer', icon: 'fas fa-music', description: 'Vocal performer' },
+        { id: 'speaker', name: 'Speaker', icon: 'fas fa-user-tie', description: 'Public speaker' },
+        { id: 'instrumentalist', name: 'Instrumentalist', icon: 'fas fa-guitar', description: 'Musical instrument player' },
+        { id: 'a1-audio-tech', name: 'A1 Audio Tech', icon: 'fas fa-headphones', description: 'Lead audio technician' },
+        { id: 'a2-audio-tech', name: 'A2 Audio Tech', icon: 'fas fa-microchip', description: 'Assistant audio technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' }
+    ],
+    testingChallenges: [
+        {
+            type: 'channel-test',
+            title: 'Multi-Channel Audio Routing',
+            icon: 'fa-random',
+            description: 'Test routing audio to different channels and monitor mixes',
+            instructions: [
+                'Select specific audio channels from the list',
+                'Route audio to main output and auxiliary channels',
+                'Verify that audio is properly distributed',
+                'Test monitor mix routing for performers',
+                'Clear routing to reset the system'
+            ]
+        },
+        {
+            type: 'speaker-test',
+            title: 'Multi-Zone Speaker Testing',
+            icon: 'fa-volume-up',
+            description: 'Test audio distribution across multiple speaker zones',
+            instructions: [
+                'Select different speaker combinations',
+                'Test main speakers and monitor speakers separately',
+                'Adjust volume levels for each zone',
+                'Verify audio output through visual feedback',
+                'Test stereo separation and balance'
+            ]
+        }
+    ],
+    stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Monitor Zone', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '35%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Wireless Zone', x: '65%', y: '5%', width: '30%', height: '30%' }
+        ]
+    }
+};
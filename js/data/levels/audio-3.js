@@ -0,0 +1,232 @@
+// Level audio-3: Professional Live Sound System
+
+export default {
+    title: 'Professional Live Sound System',
+    category: 'audio',
+    difficulty: 'advanced',
+    description: 'Set up a complex live sound system with multiple zones and wireless monitoring',
+    objectives: [
+        'Connect multiple input sources (mics, instruments, playback)',
+        'Set up wireless in-ear monitoring system',
+        'Configure multi-zone speaker system',
+        'Power all equipment with proper distribution',
+        'Create monitor mixes for performers'
+    ],
+    equipment: [
+        {
+            type: 'microphone',
+            name: 'Vocal Mic',
+            icon: 'fas fa-microphone',
+            quantity: 3,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Instrument Mic',
+            icon: 'fas fa-microphone',
+            quantity: 2,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'playback-device',
+            name: 'Music Playback',
+            icon: 'fas fa-music',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-out', position: 'bottom', label: 'Left Out' },
+                { type: 'xlr-out', position: 'bottom', label: 'Right Out' }
+            ]
+        },
+        {
+            type: 'mixing-console',
+            name: '24-Channel Mixer',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Input 1' },
+                { type: 'xlr-in', position: 'top', label: 'Input 2' },
+                { type: 'xlr-in', position: 'top', label: 'Input 3' },
+                { type: 'xlr-in', position: 'top', label: 'Input 4' },
+                { type: 'xlr-in', position: 'top', label: 'Input 5' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main L Out' },
+                { type: 'xlr-out', position: 'bottom', label: 'Main R Out' },
+                { type: 'xlr-out', position: 'bottom', label: 'Aux 1 Out' },
+                { type: 'xlr-out', position: 'bottom', label: 'Aux 2 Out' }
+            ]
+        },
+        {
+            type: 'wireless-transmitter',
+            name: 'Wireless Transmitter',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Audio In' },
+                { type: 'wireless-out', position: 'bottom', label: 'RF Out' }
+            ]
+        },
+        {
+            type: 'wireless-receiver',
+            name: 'Wireless Receiver',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'wireless-in', position: 'top', label: 'RF In' },
+                { type: 'xlr-out', position: 'bottom', label: 'Audio Out' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Main Speaker L',
+            icon: 'fas fa-volume-up',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Main Speaker R',
+            icon: 'fas fa-volume-up',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Monitor Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Monitor In' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' },
+                { type: 'power-out', position: 'right', label: 'Power Out 5' },
+                { type: 'power-out', position: 'right', label: 'Power Out 6' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 9, color: '#ff4757' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 11, color: '#00ff88' },
+        { type: 'wireless-cable', name: 'Wireless Signal', icon: 'fas fa-wifi', quantity: 2, color: '#a29bfe' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' },
+        { from: 'wireless-out', to: 'wireless-in', cable: 'wireless-cable', animation: 'wireless-signal' }
+    ],
+    settings: [
+        { type: 'gain', name: 'Gain Control', icon: 'fas fa-sliders-h' },
+        { type: 'eq', name: 'EQ Settings', icon: 'fas fa-wave-square' },
+        { type: 'pan', name: 'Pan Control', icon: 'fas fa-arrows-alt-h' },
+        { type: 'effects', name: 'Effects', icon: 'fas fa-magic' },
+        { type: 'monitor-mix', name: 'Monitor Mix', icon: 'fas fa-headphones' },
+        { type: 'wireless-freq', name: 'Wireless Frequency', icon: 'fas fa-wifi' }
+    ],
+    resourceRequirements: {
+        'microphone': ['singer', 'speaker', 'instrumentalist'],
+        'playback-device': ['dj', 'media-operator'],
+        'mixing-console': ['a1-audio-tech'],
+        'wireless-transmitter': ['a2-audio-tech'],
+        'wireless-receiver': ['a2-audio-tech'],
+        'speaker': ['a2-audio-tech'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'singer', name: 'Singer', icon: 'fas fa-music', description: 'Vocal performer' },
+        { id: 'speaker', name: 'Speaker', icon: 'fas fa-user-tie', description: 'Public speaker' },
+        { id: 'instrumentalist', name: 'Instrumentalist', icon: 'fas fa-guitar', description: 'Musical instrument player' },
+        { id: 'dj', name: 'DJ', icon: 'fas fa-compact-disc', description: 'Disc jockey' },
+        { id: 'media-operator', name: 'Media Operator', icon: 'fas fa-play-circle', description: 'Media playback operator' },
+        { id: 'a1-audio-tech', name: 'A1 Audio Tech', icon: 'fas fa-headphones', description: 'Lead audio technician' },
+        { id: 'a2-audio-tech', name: 'A2 Audio Tech', icon: 'fas fa-microchip', description: 'Assistant audio technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' }
+    ],
+    testingChallenges: [
+        {
+            type: 'microphone-test',
+            title: 'Wireless Microphone Testing',
+            icon: 'fa-microphone',
+            description: 'Test wireless microphone system and frequency coordination',
+            instructions: [
+                'Test wireless microphone signal strength',
+                'Verify frequency coordination between transmitters',
+                'Check for interference and signal dropouts',
+                'Test microphone muting and unmuting',
+                'Verify audio quality through the system'
+            ]
+        },
+        {
+            type: 'channel-test',
+            title: 'Advanced Channel Routing',
+            icon: 'fa-random',
+            description: 'Test complex audio routing for live performance',
+            instructions: [
+                'Route vocal microphones to main mix',
+                'Route instrument microphones to separate channels',
+                'Set up monitor mixes for performers',
+                'Test playback device routing',
+                'Verify all channels are properly isolated'
+            ]
+        },
+        {
+            type: 'speaker-test',
+            title: 'Multi-Zone Audio System',
+            icon: 'fa-volume-up',
+            description: 'Test complete multi-zone audio system',
+            instructions: [
+                'Test main speaker system output',
+                'Test monitor speaker system',
+                'Verify stereo imaging and balance',
+                'Test subwoofer integration',
+                'Check overall system coherence'
+            ]
+        }
+    ],
+    stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Monitor Zone', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '35%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Wireless Zone', x: '65%', y: '5%', width: '30%', height: '30%' }
+        ]
+    }
+};
@@ -0,0 +1,104 @@
+// Level lighting-3: Professional Lighting System
+
+export default {
+    title: 'Professional Lighting System',
+    category: 'lighting',
+    difficulty: 'advanced',
+    description: 'Set up a complete professional lighting system with multiple fixture types',
+    objectives: [
+        'Position multiple fixture types',
+        'Connect complex DMX control system',
+        'Power all lighting equipment',
+        'Create comprehensive lighting zones'
+    ],
+    equipment: [
+        {
+            type: 'moving-head',
+            name: 'Moving Head Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'dmx-in', position: 'bottom', label: 'DMX In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'par-light',
+            name: 'PAR Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 4,
+            requiresPower: true,
+            connectors: [
+                { type: 'dmx-in', position: 'bottom', label: 'DMX In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'dimmer',
+            name: 'Professional Dimmer',
+            icon: 'fas fa-sliders-h',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-out', position: 'top', label: 'DMX Out' },
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 8, color: '#ff4757' },
+        { type: 'dmx-cable', name: 'DMX Cable', icon: 'fas fa-plug', quantity: 6, color: '#ffa502' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'dmx-out', to: 'dmx-in', cable: 'dmx-cable', animation: 'dmx-circle' }
+    ],
+    settings: [
+        { type: 'intensity', name: 'Intensity', icon: 'fas fa-sliders-h' },
+        { type: 'color', name: 'Color Temperature', icon: 'fas fa-palette' },
+        { type: 'movement', name: 'Movement', icon: 'fas fa-arrows-alt' }
+    ],
+    resourceRequirements: {
+        'moving-head': ['performer', 'actor', 'dancer'],
+        'par-light': ['performer', 'actor', 'dancer'],
+        'dimmer': ['l1-lighting-tech'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'performer', name: 'Performer', icon: 'fas fa-star', description: 'Stage performer' },
+        { id: 'actor', name: 'Actor', icon: 'fas fa-theater-masks', description: 'Theatrical actor' },
+        { id: 'dancer', name: 'Dancer', icon: 'fas fa-running', description: 'Dance performer' },
+        { id: 'l1-lighting-tech', name: 'L1 Lighting Tech', icon: 'fas fa-lightbulb', description: 'Lead lighting technician' },
+        { id: 'l2-lighting-tech', name: 'L2 Lighting Tech', icon: 'fas fa-lightbulb', description: 'Assistant lighting technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'lighting-designer', name: 'Lighting Designer', icon: 'fas fa-palette', description: 'Lighting design specialist' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Control Zone', x: '65%', y: '5%', width: '30%', height: '30%' }
+        ]
+    }
+};
@@ -0,0 +1,73 @@
+// Level set-1: Basic Stage Set
+
+export default {
+    title: 'Basic Stage Set',
+    category: 'set',
+    difficulty: 'beginner',
+    description: 'Set up basic stage set with props and staging',
+    objectives: [
+        'Position basic stage props',
+        'Set up staging elements',
+        'Create basic set zones',
+        'Organize stage layout'
+    ],
+    equipment: [
+        {
+            type: 'stage-prop',
+            name: 'Stage Prop',
+            icon: 'fas fa-cube',
+            quantity: 3,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'stage-curtain',
+            name: 'Stage Curtain',
+            icon: 'fas fa-scroll',
+            quantity: 1,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'stage-platform',
+            name: 'Stage Platform',
+            icon: 'fas fa-square',
+            quantity: 2,
+            requiresPower: false,
+            connectors: []
+        }
+    ],
+    connections: [],
+    validConnections: [],
+    settings: [
+        { type: 'position', name: 'Position', icon: 'fas fa-arrows-alt' },
+        { type: 'rotation', name: 'Rotation', icon: 'fas fa-redo' }
+    ],
+    resourceRequirements: {
+        'stage-prop': ['performer', 'actor', 'dancer'],
+        'stage-curtain': ['stage-hand'],
+        'stage-platform': ['stage-hand', 'grip'],
+        'stage-ladder': ['stage-hand', 'grip'],
+        'stage-rigging': ['rigger']
+    },
+    availableResources: [
+        { id: 'performer', name: 'Performer', icon: 'fas fa-star', description: 'Stage performer' },
+        { id: 'actor', name: 'Actor', icon: 'fas fa-theater-masks', description: 'Theatrical actor' },
+        { id: 'dancer', name: 'Dancer', icon: 'fas fa-running', description: 'Dance performer' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' },
+        { id: 'rigger', name: 'Rigger', icon: 'fas fa-link', description: 'Stage rigging specialist' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'set-designer', name: 'Set Designer', icon: 'fas fa-palette', description: 'Set design specialist' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Storage Area', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Set Control', x: '65%', y: '5%', width: '30%', height: '30%' }
+        ]
+    }
+};
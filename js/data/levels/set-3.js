@@ -0,0 +1,72 @@
+// Level set-3: Professional Stage Set
+
+export default {
+    title: 'Professional Stage Set',
+    category: 'set',
+    difficulty: 'advanced',
+    description: 'Set up professional stage set with complex staging',
+    objectives: [
+        'Position professional stage elements',
+        'Set up complex staging system',
+        'Create professional set zones',
+        'Organize complex layout'
+    ],
+    equipment: [
+        {
+            type: 'stage-prop',
+            name: 'Stage Prop',
+            icon: 'fas fa-cube',
+            quantity: 8,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'stage-curtain',
+            name: 'Stage Curtain',
+            icon: 'fas fa-scroll',
+            quantity: 3,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'stage-platform',
+            name: 'Stage Platform',
+            icon: 'fas fa-square',
+            quantity: 4,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'stage-ladder',
+            name: 'Stage Ladder',
+            icon: 'fas fa-arrows-alt-v',
+            quantity: 2,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'stage-rigging',
+            name: 'Stage Rigging',
+            icon: 'fas fa-link',
+            quantity: 1,
+            requiresPower: false,
+            connectors: []
+        }
+    ],
+    connections: [],
+    validConnections: [],
+    settings: [
+        { type: 'position', name: 'Position', icon: 'fas fa-arrows-alt' },
+        { type: 'rotation', name: 'Rotation', icon: 'fas fa-redo' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Storage Area', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Set Control', x: '65%', y: '5%', width: '30%', height: '30%' }
+        ]
+    }
+};
@@ -0,0 +1,127 @@
+// Level streaming-1: Social Media Live Stream
+
+export default {
+    title: 'Social Media Live Stream',
+    category: 'streaming',
+    difficulty: 'beginner',
+    description: 'Set up multi-platform social media live streaming with chat integration',
+    objectives: [
+        'Position streaming cameras and mobile devices',
+        'Connect multi-platform streaming encoder',
+        'Set up chat overlay and engagement tools',
+        'Power all streaming equipment',
+        'Create interactive streaming zones'
+    ],
+    equipment: [
+        {
+            type: 'camera',
+            name: 'Streaming Camera',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' }
+            ]
+        },
+        {
+            type: 'mobile-device',
+            name: 'Mobile Phone',
+            icon: 'fas fa-mobile-alt',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'bottom', label: 'Power In' },
+                { type: 'usb-out', position: 'bottom', label: 'USB Out' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Multi-Platform Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'usb-in', position: 'back', label: 'USB In 1' },
+                { type: 'usb-in', position: 'back', label: 'USB In 2' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'chat-computer',
+            name: 'Chat Management PC',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'light-fixture',
+            name: 'Ring Light',
+            icon: 'fas fa-lightbulb',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'dmx-in', position: 'back', label: 'DMX In' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 4, color: '#ff4757' },
+        { type: 'usb-cable', name: 'USB Cable', icon: 'fas fa-plug', quantity: 3, color: '#00ccff' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 2, color: '#ffa502' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'usb-out', to: 'usb-in', cable: 'usb-cable', animation: 'data-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'platforms', name: 'Streaming Platforms', icon: 'fas fa-globe' },
+        { type: 'chat', name: 'Chat Integration', icon: 'fas fa-comments' },
+        { type: 'overlay', name: 'Graphics Overlay', icon: 'fas fa-palette' }
+    ],
+    resourceRequirements: {
+        'camera': ['streamer'],
+        'mobile-device': ['streamer'],
+        'streaming-encoder': ['streaming-tech'],
+        'chat-computer': ['chat-moderator'],
+        'light-fixture': ['lighting-tech'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'streamer', name: 'Content Creator', icon: 'fas fa-user', description: 'Social media streamer' },
+        { id: 'streaming-tech', name: 'Streaming Tech', icon: 'fas fa-broadcast-tower', description: 'Streaming technician' },
+        { id: 'chat-moderator', name: 'Chat Moderator', icon: 'fas fa-shield-alt', description: 'Chat moderation specialist' },
+        { id: 'lighting-tech', name: 'Lighting Tech', icon: 'fas fa-lightbulb', description: 'Lighting technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Streaming Area', x: '5%', y: '5%', width: '30%', height: '25%' },
+            { name: 'FOH Position', x: '40%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '35%', width: '25%', height: '20%' },
+            { name: 'Streaming Control', x: '70%', y: '5%', width: '25%', height: '30%' },
+            { name: 'Chat Station', x: '40%', y: '30%', width: '25%', height: '20%' }
+        ]
+    }
+};
@@ -0,0 +1,160 @@
+// Level streaming-2: Gaming Tournament Stream
+
+export default {
+    title: 'Gaming Tournament Stream',
+    category: 'streaming',
+    difficulty: 'intermediate',
+    description: 'Set up professional gaming tournament streaming with multiple players and commentators',
+    objectives: [
+        'Position multiple gaming stations and cameras',
+        'Connect tournament streaming system',
+        'Set up commentator audio and video',
+        'Power all gaming and streaming equipment',
+        'Create tournament streaming zones'
+    ],
+    equipment: [
+        {
+            type: 'gaming-pc',
+            name: 'Gaming PC 1',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' }
+            ]
+        },
+        {
+            type: 'gaming-pc',
+            name: 'Gaming PC 2',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Player Camera 1',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Player Camera 2',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Commentator Mic',
+            icon: 'fas fa-microphone',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Tournament Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In 1' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In 2' },
+                { type: 'usb-in', position: 'back', label: 'USB In 1' },
+                { type: 'usb-in', position: 'back', label: 'USB In 2' },
+                { type: 'xlr-in', position: 'back', label: 'XLR In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Tournament Monitor',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' },
+                { type: 'power-out', position: 'right', label: 'Power Out 5' },
+                { type: 'power-out', position: 'right', label: 'Power Out 6' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 6, color: '#ff4757' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 4, color: '#00ccff' },
+        { type: 'usb-cable', name: 'USB Cable', icon: 'fas fa-plug', quantity: 4, color: '#a29bfe' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 1, color: '#00ff88' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 1, color: '#ffa502' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'usb-out', to: 'usb-in', cable: 'usb-cable', animation: 'data-pulse' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'tournament', name: 'Tournament Mode', icon: 'fas fa-trophy' },
+        { type: 'commentary', name: 'Commentary Audio', icon: 'fas fa-microphone' },
+        { type: 'overlay', name: 'Score Overlay', icon: 'fas fa-chart-bar' }
+    ],
+    resourceRequirements: {
+        'gaming-pc': ['gamer'],
+        'camera': ['camera-operator'],
+        'microphone': ['commentator'],
+        'streaming-encoder': ['streaming-tech'],
+        'screen': ['tournament-director'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'gamer', name: 'Gamer', icon: 'fas fa-gamepad', description: 'Tournament player' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Video camera operator' },
+        { id: 'commentator', name: 'Commentator', icon: 'fas fa-microphone', description: 'Tournament commentator' },
+        { id: 'streaming-tech', name: 'Streaming Tech', icon: 'fas fa-broadcast-tower', description: 'Streaming technician' },
+        { id: 'tournament-director', name: 'Tournament Director', icon: 'fas fa-trophy', description: 'Tournament coordinator' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Streaming Area', x: '5%', y: '5%', width: '30%', height: '25%' },
+            { name: 'FOH Position', x: '40%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '35%', width: '25%', height: '20%' },
+            { name: 'Streaming Control', x: '70%', y: '5%', width: '25%', height: '30%' },
+            { name: 'Chat Station', x: '40%', y: '30%', width: '25%', height: '20%' }
+        ]
+    }
+};
@@ -0,0 +1,217 @@
+// Level streaming-3: Professional Esports Arena
+
+export default {
+    title: 'Professional Esports Arena',
+    category: 'streaming',
+    difficulty: 'advanced',
+    description: 'Set up complete professional esports arena with multi-camera production, live audience, and global streaming',
+    objectives: [
+        'Position professional esports gaming stations',
+        'Connect multi-camera production system',
+        'Set up live audience audio and video',
+        'Power all arena equipment with redundancy',
+        'Create professional esports production zones'
+    ],
+    equipment: [
+        {
+            type: 'gaming-pc',
+            name: 'Pro Gaming PC 1',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'gaming-pc',
+            name: 'Pro Gaming PC 2',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'usb-out', position: 'back', label: 'USB Out' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Player Camera 1',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Player Camera 2',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Audience Camera',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Commentator Mic 1',
+            icon: 'fas fa-microphone',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'microphone',
+            name: 'Commentator Mic 2',
+            icon: 'fas fa-microphone',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'xlr-out', position: 'bottom', label: 'XLR Out' }
+            ]
+        },
+        {
+            type: 'video-switcher',
+            name: 'Production Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 3' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 4' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 5' },
+                { type: 'hdmi-out', position: 'front', label: 'Program Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Preview Out' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Multi-Platform Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Arena Display',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'speaker',
+            name: 'Arena Speaker',
+            icon: 'fas fa-volume-up',
+            quantity: 2,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'xlr-in', position: 'top', label: 'Speaker In' }
+            ]
+        },
+        {
+            type: 'ups',
+            name: 'Uninterruptible Power Supply',
+            icon: 'fas fa-battery-full',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'UPS Out 1' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 2' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 3' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 4' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 5' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 6' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 7' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 8' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 10, color: '#ff4757' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 8, color: '#00ccff' },
+        { type: 'usb-cable', name: 'USB Cable', icon: 'fas fa-plug', quantity: 2, color: '#a29bfe' },
+        { type: 'xlr-cable', name: 'XLR Cable', icon: 'fas fa-plug', quantity: 3, color: '#00ff88' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 3, color: '#ffa502' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'usb-out', to: 'usb-in', cable: 'usb-cable', animation: 'data-pulse' },
+        { from: 'xlr-out', to: 'xlr-in', cable: 'xlr-cable', animation: 'audio-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'esports', name: 'Esports Mode', icon: 'fas fa-trophy' },
+        { type: 'production', name: 'Production Control', icon: 'fas fa-sliders-h' },
+        { type: 'streaming', name: 'Multi-Platform', icon: 'fas fa-globe' },
+        { type: 'audience', name: 'Audience Audio', icon: 'fas fa-users' }
+    ],
+    resourceRequirements: {
+        'gaming-pc': ['pro-gamer'],
+        'camera': ['camera-operator'],
+        'microphone': ['commentator'],
+        'video-switcher': ['production-director'],
+        'streaming-encoder': ['streaming-tech'],
+        'screen': ['arena-manager'],
+        'speaker': ['audio-tech'],
+        'ups': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'pro-gamer', name: 'Pro Gamer', icon: 'fas fa-gamepad', description: 'Professional esports player' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Video camera operator' },
+        { id: 'commentator', name: 'Commentator', icon: 'fas fa-microphone', description: 'Esports commentator' },
+        { id: 'production-director', name: 'Production Director', icon: 'fas fa-video', description: 'Production coordinator' },
+        { id: 'streaming-tech', name: 'Streaming Tech', icon: 'fas fa-broadcast-tower', description: 'Streaming technician' },
+        { id: 'arena-manager', name: 'Arena Manager', icon: 'fas fa-trophy', description: 'Arena operations manager' },
+        { id: 'audio-tech', name: 'Audio Tech', icon: 'fas fa-volume-up', description: 'Audio technician' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Streaming Area', x: '5%', y: '5%', width: '30%', height: '25%' },
+            { name: 'FOH Position', x: '40%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '35%', width: '25%', height: '20%' },
+            { name: 'Streaming Control', x: '70%', y: '5%', width: '25%', height: '30%' },
+            { name: 'Chat Station', x: '40%', y: '30%', width: '25%', height: '20%' }
+        ]
+    }
+};
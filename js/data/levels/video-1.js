@@ -0,0 +1,141 @@
+// Level video-1: Corporate Presentation Setup
+
+export default {
+    title: 'Corporate Presentation Setup',
+    category: 'video',
+    difficulty: 'beginner',
+    description: 'Set up professional corporate presentation system with multiple inputs and backup',
+    objectives: [
+        'Position main and backup projectors',
+        'Connect laptop and backup media sources',
+        'Set up video switcher for seamless transitions',
+        'Power all video equipment with redundancy',
+        'Create presentation zones with proper sightlines'
+    ],
+    equipment: [
+        {
+            type: 'projector',
+            name: 'Main Projector',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In 1' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In 2' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'projector',
+            name: 'Backup Projector',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Main Screen',
+            icon: 'fas fa-square',
+            quantity: 1,
+            requiresPower: false,
+            connectors: []
+        },
+        {
+            type: 'video-switcher',
+            name: 'HDMI Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-out', position: 'front', label: 'Output 1' },
+                { type: 'hdmi-out', position: 'front', label: 'Output 2' }
+            ]
+        },
+        {
+            type: 'laptop',
+            name: 'Presenter Laptop',
+            icon: 'fas fa-laptop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'right', label: 'HDMI Out' }
+            ]
+        },
+        {
+            type: 'media-player',
+            name: 'Backup Media Player',
+            icon: 'fas fa-play',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 5, color: '#ff4757' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 6, color: '#00ccff' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' }
+    ],
+    settings: [
+        { type: 'brightness', name: 'Brightness', icon: 'fas fa-sliders-h' },
+        { type: 'resolution', name: 'Resolution', icon: 'fas fa-expand' },
+        { type: 'switching', name: 'Switching', icon: 'fas fa-random' },
+        { type: 'backup', name: 'Backup Mode', icon: 'fas fa-shield-alt' }
+    ],
+    resourceRequirements: {
+        'projector': ['v1-video-tech'],
+        'screen': ['stage-hand'],
+        'video-switcher': ['v1-video-tech'],
+        'laptop': ['presenter'],
+        'media-player': ['media-operator'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'v1-video-tech', name: 'V1 Video Tech', icon: 'fas fa-video', description: 'Lead video technician' },
+        { id: 'presenter', name: 'Presenter', icon: 'fas fa-user-tie', description: 'Corporate presenter' },
+        { id: 'media-operator', name: 'Media Operator', icon: 'fas fa-play-circle', description: 'Media playback operator' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'video-designer', name: 'Video Designer', icon: 'fas fa-palette', description: 'Video design specialist' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Video Control', x: '80%', y: '5%', width: '15%', height: '30%' },
+            { name: 'Camera Position 1', x: '35%', y: '30%', width: '20%', height: '20%' },
+            { name: 'Camera Position 2', x: '60%', y: '30%', width: '15%', height: '20%' },
+            { name: 'Camera Position 3', x: '35%', y: '55%', width: '20%', height: '20%' }
+        ]
+    }
+};
@@ -0,0 +1,178 @@
+// Level video-2: Live Streaming Multi-Camera Setup
+
+export default {
+    title: 'Live Streaming Multi-Camera Setup',
+    category: 'video',
+    difficulty: 'intermediate',
+    description: 'Set up professional live streaming system with multiple cameras and graphics',
+    objectives: [
+        'Position multiple cameras for different angles',
+        'Connect live video switcher with graphics overlay',
+        'Set up streaming encoder and backup recording',
+        'Power all video equipment with redundancy',
+        'Create live streaming zones with proper coverage'
+    ],
+    equipment: [
+        {
+            type: 'camera',
+            name: 'Main Camera',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Wide Shot Camera',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Close-up Camera',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' }
+            ]
+        },
+        {
+            type: 'video-switcher',
+            name: 'Live Video Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 3' },
+                { type: 'hdmi-in', position: 'back', label: 'Graphics Input' },
+                { type: 'hdmi-out', position: 'front', label: 'Program Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Preview Out' }
+            ]
+        },
+        {
+            type: 'graphics-computer',
+            name: 'Graphics Computer',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Streaming Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'recorder',
+            name: 'Backup Recorder',
+            icon: 'fas fa-hdd',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Monitor Screen',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'power-distro',
+            name: 'Power Distribution',
+            icon: 'fas fa-plug',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'Power Out 1' },
+                { type: 'power-out', position: 'right', label: 'Power Out 2' },
+                { type: 'power-out', position: 'right', label: 'Power Out 3' },
+                { type: 'power-out', position: 'right', label: 'Power Out 4' },
+                { type: 'power-out', position: 'right', label: 'Power Out 5' },
+                { type: 'power-out', position: 'right', label: 'Power Out 6' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 8, color: '#ff4757' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 10, color: '#00ccff' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 1, color: '#ffa502' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'brightness', name: 'Brightness', icon: 'fas fa-sliders-h' },
+        { type: 'resolution', name: 'Resolution', icon: 'fas fa-expand' },
+        { type: 'switching', name: 'Switching', icon: 'fas fa-random' },
+        { type: 'streaming', name: 'Streaming', icon: 'fas fa-broadcast-tower' },
+        { type: 'graphics', name: 'Graphics', icon: 'fas fa-palette' }
+    ],
+    resourceRequirements: {
+        'camera': ['camera-operator'],
+        'video-switcher': ['v1-video-tech'],
+        'graphics-computer': ['graphics-operator'],
+        'streaming-encoder': ['v1-video-tech'],
+        'recorder': ['v2-video-tech'],
+        'screen': ['v2-video-tech'],
+        'power-distro': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'v1-video-tech', name: 'V1 Video Tech', icon: 'fas fa-video', description: 'Lead video technician' },
+        { id: 'v2-video-tech', name: 'V2 Video Tech', icon: 'fas fa-video', description: 'Assistant video technician' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Video camera operator' },
+        { id: 'graphics-operator', name: 'Graphics Operator', icon: 'fas fa-palette', description: 'Graphics and overlay operator' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'video-designer', name: 'Video Designer', icon: 'fas fa-palette', description: 'Video design specialist' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Video Control', x: '80%', y: '5%', width: '15%', height: '30%' },
+            { name: 'Camera Position 1', x: '35%', y: '30%', width: '20%', height: '20%' },
+            { name: 'Camera Position 2', x: '60%', y: '30%', width: '15%', height: '20%' },
+            { name: 'Camera Position 3', x: '35%', y: '55%', width: '20%', height: '20%' }
+        ]
+    }
+};
@@ -0,0 +1,213 @@
+// Level video-3: Professional Broadcast Studio
+
+export default {
+    title: 'Professional Broadcast Studio',
+    category: 'video',
+    difficulty: 'advanced',
+    description: 'Set up complete professional broadcast studio with multi-camera production, graphics, and live streaming',
+    objectives: [
+        'Position professional broadcast cameras and robotic systems',
+        'Connect advanced video switcher with effects and graphics',
+        'Set up multi-format recording and streaming systems',
+        'Power all broadcast equipment with UPS backup',
+        'Create professional broadcast zones with proper workflow'
+    ],
+    equipment: [
+        {
+            type: 'camera',
+            name: 'Studio Camera A',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' },
+                { type: 'tally-in', position: 'back', label: 'Tally In' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Studio Camera B',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' },
+                { type: 'tally-in', position: 'back', label: 'Tally In' }
+            ]
+        },
+        {
+            type: 'camera',
+            name: 'Robotic Camera',
+            icon: 'fas fa-robot',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'sdi-out', position: 'back', label: 'SDI Out' },
+                { type: 'control-in', position: 'back', label: 'Control In' }
+            ]
+        },
+        {
+            type: 'video-switcher',
+            name: 'Professional Video Switcher',
+            icon: 'fas fa-random',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 1' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 2' },
+                { type: 'hdmi-in', position: 'back', label: 'Input 3' },
+                { type: 'hdmi-in', position: 'back', label: 'Graphics Input' },
+                { type: 'hdmi-in', position: 'back', label: 'VTR Input' },
+                { type: 'hdmi-out', position: 'front', label: 'Program Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Preview Out' },
+                { type: 'hdmi-out', position: 'front', label: 'Clean Out' }
+            ]
+        },
+        {
+            type: 'graphics-computer',
+            name: 'Graphics Workstation',
+            icon: 'fas fa-desktop',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'vtr',
+            name: 'Video Tape Recorder',
+            icon: 'fas fa-video',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' }
+            ]
+        },
+        {
+            type: 'streaming-encoder',
+            name: 'Multi-Stream Encoder',
+            icon: 'fas fa-broadcast-tower',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'ethernet-out', position: 'back', label: 'Network Out' }
+            ]
+        },
+        {
+            type: 'recorder',
+            name: 'Multi-Format Recorder',
+            icon: 'fas fa-hdd',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'power-in', position: 'left', label: 'Power In' },
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'hdmi-out', position: 'back', label: 'HDMI Out' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Program Monitor',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'screen',
+            name: 'Preview Monitor',
+            icon: 'fas fa-tv',
+            quantity: 1,
+            requiresPower: true,
+            connectors: [
+                { type: 'hdmi-in', position: 'back', label: 'HDMI In' },
+                { type: 'power-in', position: 'left', label: 'Power In' }
+            ]
+        },
+        {
+            type: 'ups',
+            name: 'Uninterruptible Power Supply',
+            icon: 'fas fa-battery-full',
+            quantity: 1,
+            requiresPower: false,
+            connectors: [
+                { type: 'power-out', position: 'right', label: 'UPS Out 1' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 2' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 3' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 4' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 5' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 6' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 7' },
+                { type: 'power-out', position: 'right', label: 'UPS Out 8' }
+            ]
+        }
+    ],
+    connections: [
+        { type: 'power-cable', name: 'Power Cable', icon: 'fas fa-plug', quantity: 10, color: '#ff4757' },
+        { type: 'hdmi-cable', name: 'HDMI Cable', icon: 'fas fa-plug', quantity: 15, color: '#00ccff' },
+        { type: 'ethernet-cable', name: 'Ethernet Cable', icon: 'fas fa-plug', quantity: 2, color: '#ffa502' }
+    ],
+    validConnections: [
+        { from: 'power-out', to: 'power-in', cable: 'power-cable', animation: 'power-glow' },
+        { from: 'hdmi-out', to: 'hdmi-in', cable: 'hdmi-cable', animation: 'video-pulse' },
+        { from: 'ethernet-out', to: 'ethernet-in', cable: 'ethernet-cable', animation: 'network-pulse' }
+    ],
+    settings: [
+        { type: 'brightness', name: 'Brightness', icon: 'fas fa-sliders-h' },
+        { type: 'resolution', name: 'Resolution', icon: 'fas fa-expand' },
+        { type: 'switching', name: 'Switching', icon: 'fas fa-random' },
+        { type: 'streaming', name: 'Streaming', icon: 'fas fa-broadcast-tower' },
+        { type: 'graphics', name: 'Graphics', icon: 'fas fa-palette' },
+        { type: 'recording', name: 'Recording', icon: 'fas fa-hdd' },
+        { type: 'robotic', name: 'Robotic Control', icon: 'fas fa-robot' }
+    ],
+    resourceRequirements: {
+        'camera': ['camera-operator'],
+        'video-switcher': ['v1-video-tech'],
+        'graphics-computer': ['graphics-operator'],
+        'vtr': ['v2-video-tech'],
+        'streaming-encoder': ['v1-video-tech'],
+        'recorder': ['v2-video-tech'],
+        'screen': ['v2-video-tech'],
+        'ups': ['stage-hand']
+    },
+    availableResources: [
+        { id: 'v1-video-tech', name: 'V1 Video Tech', icon: 'fas fa-video', description: 'Lead video technician' },
+        { id: 'v2-video-tech', name: 'V2 Video Tech', icon: 'fas fa-video', description: 'Assistant video technician' },
+        { id: 'camera-operator', name: 'Camera Operator', icon: 'fas fa-camera', description: 'Video camera operator' },
+        { id: 'graphics-operator', name: 'Graphics Operator', icon: 'fas fa-palette', description: 'Graphics and overlay operator' },
+        { id: 'stage-hand', name: 'Stage Hand', icon: 'fas fa-hard-hat', description: 'Stage setup and maintenance' },
+        { id: 'grip', name: 'Grip', icon: 'fas fa-tools', description: 'Equipment setup specialist' },
+        { id: 'stage-manager', name: 'Stage Manager', icon: 'fas fa-clipboard-list', description: 'Stage coordination' },
+        { id: 'video-designer', name: 'Video Designer', icon: 'fas fa-palette', description: 'Video design specialist' }
+    ], stageSetup: {
+        width: '100%',
+        height: '100%',
+        zones: [
+            { name: 'Stage Front', x: '5%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Stage Back', x: '5%', y: '30%', width: '25%', height: '20%' },
+            { name: 'FOH Position', x: '35%', y: '5%', width: '25%', height: '20%' },
+            { name: 'Power Station', x: '5%', y: '55%', width: '25%', height: '20%' },
+            { name: 'Video Control', x: '80%', y: '5%', width: '15%', height: '30%' },
+            { name: 'Camera Position 1', x: '35%', y: '30%', width: '20%', height: '20%' },
+            { name: 'Camera Position 2', x: '60%', y: '30%', width: '15%', height: '20%' },
+            { name: 'Camera Position 3', x: '35%', y: '55%', width: '20%', height: '20%' }
+        ]
+    }
+};
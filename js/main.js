@@ -7,6 +7,7 @@ import { getLevelData } from './data/LevelData.js';
 import { getConnectorColor, saveToStorage, loadFromStorage } from './utils/Helpers.js';
 import { AuthManager } from './modules/AuthManager.js';
 import { TutorialManager } from './modules/TutorialManager.js';
+import { logger } from './utils/Logger.js';
 
 // Global game instance
 let game = null;
@@ -15,20 +16,20 @@ let game = null;
  * Validate that all required modules are loaded
  */
 function validateModules() {
-    console.log('🔍 Validating modules...');
+    logger.debug('🔍 Validating modules...');
 
     try {
         // Test GameEngine - just check if it's a function
         if (typeof AVMasterGame !== 'function') {
             throw new Error('GameEngine module not loaded properly');
         }
-        console.log('✓ GameEngine module validated');
+        logger.debug('✓ GameEngine module validated');
 
         // Test LevelData - just check if function exists, don't call it yet
         if (typeof getLevelData !== 'function') {
             throw new Error('LevelData module not loaded properly');
         }
-        console.log('✓ LevelData module validated');
+        logger.debug('✓ LevelData module validated');
 
         // Test Helpers - just check if functions exist
         if (typeof getConnectorColor !== 'function' ||
@@ -36,11 +37,11 @@ function validateModules() {
             typeof loadFromStorage !== 'function') {
             throw new Error('Helpers module not loaded properly');
         }
-        console.log('✓ Helpers module validated');
+        logger.debug('✓ Helpers module validated');
 
         return true;
     } catch (error) {
-        console.error('❌ Module validation failed:', error);
+        logger.error('❌ Module validation failed:', error);
         return false;
     }
 }
@@ -49,7 +50,7 @@ function validateModules() {
  * Validate DOM elements are present
  */
 function validateDOM() {
-    console.log('🔍 Validating DOM elements...');
+    logger.debug('🔍 Validating DOM elements...');
 
     const requiredElements = [
         'loading-screen',
@@ -72,11 +73,11 @@ function validateDOM() {
     }
 
     if (missingElements.length > 0) {
-        console.error('❌ Missing DOM elements:', missingElements);
+        logger.error('❌ Missing DOM elements:', missingElements);
         return false;
     }
 
-    console.log('✓ All required DOM elements found');
+    logger.debug('✓ All required DOM elements found');
     return true;
 }
 
@@ -84,88 +85,88 @@ function validateDOM() {
  * Initialize the game with proper loading sequence
  */
 async function initializeGame() {
-    console.log('🚀 AV Master Game - Starting initialization...');
+    logger.debug('🚀 AV Master Game - Starting initialization...');
 
     try {
         // Step 1: Validate modules (just function existence)
-        console.log('\n📦 Step 1: Validating modules...');
+        logger.debug('\n📦 Step 1: Validating modules...');
         if (!validateModules()) {
             throw new Error('Module validation failed');
         }
-        console.log('✅ Step 1 complete: All modules validated');
+        logger.debug('✅ Step 1 complete: All modules validated');
 
         // Step 2: Validate DOM
-        console.log('\n🏗️ Step 2: Validating DOM...');
+        logger.debug('\n🏗️ Step 2: Validating DOM...');
         if (!validateDOM()) {
             throw new Error('DOM validation failed');
         }
-        console.log('✅ Step 2 complete: All DOM elements validated');
+        logger.debug('✅ Step 2 complete: All DOM elements validated');
 
         // Step 3: Initialize authentication
-        console.log('\n🔐 Step 3: Initializing authentication...');
+        logger.debug('\n🔐 Step 3: Initializing authentication...');
         window.authManager = new AuthManager();
-        console.log('✅ Step 3 complete: Authentication initialized');
+        logger.debug('✅ Step 3 complete: Authentication initialized');
 
         // Step 3.5: Initialize tutorial system
-        console.log('\n📚 Step 3.5: Initializing tutorial system...');
+        logger.debug('\n📚 Step 3.5: Initializing tutorial system...');
         window.tutorialManager = new TutorialManager();
-        console.log('✅ Step 3.5 complete: Tutorial system initialized');
+        logger.debug('✅ Step 3.5 complete: Tutorial system initialized');
 
         // Step 4: Create game instance
-        console.log('\n🎮 Step 4: Creating game instance...');
+        logger.debug('\n🎮 Step 4: Creating game instance...');
         game = new AVMasterGame();
-        console.log('✅ Step 4 complete: Game instance created');
+        logger.debug('✅ Step 4 complete: Game instance created');
 
         // Step 5: Initialize game engine
-        console.log('\n⚙️ Step 5: Initializing game engine...');
-        console.log('🔍 DOM state before init:', {
+        logger.debug('\n⚙️ Step 5: Initializing game engine...');
+        logger.debug('🔍 DOM state before init:', {
             mainMenu: !!document.getElementById('main-menu'),
             startGameBtn: !!document.getElementById('start-game-btn'),
             currentScreen: document.querySelector('.screen.active')?.id
         });
         game.init();
-        console.log('✅ Step 5 complete: Game engine initialized');
-        console.log('🔍 DOM state after init:', {
+        logger.debug('✅ Step 5 complete: Game engine initialized');
+        logger.debug('🔍 DOM state after init:', {
             mainMenu: !!document.getElementById('main-menu'),
             startGameBtn: !!document.getElementById('start-game-btn'),
             currentScreen: document.querySelector('.screen.active')?.id
         });
 
         // Step 6: Setup global event listeners
-        console.log('\n🎯 Step 6: Setting up global event listeners...');
+        logger.debug('\n🎯 Step 6: Setting up global event listeners...');
         setupGlobalEventListeners();
-        console.log('✅ Step 6 complete: Global event listeners set up');
+        logger.debug('✅ Step 6 complete: Global event listeners set up');
 
         // Step 7: Make game globally accessible
-        console.log('\n🌐 Step 7: Making game globally accessible...');
+        logger.debug('\n🌐 Step 7: Making game globally accessible...');
         window.game = game;
-        console.log('✅ Step 7 complete: Game made globally accessible');
+        logger.debug('✅ Step 7 complete: Game made globally accessible');
 
         // Step 8: Test button clickability
-        console.log('\n🧪 Step 8: Testing button clickability...');
+        logger.debug('\n🧪 Step 8: Testing button clickability...');
         setTimeout(() => {
             const testBtn = document.getElementById('start-game-btn');
             if (testBtn) {
-                console.log('🔍 Adding direct test click listener...');
+                logger.debug('🔍 Adding direct test click listener...');
                 testBtn.onclick = (e) => {
-                    console.log('🧪 DIRECT CLICK DETECTED!');
+                    logger.debug('🧪 DIRECT CLICK DETECTED!');
                     e.preventDefault();
                     e.stopPropagation();
                 };
-                console.log('✅ Direct click listener added');
+                logger.debug('✅ Direct click listener added');
             } else {
-                console.log('❌ Test button not found in timeout');
+                logger.debug('❌ Test button not found in timeout');
             }
         }, 1000);
 
-        console.log('✅ Button testing setup complete');
+        logger.debug('✅ Button testing setup complete');
 
-        console.log('\n🎉 AV Master Game - Initialization completed successfully!');
+        logger.debug('\n🎉 AV Master Game - Initialization completed successfully!');
         return true;
 
     } catch (error) {
-        console.error('❌ Game initialization failed:', error);
-        console.error('Stack trace:', error.stack);
+        logger.error('❌ Game initialization failed:', error);
+        logger.error('Stack trace:', error.stack);
 
         // Show error message to user
         showInitializationError(error.message);
@@ -182,20 +183,20 @@ function setupGlobalEventListeners() {
     if (stageArea) {
         stageArea.addEventListener('dragover', (e) => game.handleDragOver(e));
         stageArea.addEventListener('drop', (e) => game.handleDrop(e));
-        console.log('✓ Stage area drag/drop events set up');
+        logger.debug('✓ Stage area drag/drop events set up');
     }
 
     // Connector click events are handled by the game engine via event delegation
-    console.log('✓ Connector click events will be set up by game engine');
+    logger.debug('✓ Connector click events will be set up by game engine');
 
     // Setup global event listener for testing challenge button
     document.addEventListener('click', (e) => {
         if (e.target && e.target.id === 'testing-challenge-btn') {
-            console.log('🔬 Global testing challenge button clicked!');
+            logger.debug('🔬 Global testing challenge button clicked!');
             if (game && typeof game.startTestingChallenges === 'function') {
                 game.startTestingChallenges();
             } else {
-                console.error('❌ Game or startTestingChallenges not available');
+                logger.error('❌ Game or startTestingChallenges not available');
             }
         }
     });
@@ -235,7 +236,7 @@ function setupKeyboardShortcuts() {
         }
     });
 
-    console.log('✓ Keyboard shortcuts set up (Ctrl+Shift+U: Unlock All, Ctrl+Shift+N: Lock/Reset)');
+    logger.debug('✓ Keyboard shortcuts set up (Ctrl+Shift+U: Unlock All, Ctrl+Shift+N: Lock/Reset)');
 }
 
 /**
@@ -243,7 +244,7 @@ function setupKeyboardShortcuts() {
  */
 function unlockAllLevels() {
     if (!game) {
-        console.warn('⚠️ Game not initialized yet');
+        logger.warn('⚠️ Game not initialized yet');
         return;
     }
 
@@ -260,13 +261,13 @@ function unlockAllLevels() {
             game.updateLevelSelectionUI();
         }
 
-        console.log('🎉 All levels unlocked for testing!');
-        console.log('📋 Unlocked levels:', game.gameState.unlockedLevels);
+        logger.debug('🎉 All levels unlocked for testing!');
+        logger.debug('📋 Unlocked levels:', game.gameState.unlockedLevels);
 
         // Show a brief notification
         showNotification('All levels unlocked for testing!', 'success');
     }).catch(error => {
-        console.error('❌ Failed to unlock levels:', error);
+        logger.error('❌ Failed to unlock levels:', error);
         showNotification('Failed to unlock levels', 'error');
     });
 }
@@ -276,7 +277,7 @@ function unlockAllLevels() {
  */
 function resetGameState() {
     if (!game) {
-        console.warn('⚠️ Game not initialized yet');
+        logger.warn('⚠️ Game not initialized yet');
         return;
     }
 
@@ -303,7 +304,7 @@ function resetGameState() {
         game.updateLevelSelectionUI();
     }
 
-    console.log('🔄 Game state reset to initial state');
+    logger.debug('🔄 Game state reset to initial state');
     showNotification('Game state reset', 'info');
 }
 
@@ -402,7 +403,7 @@ function cleanup() {
 
 // Initialize the game when the DOM is loaded
 document.addEventListener('DOMContentLoaded', () => {
-    console.log('📄 DOM Content Loaded - Starting game initialization...');
+    logger.debug('📄 DOM Content Loaded - Starting game initialization...');
     initializeGame();
 });
 
@@ -413,10 +414,10 @@ window.addEventListener('beforeunload', cleanup);
 document.addEventListener('visibilitychange', () => {
     if (game) {
         if (document.hidden) {
-            console.log('⏸️ Page hidden - pausing game');
+            logger.debug('⏸️ Page hidden - pausing game');
             game.pauseGame();
         } else {
-            console.log('▶️ Page visible - resuming game');
+            logger.debug('▶️ Page visible - resuming game');
             game.resumeGame();
         }
     }
@@ -2,6 +2,7 @@
 // Handles AI chat functionality, voice recognition, and equipment information display
 
 import { config } from '../config.js';
+import { logger } from '../utils/Logger.js';
 
 export class AITutor {
     constructor() {
@@ -15,6 +16,8 @@ export class AITutor {
         this.backendUrl = config.BACKEND_URL; // Backend API URL
         this.linkPreviewQueue = []; // Queue for link preview requests
         this.isProcessingLinkPreview = false;
+        this.speechGeneration = 0; // Bumped whenever queued speech is cancelled
+        this.pendingUtterances = 0; // Queued utterances of the current generation
         this.currentLanguage = 'en'; // Default language
         this.languageMap = {
             'en': {
@@ -166,7 +169,7 @@ export class AITutor {
         this.setupVoiceRecognition();
         this.setupEventListeners();
         this.initializeVoices();
-        console.log('🤖 AI Tutor initialized');
+        logger.debug('🤖 AI Tutor initialized');
     }
 
     initializeVoices() {
@@ -175,7 +178,7 @@ export class AITutor {
             // Some browsers need time to load voices
             const loadVoices = () => {
                 const voices = this.synthesis.getVoices();
-                console.log('🎤 Available voices:', voices.length);
+                logger.debug('🎤 Available voices:', voices.length);
 
                 // Group voices by language for better debugging
                 const voicesByLang = {};
@@ -189,7 +192,7 @@ export class AITutor {
 
                 // Log voices grouped by language
                 Object.keys(voicesByLang).forEach(lang => {
-                    console.log(`🎤 ${lang} voices (${voicesByLang[lang].length}):`,
+                    logger.debug(`🎤 ${lang} voices (${voicesByLang[lang].length}):`,
                         voicesByLang[lang].map(v => v.name).join(', '));
                 });
 
@@ -198,7 +201,7 @@ export class AITutor {
                     const currentLang = this.languageMap[this.currentLanguage];
                     const bestVoice = this.findBestVoiceForLanguage(voices, currentLang);
                     if (bestVoice) {
-                        console.log('🎤 Best voice for current language:', bestVoice.name, bestVoice.lang);
+                        logger.debug('🎤 Best voice for current language:', bestVoice.name, bestVoice.lang);
                     }
                 }
             };
@@ -221,29 +224,29 @@ export class AITutor {
             this.recognition.lang = this.languageMap[this.currentLanguage].code;
 
             this.recognition.onstart = () => {
-                console.log('🎤 Voice recognition started');
+                logger.debug('🎤 Voice recognition started');
                 this.showVoiceStatus('Listening...');
             };
 
             this.recognition.onresult = (event) => {
                 const transcript = event.results[0][0].transcript;
-                console.log('🎤 Voice input:', transcript);
+                logger.debug('🎤 Voice input:', transcript);
                 this.handleVoiceInput(transcript);
             };
 
             this.recognition.onerror = (event) => {
-                console.error('🎤 Voice recognition error:', event.error);
+                logger.error('🎤 Voice recognition error:', event.error);
                 this.hideVoiceStatus();
             };
 
             this.recognition.onend = () => {
-                console.log('🎤 Voice recognition ended');
+                logger.debug('🎤 Voice recognition ended');
                 this.hideVoiceStatus();
                 // Only restart if still in voice mode and not paused by AI speaking
                 // The resumeVoiceRecognition function will handle restarting when needed
             };
         } else {
-            console.warn('🎤 Voice recognition not supported in this browser');
+            logger.warn('🎤 Voice recognition not supported in this browser');
         }
     }
 
@@ -252,7 +255,7 @@ export class AITutor {
         const aiTutorToggle = document.getElementById('ai-tutor-toggle');
         if (aiTutorToggle) {
             aiTutorToggle.addEventListener('click', () => this.toggleAITutor().catch(error => {
-                console.error('🤖 Error toggling AI Tutor:', error);
+                logger.error('🤖 Error toggling AI Tutor:', error);
             }));
         }
 
@@ -316,7 +319,7 @@ export class AITutor {
 
             // Focus the input when AI tutor is opened
             aiChatInput.addEventListener('focus', () => {
-                console.log('🤖 Chat input focused');
+                logger.debug('🤖 Chat input focused');
             });
         }
 
@@ -375,7 +378,7 @@ export class AITutor {
                     const testResponse = await this.callBackendAPI('Hello, please introduce yourself as AVA');
                     this.addAIMessage(testResponse);
                 } catch (error) {
-                    console.error('🤖 Backend test failed:', error);
+                    logger.error('🤖 Backend test failed:', error);
                     this.addAIMessage('Backend connection failed. Please check the server.');
                 }
             }
@@ -389,7 +392,7 @@ export class AITutor {
         for (const preferredVoiceName of languageConfig.preferredVoices) {
             selectedVoice = voices.find(voice => voice.name === preferredVoiceName);
             if (selectedVoice) {
-                console.log('🎤 Found preferred voice for', languageConfig.name, ':', selectedVoice.name);
+                logger.debug('🎤 Found preferred voice for', languageConfig.name, ':', selectedVoice.name);
                 return selectedVoice;
             }
         }
@@ -398,7 +401,7 @@ export class AITutor {
         for (const fluentCode of languageConfig.fluentLanguageCodes) {
             selectedVoice = voices.find(voice => voice.lang === fluentCode);
             if (selectedVoice) {
-                console.log('🎤 Found fluent language code match for', languageConfig.name, ':', selectedVoice.name, '(', selectedVoice.lang, ')');
+                logger.debug('🎤 Found fluent language code match for', languageConfig.name, ':', selectedVoice.name, '(', selectedVoice.lang, ')');
                 return selectedVoice;
             }
         }
@@ -407,7 +410,7 @@ export class AITutor {
         const languageCode = languageConfig.voice;
         selectedVoice = voices.find(voice => voice.lang === languageCode);
         if (selectedVoice) {
-            console.log('🎤 Found exact language match for', languageConfig.name, ':', selectedVoice.name, '(', selectedVoice.lang, ')');
+            logger.debug('🎤 Found exact language match for', languageConfig.name, ':', selectedVoice.name, '(', selectedVoice.lang, ')');
             return selectedVoice;
         }
 
@@ -433,13 +436,13 @@ export class AITutor {
             });
 
             if (selectedVoice) {
-                console.log('🎤 Found explicit language voice for', languageConfig.name, ':', selectedVoice.name, '(', selectedVoice.lang, ')');
+                logger.debug('🎤 Found explicit language voice for', languageConfig.name, ':', selectedVoice.name, '(', selectedVoice.lang, ')');
                 return selectedVoice;
             }
 
             // If no fluent voice found for non-English language, DO NOT fall back to English
             // Instead, inform the user that no fluent voice is available
-            console.warn('🎤 No fluent voice available for', languageConfig.name, '- will use text-only mode');
+            logger.warn('🎤 No fluent voice available for', languageConfig.name, '- will use text-only mode');
             return null;
         }
 
@@ -448,7 +451,7 @@ export class AITutor {
             // Try to find any English voice
             selectedVoice = voices.find(voice => voice.lang.startsWith('en-'));
             if (selectedVoice) {
-                console.log('🎤 Found English fallback voice:', selectedVoice.name, '(', selectedVoice.lang, ')');
+                logger.debug('🎤 Found English fallback voice:', selectedVoice.name, '(', selectedVoice.lang, ')');
                 return selectedVoice;
             }
         }
@@ -456,17 +459,17 @@ export class AITutor {
         // Step 6: Last resort - only for English, use any available voice
         if (languageConfig.name === 'English' && voices.length > 0) {
             selectedVoice = voices[0];
-            console.log('🎤 Using last resort voice for English:', selectedVoice.name, '(', selectedVoice.lang, ')');
+            logger.debug('🎤 Using last resort voice for English:', selectedVoice.name, '(', selectedVoice.lang, ')');
             return selectedVoice;
         }
 
-        console.warn('🎤 No suitable voice found for', languageConfig.name);
+        logger.warn('🎤 No suitable voice found for', languageConfig.name);
         return null;
     }
 
     changeLanguage(languageCode) {
         this.currentLanguage = languageCode;
-        console.log('🌍 Language changed to:', this.languageMap[languageCode].name);
+        logger.debug('🌍 Language changed to:', this.languageMap[languageCode].name);
 
         // Update voice recognition language
         if (this.recognition) {
@@ -518,7 +521,7 @@ export class AITutor {
             try {
                 this.recognition.start();
             } catch (error) {
-                console.error('🎤 Error starting voice recognition:', error);
+                logger.error('🎤 Error starting voice recognition:', error);
             }
         }
     }
@@ -528,7 +531,7 @@ export class AITutor {
             try {
                 this.recognition.stop();
             } catch (error) {
-                console.error('🎤 Error stopping voice recognition:', error);
+                logger.error('🎤 Error stopping voice recognition:', error);
             }
         }
     }
@@ -536,10 +539,10 @@ export class AITutor {
     pauseVoiceRecognition() {
         if (this.recognition && this.isVoiceMode && this.isActive) {
             try {
-                console.log('🎤 Pausing voice recognition to prevent feedback loop');
+                logger.debug('🎤 Pausing voice recognition to prevent feedback loop');
                 this.recognition.stop();
             } catch (error) {
-                console.error('🎤 Error pausing voice recognition:', error);
+                logger.error('🎤 Error pausing voice recognition:', error);
             }
         }
     }
@@ -547,13 +550,13 @@ export class AITutor {
     resumeVoiceRecognition() {
         if (this.recognition && this.isVoiceMode && this.isActive) {
             try {
-                console.log('🎤 Resuming voice recognition');
+                logger.debug('🎤 Resuming voice recognition');
                 // Add a small delay to ensure speech is completely finished
                 setTimeout(() => {
                     this.recognition.start();
                 }, 500);
             } catch (error) {
-                console.error('🎤 Error resuming voice recognition:', error);
+                logger.error('🎤 Error resuming voice recognition:', error);
             }
         }
     }
@@ -587,47 +590,6 @@ export class AITutor {
         this.chatHistory.push({ role: 'user', content: message });
     }
 
-    addAIMessage(message) {
-        const chatMessages = document.getElementById('ai-chat-messages');
-        const aiMessage = document.createElement('div');
-        aiMessage.className = 'ai-message';
-
-        // Check if message contains URLs
-        const urls = this.extractUrls(message);
-        const hasUrls = urls.length > 0;
-
-        // Format the message for better readability (display version)
-        const formattedMessage = this.formatMessageForDisplay(message);
-
-        // Create clean version for speech synthesis
-        const speechText = this.formatMessageForSpeech(message);
-
-        aiMessage.innerHTML = `
-            <div class="ai-avatar">
-                <i class="fas fa-robot"></i>
-            </div>
-            <div class="ai-message-content">
-                <div class="ai-message-text">${formattedMessage}</div>
-                ${hasUrls ? this.createWebContentSection(urls) : ''}
-            </div>
-        `;
-
-        chatMessages.appendChild(aiMessage);
-        chatMessages.scrollTop = chatMessages.scrollHeight;
-
-        this.chatHistory.push({ role: 'assistant', content: message });
-
-        // Speak the cleaned response if in voice mode
-        if (this.isVoiceMode && speechText) {
-            this.speakMessage(speechText);
-        }
-
-        // Expand chat window if URLs are present
-        if (hasUrls) {
-            this.expandChatForWebContent();
-        }
-    }
-
     async processAIResponse(userMessage) {
         // Show progress spinner
         this.showProgressSpinner();
@@ -645,21 +607,37 @@ export class AITutor {
             this.addTypingIndicator();
         }
 
+        // Regular chat replies stream in: the message appears with the first token
+        let streamingMessage = null;
+        const onToken = (delta) => {
+            if (!streamingMessage) {
+                this.removeTypingIndicator();
+                streamingMessage = this.addAIMessage('', { streaming: true });
+            }
+            streamingMessage.append(delta);
+        };
+
         try {
+            // Generate AI response using hybrid approach
+            const response = await this.generateAIResponse(userMessage, { onToken });
+
             // Remove all indicators
             this.removeTypingIndicator();
             this.removeWebSearchIndicator();
             this.removePricingSearchIndicator();
 
-            // Generate AI response using hybrid approach
-            const response = await this.generateAIResponse(userMessage);
-            this.addAIMessage(response);
+            if (streamingMessage) {
+                streamingMessage.finish(response);
+            } else {
+                this.addAIMessage(response);
+            }
 
         } catch (error) {
-            console.error('🤖 Error processing AI response:', error);
+            logger.error('🤖 Error processing AI response:', error);
             this.removeTypingIndicator();
             this.removeWebSearchIndicator();
             this.removePricingSearchIndicator();
+            streamingMessage?.finish();
             this.addAIMessage('Error processing your request. Please try again.');
         } finally {
             // Always hide progress spinner
@@ -667,13 +645,13 @@ export class AITutor {
         }
     }
 
-    async generateAIResponse(userMessage) {
+    async generateAIResponse(userMessage, { onToken = null } = {}) {
         try {
             // Check if the message requires pricing search first
             const needsPricingSearch = this.detectPricingSearchNeeded(userMessage);
 
             if (needsPricingSearch) {
-                console.log('💰 Pricing search detected, using specialized pricing search');
+                logger.debug('💰 Pricing search detected, using specialized pricing search');
                 return await this.callPricingSearchAPI(userMessage);
             }
 
@@ -681,14 +659,14 @@ export class AITutor {
             const needsWebSearch = this.detectWebSearchNeeded(userMessage);
 
             if (needsWebSearch) {
-                console.log('🌐 Web search detected, using real web search with GPT-4o');
+                logger.debug('🌐 Web search detected, using real web search with GPT-4o');
                 return await this.callWebSearchAPI(userMessage);
             } else {
-                console.log('💬 Regular conversation, using GPT-4o for voice');
-                return await this.callBackendAPI(userMessage);
+                logger.debug('💬 Regular conversation, using GPT-4o for voice');
+                return await this.callBackendAPI(userMessage, { onToken });
             }
         } catch (error) {
-            console.error('🤖 Error generating AI response:', error);
+            logger.error('🤖 Error generating AI response:', error);
             throw new Error(`AI service unavailable: ${error.message}`);
         }
     }
@@ -759,15 +737,21 @@ export class AITutor {
         return pricingKeywords.some(keyword => lowerMessage.includes(keyword)) || hasPricingPatterns;
     }
 
-    async callBackendAPI(userMessage) {
+    /**
+     * Send a chat message to the backend and resolve with the full reply.
+     * With onToken the reply is streamed as server-sent events and onToken is
+     * called with each text delta as it arrives.
+     */
+    async callBackendAPI(userMessage, { onToken = null } = {}) {
         const backendUrl = this.backendUrl || ''; // Backend API URL
-        console.log('🤖 Attempting to call backend API...');
+        const stream = !!onToken && config.AI_STREAMING !== false;
+        logger.debug('🤖 Attempting to call backend API...');
 
         try {
             // Get current conversation ID or start new one
             let conversationId = this.currentConversationId;
             if (!conversationId) {
-                console.log('🤖 Starting new conversation...');
+                logger.debug('🤖 Starting new conversation...');
                 const sessionResponse = await fetch(`${backendUrl}/api/ai/conversation/start`, {
                     method: 'POST',
                     headers: {
@@ -778,20 +762,20 @@ export class AITutor {
                     })
                 });
 
-                console.log('🤖 Session response status:', sessionResponse.status);
+                logger.debug('🤖 Session response status:', sessionResponse.status);
                 if (!sessionResponse.ok) {
                     const errorText = await sessionResponse.text();
-                    console.error('🤖 Session response error:', errorText);
+                    logger.error('🤖 Session response error:', errorText);
                     throw new Error(`Failed to start conversation: ${sessionResponse.status} ${errorText}`);
                 }
 
                 const sessionData = await sessionResponse.json();
-                console.log('🤖 Session data:', sessionData);
+                logger.debug('🤖 Session data:', sessionData);
                 conversationId = sessionData.conversation_id;
                 this.currentConversationId = conversationId;
             }
 
-            console.log('🤖 Sending message to backend with conversation ID:', conversationId);
+            logger.debug('🤖 Sending message to backend with conversation ID:', conversationId);
             // Send message to backend
             const response = await fetch(`${backendUrl}/api/ai/chat`, {
                 method: 'POST',
@@ -802,36 +786,84 @@ export class AITutor {
                     message: userMessage,
                     conversationId: conversationId,
                     equipmentContext: this.currentEquipment || null,
-                    language: this.currentLanguage
+                    language: this.currentLanguage,
+                    stream
                 })
             });
 
-            console.log('🤖 Chat response status:', response.status);
+            logger.debug('🤖 Chat response status:', response.status);
             if (!response.ok) {
                 const errorText = await response.text();
-                console.error('🤖 Chat response error:', errorText);
+                logger.error('🤖 Chat response error:', errorText);
                 throw new Error(`Backend API error: ${response.status} ${errorText}`);
             }
 
+            if (stream && (response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+                return await this.readChatStream(response, onToken);
+            }
+
             const data = await response.json();
-            console.log('🤖 Chat response data:', data);
+            logger.debug('🤖 Chat response data:', data);
             return data.response;
 
         } catch (error) {
-            console.error('🤖 Backend API call failed:', error);
+            logger.error('🤖 Backend API call failed:', error);
             throw new Error(`Backend API unavailable: ${error.message}`);
         }
     }
 
+    /**
+     * Read a streamed /api/ai/chat response (token, done and error events)
+     * and resolve with the full reply text.
+     */
+    async readChatStream(response, onToken) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const startTime = performance.now();
+        let buffer = '';
+        let reply = '';
+        let firstTokenAt = null;
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const frame = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                const event = /^event: (.*)$/m.exec(frame)?.[1];
+                const data = JSON.parse(/^data: (.*)$/m.exec(frame)?.[1] || 'null');
+
+                if (event === 'token') {
+                    if (firstTokenAt === null) {
+                        firstTokenAt = performance.now();
+                        logger.info(`🤖 First token after ${Math.round(firstTokenAt - startTime)}ms`);
+                    }
+                    reply += data.content;
+                    onToken(data.content);
+                } else if (event === 'done') {
+                    logger.debug('🤖 Chat stream complete:', data);
+                } else if (event === 'error') {
+                    throw new Error(data?.message || 'AI stream failed');
+                }
+            }
+        }
+
+        return reply;
+    }
+
     async callWebSearchAPI(userMessage) {
         const backendUrl = this.backendUrl || ''; // Backend API URL
-        console.log('🌐 Attempting web search with GPT-5...');
+        logger.debug('🌐 Attempting web search with GPT-5...');
 
         try {
             // Get current conversation ID or start new one
             let conversationId = this.currentConversationId;
             if (!conversationId) {
-                console.log('🌐 Starting new conversation for web search...');
+                logger.debug('🌐 Starting new conversation for web search...');
                 const sessionResponse = await fetch(`${backendUrl}/api/ai/conversation/start`, {
                     method: 'POST',
                     headers: {
@@ -842,20 +874,20 @@ export class AITutor {
                     })
                 });
 
-                console.log('🌐 Session response status:', sessionResponse.status);
+                logger.debug('🌐 Session response status:', sessionResponse.status);
                 if (!sessionResponse.ok) {
                     const errorText = await sessionResponse.text();
-                    console.error('🌐 Session response error:', errorText);
+                    logger.error('🌐 Session response error:', errorText);
                     throw new Error(`Failed to start conversation: ${sessionResponse.status} ${errorText}`);
                 }
 
                 const sessionData = await sessionResponse.json();
-                console.log('🌐 Session data:', sessionData);
+                logger.debug('🌐 Session data:', sessionData);
                 conversationId = sessionData.conversation_id;
                 this.currentConversationId = conversationId;
             }
 
-            console.log('🌐 Sending web search request with conversation ID:', conversationId);
+            logger.debug('🌐 Sending web search request with conversation ID:', conversationId);
 
             // Send web search request to backend
             const response = await fetch(`${backendUrl}/api/ai/web-search`, {
@@ -870,32 +902,32 @@ export class AITutor {
                 })
             });
 
-            console.log('🌐 Web search response status:', response.status);
+            logger.debug('🌐 Web search response status:', response.status);
             if (!response.ok) {
                 const errorText = await response.text();
-                console.error('🌐 Web search response error:', errorText);
+                logger.error('🌐 Web search response error:', errorText);
                 throw new Error(`Web search API error: ${response.status} ${errorText}`);
             }
 
             const data = await response.json();
-            console.log('🌐 Web search response data:', data);
+            logger.debug('🌐 Web search response data:', data);
             return data.response;
 
         } catch (error) {
-            console.error('🌐 Web search API call failed:', error);
+            logger.error('🌐 Web search API call failed:', error);
             throw new Error(`Web search API unavailable: ${error.message}`);
         }
     }
 
     async callPricingSearchAPI(userMessage) {
         const backendUrl = this.backendUrl || ''; // Backend API URL
-        console.log('💰 Attempting pricing search...');
+        logger.debug('💰 Attempting pricing search...');
 
         try {
             // Get current conversation ID or start new one
             let conversationId = this.currentConversationId;
             if (!conversationId) {
-                console.log('💰 Starting new conversation for pricing search...');
+                logger.debug('💰 Starting new conversation for pricing search...');
                 const sessionResponse = await fetch(`${backendUrl}/api/ai/conversation/start`, {
                     method: 'POST',
                     headers: {
@@ -906,20 +938,20 @@ export class AITutor {
                     })
                 });
 
-                console.log('💰 Session response status:', sessionResponse.status);
+                logger.debug('💰 Session response status:', sessionResponse.status);
                 if (!sessionResponse.ok) {
                     const errorText = await sessionResponse.text();
-                    console.error('💰 Session response error:', errorText);
+                    logger.error('💰 Session response error:', errorText);
                     throw new Error(`Failed to start conversation: ${sessionResponse.status} ${errorText}`);
                 }
 
                 const sessionData = await sessionResponse.json();
-                console.log('💰 Session data:', sessionData);
+                logger.debug('💰 Session data:', sessionData);
                 conversationId = sessionData.conversation_id;
                 this.currentConversationId = conversationId;
             }
 
-            console.log('💰 Sending pricing search request with conversation ID:', conversationId);
+            logger.debug('💰 Sending pricing search request with conversation ID:', conversationId);
 
             // Send pricing search request to backend
             const response = await fetch(`${backendUrl}/api/ai/pricing-search`, {
@@ -934,19 +966,19 @@ export class AITutor {
                 })
             });
 
-            console.log('💰 Pricing search response status:', response.status);
+            logger.debug('💰 Pricing search response status:', response.status);
             if (!response.ok) {
                 const errorText = await response.text();
-                console.error('💰 Pricing search response error:', errorText);
+                logger.error('💰 Pricing search response error:', errorText);
                 throw new Error(`Pricing search API error: ${response.status} ${errorText}`);
             }
 
             const data = await response.json();
-            console.log('💰 Pricing search response data:', data);
+            logger.debug('💰 Pricing search response data:', data);
             return data.response;
 
         } catch (error) {
-            console.error('💰 Pricing search API call failed:', error);
+            logger.error('💰 Pricing search API call failed:', error);
             throw new Error(`Pricing search API unavailable: ${error.message}`);
         }
     }
@@ -1113,7 +1145,7 @@ export class AITutor {
                 const response = await this.callBackendAPI(`I'm now working with a ${equipment.name} (${equipment.type}). Please introduce yourself and tell me about this equipment.`);
                 this.addAIMessage(response);
             } catch (error) {
-                console.error('🤖 Error getting equipment introduction:', error);
+                logger.error('🤖 Error getting equipment introduction:', error);
                 // No fallback - let the error propagate
                 throw error;
             }
@@ -1205,11 +1237,11 @@ export class AITutor {
     stopAISpeech() {
         if (this.synthesis) {
             try {
-                console.log('🎤 Stopping AI speech immediately');
+                logger.debug('🎤 Stopping AI speech immediately');
                 this.synthesis.cancel();
                 this.hideVoiceStatus();
             } catch (error) {
-                console.error('🎤 Error stopping AI speech:', error);
+                logger.error('🎤 Error stopping AI speech:', error);
             }
         }
     }
@@ -1259,7 +1291,7 @@ export class AITutor {
             return url.replace(/[.,;:!?)\]}>]+$/, '');
         });
 
-        console.log('Extracted URLs from text:', urls);
+        logger.debug('Extracted URLs from text:', urls);
         return urls;
     }
 
@@ -1308,9 +1340,10 @@ export class AITutor {
                 backendUrl
             });
 
-            // Start processing queue if not already processing
+            // Start processing once the section is in the DOM (the caller inserts
+            // this HTML synchronously), so all of a message's links go in one batch
             if (!this.isProcessingLinkPreview) {
-                this.processLinkPreviewQueue();
+                queueMicrotask(() => this.processLinkPreviewQueue());
             }
 
             return base;
@@ -1443,50 +1476,120 @@ export class AITutor {
         return speechText;
     }
 
-    addAIMessage(message) {
+    /**
+     * Add an AI reply to the chat. With streaming the message starts empty and
+     * the returned handle fills it in: append(delta) for each streamed chunk,
+     * finish(fullText) once the reply is complete. In voice mode each complete
+     * sentence is spoken as soon as it has arrived.
+     */
+    addAIMessage(message, { streaming = false } = {}) {
         const chatMessages = document.getElementById('ai-chat-messages');
         const aiMessage = document.createElement('div');
         aiMessage.className = 'ai-message';
 
-        // Check if message contains URLs
-        const urls = this.extractUrls(message);
-        const hasUrls = urls.length > 0;
-
-        // Format the message for better readability (display version)
-        const formattedMessage = this.formatMessageForDisplay(message);
-
-        // Create clean version for speech synthesis
-        const speechText = this.formatMessageForSpeech(message);
-
         aiMessage.innerHTML = `
             <div class="ai-avatar">
                 <i class="fas fa-robot"></i>
             </div>
             <div class="ai-message-content">
-                <div class="ai-message-text">${formattedMessage}</div>
-                ${hasUrls ? this.createWebContentSection(urls) : ''}
+                <div class="ai-message-text"></div>
             </div>
         `;
+        const messageText = aiMessage.querySelector('.ai-message-text');
 
         chatMessages.appendChild(aiMessage);
-        chatMessages.scrollTop = chatMessages.scrollHeight;
 
-        this.chatHistory.push({ role: 'assistant', content: message });
+        const complete = (fullText) => {
+            // Format the message for better readability (display version)
+            messageText.innerHTML = this.formatMessageForDisplay(fullText);
+
+            // Check if message contains URLs
+            const urls = this.extractUrls(fullText);
+            if (urls.length > 0) {
+                messageText.insertAdjacentHTML('afterend', this.createWebContentSection(urls));
+                // Expand chat window if URLs are present
+                this.expandChatForWebContent();
+            }
+
+            chatMessages.scrollTop = chatMessages.scrollHeight;
+            this.chatHistory.push({ role: 'assistant', content: fullText });
+        };
+
+        if (!streaming) {
+            complete(message);
 
-        // Speak the cleaned response if in voice mode
-        if (this.isVoiceMode && speechText) {
-            this.speakMessage(speechText);
+            // Speak the cleaned response if in voice mode
+            const speechText = this.formatMessageForSpeech(message);
+            if (this.isVoiceMode && speechText) {
+                this.speakMessage(speechText);
+            }
+            return null;
         }
 
-        // Expand chat window if URLs are present
-        if (hasUrls) {
-            this.expandChatForWebContent();
+        messageText.classList.add('streaming');
+        let text = message;
+        let spokenLength = 0;
+        let renderScheduled = false;
+        let finished = false;
+
+        // Re-render at most once per frame, however fast the chunks arrive
+        const render = () => {
+            renderScheduled = false;
+            if (finished) return;
+            messageText.innerHTML = this.formatMessageForDisplay(text);
+            chatMessages.scrollTop = chatMessages.scrollHeight;
+        };
+
+        const speakUpTo = (end) => {
+            if (!this.isVoiceMode || end <= spokenLength) return;
+            const speechText = this.formatMessageForSpeech(text.slice(spokenLength, end));
+            spokenLength = end;
+            if (speechText) {
+                // Queue behind the previous sentence instead of interrupting it
+                this.speakMessage(speechText, { queue: true });
+            }
+        };
+
+        return {
+            append: (delta) => {
+                if (finished) return;
+                text += delta;
+                speakUpTo(this.findSentenceEnd(text, spokenLength));
+                if (!renderScheduled) {
+                    renderScheduled = true;
+                    requestAnimationFrame(render);
+                }
+            },
+            finish: (fullText = text) => {
+                if (finished) return;
+                text = fullText;
+                speakUpTo(text.length);
+                finished = true;
+                messageText.classList.remove('streaming');
+                complete(text);
+            }
+        };
+    }
+
+    /**
+     * End of the last complete sentence in text after position from (from
+     * itself when there is none yet). List numbers like "1." do not count.
+     */
+    findSentenceEnd(text, from) {
+        const boundary = /[.!?]+["')\]]*(?=\s)|\n\s*\n/g;
+        boundary.lastIndex = from;
+        let end = from;
+        let match;
+        while ((match = boundary.exec(text))) {
+            if (match[0][0] === '.' && /\d/.test(text[match.index - 1] || '')) continue;
+            end = match.index + match[0].length;
         }
+        return end;
     }
 
-    speakMessage(message) {
+    speakMessage(message, { queue = false } = {}) {
         if (this.synthesis && this.isVoiceMode) {
-            this.speakWithSettings(message);
+            this.speakWithSettings(message, null, undefined, undefined, undefined, { queue });
         }
     }
 
@@ -1496,7 +1599,13 @@ export class AITutor {
         }
     }
 
-    speakWithSettings(message, voiceName = null, rate = 0.85, pitch = 1.1, volume = 0.9) {
+    /**
+     * Speak a message with the best voice for the current language. By default
+     * any current speech is cancelled first; with queue the utterance plays
+     * after the ones already queued (streamed replies speak sentence by
+     * sentence). Voice recognition stays paused until the last one ends.
+     */
+    speakWithSettings(message, voiceName = null, rate = 0.85, pitch = 1.1, volume = 0.9, { queue = false } = {}) {
         if (!this.synthesis) return;
 
         // Get available voices and select the best one
@@ -1517,10 +1626,10 @@ export class AITutor {
         // Set voice if found
         if (selectedVoice) {
             utterance.voice = selectedVoice;
-            console.log('🎤 Using voice:', selectedVoice.name, 'for', this.languageMap[this.currentLanguage].name);
+            logger.debug('🎤 Using voice:', selectedVoice.name, 'for', this.languageMap[this.currentLanguage].name);
         } else {
             // No fluent voice available for this language
-            console.warn('🎤 No fluent voice available for', this.languageMap[this.currentLanguage].name, '- using text-only mode');
+            logger.warn('🎤 No fluent voice available for', this.languageMap[this.currentLanguage].name, '- using text-only mode');
             // Don't speak - let the user know via text
             this.addMessageToChat('system', `Voice mode is not available for ${this.languageMap[this.currentLanguage].name}. Please use text mode for the best experience.`);
             return; // Don't speak
@@ -1531,31 +1640,46 @@ export class AITutor {
         utterance.pitch = parseFloat(pitch);
         utterance.volume = parseFloat(volume);
 
+        // Stop any current speech before starting new one. Utterances of an
+        // earlier generation still fire onend/onerror afterwards; ignore them.
+        if (!queue) {
+            this.synthesis.cancel();
+            this.speechGeneration++;
+            this.pendingUtterances = 0;
+        }
+        const generation = this.speechGeneration;
+        this.pendingUtterances++;
+
+        const utteranceDone = () => {
+            if (generation !== this.speechGeneration) return false;
+            this.pendingUtterances = Math.max(0, this.pendingUtterances - 1);
+            return this.pendingUtterances === 0;
+        };
+
         // Add event listeners for better control
         utterance.onstart = () => {
-            console.log('🎤 Speech started');
+            logger.debug('🎤 Speech started');
             this.showVoiceStatus('Speaking...');
             // Pause voice recognition to prevent feedback loop
             this.pauseVoiceRecognition();
         };
 
         utterance.onend = () => {
-            console.log('🎤 Speech ended');
+            logger.debug('🎤 Speech ended');
+            if (!utteranceDone()) return;
             this.hideVoiceStatus();
             // Resume voice recognition after AI finishes speaking
             this.resumeVoiceRecognition();
         };
 
         utterance.onerror = (event) => {
-            console.error('🎤 Speech error:', event.error);
+            logger.error('🎤 Speech error:', event.error);
+            if (!utteranceDone()) return;
             this.hideVoiceStatus();
             // Resume voice recognition even if speech fails
             this.resumeVoiceRecognition();
         };
 
-        // Stop any current speech before starting new one
-        this.synthesis.cancel();
-
         // Start speaking
         this.synthesis.speak(utterance);
     }
@@ -1617,29 +1741,29 @@ export class AITutor {
 
     // Test function for debugging link preview
     async testLinkPreview() {
-        console.log('Testing link preview functionality...');
+        logger.debug('Testing link preview functionality...');
         const testUrl = 'https://www.amazon.com';
         const backendUrl = this.backendUrl || '';
 
         try {
-            console.log('Testing backend health...');
+            logger.debug('Testing backend health...');
             const healthCheck = await fetch(`${backendUrl}/health`);
-            console.log('Health check status:', healthCheck.status);
+            logger.debug('Health check status:', healthCheck.status);
 
-            console.log('Testing link preview API...');
+            logger.debug('Testing link preview API...');
             const resp = await fetch(`${backendUrl}/api/ai/link-preview`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ url: testUrl })
             });
 
-            console.log('Link preview response status:', resp.status);
+            logger.debug('Link preview response status:', resp.status);
             const data = await resp.json();
-            console.log('Link preview data:', data);
+            logger.debug('Link preview data:', data);
 
             return data;
         } catch (error) {
-            console.error('Link preview test failed:', error);
+            logger.error('Link preview test failed:', error);
             return null;
         }
     }
@@ -1650,48 +1774,87 @@ export class AITutor {
         }
 
         this.isProcessingLinkPreview = true;
-        console.log(`🔄 Processing link preview queue (${this.linkPreviewQueue.length} items)`);
+        logger.debug(`🔄 Processing link preview queue (${this.linkPreviewQueue.length} items)`);
 
-        while (this.linkPreviewQueue.length > 0) {
-            const item = this.linkPreviewQueue.shift();
-            await this.fetchLinkPreview(item);
-
-            // Add delay between requests to prevent overwhelming the backend
-            if (this.linkPreviewQueue.length > 0) {
-                await new Promise(resolve => setTimeout(resolve, 500)); // 500ms delay
+        try {
+            while (this.linkPreviewQueue.length > 0) {
+                // Everything queued so far is fetched at once, in batches of up to 10
+                // (no preview needed for direct images)
+                const items = this.linkPreviewQueue.splice(0).filter(item => !item.isImage);
+                const batches = [];
+                for (let i = 0; i < items.length; i += 10) {
+                    batches.push(items.slice(i, i + 10));
+                }
+                await Promise.all(batches.map(batch => this.fetchLinkPreviews(batch)));
             }
+        } finally {
+            this.isProcessingLinkPreview = false;
         }
 
-        this.isProcessingLinkPreview = false;
-        console.log('✅ Link preview queue processing complete');
+        logger.debug('✅ Link preview queue processing complete');
     }
 
-    async fetchLinkPreview({ itemId, url, domain, isImage, backendUrl }) {
+    /**
+     * Fetch the previews for several links with one batch request. Falls back
+     * to parallel single requests if the backend has no batch endpoint.
+     */
+    async fetchLinkPreviews(items) {
+        if (items.length === 0) return;
+
+        const backendUrl = items[0].backendUrl;
+        items.forEach(item => this.showLinkPreviewLoading(item));
+
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => {
+            logger.warn('Link preview batch timeout for:', items.map(item => item.url));
+            controller.abort();
+        }, 8000); // 8 second timeout
+
         try {
-            const el = document.getElementById(itemId);
-            if (!el || isImage) return; // no preview needed for direct images
-
-            // Show loading state for link preview
-            const previewContainer = el.querySelector('.website-preview .preview-placeholder');
-            if (previewContainer) {
-                previewContainer.innerHTML = `
-                    <div class="link-preview-loading">
-                        <div class="link-preview-spinner"></div>
-                        <div class="link-preview-loading-text">Loading preview...</div>
-                    </div>`;
+            const resp = await fetch(`${backendUrl}/api/ai/link-previews`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ urls: items.map(item => item.url) }),
+                signal: controller.signal
+            });
+
+            if (resp.status === 404) {
+                clearTimeout(timeoutId);
+                await Promise.all(items.map(item => this.fetchLinkPreview(item)));
+                return;
             }
+            if (!resp.ok) {
+                logger.warn('Link preview batch response not ok:', resp.status);
+                items.forEach(item => this.showLinkPreviewFallback(item));
+                return;
+            }
+
+            const data = await resp.json();
+            const previews = new Map((data.previews || []).map(preview => [preview.url, preview]));
+            items.forEach(item => this.renderLinkPreview(item, previews.get(item.url) || {}));
+        } catch (e) {
+            logger.warn('Link preview batch fetch failed:', e);
+            items.forEach(item => this.showLinkPreviewFallback(item));
+        } finally {
+            clearTimeout(timeoutId);
+        }
+    }
 
-            console.log('Fetching link preview for:', url);
+    async fetchLinkPreview(item) {
+        const { url, isImage, backendUrl } = item;
+        if (isImage) return; // no preview needed for direct images
+
+        try {
+            this.showLinkPreviewLoading(item);
+            logger.debug('Fetching link preview for:', url);
 
             // Add timeout to prevent stuck loading state
             const controller = new AbortController();
             const timeoutId = setTimeout(() => {
-                console.warn('Link preview timeout for:', url);
+                logger.warn('Link preview timeout for:', url);
                 controller.abort();
             }, 8000); // 8 second timeout
 
-            console.log('Making link preview request to:', `${backendUrl}/api/ai/link-preview`);
-
             let resp;
             try {
                 resp = await fetch(`${backendUrl}/api/ai/link-preview`, {
@@ -1700,62 +1863,71 @@ export class AITutor {
                     body: JSON.stringify({ url }),
                     signal: controller.signal
                 });
-            } catch (fetchError) {
-                console.error('Fetch error details:', fetchError);
-                throw fetchError;
+            } finally {
+                clearTimeout(timeoutId);
             }
-
-            clearTimeout(timeoutId);
-            console.log('Link preview response status:', resp.status);
+            logger.debug('Link preview response status:', resp.status);
 
             if (!resp.ok) {
-                console.warn('Link preview response not ok:', resp.status);
+                logger.warn('Link preview response not ok:', resp.status);
                 // Show fallback state instead of leaving loading
-                if (previewContainer) {
-                    previewContainer.innerHTML = `
-                        <div class="preview-placeholder">
-                            <i class="fas fa-globe"></i>
-                            <span>${domain}</span>
-                            <a href="${url}" target="_blank" class="preview-link">Open Website</a>
-                        </div>`;
-                }
+                this.showLinkPreviewFallback(item);
                 return;
             }
 
             const data = await resp.json();
-            console.log('Link preview data:', data);
-            const preview = data.preview || {};
-
-            if (previewContainer) {
-                const imgHtml = preview.image ? `<img src="${preview.image}" alt="${domain}" class="link-thumb" onerror="this.remove()">` : '';
-                const faviconHtml = preview.favicon ? `<img src="${preview.favicon}" class="favicon" alt="">` : '';
-                previewContainer.innerHTML = `
-                    <div class="link-preview-card">
-                        <div class="link-preview-media">${imgHtml}</div>
-                        <div class="link-preview-meta">
-                            <div class="link-preview-title">${this.escapeHtml(preview.title || domain)}</div>
-                            <div class="link-preview-domain">${faviconHtml}<span>${domain}</span></div>
-                            ${preview.description ? `<div class="link-preview-desc">${this.escapeHtml(preview.description)}</div>` : ''}
-                            <a href="${url}" target="_blank" class="preview-link">Open Website</a>
-                        </div>
-                    </div>`;
-                console.log('Link preview updated for:', url);
-            }
+            this.renderLinkPreview(item, data.preview || {});
         } catch (e) {
-            console.warn('Link preview fetch failed:', e);
+            logger.warn('Link preview fetch failed:', e);
             // Show fallback state on error
-            const el = document.getElementById(itemId);
-            if (el) {
-                const previewContainer = el.querySelector('.website-preview .preview-placeholder');
-                if (previewContainer) {
-                    previewContainer.innerHTML = `
-                        <div class="preview-placeholder">
-                            <i class="fas fa-globe"></i>
-                            <span>${domain}</span>
-                            <a href="${url}" target="_blank" class="preview-link">Open Website</a>
-                        </div>`;
-                }
-            }
+            this.showLinkPreviewFallback(item);
+        }
+    }
+
+    getLinkPreviewContainer(itemId) {
+        const el = document.getElementById(itemId);
+        return el ? el.querySelector('.website-preview .preview-placeholder') : null;
+    }
+
+    showLinkPreviewLoading({ itemId }) {
+        const previewContainer = this.getLinkPreviewContainer(itemId);
+        if (previewContainer) {
+            previewContainer.innerHTML = `
+                <div class="link-preview-loading">
+                    <div class="link-preview-spinner"></div>
+                    <div class="link-preview-loading-text">Loading preview...</div>
+                </div>`;
         }
     }
+
+    showLinkPreviewFallback({ itemId, url, domain }) {
+        const previewContainer = this.getLinkPreviewContainer(itemId);
+        if (previewContainer) {
+            previewContainer.innerHTML = `
+                <div class="preview-placeholder">
+                    <i class="fas fa-globe"></i>
+                    <span>${domain}</span>
+                    <a href="${url}" target="_blank" class="preview-link">Open Website</a>
+                </div>`;
+        }
+    }
+
+    renderLinkPreview({ itemId, url, domain }, preview) {
+        const previewContainer = this.getLinkPreviewContainer(itemId);
+        if (!previewContainer) return;
+
+        const imgHtml = preview.image ? `<img src="${preview.image}" alt="${domain}" class="link-thumb" onerror="this.remove()">` : '';
+        const faviconHtml = preview.favicon ? `<img src="${preview.favicon}" class="favicon" alt="">` : '';
+        previewContainer.innerHTML = `
+            <div class="link-preview-card">
+                <div class="link-preview-media">${imgHtml}</div>
+                <div class="link-preview-meta">
+                    <div class="link-preview-title">${this.escapeHtml(preview.title || domain)}</div>
+                    <div class="link-preview-domain">${faviconHtml}<span>${domain}</span></div>
+                    ${preview.description ? `<div class="link-preview-desc">${this.escapeHtml(preview.description)}</div>` : ''}
+                    <a href="${url}" target="_blank" class="preview-link">Open Website</a>
+                </div>
+            </div>`;
+        logger.debug('Link preview updated for:', url);
+    }
 }
@@ -1,6 +1,8 @@
 // Audio System Module
 // Handles all audio-related functionality including Web Audio API, sound effects, and real audio
 
+import { logger } from '../utils/Logger.js';
+
 export class AudioSystem {
     constructor() {
         this.audioContext = null;
@@ -26,9 +28,9 @@ export class AudioSystem {
             this.audioAnalyser = this.audioContext.createAnalyser();
             this.audioAnalyser.fftSize = 256;
             this.isInitialized = true;
-            console.log('✓ Audio system initialized');
+            logger.debug('✓ Audio system initialized');
         } catch (e) {
-            console.log('Audio context not supported or failed to initialize');
+            logger.debug('Audio context not supported or failed to initialize');
         }
     }
 
@@ -52,7 +54,7 @@ export class AudioSystem {
             });
             return true;
         } catch (error) {
-            console.log('Microphone access denied:', error);
+            logger.debug('Microphone access denied:', error);
             return false;
         }
     }
@@ -78,7 +80,7 @@ export class AudioSystem {
 
             return true;
         } catch (error) {
-            console.log('Error starting real audio:', error);
+            logger.debug('Error starting real audio:', error);
             return false;
         }
     }
@@ -156,7 +158,7 @@ export class AudioSystem {
             oscillator.start(this.audioContext.currentTime);
             oscillator.stop(this.audioContext.currentTime + duration);
         } catch (error) {
-            console.log('Error playing sound:', error);
+            logger.debug('Error playing sound:', error);
         }
     }
 
@@ -199,7 +201,7 @@ export class AudioSystem {
      */
     playBackgroundMusic() {
         // This would be implemented with actual background music
-        console.log('Background music would play here');
+        logger.debug('Background music would play here');
     }
 
     /**
@@ -2,6 +2,7 @@
 // Handles user authentication, registration, and session management
 
 import { config } from '../config.js';
+import { logger } from '../utils/Logger.js';
 
 export class AuthManager {
     constructor() {
@@ -25,7 +26,7 @@ export class AuthManager {
 
         this.setupEventListeners();
         this.startSessionMonitoring();
-        console.log('🔐 Auth Manager initialized');
+        logger.debug('🔐 Auth Manager initialized');
     }
 
 
@@ -88,7 +89,7 @@ export class AuthManager {
 
     async validateToken() {
         if (this.authCheckInProgress) {
-            console.log('🔐 Auth check already in progress, skipping...');
+            logger.debug('🔐 Auth check already in progress, skipping...');
             return;
         }
 
@@ -106,13 +107,13 @@ export class AuthManager {
                 this.currentUser = data.user;
                 this.isAuthenticated = true;
                 this.updateUI();
-                console.log('✅ Token validated, user authenticated');
+                logger.debug('✅ Token validated, user authenticated');
             } else {
                 this.clearAuth();
-                console.log('❌ Token invalid, cleared auth');
+                logger.debug('❌ Token invalid, cleared auth');
             }
         } catch (error) {
-            console.error('Token validation error:', error);
+            logger.error('Token validation error:', error);
             this.clearAuth();
         } finally {
             this.authCheckInProgress = false;
@@ -127,11 +128,11 @@ export class AuthManager {
      */
     checkAuthentication(action = null, showLoginPrompt = true) {
         if (this.isAuthenticated && this.currentUser) {
-            console.log('✅ User is authenticated:', this.currentUser.email);
+            logger.debug('✅ User is authenticated:', this.currentUser.email);
             return true;
         }
 
-        console.log('❌ User is not authenticated');
+        logger.debug('❌ User is not authenticated');
         
         if (action) {
             this.setPendingGameAction(action);
@@ -148,7 +149,7 @@ export class AuthManager {
      * Show authentication required modal
      */
     showAuthenticationRequired(action = null) {
-        console.log('🔐 Showing authentication required for action:', action);
+        logger.debug('🔐 Showing authentication required for action:', action);
         
         // Create modal if it doesn't exist
         let modal = document.getElementById('auth-required-modal');
@@ -244,7 +245,7 @@ export class AuthManager {
             }
         }, 5 * 60 * 1000); // 5 minutes
 
-        console.log('🔐 Session monitoring started');
+        logger.debug('🔐 Session monitoring started');
     }
 
     /**
@@ -254,15 +255,15 @@ export class AuthManager {
         if (this.sessionCheckInterval) {
             clearInterval(this.sessionCheckInterval);
             this.sessionCheckInterval = null;
-            console.log('🔐 Session monitoring stopped');
+            logger.debug('🔐 Session monitoring stopped');
         }
     }
 
     async register(userData) {
         try {
-            console.log('🔍 Frontend sending registration data:', userData);
-            console.log('🔍 Backend URL:', this.backendUrl);
-            console.log('🔍 Request body:', JSON.stringify(userData));
+            logger.debug('🔍 Frontend sending registration data:', userData);
+            logger.debug('🔍 Backend URL:', this.backendUrl);
+            logger.debug('🔍 Request body:', JSON.stringify(userData));
 
             const response = await fetch(`${this.backendUrl}/api/auth/register`, {
                 method: 'POST',
@@ -272,11 +273,11 @@ export class AuthManager {
                 body: JSON.stringify(userData)
             });
 
-            console.log('🔍 Response status:', response.status);
-            console.log('🔍 Response headers:', Object.fromEntries(response.headers.entries()));
+            logger.debug('🔍 Response status:', response.status);
+            logger.debug('🔍 Response headers:', Object.fromEntries(response.headers.entries()));
 
             const data = await response.json();
-            console.log('🔍 Response data:', data);
+            logger.debug('🔍 Response data:', data);
 
             if (response.ok) {
                 this.setAuth(data.token, data.user);
@@ -287,7 +288,7 @@ export class AuthManager {
                 throw new Error(data.error || 'Registration failed');
             }
         } catch (error) {
-            console.error('🔍 Registration error details:', {
+            logger.error('🔍 Registration error details:', {
                 message: error.message,
                 name: error.name,
                 stack: error.stack
@@ -299,8 +300,8 @@ export class AuthManager {
 
     async login(credentials) {
         try {
-            console.log('🔍 Frontend sending login data:', credentials);
-            console.log('🔍 Backend URL:', this.backendUrl);
+            logger.debug('🔍 Frontend sending login data:', credentials);
+            logger.debug('🔍 Backend URL:', this.backendUrl);
 
             const response = await fetch(`${this.backendUrl}/api/auth/login`, {
                 method: 'POST',
@@ -327,7 +328,7 @@ export class AuthManager {
                 throw new Error(data.error || 'Login failed');
             }
         } catch (error) {
-            console.error('Login error:', error);
+            logger.error('Login error:', error);
             this.showNotification(error.message, 'error');
             return { success: false, error: error.message };
         }
@@ -344,7 +345,7 @@ export class AuthManager {
                 });
             }
         } catch (error) {
-            console.error('Logout error:', error);
+            logger.error('Logout error:', error);
         } finally {
             this.clearAuth();
             this.showNotification('Logged out successfully', 'info');
@@ -374,7 +375,7 @@ export class AuthManager {
                 throw new Error(data.error || 'Profile update failed');
             }
         } catch (error) {
-            console.error('Profile update error:', error);
+            logger.error('Profile update error:', error);
             this.showNotification(error.message, 'error');
             return { success: false, error: error.message };
         }
@@ -401,7 +402,7 @@ export class AuthManager {
                 throw new Error(data.error || 'Password change failed');
             }
         } catch (error) {
-            console.error('Password change error:', error);
+            logger.error('Password change error:', error);
             this.showNotification(error.message, 'error');
             return { success: false, error: error.message };
         }
@@ -417,7 +418,7 @@ export class AuthManager {
 
         this.updateUI();
         this.startSessionMonitoring();
-        console.log('🔐 User authenticated:', user.email);
+        logger.debug('🔐 User authenticated:', user.email);
     }
 
     clearAuth() {
@@ -431,17 +432,17 @@ export class AuthManager {
 
         this.updateUI();
         this.stopSessionMonitoring();
-        console.log('🔐 Auth cleared');
+        logger.debug('🔐 Auth cleared');
     }
 
     setPendingGameAction(action) {
         this.pendingGameAction = action;
-        console.log('🎮 Pending game action set:', action);
+        logger.debug('🎮 Pending game action set:', action);
     }
 
     executePendingGameAction() {
         if (this.pendingGameAction && window.game) {
-            console.log('🎮 Executing pending game action:', this.pendingGameAction);
+            logger.debug('🎮 Executing pending game action:', this.pendingGameAction);
 
             switch (this.pendingGameAction) {
                 case 'start-game':
@@ -460,7 +461,7 @@ export class AuthManager {
                     window.game.showLevelSelect();
                     break;
                 default:
-                    console.log('🎮 Unknown pending action:', this.pendingGameAction);
+                    logger.debug('🎮 Unknown pending action:', this.pendingGameAction);
             }
 
             this.pendingGameAction = null; // Clear after execution
@@ -691,10 +692,10 @@ export class AuthManager {
         form.addEventListener('submit', async (e) => {
             e.preventDefault();
 
-            console.log('🔍 Form submission started');
+            logger.debug('🔍 Form submission started');
 
             const formData = new FormData(form);
-            console.log('🔍 FormData entries:', Array.from(formData.entries()));
+            logger.debug('🔍 FormData entries:', Array.from(formData.entries()));
 
             const userData = {
                 firstName: formData.get('firstName'),
@@ -705,7 +706,7 @@ export class AuthManager {
                 role: formData.get('role')
             };
 
-            console.log('🔍 Processed userData:', userData);
+            logger.debug('🔍 Processed userData:', userData);
 
             const submitBtn = form.querySelector('button[type="submit"]');
             const originalText = submitBtn.innerHTML;
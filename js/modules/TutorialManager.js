@@ -1,4 +1,5 @@
 import { config } from '../config.js';
+import { logger } from '../utils/Logger.js';
 
 export class TutorialManager {
     constructor() {
@@ -535,7 +536,7 @@ export class TutorialManager {
 
     init() {
         this.setupEventListeners();
-        console.log('📚 Tutorial Manager initialized');
+        logger.debug('📚 Tutorial Manager initialized');
     }
 
     setupEventListeners() {
@@ -582,7 +583,7 @@ export class TutorialManager {
             modal.style.display = 'flex';
             this.currentStep = 0;
             this.updateTutorialDisplay();
-            console.log('📚 Tutorial opened');
+            logger.debug('📚 Tutorial opened');
         }
     }
 
@@ -590,7 +591,7 @@ export class TutorialManager {
         const modal = document.getElementById('tutorial-modal');
         if (modal) {
             modal.style.display = 'none';
-            console.log('📚 Tutorial closed');
+            logger.debug('📚 Tutorial closed');
         }
     }
 
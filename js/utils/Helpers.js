@@ -1,6 +1,8 @@
 // Helper Utilities Module
 // Contains common utility functions used throughout the game
 
+import { logger } from './Logger.js';
+
 /**
  * Get connector color based on connector type
  */
@@ -153,6 +155,19 @@ export function getEquipmentInfo(equipmentType, equipmentName) {
     };
 }
 
+/**
+ * Publish a readiness signal for automation
+ * Merges state into window.__avReady and dispatches it as a CustomEvent so
+ * tests can await real game transitions instead of sleeping.
+ */
+export function signalReady(eventName, state = {}) {
+    if (typeof window === 'undefined') return;
+
+    const previous = window.__avReady || { seq: 0 };
+    window.__avReady = { ...previous, ...state, lastEvent: eventName, seq: previous.seq + 1 };
+    window.dispatchEvent(new CustomEvent(eventName, { detail: { ...window.__avReady } }));
+}
+
 /**
  * Generate random position within bounds
  */
@@ -257,7 +272,7 @@ export function saveToStorage(key, data) {
         localStorage.setItem(key, JSON.stringify(data));
         return true;
     } catch (error) {
-        console.error('Error saving to localStorage:', error);
+        logger.error('Error saving to localStorage:', error);
         return false;
     }
 }
@@ -270,7 +285,7 @@ export function loadFromStorage(key) {
         const item = localStorage.getItem(key);
         return item ? JSON.parse(item) : null;
     } catch (error) {
-        console.error('Error loading from localStorage:', error);
+        logger.error('Error loading from localStorage:', error);
         return null;
     }
 }
@@ -283,7 +298,7 @@ export function removeFromStorage(key) {
         localStorage.removeItem(key);
         return true;
     } catch (error) {
-        console.error('Error removing from localStorage:', error);
+        logger.error('Error removing from localStorage:', error);
         return false;
     }
 }
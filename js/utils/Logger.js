@@ -0,0 +1,78 @@
+// Logger Module
+// Leveled front-end logging. Methods below the active level are no-ops, so
+// disabled debug calls neither format nor retain the objects passed to them.
+//
+// The level is picked from the first of:
+//   1. ?log=<level> URL flag (debug | info | warn | error | silent)
+//   2. localStorage 'avLogLevel'
+//   3. config.LOG_LEVEL
+//   4. 'warn' when config.NODE_ENV is production, otherwise 'debug'
+
+import { config } from '../config.js';
+
+const LEVELS = {
+    debug: 10,
+    info: 20,
+    warn: 30,
+    error: 40,
+    silent: 100
+};
+
+function noop() { }
+
+/**
+ * Resolve the initial log level from URL, storage and config
+ */
+function resolveLogLevel() {
+    try {
+        if (typeof window !== 'undefined') {
+            const fromUrl = new URLSearchParams(window.location.search).get('log');
+            if (fromUrl in LEVELS) return fromUrl;
+
+            const fromStorage = window.localStorage?.getItem('avLogLevel');
+            if (fromStorage in LEVELS) return fromStorage;
+        }
+    } catch (error) {
+        // Storage can be unavailable (privacy mode, sandboxed iframes)
+    }
+
+    if (config.LOG_LEVEL in LEVELS) return config.LOG_LEVEL;
+    return config.NODE_ENV === 'production' ? 'warn' : 'debug';
+}
+
+export const logger = {
+    level: 'debug',
+    debug: noop,
+    info: noop,
+    warn: noop,
+    error: noop,
+
+    /**
+     * Check whether a level is enabled, to guard debug-only work
+     */
+    enabled(level) {
+        return LEVELS[level] >= LEVELS[this.level];
+    }
+};
+
+/**
+ * Set the active log level at runtime (e.g. from the DevTools console)
+ */
+export function setLogLevel(level) {
+    logger.level = level in LEVELS ? level : 'warn';
+
+    // Bound console methods keep the caller's file/line in DevTools
+    logger.debug = logger.enabled('debug') ? console.log.bind(console) : noop;
+    logger.info = logger.enabled('info') ? console.info.bind(console) : noop;
+    logger.warn = logger.enabled('warn') ? console.warn.bind(console) : noop;
+    logger.error = logger.enabled('error') ? console.error.bind(console) : noop;
+}
+
+setLogLevel(resolveLogLevel());
+
+// Logged here rather than in config.js, which the logger itself depends on
+logger.debug('🔧 AV Master Config loaded:', config);
+
+if (typeof window !== 'undefined') {
+    window.avSetLogLevel = setLogLevel;
+}
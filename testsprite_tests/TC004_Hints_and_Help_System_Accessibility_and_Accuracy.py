@@ -1,35 +1,15 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, session_context
+from readiness import wait_for_menu, wait_for_screen, wait_for_level
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+async def run_test(context=None):
+    async with session_context(context) as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8005", wait_until="commit", timeout=10000)
+        await page.goto(BASE_URL, wait_until="commit", timeout=10000)
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -44,41 +24,44 @@ async def run_test():
             except async_api.Error:
                 pass
         
+        # Wait for the loading sequence to hand over to the main menu
+        await wait_for_menu(page)
+        
         # Interact with the page elements to simulate user flow
         # Click 'Start New Game' to begin a level with incomplete connections.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000); await wait_for_screen(page, 'level-select')
         
 
         # Click on 'Mic Setup' to start the level.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[3]/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000); await wait_for_level(page)
         
 
         # Click the 'Hint' button to verify a general hint appears relevant to the current level progress.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[4]/div[3]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000)
         
 
         # Close the general hint dialog and attempt to click the 'Detailed Hint' button to verify detailed step-by-step guidance.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000)
         
 
         # Click the 'Detailed Hint' button to verify detailed step-by-step guidance matches level objectives and connection requirements.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[4]/div[3]/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000)
         
 
         # Confirm that requesting hints affects scoring as expected by checking score before and after hint requests.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000)
         
 
         # Assert that the general hint dialog appears and contains relevant text about incomplete connections
@@ -97,15 +80,7 @@ async def run_test():
         # Assuming hint request button clicked earlier
         score_after = int(await score_element.text_content())
         assert score_after <= score_before, 'Score should decrease or remain same after requesting hints'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
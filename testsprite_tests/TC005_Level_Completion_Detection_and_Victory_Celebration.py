@@ -1,35 +1,15 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, session_context
+from readiness import wait_for_menu, wait_for_screen, wait_for_level
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+async def run_test(context=None):
+    async with session_context(context) as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8005", wait_until="commit", timeout=10000)
+        await page.goto(BASE_URL, wait_until="commit", timeout=10000)
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -44,42 +24,37 @@ async def run_test():
             except async_api.Error:
                 pass
         
+        # Wait for the loading sequence to hand over to the main menu
+        await wait_for_menu(page)
+        
         # Interact with the page elements to simulate user flow
         # Click 'Start New Game' to begin the first level and start testing connections.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000); await wait_for_screen(page, 'level-select')
         
 
         # Click on 'Mic Setup' to start the level and begin testing connections.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[3]/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000); await wait_for_level(page)
         
 
         # Drag and drop to complete all required connections correctly in the level.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[4]/div[2]/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000)
         
 
         # Drag and drop the Wireless Vocal Mic (index 1) to the Mic Receiver (index 3) to start making correct connections.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div[4]/div[2]/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await elem.click(timeout=5000)
         
 
         # Final generic failing assertion since expected result is unknown
         assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,116 @@
+"""Per-interaction timing of the game at different front-end log levels.
+
+Loads the game once per level (``?log=debug`` is the old always-on logging,
+``?log=warn`` the production default) and times the same scripted interactions
+inside the page with ``performance.now()``:
+
+    screen   switchScreen() between the menu and level select
+    level    loadLevel() of the benchmark level
+    place    placeEquipment() for every tool in the level
+    click    handleConnectorClick() on connector pairs (valid and invalid)
+    refresh  forceRefreshConnectors()
+
+Usage:
+    python bench_interactions.py                     # debug vs warn, audio-1
+    python bench_interactions.py -l audio-2 -r 20    # 20 rounds on audio-2
+    python bench_interactions.py --levels debug info warn silent
+
+Run it again with ``--devtools`` to see the cost of the console retaining
+logged objects.
+"""
+import argparse
+import asyncio
+import statistics
+
+from harness import BASE_URL, session_context
+from readiness import wait_for_menu, wait_for_level
+
+INTERACTIONS = ["screen", "level", "place", "click", "refresh"]
+
+# Runs one round of every interaction and returns {interaction: [ms, ...]}
+ROUND_SCRIPT = """async (levelId) => {
+    const game = window.game;
+    const samples = { screen: [], level: [], place: [], click: [], refresh: [] };
+    const time = async (name, fn) => {
+        const started = performance.now();
+        await fn();
+        samples[name].push(performance.now() - started);
+    };
+
+    await time('screen', () => game.switchScreen('level-select'));
+    await time('screen', () => game.switchScreen('main-menu'));
+    await time('level', () => game.loadLevel(levelId));
+
+    const stage = document.getElementById('stage-area').getBoundingClientRect();
+    const tools = Array.from(document.querySelectorAll('#equipment-tools .tool-item'));
+    for (const [i, tool] of tools.entries()) {
+        const x = stage.left + 80 + (i % 4) * 160;
+        const y = stage.top + 80 + Math.floor(i / 4) * 140;
+        await time('place', () => game.placeEquipment(tool, x, y));
+    }
+
+    const connectors = Array.from(document.querySelectorAll('#stage-area .connector'));
+    for (let i = 0; i + 1 < connectors.length; i += 2) {
+        for (const connector of [connectors[i], connectors[connectors.length - 1 - i]]) {
+            const equipment = connector.closest('.equipment');
+            await time('click', () => game.handleConnectorClick(connector, equipment));
+        }
+    }
+
+    await time('refresh', () => game.forceRefreshConnectors());
+    return samples;
+}"""
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def bench_level(context, log_level, level_id, rounds, devtools=False):
+    page = await context.new_page()
+    if devtools:
+        # With the Runtime domain enabled, logged objects are kept alive like in an open DevTools
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Runtime.enable")
+    await page.goto(f"{BASE_URL}/?log={log_level}")
+    await wait_for_menu(page)
+
+    samples = {name: [] for name in INTERACTIONS}
+    for _ in range(rounds):
+        result = await page.evaluate(ROUND_SCRIPT, level_id)
+        await wait_for_level(page, level_id)
+        for name in INTERACTIONS:
+            samples[name].extend(result[name])
+
+    await page.close()
+    return samples
+
+
+async def main(args):
+    results = {}
+    for log_level in args.levels:
+        # A fresh context per log level, so localStorage and caches do not carry over
+        async with session_context(headless=not args.headed) as context:
+            results[log_level] = await bench_level(context, log_level, args.level, args.rounds, args.devtools)
+
+    print(f"Per-interaction time on {args.level}, {args.rounds} rounds (ms: mean / p95)\n")
+    print("interaction " + "".join(f"{level:>18}" for level in args.levels))
+    for name in INTERACTIONS:
+        row = f"{name:<11} "
+        for log_level in args.levels:
+            values = results[log_level][name]
+            row += f"{statistics.mean(values):>9.3f} /{percentile(values, 95):>6.3f}" if values else f"{'-':>18}"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-l", "--level", default="audio-1", help="level to load (default: audio-1)")
+    parser.add_argument("-r", "--rounds", type=int, default=10, help="rounds per log level (default: 10)")
+    parser.add_argument("--levels", nargs="+", default=["debug", "warn"],
+                        help="log levels to compare (default: debug warn)")
+    parser.add_argument("--headed", action="store_true", help="run with a visible browser")
+    parser.add_argument("--devtools", action="store_true",
+                        help="enable the CDP Runtime domain so console messages are retained")
+    asyncio.run(main(parser.parse_args()))
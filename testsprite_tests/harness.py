@@ -0,0 +1,58 @@
+"""Shared Playwright session helpers for the testsprite_tests scripts.
+
+Each TC script calls ``session_context()`` to get the browser context it runs
+in. When the script is launched on its own, the helper starts a private
+Playwright session and browser. When run_suite.py drives the suite, it passes
+in a fresh context from its pool, and the helper only hands it through.
+"""
+import os
+from contextlib import asynccontextmanager
+
+from playwright import async_api
+
+# Address of the locally served game (override for CI or a remote stage)
+BASE_URL = os.environ.get("AV_MASTER_URL", "http://localhost:8005")
+
+# Chromium flags shared by every session. "--single-process" is deliberately
+# absent: it prevents one browser from hosting several contexts at once.
+BROWSER_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+]
+
+
+async def launch_browser(pw, headless=True):
+    """Launch the Chromium instance used by a standalone script or a runner worker."""
+    return await pw.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+
+@asynccontextmanager
+async def session_context(context=None, default_timeout=5000, headless=True):
+    """Yield the browser context a test should run in.
+
+    A context supplied by the runner is used as-is. The runner owns it and
+    closes it. Without one, a private Playwright session, browser and context
+    are created here and torn down when the test finishes.
+    """
+    if context is not None:
+        context.set_default_timeout(default_timeout)
+        yield context
+        return
+
+    pw = None
+    browser = None
+    context = None
+
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await launch_browser(pw, headless=headless)
+        context = await browser.new_context()
+        context.set_default_timeout(default_timeout)
+        yield context
+    finally:
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
@@ -0,0 +1,65 @@
+"""Python wrapper around the headless level simulator (tools/level-sim.mjs).
+
+Connection rules, progress counting and completion checks run in Node
+against the level definitions with no browser, so a level change can be checked in
+milliseconds:
+
+    from level_simulator import verify, replay, fuzz
+
+    assert all(r["completable"] for r in verify(["audio-1"]))
+    result = replay({"level": "audio-1", "steps": [
+        {"placeAll": True},
+        {"connect": ["power-distribution-1/power-out", "mixing-console-1/power-in"], "cable": "power-cable"},
+    ]})
+
+Connector references are either a full connector id or
+"<equipment id>/<connector key, label or type>". Equipment ids default to the
+slugged equipment name plus a 1-based index (e.g. "main-speaker-2").
+"""
+import json
+import os
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(REPO_ROOT, "tools", "level-sim.mjs")
+NODE = os.environ.get("NODE", "node")
+
+
+class SimulatorError(RuntimeError):
+    pass
+
+
+def _run(args, stdin=None):
+    proc = subprocess.run(
+        [NODE, CLI, *args, "--json"],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    # verify exits 1 when a level is not completable; that is a result, not an error
+    if proc.returncode not in (0, 1) or not proc.stdout:
+        raise SimulatorError(proc.stderr.strip() or f"level-sim exited with {proc.returncode}")
+    return json.loads(proc.stdout)
+
+
+def verify(levels=None):
+    """Greedy-solve each level; returns [{level, completable, connections, missing}]."""
+    return _run(["verify", *(levels or [])])
+
+
+def replay(scripts):
+    """Replay one script dict or a list of them; returns per-script results and throughput."""
+    return _run(["replay", "-"], stdin=json.dumps(scripts))
+
+
+def fuzz(levels=None, runs=1000, steps=50, seed=1):
+    """Replay random wiring sequences against each level; returns counts and throughput."""
+    return _run(["fuzz", "--runs", str(runs), "--steps", str(steps), "--seed", str(seed), *(levels or [])])
+
+
+if __name__ == "__main__":
+    for result in verify():
+        status = "✅" if result["completable"] else "❌"
+        missing = ", ".join(f"{m['type']} {m['current']}/{m['required']}" for m in result["missing"])
+        print(f"{status} {result['level']:<12} {missing}")
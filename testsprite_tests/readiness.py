@@ -0,0 +1,109 @@
+"""Event-driven waits on the game's readiness signals.
+
+GameEngine publishes its state on ``window.__avReady`` and dispatches an
+``av:*`` CustomEvent when a transition finishes:
+
+    av:screen-changed     {screen}
+    av:level-loaded       {level, equipment: 0, connections: 0}
+    av:equipment-placed   {equipment}
+    av:connection-created {connections}
+
+The helpers below wait for that state. Each returns as soon as the game
+reports it, instead of sleeping a fixed time before every interaction.
+"""
+import itertools
+from contextlib import asynccontextmanager
+
+DEFAULT_TIMEOUT = 10000
+
+_waiter_ids = itertools.count()
+
+
+async def wait_for_state(page, predicate, arg=None, timeout=DEFAULT_TIMEOUT):
+    """Wait until ``predicate(state, arg)`` holds for ``window.__avReady``.
+
+    ``predicate`` is a JavaScript arrow function source string.
+    """
+    handle = await page.wait_for_function(
+        f"""([arg]) => {{
+            const state = window.__avReady;
+            return !!state && ({predicate})(state, arg);
+        }}""",
+        arg=[arg],
+        timeout=timeout,
+    )
+    return await handle.json_value()
+
+
+async def wait_for_screen(page, screen_id, timeout=DEFAULT_TIMEOUT):
+    """Wait until ``switchScreen`` has activated ``screen_id``."""
+    return await wait_for_state(page, "(s, id) => s.screen === id", screen_id, timeout)
+
+
+async def wait_for_menu(page, timeout=DEFAULT_TIMEOUT):
+    """Wait for the loading sequence to finish and the main menu to show."""
+    return await wait_for_screen(page, "main-menu", timeout)
+
+
+async def wait_for_level(page, level_id=None, timeout=DEFAULT_TIMEOUT):
+    """Wait until ``loadLevel`` has finished (for ``level_id`` if given)."""
+    return await wait_for_state(
+        page, "(s, id) => s.screen === 'game' && !!s.level && (!id || s.level === id)", level_id, timeout
+    )
+
+
+async def wait_for_equipment(page, count, timeout=DEFAULT_TIMEOUT):
+    """Wait until at least ``count`` pieces of equipment are on the stage."""
+    return await wait_for_state(page, "(s, n) => (s.equipment || 0) >= n", count, timeout)
+
+
+async def wait_for_connections(page, count, timeout=DEFAULT_TIMEOUT):
+    """Wait until at least ``count`` valid connections exist."""
+    return await wait_for_state(page, "(s, n) => (s.connections || 0) >= n", count, timeout)
+
+
+async def wait_for_animations(locator, timeout=DEFAULT_TIMEOUT):
+    """Wait for the element's running CSS transitions/animations to finish."""
+    await locator.evaluate(
+        "el => Promise.all(el.getAnimations().map(a => a.finished.catch(() => null)))",
+        timeout=timeout,
+    )
+
+
+@asynccontextmanager
+async def expect_game_event(page, event_name, timeout=DEFAULT_TIMEOUT):
+    """Arm a listener for ``event_name`` and wait for it when the block exits.
+
+    The listener is installed before the block runs, so an event fired
+    synchronously by the triggering click is not missed::
+
+        async with expect_game_event(page, "av:connection-created") as event:
+            await page.locator(".cable-option").first.click()
+        print(event["detail"])
+    """
+    waiter_id = f"w{next(_waiter_ids)}"
+    await page.evaluate(
+        """([id, name, timeout]) => {
+            const waits = window.__avWaits || (window.__avWaits = {});
+            waits[id] = new Promise((resolve, reject) => {
+                const timer = setTimeout(() => reject(new Error(`Timed out waiting for ${name}`)), timeout);
+                window.addEventListener(name, (e) => {
+                    clearTimeout(timer);
+                    resolve(e.detail);
+                }, { once: true });
+            });
+        }""",
+        [waiter_id, event_name, timeout],
+    )
+    event = {}
+    yield event
+    event["detail"] = await page.evaluate(
+        """async (id) => {
+            try {
+                return await window.__avWaits[id];
+            } finally {
+                delete window.__avWaits[id];
+            }
+        }""",
+        waiter_id,
+    )
@@ -0,0 +1,183 @@
+"""Parallel runner for the testsprite_tests Playwright suite.
+
+Each worker process launches one headless Chromium and runs its share of the
+TC scripts concurrently on asyncio. Every test gets a fresh BrowserContext
+from a small pre-warmed pool. Per-test wall times are printed at the end,
+with the speedup over running the same tests one after another.
+
+Usage:
+    python run_suite.py                   # all TC*.py, one worker per core
+    python run_suite.py -w 2 -c 3 TC002   # 2 workers, 3 contexts each, TC002 only
+    python run_suite.py --serial-baseline # also time the old one-script-at-a-time run
+"""
+import argparse
+import asyncio
+import glob
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from playwright import async_api
+from harness import launch_browser
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class ContextPool:
+    """Pre-warmed pool of fresh browser contexts on a single browser.
+
+    A context is never reused. On release it is closed and a replacement
+    is created in the background, so the next test does not pay for it.
+    """
+
+    def __init__(self, browser, size):
+        self.browser = browser
+        self.size = size
+        self.available = asyncio.Queue()
+        self.pending = set()
+
+    async def start(self):
+        for _ in range(self.size):
+            await self.available.put(await self.browser.new_context())
+
+    async def acquire(self):
+        return await self.available.get()
+
+    async def release(self, context):
+        await context.close()
+        task = asyncio.ensure_future(self._replenish())
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def _replenish(self):
+        await self.available.put(await self.browser.new_context())
+
+    async def close(self):
+        if self.pending:
+            await asyncio.gather(*self.pending, return_exceptions=True)
+        while not self.available.empty():
+            await self.available.get_nowait().close()
+
+
+def discover_tests(patterns):
+    paths = sorted(glob.glob(os.path.join(TESTS_DIR, "TC*.py")))
+    if patterns:
+        paths = [p for p in paths if any(pat in os.path.basename(p) for pat in patterns)]
+    return paths
+
+
+def load_test(path):
+    """Import a TC script as a module without triggering its __main__ block."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def run_one(pool, path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    context = await pool.acquire()
+    started = time.perf_counter()
+    try:
+        result = await load_test(path).run_test(context)
+        # Scripts that report failure by returning False instead of raising
+        passed = result is not False
+        error = None if passed else "run_test() returned False"
+    except Exception as e:
+        passed = False
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+    finally:
+        elapsed = time.perf_counter() - started
+        await pool.release(context)
+    return {"name": name, "passed": passed, "seconds": elapsed, "error": error}
+
+
+async def run_worker(paths, pool_size):
+    pw = await async_api.async_playwright().start()
+    browser = None
+    pool = None
+    try:
+        browser = await launch_browser(pw, headless=True)
+        pool = ContextPool(browser, pool_size)
+        await pool.start()
+        return await asyncio.gather(*(run_one(pool, path) for path in paths))
+    finally:
+        if pool:
+            await pool.close()
+        if browser:
+            await browser.close()
+        await pw.stop()
+
+
+def worker_main(paths, pool_size):
+    # Worker processes import the TC scripts, which import harness by name
+    if TESTS_DIR not in sys.path:
+        sys.path.insert(0, TESTS_DIR)
+    return asyncio.run(run_worker(paths, pool_size))
+
+
+def run_serial_baseline(paths):
+    """Time the pre-runner workflow: each script on its own, one after another."""
+    started = time.perf_counter()
+    for path in paths:
+        subprocess.run([sys.executable, path], cwd=TESTS_DIR,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("tests", nargs="*", help="substrings selecting TC scripts (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes, each with its own browser (default: CPU count)")
+    parser.add_argument("-c", "--contexts", type=int, default=2,
+                        help="concurrent browser contexts per worker (default: 2)")
+    parser.add_argument("--serial-baseline", action="store_true",
+                        help="also run every script standalone in sequence and compare")
+    args = parser.parse_args()
+
+    paths = discover_tests(args.tests)
+    if not paths:
+        print("No matching TC*.py scripts found")
+        return 1
+
+    workers = max(1, min(args.workers, len(paths)))
+    shards = [paths[i::workers] for i in range(workers)]
+
+    print(f"🚀 Running {len(paths)} tests on {workers} worker(s) x {args.contexts} context(s)")
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard_results in executor.map(worker_main, shards, [args.contexts] * workers):
+            results.extend(shard_results)
+    wall = time.perf_counter() - started
+
+    results.sort(key=lambda r: r["name"])
+    width = max(len(r["name"]) for r in results)
+    print()
+    for r in results:
+        status = "✅ PASS" if r["passed"] else "❌ FAIL"
+        print(f"  {r['name']:<{width}}  {r['seconds']:7.2f}s  {status}")
+        if r["error"]:
+            print(f"  {'':<{width}}  {r['error'].splitlines()[-1]}")
+
+    summed = sum(r["seconds"] for r in results)
+    failed = sum(1 for r in results if not r["passed"])
+    print()
+    print(f"⏱️  Wall time: {wall:.2f}s (sum of test times {summed:.2f}s, {summed / wall:.1f}x parallelism)")
+
+    if args.serial_baseline:
+        serial = run_serial_baseline(paths)
+        print(f"⏱️  Serial baseline: {serial:.2f}s -> {serial / wall:.1f}x speedup")
+
+    print(f"📊 {len(results) - failed} passed, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
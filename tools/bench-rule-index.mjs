@@ -0,0 +1,73 @@
+#!/usr/bin/env node
+// Micro-benchmark: connection rule lookup, linear scan vs. per-level index.
+// Grows an advanced level's validConnections table and shows the indexed
+// lookup cost staying flat while the linear scan grows with the table.
+//
+// Usage: node tools/bench-rule-index.mjs [--iterations N]
+
+import { getLevelData } from '../js/data/LevelData.js';
+import { buildConnectionRuleIndex, findValidConnection } from '../js/core/LevelRules.js';
+
+const iterationsArg = process.argv.indexOf('--iterations');
+const ITERATIONS = iterationsArg !== -1 ? parseInt(process.argv[iterationsArg + 1], 10) : 200000;
+const SIZES = [5, 25, 100, 500, 2000];
+
+/**
+ * The pre-index lookup: two linear scans, forward then reverse
+ */
+function linearFind(levelData, fromType, toType, cableType) {
+    let validConnection = levelData.validConnections.find(conn =>
+        conn.from === fromType && conn.to === toType && conn.cable === cableType
+    );
+    if (!validConnection) {
+        validConnection = levelData.validConnections.find(conn =>
+            conn.from === toType && conn.to === fromType && conn.cable === cableType
+        );
+    }
+    return validConnection || null;
+}
+
+/**
+ * Pad the advanced-3 rule table with synthetic rules up to `size` entries
+ */
+async function levelWithRules(size) {
+    const base = await getLevelData('advanced-3');
+    const rules = [...base.validConnections];
+    for (let i = rules.length; i < size; i++) {
+        rules.unshift({ from: `custom-${i}-out`, to: `custom-${i}-in`, cable: `custom-${i}-cable`, animation: 'none' });
+    }
+    return { ...base, validConnections: rules.slice(0, Math.max(size, base.validConnections.length)) };
+}
+
+function time(fn) {
+    const started = process.hrtime.bigint();
+    for (let i = 0; i < ITERATIONS; i++) fn(i);
+    return Number(process.hrtime.bigint() - started) / ITERATIONS;
+}
+
+// Realistic mix: valid forward, valid reverse and invalid attempts
+const probes = [
+    ['power-out', 'power-in', 'power-cable'],
+    ['xlr-in', 'xlr-out', 'xlr-cable'],
+    ['hdmi-out', 'hdmi-in', 'dmx-cable']
+];
+
+console.log(`Rule lookup, ${ITERATIONS} lookups per row (ns/lookup)\n`);
+console.log('rules   linear   indexed   build(µs)');
+
+for (const size of SIZES) {
+    const levelData = await levelWithRules(size);
+
+    const buildStarted = process.hrtime.bigint();
+    buildConnectionRuleIndex(levelData);
+    const buildUs = Number(process.hrtime.bigint() - buildStarted) / 1000;
+
+    // Warm up both paths (and the per-level index cache)
+    time(i => linearFind(levelData, ...probes[i % probes.length]));
+    time(i => findValidConnection(levelData, ...probes[i % probes.length]));
+
+    const linear = time(i => linearFind(levelData, ...probes[i % probes.length]));
+    const indexed = time(i => findValidConnection(levelData, ...probes[i % probes.length]));
+
+    console.log(`${String(levelData.validConnections.length).padStart(5)} ${linear.toFixed(1).padStart(8)} ${indexed.toFixed(1).padStart(9)} ${buildUs.toFixed(1).padStart(11)}`);
+}
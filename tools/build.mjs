@@ -0,0 +1,252 @@
+#!/usr/bin/env node
+// Production build for the static frontend.
+// Bundles js/main.js (code-split, tree-shaken, minified ES modules) and
+// styles.css with esbuild into content-hashed files under dist/assets/,
+// rewrites index.html to load them, precompresses every text asset
+// (.gz and .br next to the original) and writes dist/manifest.json.
+// Ends with a first-load byte/request report: unbundled source vs. dist/.
+//
+// Usage:
+//   node tools/build.mjs                  build into dist/ and report
+//   node tools/build.mjs --strip-debug    also drop logger.debug/info calls from the bundles
+//   node tools/build.mjs --no-compress    skip the .gz/.br variants
+//   node tools/build.mjs --report         report only (source tree, plus dist/ if built)
+
+import { existsSync, mkdirSync, readFileSync, readdirSync, rmSync, statSync, writeFileSync } from 'node:fs';
+import { dirname, extname, join, relative, resolve } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { brotliCompressSync, gzipSync, constants as zlibConstants } from 'node:zlib';
+
+const ROOT = resolve(dirname(fileURLToPath(import.meta.url)), '..');
+const OUTDIR = join(ROOT, 'dist');
+const ASSET_DIR = 'assets';
+
+// Text assets worth precompressing; nginx serves the .gz/.br sibling directly
+const COMPRESSIBLE = new Set(['.html', '.js', '.css', '.json', '.svg', '.map', '.txt']);
+
+const args = new Set(process.argv.slice(2));
+
+/**
+ * Gzip and brotli sizes of a buffer, at the levels used for the precompressed files
+ */
+function compressedSizes(buffer) {
+    return {
+        gzip: gzipSync(buffer, { level: 9 }).length,
+        brotli: brotliCompressSync(buffer, {
+            params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 11 }
+        }).length
+    };
+}
+
+function walk(dir) {
+    return readdirSync(dir).flatMap(name => {
+        const path = join(dir, name);
+        return statSync(path).isDirectory() ? walk(path) : [path];
+    });
+}
+
+/**
+ * Bundle JS and CSS with esbuild; returns the esbuild metafile
+ */
+async function bundle() {
+    // Imported here so `--report` works without the dev dependency installed
+    const esbuild = await import('esbuild');
+
+    const result = await esbuild.build({
+        absWorkingDir: ROOT,
+        entryPoints: { main: 'js/main.js', styles: 'styles.css' },
+        outdir: OUTDIR,
+        bundle: true,
+        splitting: true,
+        format: 'esm',
+        target: ['es2020'],
+        minify: true,
+        treeShaking: true,
+        sourcemap: 'linked',
+        legalComments: 'none',
+        // Level modules (js/data/levels/*.js) become one lazily loaded chunk each
+        entryNames: `${ASSET_DIR}/[name]-[hash]`,
+        chunkNames: `${ASSET_DIR}/chunks/[name]-[hash]`,
+        assetNames: `${ASSET_DIR}/[name]-[hash]`,
+        pure: args.has('--strip-debug') ? ['logger.debug', 'logger.info'] : [],
+        metafile: true,
+        logLevel: 'warning'
+    });
+
+    return result.metafile;
+}
+
+/**
+ * Build the manifest: source entry -> hashed file, plus each output's static imports
+ */
+function buildManifest(metafile) {
+    const manifest = { entries: {}, files: {} };
+
+    Object.entries(metafile.outputs).forEach(([outputPath, output]) => {
+        if (outputPath.endsWith('.map')) return;
+
+        const file = relative(OUTDIR, join(ROOT, outputPath));
+        manifest.files[file] = {
+            bytes: output.bytes,
+            // Chunks the browser has to fetch before this file can run
+            imports: (output.imports || [])
+                .filter(imported => imported.kind === 'import-statement' && !imported.external)
+                .map(imported => relative(OUTDIR, join(ROOT, imported.path)))
+        };
+        if (output.entryPoint) {
+            manifest.entries[output.entryPoint] = file;
+        }
+    });
+
+    return manifest;
+}
+
+/**
+ * Static import closure of a built file
+ */
+function staticImports(manifest, file, seen = new Set()) {
+    (manifest.files[file]?.imports || []).forEach(imported => {
+        if (!seen.has(imported)) {
+            seen.add(imported);
+            staticImports(manifest, imported, seen);
+        }
+    });
+    return seen;
+}
+
+/**
+ * Point index.html at the hashed bundles and preload the entry's static chunks
+ */
+function rewriteIndexHtml(manifest) {
+    let html = readFileSync(join(ROOT, 'index.html'), 'utf8');
+    const mainFile = manifest.entries['js/main.js'];
+    const cssFile = manifest.entries['styles.css'];
+
+    html = html.replace(/<link rel="stylesheet" href="styles\.css">/, `<link rel="stylesheet" href="/${cssFile}">`);
+    html = html.replace(/<script type="module" src="js\/main\.js[^"]*"><\/script>/,
+        `<script type="module" src="/${mainFile}"></script>`);
+
+    // Classic scripts pointing at files that are not in the tree would only cost a 404
+    html = html.replace(/\s*<script src="([^":]+)"><\/script>/g, (tag, src) => {
+        if (existsSync(join(ROOT, src))) return tag;
+        console.warn(`⚠️  Dropping <script src="${src}">: file does not exist`);
+        return '';
+    });
+
+    const preloads = [...staticImports(manifest, mainFile)]
+        .map(file => `    <link rel="modulepreload" href="/${file}">`)
+        .join('\n');
+    if (preloads) {
+        html = html.replace('</head>', `${preloads}\n</head>`);
+    }
+
+    writeFileSync(join(OUTDIR, 'index.html'), html);
+}
+
+/**
+ * Write .gz and .br siblings for every compressible file that gets smaller
+ */
+function precompress() {
+    walk(OUTDIR)
+        .filter(path => COMPRESSIBLE.has(extname(path)))
+        .forEach(path => {
+            const content = readFileSync(path);
+            const gzip = gzipSync(content, { level: 9 });
+            const brotli = brotliCompressSync(content, {
+                params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 11 }
+            });
+            if (gzip.length < content.length) writeFileSync(`${path}.gz`, gzip);
+            if (brotli.length < content.length) writeFileSync(`${path}.br`, brotli);
+        });
+}
+
+/**
+ * Files the unbundled source tree loads before the menu is interactive:
+ * index.html, its local stylesheet and scripts, and js/main.js's static import graph
+ */
+function sourceFirstLoad() {
+    const files = ['index.html', 'styles.css', 'config.js'];
+    const pending = ['js/main.js'];
+    const importPattern = /(?:^|\n)\s*(?:import|export)\s+(?:[^'";]*?\s+from\s+)?['"](\.{1,2}\/[^'"]+)['"]/g;
+
+    while (pending.length > 0) {
+        const file = pending.pop();
+        if (files.includes(file)) continue;
+        files.push(file);
+
+        const source = readFileSync(join(ROOT, file), 'utf8');
+        for (const match of source.matchAll(importPattern)) {
+            pending.push(relative(ROOT, join(ROOT, dirname(file), match[1])));
+        }
+    }
+
+    return files.map(file => {
+        const path = join(ROOT, file);
+        if (!existsSync(path)) return { file, bytes: 0, gzip: 0, brotli: 0, missing: true };
+
+        const content = readFileSync(path);
+        return { file, bytes: content.length, ...compressedSizes(content) };
+    });
+}
+
+function distFirstLoad(manifest) {
+    const mainFile = manifest.entries['js/main.js'];
+    const files = ['index.html', manifest.entries['styles.css'], mainFile, ...staticImports(manifest, mainFile)];
+
+    return files.map(file => {
+        const content = readFileSync(join(OUTDIR, file));
+        return { file, bytes: content.length, ...compressedSizes(content) };
+    });
+}
+
+function formatKB(bytes) {
+    return `${(bytes / 1024).toFixed(1)} KB`.padStart(10);
+}
+
+function printLoad(label, files, repeatRequests) {
+    const total = key => files.reduce((sum, file) => sum + file[key], 0);
+    console.log(`\n${label}`);
+    files.forEach(file => {
+        const note = file.missing ? '  (404)' : '';
+        console.log(`  ${file.file.padEnd(48)} ${formatKB(file.bytes)} ${formatKB(file.gzip)} ${formatKB(file.brotli)}${note}`);
+    });
+    console.log(`  ${`${files.length} requests`.padEnd(48)} ${formatKB(total('bytes'))} ${formatKB(total('gzip'))} ${formatKB(total('brotli'))}`);
+    console.log(`  repeat visit: ${repeatRequests} request(s) to the server`);
+}
+
+function report() {
+    console.log(`First load, local assets only (CDN fonts/icons unchanged)`);
+    console.log(`  ${''.padEnd(48)} ${'raw'.padStart(10)} ${'gzip'.padStart(10)} ${'brotli'.padStart(10)}`);
+
+    // Served with -c-1, every file is re-requested on each visit
+    const source = sourceFirstLoad();
+    printLoad('Before: unbundled source', source, source.length);
+
+    const manifestPath = join(OUTDIR, 'manifest.json');
+    if (existsSync(manifestPath)) {
+        // Hashed assets are immutable, so only index.html is revalidated
+        printLoad('After: dist/', distFirstLoad(JSON.parse(readFileSync(manifestPath, 'utf8'))), 1);
+    }
+}
+
+async function main() {
+    if (!args.has('--report')) {
+        rmSync(OUTDIR, { recursive: true, force: true });
+        mkdirSync(OUTDIR, { recursive: true });
+
+        const manifest = buildManifest(await bundle());
+        rewriteIndexHtml(manifest);
+        writeFileSync(join(OUTDIR, 'manifest.json'), JSON.stringify(manifest, null, 2));
+        if (!args.has('--no-compress')) {
+            precompress();
+        }
+        console.log(`✅ Built ${Object.keys(manifest.files).length} files into ${relative(ROOT, OUTDIR)}/`);
+    }
+
+    report();
+}
+
+main().catch(error => {
+    console.error(`❌ Build failed: ${error.message}`);
+    process.exitCode = 1;
+});
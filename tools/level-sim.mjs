@@ -0,0 +1,172 @@
+#!/usr/bin/env node
+// Headless Level Simulator CLI
+// Drives js/core/LevelSimulator.js against the level definitions without a browser.
+//
+// Usage:
+//   node tools/level-sim.mjs verify [levelId...]            greedy-solve each level, report completability
+//   node tools/level-sim.mjs replay <script.json | ->       replay scripted wiring sequences
+//   node tools/level-sim.mjs fuzz [--runs N] [--steps M] [--seed S] [levelId...]
+//
+// Add --json to any command for machine-readable output (used by
+// testsprite_tests/level_simulator.py).
+
+import { readFileSync } from 'node:fs';
+import { LEVEL_MANIFEST, LEVEL_ORDER, getCachedLevelData, loadLevels } from '../js/data/LevelData.js';
+import { LevelSimulator } from '../js/core/LevelSimulator.js';
+
+function parseArgs(argv) {
+    const args = { command: argv[0], positional: [], runs: 1000, steps: 50, seed: 1, json: false };
+    for (let i = 1; i < argv.length; i++) {
+        const arg = argv[i];
+        if (arg === '--json') args.json = true;
+        else if (arg === '--runs') args.runs = parseInt(argv[++i], 10);
+        else if (arg === '--steps') args.steps = parseInt(argv[++i], 10);
+        else if (arg === '--seed') args.seed = parseInt(argv[++i], 10);
+        else args.positional.push(arg);
+    }
+    return args;
+}
+
+function selectLevels(ids) {
+    const levels = ids.length > 0 ? ids : LEVEL_ORDER;
+    levels.forEach(id => {
+        if (!LEVEL_MANIFEST[id]) throw new Error(`Unknown level: ${id}`);
+    });
+    return levels;
+}
+
+/**
+ * Small deterministic PRNG so fuzz runs are reproducible from a seed
+ */
+function mulberry32(seed) {
+    let a = seed >>> 0;
+    return () => {
+        a = (a + 0x6D2B79F5) >>> 0;
+        let t = a;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+function verify(levelIds) {
+    return levelIds.map(id => {
+        const result = new LevelSimulator(id, getCachedLevelData(id)).solve();
+        const missing = Object.entries(result.progress)
+            .filter(([, p]) => p.current < p.required)
+            .map(([type, p]) => ({ type, current: p.current, required: p.required }));
+        return { level: id, completable: result.completable, connections: result.connections, missing };
+    });
+}
+
+function replay(source) {
+    const text = readFileSync(source === '-' ? 0 : source, 'utf8');
+    const parsed = JSON.parse(text);
+    const scripts = Array.isArray(parsed) ? parsed : [parsed];
+
+    const started = performance.now();
+    const results = scripts.map(script => new LevelSimulator(script.level, getCachedLevelData(script.level)).replay(script.steps || []));
+    const elapsedMs = performance.now() - started;
+
+    return { results, elapsedMs, perSecond: scripts.length / (elapsedMs / 1000) };
+}
+
+function fuzz(levelIds, { runs, steps, seed }) {
+    const random = mulberry32(seed);
+    const perLevel = [];
+    const started = performance.now();
+
+    levelIds.forEach(id => {
+        const levelData = getCachedLevelData(id);
+        const cables = (levelData.connections || []).map(c => c.type);
+        const totals = { valid: 0, invalid: 0, duplicate: 0, rejected: 0 };
+        let completed = 0;
+
+        const simulator = new LevelSimulator(id, levelData);
+        simulator.placeAllEquipment();
+        const connectorIds = [...simulator.connectors.keys()];
+        const levelStarted = performance.now();
+
+        for (let run = 0; run < runs; run++) {
+            simulator.reset();
+            simulator.placeAllEquipment();
+            if (connectorIds.length < 2 || cables.length === 0) continue;
+
+            for (let step = 0; step < steps; step++) {
+                const from = connectorIds[Math.floor(random() * connectorIds.length)];
+                const to = connectorIds[Math.floor(random() * connectorIds.length)];
+                const cable = cables[Math.floor(random() * cables.length)];
+                simulator.connect(from, to, cable);
+            }
+
+            Object.keys(totals).forEach(key => {
+                totals[key] += simulator.attempts[key];
+            });
+            if (simulator.completed) completed++;
+        }
+
+        const elapsedMs = performance.now() - levelStarted;
+        perLevel.push({ level: id, runs, completed, attempts: totals, elapsedMs, perSecond: runs / (elapsedMs / 1000) });
+    });
+
+    const elapsedMs = performance.now() - started;
+    const totalRuns = runs * levelIds.length;
+    return { levels: perLevel, runs: totalRuns, steps, seed, elapsedMs, perSecond: totalRuns / (elapsedMs / 1000) };
+}
+
+function main() {
+    const args = parseArgs(process.argv.slice(2));
+    let output;
+
+    switch (args.command) {
+        case 'verify':
+            output = verify(selectLevels(args.positional));
+            if (!args.json) {
+                output.forEach(r => {
+                    const detail = r.missing.map(m => `${m.type} ${m.current}/${m.required}`).join(', ');
+                    console.log(`${r.completable ? '✅' : '❌'} ${r.level.padEnd(12)} ${String(r.connections).padStart(4)} connections${detail ? `  missing: ${detail}` : ''}`);
+                });
+            }
+            process.exitCode = output.every(r => r.completable) ? 0 : 1;
+            break;
+
+        case 'replay':
+            if (!args.positional[0]) throw new Error('replay needs a script file or - for stdin');
+            output = replay(args.positional[0]);
+            if (!args.json) {
+                output.results.forEach(r => {
+                    console.log(`${r.completed ? '✅' : '⏳'} ${r.level.padEnd(12)} score ${r.score}  ${JSON.stringify(r.attempts)}`);
+                });
+                console.log(`⏱️  ${output.results.length} sequences in ${output.elapsedMs.toFixed(1)} ms (${Math.round(output.perSecond)}/s)`);
+            }
+            break;
+
+        case 'fuzz':
+            output = fuzz(selectLevels(args.positional), args);
+            if (!args.json) {
+                output.levels.forEach(r => {
+                    console.log(`${r.level.padEnd(12)} ${r.runs} runs  ${r.completed} completed  ${Math.round(r.perSecond)}/s  ${JSON.stringify(r.attempts)}`);
+                });
+                console.log(`⏱️  ${output.runs} sequences x ${output.steps} steps in ${output.elapsedMs.toFixed(1)} ms (${Math.round(output.perSecond)}/s)`);
+            }
+            break;
+
+        default:
+            console.error('Usage: node tools/level-sim.mjs <verify|replay|fuzz> [options] [levelId...]');
+            process.exitCode = 2;
+            return;
+    }
+
+    if (args.json) {
+        process.stdout.write(JSON.stringify(output));
+    }
+}
+
+try {
+    // Level definitions are loaded on demand; load them all so the simulator can run synchronously
+    await loadLevels();
+    main();
+} catch (error) {
+    console.error(`❌ ${error.message}`);
+    process.exitCode = 2;
+}